@@ -1740,6 +1740,16 @@ def table_interpolation_trilinear(V_xyz, table):
     return xyz_o
 
 
+_TABLE_INTERPOLATION_CHUNK_SIZE = 2 ** 16
+"""
+Count of :math:`V_{xyz}` values processed at once by the
+:func:`colour.algebra.table_interpolation_tetrahedral` definition so that the
+intermediate arrays stay cache-sized.
+
+_TABLE_INTERPOLATION_CHUNK_SIZE : int
+"""
+
+
 def table_interpolation_tetrahedral(V_xyz, table):
     """
     Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
@@ -1757,6 +1767,14 @@ def table_interpolation_tetrahedral(V_xyz, table):
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Notes
+    -----
+    -   Only the tetrahedron encompassing a given :math:`V_{xyz}` value is
+        evaluated: It is selected by sorting the indexes relative
+        :math:`V_{xyzr}` coordinates and the values are processed in chunks of
+        :attr:`colour.algebra.interpolation._TABLE_INTERPOLATION_CHUNK_SIZE`
+        size.
+
     References
     ----------
     :cite:`Kirk2006`
@@ -1783,28 +1801,47 @@ def table_interpolation_tetrahedral(V_xyz, table):
     """
 
     V_xyz = as_float_array(V_xyz)
+    table = as_float_array(table)
 
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+    V_xyz_f = np.reshape(V_xyz, (-1, 3))
+    table_f = np.reshape(table, (-1, table.shape[-1]))
 
-    vertices = np.moveaxis(vertices, 0, -1)
-    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
-    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
-
-    xyz_o = np.select([
-        np.logical_and(x > y, y > z),
-        np.logical_and(x > y, x > z),
-        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
-        np.logical_and(x <= y, z > y),
-        np.logical_and(x <= y, z > x),
-        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
-    ], [
-        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
-        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
-    ])
+    # Maximum index value and flat index stride on a given table axis.
+    i_m = np.array(table.shape[0:-1]) - 1
+    i_s = np.array([table.shape[1] * table.shape[2], table.shape[2], 1])
+
+    xyz_o = np.empty([V_xyz_f.shape[0], table.shape[-1]])
+    for i in range(0, V_xyz_f.shape[0], _TABLE_INTERPOLATION_CHUNK_SIZE):
+        chunk = slice(i, i + _TABLE_INTERPOLATION_CHUNK_SIZE)
+
+        V_xyzc = np.clip(V_xyz_f[chunk], 0, 1)
+
+        i_f = np.floor(V_xyzc * i_m).astype(DEFAULT_INT_DTYPE)
+        i_c = np.minimum(i_f + 1, i_m)
+
+        # Relative to indexes ``V_xyz`` values and flat index increments to
+        # the next vertex on a given table axis.
+        r = list(tsplit(i_m * V_xyzc - i_f))
+        d = list(np.transpose((i_c - i_f) * i_s))
+
+        # Sorting the relative coordinates in descending order along with
+        # their flat index increments with a sorting network: The tetrahedron
+        # encompassing a given V_xyz value is walked from the "V000" vertex to
+        # the "V111" vertex along the axes of decreasing relative coordinates.
+        for a, b in ((0, 1), (1, 2), (0, 1)):
+            swap = r[a] < r[b]
+            r[a], r[b] = np.where(swap, r[b], r[a]), np.where(swap, r[a], r[b])
+            d[a], d[b] = np.where(swap, d[b], d[a]), np.where(swap, d[a], d[b])
+
+        i_0 = np.dot(i_f, i_s)
+        i_1 = i_0 + d[0]
+        i_2 = i_1 + d[1]
+        i_3 = i_2 + d[2]
+
+        xyz_o[chunk] = ((1 - r[0])[:, np.newaxis] * table_f[i_0] +
+                        (r[0] - r[1])[:, np.newaxis] * table_f[i_1] +
+                        (r[1] - r[2])[:, np.newaxis] * table_f[i_2] +
+                        r[2][:, np.newaxis] * table_f[i_3])
 
     xyz_o = np.reshape(xyz_o, V_xyz.shape)
 
@@ -1127,6 +1127,19 @@ table_interpolation_tetrahedral` definition.
                 [0.61272658, 0.92799297, 0.29650424],
             ]))
 
+        V_xyz = np.tile(V_xyz, (8192, 1))
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, LUT_TABLE),
+            table_interpolation_tetrahedral(V_xyz[:16], LUT_TABLE)[np.tile(
+                np.arange(16), 8192)],
+            decimal=7)
+
+        V_xyz = np.array([[0, 0, 0], [1, 1, 1], [0, 1 / 3, 2 / 3]])
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, LUT_TABLE),
+            LUT_TABLE[[0, 3, 0], [0, 3, 1], [0, 3, 2]],
+            decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
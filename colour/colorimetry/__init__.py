@@ -21,7 +21,8 @@ from .tristimulus import sd_to_XYZ, msds_to_XYZ
 from .tristimulus import (
     SPECTRAL_SHAPE_ASTME308, lagrange_coefficients_ASTME2022,
     tristimulus_weighting_factors_ASTME2022,
-    adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
+    adjust_tristimulus_weighting_factors_ASTME308,
+    interpolate_20nm_to_10nm_ASTME308, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
     msds_to_XYZ_integration, msds_to_XYZ_ASTME308, wavelength_to_XYZ)
 from .correction import BANDPASS_CORRECTION_METHODS
@@ -83,7 +84,8 @@ __all__ += ['sd_to_XYZ', 'msds_to_XYZ']
 __all__ += [
     'SPECTRAL_SHAPE_ASTME308', 'lagrange_coefficients_ASTME2022',
     'tristimulus_weighting_factors_ASTME2022',
-    'adjust_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_integration',
+    'adjust_tristimulus_weighting_factors_ASTME308',
+    'interpolate_20nm_to_10nm_ASTME308', 'sd_to_XYZ_integration',
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_ASTME308',
     'msds_to_XYZ_integration', 'msds_to_XYZ_ASTME308', 'wavelength_to_XYZ'
 ]
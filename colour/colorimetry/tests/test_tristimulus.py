@@ -18,7 +18,8 @@ from colour.colorimetry import (MSDS_CMFS, sd_CIE_standard_illuminant_A,
                                 SpectralDistribution, SpectralShape)
 from colour.colorimetry import (
     lagrange_coefficients_ASTME2022, tristimulus_weighting_factors_ASTME2022,
-    adjust_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_integration,
+    adjust_tristimulus_weighting_factors_ASTME308,
+    interpolate_20nm_to_10nm_ASTME308, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME308, sd_to_XYZ_ASTME308,
     sd_to_XYZ, msds_to_XYZ_integration, msds_to_XYZ_ASTME308,
     wavelength_to_XYZ)
@@ -40,7 +41,8 @@ __all__ = [
     'TVS_D65_ASTME308_K1_MSDS', 'TestLagrangeCoefficientsASTME2022',
     'TestTristimulusWeightingFactorsASTME2022',
     'TestAdjustTristimulusWeightingFactorsASTME308',
-    'TestSd_to_XYZ_integration', 'TestSd_to_XYZ_ASTME308', 'TestSd_to_XYZ',
+    'TestInterpolate20nmTo10nmASTME308', 'TestSd_to_XYZ_integration',
+    'TestSd_to_XYZ_ASTME308', 'TestSd_to_XYZ',
     'TestMsds_to_XYZ_integration', 'TestMsds_to_XYZ_ASTME308',
     'TestWavelength_to_XYZ'
 ]
@@ -564,6 +566,48 @@ adjust_tristimulus_weighting_factors_ASTME308` definition.
             decimal=3)
 
 
+class TestInterpolate20nmTo10nmASTME308(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+interpolate_20nm_to_10nm_ASTME308` definition unit tests methods.
+    """
+
+    def test_interpolate_20nm_to_10nm_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+interpolate_20nm_to_10nm_ASTME308` definition.
+        """
+
+        R = np.array([0.0641, 0.0645, 0.0562, 0.0537, 0.0559])
+        np.testing.assert_almost_equal(
+            interpolate_20nm_to_10nm_ASTME308(R),
+            np.array([
+                0.06410000, 0.06538750, 0.06450000, 0.06053125, 0.05620000,
+                0.05429375, 0.05370000, 0.05421250, 0.05590000
+            ]),
+            decimal=7)
+
+        sd = SD_SAMPLE.copy().align(SpectralShape(340, 830, 20))
+        R = np.tile(sd.values, (6, 1)) * np.linspace(0, 1, 6)[:, np.newaxis]
+        R_10 = interpolate_20nm_to_10nm_ASTME308(R)
+        self.assertTupleEqual(R_10.shape, (6, len(sd.values) * 2 - 1))
+        np.testing.assert_almost_equal(
+            R_10[-1], interpolate_20nm_to_10nm_ASTME308(sd.values), decimal=7)
+        np.testing.assert_almost_equal(
+            interpolate_20nm_to_10nm_ASTME308(np.reshape(R, (2, 3, -1))),
+            np.reshape(R_10, (2, 3, -1)),
+            decimal=7)
+
+    def test_raise_exception_interpolate_20nm_to_10nm_ASTME308(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+interpolate_20nm_to_10nm_ASTME308` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, interpolate_20nm_to_10nm_ASTME308,
+                          np.array([0.0641, 0.0645]))
+
+
 class TestSd_to_XYZ_integration(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.sd_to_XYZ_integration`
@@ -1106,6 +1150,57 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
             TVS_D65_ASTME308_K1_MSDS,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            msds_to_XYZ_ASTME308(
+                np.transpose(msds.values),
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                shape=msds.shape),
+            TVS_D65_ASTME308_MSDS,
+            decimal=7)
+
+    def test_msds_to_XYZ_ASTME308_array(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
+        definition *array_like* code path against
+        :func:`colour.colorimetry.tristimulus.sd_to_XYZ_ASTME308` definition.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        A = sd_CIE_standard_illuminant_A(cmfs.shape)
+        shapes = (SpectralShape(400, 700, 20), SpectralShape(360, 780, 10),
+                  SpectralShape(340, 830, 5), SpectralShape(380, 730, 1))
+        settings = ({}, {
+            'use_practice_range': False,
+            'mi_5nm_omission_method': False,
+            'mi_20nm_interpolation_method': False,
+        }, {
+            'k': 1
+        })
+        for shape in shapes:
+            msds = MSDS_TWO.copy().align(shape)
+            for kwargs in settings:
+                XYZ = np.array([
+                    sd_to_XYZ_ASTME308(sd, cmfs, A, **kwargs)
+                    for sd in msds.to_sds()
+                ])
+                R = np.transpose(msds.values)
+
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_ASTME308(R, cmfs, A, shape=shape, **kwargs),
+                    XYZ,
+                    decimal=7)
+
+                np.testing.assert_almost_equal(
+                    msds_to_XYZ_ASTME308(
+                        np.reshape(R, (2, 6, -1)),
+                        cmfs,
+                        A,
+                        shape=shape,
+                        **kwargs),
+                    np.reshape(XYZ, (2, 6, 3)),
+                    decimal=7)
+
     def test_domain_range_scale_msds_to_XYZ_ASTME308(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_ASTME308`
@@ -1129,7 +1224,11 @@ class TestMsds_to_XYZ_ASTME308(unittest.TestCase):
         definition raise exception.
         """
 
-        self.assertRaises(ValueError, msds_to_XYZ_ASTME308, DATA_TWO)
+        self.assertRaises(
+            ValueError,
+            msds_to_XYZ_ASTME308,
+            DATA_TWO,
+            shape=SpectralShape(400, 700, 60))
 
 
 class TestWavelength_to_XYZ(unittest.TestCase):
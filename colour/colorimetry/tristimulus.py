@@ -37,13 +37,14 @@ References
 import numpy as np
 
 from colour.algebra import lagrange_coefficients
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
+from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SpectralDistribution,
                                 MultiSpectralDistributions, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
                               filter_kwargs, from_range_100,
-                              get_domain_range_scale, runtime_warning, tsplit)
+                              get_domain_range_scale, register_cache,
+                              runtime_warning, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -55,7 +56,8 @@ __status__ = 'Production'
 __all__ = [
     'SPECTRAL_SHAPE_ASTME308', 'lagrange_coefficients_ASTME2022',
     'tristimulus_weighting_factors_ASTME2022',
-    'adjust_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_integration',
+    'adjust_tristimulus_weighting_factors_ASTME308',
+    'interpolate_20nm_to_10nm_ASTME308', 'sd_to_XYZ_integration',
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME308', 'sd_to_XYZ_ASTME308',
     'SD_TO_XYZ_METHODS', 'sd_to_XYZ', 'msds_to_XYZ_integration',
     'msds_to_XYZ_ASTME308', 'MSDS_TO_XYZ_METHODS', 'msds_to_XYZ',
@@ -73,11 +75,16 @@ References
 SPECTRAL_SHAPE_ASTME308 : SpectralShape
 """
 
-_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = None
+_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = register_cache(
+    '{0}._CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS'.format(__name__),
+    maximum_size=64)
 
-_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = None
+_CACHE_TRISTIMULUS_WEIGHTING_FACTORS = register_cache(
+    '{0}._CACHE_TRISTIMULUS_WEIGHTING_FACTORS'.format(__name__),
+    maximum_size=256)
 
-_CACHE_SD_TO_XYZ = None
+_CACHE_SD_TO_XYZ = register_cache(
+    '{0}._CACHE_SD_TO_XYZ'.format(__name__), maximum_size=4096)
 
 
 def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
@@ -129,13 +136,10 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
            [ 0.05...,  0.99..., -0.04...]])
     """
 
-    global _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS
-    if _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS is None:
-        _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS = {}
-
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
-    if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
-        return np.copy(_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key])
+    lica = _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS.get(hash_key)
+    if lica is not None:
+        return np.copy(lica)
 
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
@@ -251,16 +255,13 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
         raise ValueError(
             '"{0}" shape "interval" must be 1!'.format(illuminant))
 
-    global _CACHE_TRISTIMULUS_WEIGHTING_FACTORS
-    if _CACHE_TRISTIMULUS_WEIGHTING_FACTORS is None:
-        _CACHE_TRISTIMULUS_WEIGHTING_FACTORS = {}
-
     hash_key = tuple([
         hash(arg) for arg in (cmfs, illuminant, shape, k,
                               get_domain_range_scale())
     ])
-    if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
-        return np.copy(_CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key])
+    W = _CACHE_TRISTIMULUS_WEIGHTING_FACTORS.get(hash_key)
+    if W is not None:
+        return np.copy(W)
 
     Y = cmfs.values
     S = illuminant.values
@@ -393,6 +394,74 @@ def adjust_tristimulus_weighting_factors_ASTME308(W, shape_r, shape_t):
     return W[start_index:-end_index or None, ...]
 
 
+def interpolate_20nm_to_10nm_ASTME308(R):
+    """
+    Interpolates given 20 nm measurement interval spectral data to 10 nm using
+    the third-order *Lagrange* interpolation of practise *ASTM E308-15*
+    method.
+
+    The two additional 20 nm intervals required at each end of the data are
+    extrapolated and every odd numbered 10 nm value is interpolated from the
+    four surrounding 20 nm values with a single stencil operation, the
+    computation is vectorised over all the leading axes.
+
+    Parameters
+    ----------
+    R : array_like
+        20 nm measurement interval spectral data, the wavelengths are expected
+        to be in the last axis, e.g. for 128 reflectances sampled from 400nm
+        to 700nm, ``R`` shape should be (128, 16).
+
+    Returns
+    -------
+    ndarray
+        10 nm interval spectral data, for 128 reflectances sampled from 400nm
+        to 700nm, the output shape will be (128, 31).
+
+    Raises
+    ------
+    ValueError
+        If the spectral data has less than 3 wavelengths.
+
+    References
+    ----------
+    :cite:`ASTMInternational2015b`
+
+    Examples
+    --------
+    >>> R = np.array([0.0641, 0.0645, 0.0562, 0.0537, 0.0559])
+    >>> interpolate_20nm_to_10nm_ASTME308(R)  # doctest: +ELLIPSIS
+    array([ 0.0641    ,  0.0653875 ,  0.0645    ,  0.06053125,  0.0562    ,
+            0.05429375,  0.0537    ,  0.0542125 ,  0.0559    ])
+    """
+
+    R = as_float_array(R)
+
+    if R.shape[-1] < 3:
+        raise ValueError(
+            '"ASTM E308-15" 20nm interpolation method requires at least 3 '
+            'wavelengths!')
+
+    # Extrapolation of additional 20nm padding intervals.
+    R_p = np.concatenate(
+        [
+            3 * R[..., 0:1] - 3 * R[..., 1:2] + R[..., 2:3],
+            R,
+            R[..., -3:-2] - 3 * R[..., -2:-1] + 3 * R[..., -1:],
+        ],
+        axis=-1)
+
+    # Interpolating every odd numbered values.
+    R_i = (-0.0625 * R_p[..., :-3] + 0.5625 * R_p[..., 1:-2] +
+           0.5625 * R_p[..., 2:-1] - 0.0625 * R_p[..., 3:])
+
+    R_10 = np.empty(R.shape[:-1] + (R.shape[-1] * 2 - 1, ), dtype=R.dtype)
+    R_10[..., 0::2] = R
+    R_10[..., 1::2] = R_i
+
+    return R_10
+
+
 def sd_to_XYZ_integration(
         sd,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -734,34 +803,21 @@ def sd_to_XYZ_ASTME308(
             cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
         method = sd_to_XYZ_integration
     elif sd.shape.interval == 20 and mi_20nm_interpolation_method:
-        sd = sd.copy()
         if sd.shape.boundaries != cmfs.shape.boundaries:
             runtime_warning(
                 'Trimming "{0}" spectral distribution shape to "{1}" '
                 'colour matching functions shape.'.format(
                     illuminant.name, cmfs.name))
-            sd.trim(cmfs.shape)
-
-        # Extrapolation of additional 20nm padding intervals.
-        sd.align(SpectralShape(sd.shape.start - 20, sd.shape.end + 20, 10))
-        for i in range(2):
-            sd[sd.wavelengths[i]] = (
-                    3 * sd.values[i + 2] -
-                    3 * sd.values[i + 4] + sd.values[i + 6])  # yapf: disable
-            i_e = len(sd.domain) - 1 - i
-            sd[sd.wavelengths[i_e]] = (
-                sd.values[i_e - 6] - 3 * sd.values[i_e - 4] +
-                3 * sd.values[i_e - 2])
-
-        # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(sd.domain) - 3, 2):
-            sd[sd.wavelengths[i]] = (
-                -0.0625 * sd.values[i - 3] + 0.5625 * sd.values[i - 1] +
-                0.5625 * sd.values[i + 1] - 0.0625 * sd.values[i + 3])
-
-        # Discarding the additional 20nm padding intervals.
-        sd.trim(SpectralShape(sd.shape.start + 20, sd.shape.end - 20, 10))
+            sd = sd.copy().trim(cmfs.shape)
+
+        sd = SpectralDistribution(
+            interpolate_20nm_to_10nm_ASTME308(sd.values),
+            SpectralShape(sd.shape.start, sd.shape.end, 10).range(),
+            name=sd.name,
+            interpolator=sd.interpolator,
+            interpolator_kwargs=sd.interpolator_kwargs,
+            extrapolator=sd.extrapolator,
+            extrapolator_kwargs=sd.extrapolator_kwargs)
 
     XYZ = method(sd, cmfs, illuminant, k=k)
 
@@ -903,16 +959,13 @@ def sd_to_XYZ(
     array([ 10.8404805...,   9.6838697...,   6.2115722...])
     """
 
-    global _CACHE_SD_TO_XYZ
-    if _CACHE_SD_TO_XYZ is None:
-        _CACHE_SD_TO_XYZ = {}
-
     hash_key = tuple([
         hash(arg) for arg in (sd, cmfs, illuminant, k, method,
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
-    if hash_key in _CACHE_SD_TO_XYZ:
-        return np.copy(_CACHE_SD_TO_XYZ[hash_key])
+    XYZ = _CACHE_SD_TO_XYZ.get(hash_key)
+    if XYZ is not None:
+        return np.copy(XYZ)
 
     function = SD_TO_XYZ_METHODS[method]
 
@@ -1110,16 +1163,26 @@ def msds_to_XYZ_ASTME308(
         use_practice_range=True,
         mi_5nm_omission_method=True,
         mi_20nm_interpolation_method=True,
-        k=None):
+        k=None,
+        shape=SPECTRAL_SHAPE_DEFAULT):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant according to practise
     *ASTM E308-15* method.
 
+    The tristimulus weighting factors are computed once for the spectral shape
+    of the multi-spectral distributions and all the tristimulus values are
+    then obtained with a single matrix product, the multi-spectral
+    distributions can be either a :class:`colour.MultiSpectralDistributions`
+    class instance or an *array_like* in which case the ``shape`` must be
+    passed.
+
     Parameters
     ----------
     msds : MultiSpectralDistributions or array_like
-        Multi-spectral distributions.
+        Multi-spectral distributions, if an *array_like* the wavelengths are
+        expected to be in the last axis, e.g. for 4096 reflectances with 31
+        bins, ``msds`` shape should be (4096, 31).
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
@@ -1152,13 +1215,15 @@ def msds_to_XYZ_ASTME308(
         be the spectral concentration of the radiometric quantity corresponding
         to the photometric quantity required.
     shape : SpectralShape, optional
-        Spectral shape of the multi-spectral distributions, ``cmfs`` and
-        ``illuminant`` will be aligned to it.
+        Spectral shape of the multi-spectral distributions array :math:`msds`,
+        ignored if ``msds`` is a :class:`colour.MultiSpectralDistributions`
+        class instance.
 
     Returns
     -------
     array_like
-        *CIE XYZ* tristimulus values.
+        *CIE XYZ* tristimulus values, for 4096 reflectances with 31 bins, the
+        output shape will be (4096, 3).
 
     Notes
     -----
@@ -1169,17 +1234,22 @@ def msds_to_XYZ_ASTME308(
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
-    -   The code path using the *array_like* multi-spectral distributions
-        produces results different to the code path using a
-        :class:`colour.MultiSpectralDistributions` class instance: the former
-        favours execution speed by aligning the colour matching functions and
-        illuminant to the given spectral shape while the latter favours
-        precision by aligning the multi-spectral distributions to the colour
-        matching functions.
+    -   The multi-spectral distributions wavelengths are expected to fall on
+        the colour matching functions wavelengths, their range is trimmed to
+        the colour matching functions range and, if shorter, the weighting
+        factors at the missing wavelengths are added to the weights at the
+        shortest and longest available wavelengths which is equivalent to the
+        constant extrapolation performed by
+        :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition.
+    -   The *1 nm* and the *5 nm* omission method code paths align the colour
+        matching functions to the multi-spectral distributions interval.
+    -   Non-uniform :class:`colour.MultiSpectralDistributions` class instances
+        are converted one spectral distribution at a time with
+        :func:`colour.colorimetry.sd_to_XYZ_ASTME308` definition.
 
     References
     ----------
-    :cite:`Wyszecki2000bf`
+    :cite:`ASTMInternational2011a`, :cite:`ASTMInternational2015b`
 
     Examples
     --------
@@ -1219,15 +1289,90 @@ def msds_to_XYZ_ASTME308(
     """
 
     if isinstance(msds, MultiSpectralDistributions):
-        return as_float_array([
-            sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
-                               mi_5nm_omission_method,
-                               mi_20nm_interpolation_method, k)
-            for sd in msds.to_sds()
-        ])
+        if not msds.is_uniform():
+            return as_float_array([
+                sd_to_XYZ_ASTME308(sd, cmfs, illuminant, use_practice_range,
+                                   mi_5nm_omission_method,
+                                   mi_20nm_interpolation_method, k)
+                for sd in msds.to_sds()
+            ])
+
+        shape = msds.shape
+        R = np.transpose(msds.values)
     else:
-        raise ValueError('"ASTM E308-15" method does not support "array_like" '
-                         'multi-spectral distributions!')
+        R = as_float_array(msds)
+
+        msd_shape_m_1, shape_wl_count = R.shape[-1], len(shape.range())
+        assert msd_shape_m_1 == shape_wl_count, (
+            'Multi-spectral distributions array with {0} wavelengths '
+            'is not compatible with spectral shape with {1} wavelengths!'.
+            format(msd_shape_m_1, shape_wl_count))
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_ASTME308)
+
+    wavelengths = shape.range()
+    mask = np.logical_and(wavelengths >= cmfs.shape.start,
+                          wavelengths <= cmfs.shape.end)
+    if not np.all(mask):
+        runtime_warning('Trimming multi-spectral distributions shape to "{0}" '
+                        'colour matching functions shape.'.format(cmfs.name))
+        R = R[..., mask]
+        wavelengths = wavelengths[mask]
+        shape = SpectralShape(wavelengths[0], wavelengths[-1], shape.interval)
+
+    if shape.interval == 20 and mi_20nm_interpolation_method:
+        R = interpolate_20nm_to_10nm_ASTME308(R)
+        shape = SpectralShape(shape.start, shape.end, 10)
+
+    if shape.interval == 1 or (shape.interval == 5 and
+                               mi_5nm_omission_method):
+        if cmfs.shape.interval != shape.interval:
+            cmfs = cmfs.copy().interpolate(
+                SpectralShape(interval=shape.interval))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        W = cmfs.values * illuminant.values[..., np.newaxis]
+        W *= cmfs.shape.interval
+        W *= 100 / np.sum(W[..., 1]) if k is None else k
+        shape_r = cmfs.shape
+    else:
+        if cmfs.shape.interval != 1:
+            runtime_warning('Interpolating "{0}" cmfs to 1nm interval.'.format(
+                cmfs.name))
+            cmfs = cmfs.copy().interpolate(SpectralShape(interval=1))
+
+        if illuminant.shape != cmfs.shape:
+            runtime_warning(
+                'Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant.name, cmfs.name))
+            illuminant = illuminant.copy().align(cmfs.shape)
+
+        W = tristimulus_weighting_factors_ASTME2022(
+            cmfs, illuminant,
+            SpectralShape(cmfs.shape.start, cmfs.shape.end, shape.interval),
+            k)
+        shape_r = SpectralShape(
+            cmfs.shape.start,
+            cmfs.shape.start + shape.interval * (W.shape[0] - 1),
+            shape.interval)
+
+    W = adjust_tristimulus_weighting_factors_ASTME308(W, shape_r, shape)
+
+    XYZ = np.dot(R, W)
+
+    return from_range_100(XYZ)
 
 
 MSDS_TO_XYZ_METHODS = CaseInsensitiveMapping({
@@ -1263,10 +1408,10 @@ def msds_to_XYZ(
         **kwargs):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
-    using given colour matching functions and illuminant. For the *Integration*
-    method, the multi-spectral distributions can be either a
-    :class:`colour.MultiSpectralDistributions` class instance or an
-    *array_like* in which case the ``shape`` must be passed.
+    using given colour matching functions and illuminant. The multi-spectral
+    distributions can be either a :class:`colour.MultiSpectralDistributions`
+    class instance or an *array_like* in which case the ``shape`` must be
+    passed.
 
     Parameters
     ----------
@@ -1315,7 +1460,8 @@ def msds_to_XYZ(
         tristimulus values will use a dedicated interpolation method instead
         of a table of tristimulus weighting factors.
     shape : SpectralShape, optional
-        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`,
+        :func:`colour.colorimetry.msds_to_XYZ_ASTME308`},
         Spectral shape of the multi-spectral distributions array :math:`msds`,
         ``cmfs`` and ``illuminant`` will be aligned to it.
 
@@ -690,16 +690,15 @@ or dict_like
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is built from the cached hashes of the underlying
+            continuous signals and thus does not require hashing their
+            *domain* and *range* variables again unless they were mutated.
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        return hash(tuple(hash(signal) for signal in self._signals.values()))
 
     def __getitem__(self, x):
         """
@@ -198,6 +198,7 @@ class Signal(AbstractContinuousFunction):
         self._dtype = None
         self._domain = None
         self._range = None
+        self._hash = None
         self._interpolator = KernelInterpolator
         self._interpolator_kwargs = {}
         self._extrapolator = Extrapolator
@@ -579,16 +580,25 @@ class Signal(AbstractContinuousFunction):
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is computed once and cached, it is invalidated whenever
+            the underlying function is rebuilt, i.e. when the continuous
+            signal is mutated.
         """
 
-        return hash((
-            self.domain.tobytes(),
-            self.range.tobytes(),
-            self.interpolator.__name__,
-            repr(self.interpolator_kwargs),
-            self.extrapolator.__name__,
-            repr(self.extrapolator_kwargs),
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self.domain.tobytes(),
+                self.range.tobytes(),
+                self.interpolator.__name__,
+                repr(self.interpolator_kwargs),
+                self.extrapolator.__name__,
+                repr(self.extrapolator_kwargs),
+            ))
+
+        return self._hash
 
     def __getitem__(self, x):
         """
@@ -848,6 +858,8 @@ class Signal(AbstractContinuousFunction):
         Creates the continuous signal underlying function.
         """
 
+        self._hash = None
+
         if self._domain is not None and self._range is not None:
             self._function = self._extrapolator(
                 self._interpolator(self.domain, self.range,
@@ -361,6 +361,18 @@ extrapolator_kwargs` property.
 
         self.assertIsInstance(hash(self._multi_signals), int)
 
+        multi_signals = self._multi_signals.copy()
+        self.assertEqual(hash(multi_signals), hash(self._multi_signals))
+
+        multi_signals[0] = 20
+        self.assertNotEqual(hash(multi_signals), hash(self._multi_signals))
+
+        multi_signals.range = self._multi_signals.range
+        self.assertEqual(hash(multi_signals), hash(self._multi_signals))
+
+        multi_signals *= 2
+        self.assertNotEqual(hash(multi_signals), hash(self._multi_signals))
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.multi_signals.MultiSignals.__str__`
@@ -251,6 +251,24 @@ class TestSignal(unittest.TestCase):
 
         self.assertIsInstance(hash(self._signal), int)
 
+        signal = self._signal.copy()
+        self.assertEqual(hash(signal), hash(self._signal))
+
+        signal[0] = 20
+        self.assertNotEqual(hash(signal), hash(self._signal))
+
+        signal[0] = 10
+        self.assertEqual(hash(signal), hash(self._signal))
+
+        signal += 1
+        self.assertNotEqual(hash(signal), hash(self._signal))
+
+        signal.range = self._signal.range
+        self.assertEqual(hash(signal), hash(self._signal))
+
+        signal.domain = self._signal.domain + 1
+        self.assertNotEqual(hash(signal), hash(self._signal))
+
     def test__str__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__str__` method.
@@ -6,6 +6,8 @@ Automatic Colour Conversion Graph
 Defines the automatic colour conversion graph objects:
 
 -   :func:`colour.describe_conversion_path`
+-   :class:`colour.graph.ConversionPlan`
+-   :func:`colour.graph.conversion_plan`
 -   :func:`colour.convert`
 """
 
@@ -25,7 +27,7 @@ from colour.colorimetry import (colorimetric_purity, complementary_wavelength,
                                 luminous_efficiency, luminous_flux, sd_to_XYZ,
                                 whiteness, yellowness, wavelength_to_XYZ)
 from colour.recovery import XYZ_to_sd
-from colour.models import RGB_COLOURSPACE_sRGB
+from colour.models import RGB_COLOURSPACE_sRGB, RGB_Colourspace
 from colour.models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
@@ -54,7 +56,8 @@ from colour.appearance import (
     CIECAM02_to_XYZ, XYZ_to_ATD95, XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt,
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.temperature import CCT_to_uv, CCT_to_xy, uv_to_CCT, xy_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs, message_box,
+from colour.utilities import (as_float_array, domain_range_scale,
+                              filter_kwargs, message_box, register_cache,
                               required, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers'
@@ -70,7 +73,8 @@ __all__ = [
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
     'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'describe_conversion_path', 'ConversionPlan', 'conversion_plan',
+    'convert'
 ]
 
 
@@ -585,6 +589,9 @@ Automatic colour conversion graph.
 CONVERSION_GRAPH : DiGraph
 """
 
+_CACHE_CONVERSION_PLANS = register_cache(
+    '{0}._CACHE_CONVERSION_PLANS'.format(__name__), maximum_size=256)
+
 
 @required('NetworkX')
 def _conversion_path(source, target):
@@ -757,6 +764,519 @@ def describe_conversion_path(source,
             message_box(message, width, padding, print_callable)
 
 
+def _kwargs_signature(value):
+    """
+    Returns a hashable value signature of given keyword arguments value used
+    to key the conversion plans cache.
+
+    *Numpy* arrays are keyed on their shape, data type and content, *dict*,
+    *tuple* and *list* instances are traversed recursively, immutable scalars,
+    i.e. *None*, numbers and strings, and definitions or classes are used
+    directly. *RGB* colourspaces are keyed on their name, primaries,
+    whitepoint, normalised primary matrices and colour component transfer
+    functions.
+
+    Parameters
+    ----------
+    value : object
+        Value to return the signature of.
+
+    Returns
+    -------
+    object
+        Hashable signature.
+
+    Raises
+    ------
+    TypeError
+        If given value has no value signature, e.g. a mutable object, in which
+        case the conversion plan must not be cached.
+    """
+
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, value.dtype.str, value.tobytes())
+    elif isinstance(value, dict):
+        return ('dict', ) + tuple(
+            sorted((key, _kwargs_signature(item))
+                   for key, item in value.items()))
+    elif isinstance(value, (tuple, list)):
+        return (type(value).__name__, ) + tuple(
+            _kwargs_signature(item) for item in value)
+    elif (value is None or
+          isinstance(value, (bool, int, float, complex, str, bytes,
+                             np.generic))):
+        return (type(value).__name__, value)
+    elif isinstance(value, RGB_Colourspace):
+        return ('RGB_Colourspace', ) + tuple(
+            _kwargs_signature(item)
+            for item in (value.name, value.primaries, value.whitepoint,
+                         value.whitepoint_name, value.matrix_RGB_to_XYZ,
+                         value.matrix_XYZ_to_RGB, value.cctf_encoding,
+                         value.cctf_decoding))
+    elif isinstance(value, partial):
+        return ('partial', _kwargs_signature(value.func),
+                _kwargs_signature(value.args),
+                _kwargs_signature(value.keywords))
+    elif (inspect.isfunction(value) or inspect.isbuiltin(value) or
+          inspect.isclass(value)):
+        # NOTE: The signature holds a reference to the definition or class,
+        # thus its identity, on which it is hashed, cannot be reused.
+        return ('callable', value)
+
+    raise TypeError(
+        '"{0}" type has no value signature!'.format(type(value).__name__))
+
+
+def _copy_kwargs(kwargs):
+    """
+    Returns a copy of given keyword arguments where the *Numpy* arrays and
+    *RGB* colourspaces, at the top-level and in the conversion definitions
+    dictionaries, are copied so that a conversion plan is not affected by their
+    subsequent mutation.
+
+    Parameters
+    ----------
+    kwargs : dict
+        Keyword arguments to copy.
+
+    Returns
+    -------
+    dict
+        Keyword arguments copy.
+    """
+
+    kwargs_c = {}
+    for key, value in kwargs.items():
+        if isinstance(value, np.ndarray):
+            value = np.copy(value)
+        elif isinstance(value, RGB_Colourspace):
+            value = value.copy()
+        elif isinstance(value, dict):
+            value = _copy_kwargs(value)
+
+        kwargs_c[key] = value
+
+    return kwargs_c
+
+
+def _constant_arguments(kwargs, vectors=(), matrices=()):
+    """
+    Returns whether given keyword arguments vectors and matrices are constant,
+    i.e. single vectors and single matrices rather than arrays of them.
+
+    Parameters
+    ----------
+    kwargs : dict
+        Keyword arguments.
+    vectors : array_like, optional
+        Names of the keyword arguments expected to be single vectors.
+    matrices : array_like, optional
+        Names of the keyword arguments expected to be single matrices.
+
+    Returns
+    -------
+    bool
+        Whether the keyword arguments vectors and matrices are constant.
+    """
+
+    return (all(np.ndim(kwargs.get(name)) <= 1 for name in vectors) and
+            all(np.ndim(kwargs.get(name)) <= 2 for name in matrices))
+
+
+_LINEAR_CONVERSION_FUNCTIONS = {
+    XYZ_to_RGB:
+        lambda kwargs: kwargs.get('cctf_encoding') is None and
+        _constant_arguments(kwargs, ('illuminant_XYZ', 'illuminant_RGB'),
+                            ('matrix_XYZ_to_RGB', )),
+    RGB_to_XYZ:
+        lambda kwargs: kwargs.get('cctf_decoding') is None and
+        _constant_arguments(kwargs, ('illuminant_RGB', 'illuminant_XYZ'),
+                            ('matrix_RGB_to_XYZ', )),
+    RGB_to_RGB:
+        lambda kwargs: not kwargs.get('apply_cctf_decoding') and
+        not kwargs.get('apply_cctf_encoding'),
+    XYZ_to_UCS:
+        lambda kwargs: True,
+    UCS_to_XYZ:
+        lambda kwargs: True,
+}
+"""
+Conversion definitions that are linear transformations of their input, i.e.
+3x3 matrix products, along with the predicates returning whether they are
+linear for given keyword arguments.
+
+_LINEAR_CONVERSION_FUNCTIONS : dict
+"""
+
+
+def _linear_conversion_matrix(conversion_function, kwargs):
+    """
+    Returns the matrix of given conversion function if it is linear for given
+    keyword arguments, *None* otherwise.
+
+    The matrix is returned transposed so that it can be post-multiplied with
+    arrays whose last dimension is the colour dimension.
+
+    Parameters
+    ----------
+    conversion_function : callable
+        Conversion function.
+    kwargs : dict
+        Keyword arguments bound to the conversion function.
+
+    Returns
+    -------
+    ndarray or None
+        Transposed conversion function matrix or *None*.
+    """
+
+    predicate = _LINEAR_CONVERSION_FUNCTIONS.get(
+        _lower_order_function(conversion_function))
+
+    if predicate is None:
+        return None
+
+    keywords = dict(getattr(conversion_function, 'keywords', {}))
+    keywords.update(kwargs)
+
+    if not predicate(keywords):
+        return None
+
+    with domain_range_scale('1'):
+        # The conversion of the identity matrix rows yields the transposed
+        # conversion function matrix.
+        return as_float_array(conversion_function(np.identity(3), **kwargs))
+
+
+def _linear_conversion(a, matrix):
+    """
+    Converts given array :math:`a` with given transposed matrix, this is the
+    fused conversion function of consecutive linear steps of a conversion
+    plan.
+
+    Parameters
+    ----------
+    a : array_like
+        Array :math:`a` to convert.
+    matrix : array_like
+        Transposed matrix.
+
+    Returns
+    -------
+    ndarray
+        Converted array :math:`a`.
+    """
+
+    return np.matmul(as_float_array(a), matrix)
+
+
+def _fuse_steps(steps):
+    """
+    Fuses the consecutive linear steps of given conversion plan steps into
+    single matrix steps.
+
+    Parameters
+    ----------
+    steps : tuple
+        Conversion plan steps, i.e. a tuple of *(conversion_function, kwargs)*
+        tuples.
+
+    Returns
+    -------
+    tuple
+        Fused conversion plan steps.
+    """
+
+    fused_steps = []
+    matrix = None
+    for conversion_function, kwargs in steps:
+        step_matrix = _linear_conversion_matrix(conversion_function, kwargs)
+
+        if step_matrix is None:
+            if matrix is not None:
+                fused_steps.append((_linear_conversion, {'matrix': matrix}))
+                matrix = None
+
+            fused_steps.append((conversion_function, kwargs))
+        else:
+            matrix = (step_matrix
+                      if matrix is None else np.dot(matrix, step_matrix))
+
+    if matrix is not None:
+        fused_steps.append((_linear_conversion, {'matrix': matrix}))
+
+    return tuple(fused_steps)
+
+
+class ConversionPlan(object):
+    """
+    Defines a conversion plan from source colour representation to target
+    colour representation: The conversion path is resolved in the automatic
+    colour conversion graph and the keyword arguments are bound to the
+    conversion definitions once so that the plan can be executed repeatedly
+    without any graph traversal or introspection overhead.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.graph.ConversionPlan.source`
+    -   :attr:`~colour.graph.ConversionPlan.target`
+    -   :attr:`~colour.graph.ConversionPlan.conversion_path`
+    -   :attr:`~colour.graph.ConversionPlan.steps`
+    -   :attr:`~colour.graph.ConversionPlan.fused_steps`
+
+    Methods
+    -------
+    -   :meth:`~colour.graph.ConversionPlan.__init__`
+    -   :meth:`~colour.graph.ConversionPlan.__call__`
+    -   :meth:`~colour.graph.ConversionPlan.__repr__`
+
+    Notes
+    -----
+    -   The *Numpy* arrays and *RGB* colourspaces passed as keyword arguments
+        are copied when the plan is created.
+    -   The consecutive linear steps of the conversion path, e.g. the
+        :func:`colour.XYZ_to_RGB` and :func:`colour.RGB_to_RGB` definitions
+        without colour component transfer functions, are fused into a single
+        matrix product computed when the plan is created.
+    -   The plan is executed with the domain-range scale set to **'1'**.
+
+    Examples
+    --------
+    >>> plan = ConversionPlan('CIE XYZ', 'CIE Lab')
+    >>> plan
+    ConversionPlan('cie xyz', 'cie lab', [XYZ_to_Lab])
+    >>> plan(np.array([0.20654008, 0.12197225, 0.05136952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.4152787...,  0.5263858...,  0.2692317...])
+    """
+
+    def __init__(self, source, target, **kwargs):
+        self._source = source.lower()
+        self._target = target.lower()
+
+        kwargs = _copy_kwargs(kwargs)
+        kwargs.pop('verbose', None)
+
+        steps = []
+        for conversion_function in _conversion_path(self._source,
+                                                    self._target):
+            conversion_function_name = _lower_order_function(
+                conversion_function).__name__
+
+            # Filtering compatible keyword arguments passed directly and
+            # irrespective of any conversion function name.
+            filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+
+            # Filtering keyword arguments passed as dictionary with the
+            # conversion function name.
+            filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+
+            steps.append((conversion_function, filtered_kwargs))
+
+        self._steps = tuple(steps)
+        self._fused_steps = _fuse_steps(self._steps)
+
+    @property
+    def source(self):
+        """
+        Getter property for the conversion plan source colour representation.
+
+        Returns
+        -------
+        unicode
+            Conversion plan source colour representation.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter property for the conversion plan target colour representation.
+
+        Returns
+        -------
+        unicode
+            Conversion plan target colour representation.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._target
+
+    @property
+    def conversion_path(self):
+        """
+        Getter property for the conversion plan conversion path.
+
+        Returns
+        -------
+        list
+            Conversion path, i.e. a list of conversion function callables.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return [conversion_function for conversion_function, _ in self._steps]
+
+    @property
+    def steps(self):
+        """
+        Getter property for the conversion plan steps.
+
+        Returns
+        -------
+        tuple
+            Conversion plan steps, i.e. a tuple of
+            *(conversion_function, kwargs)* tuples where *kwargs* are the bound
+            keyword arguments of the conversion function.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._steps
+
+    @property
+    def fused_steps(self):
+        """
+        Getter property for the conversion plan fused steps, i.e. the steps
+        executed by the plan where the consecutive linear steps, e.g.
+        :func:`colour.XYZ_to_RGB` or :func:`colour.RGB_to_RGB` definitions
+        without colour component transfer functions, are fused into a single
+        matrix product.
+
+        Returns
+        -------
+        tuple
+            Conversion plan fused steps.
+
+        Notes
+        -----
+        -   This property is read only.
+        """
+
+        return self._fused_steps
+
+    @domain_range_scale('1')
+    def __call__(self, a):
+        """
+        Executes the conversion plan on given object :math:`a`.
+
+        Parameters
+        ----------
+        a : array_like or numeric or SpectralDistribution
+            Object :math:`a` to convert.
+
+        Returns
+        -------
+        ndarray or numeric or SpectralDistribution
+            Converted object :math:`a`.
+        """
+
+        for conversion_function, kwargs in self._fused_steps:
+            a = conversion_function(a, **kwargs)
+
+        return a
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the conversion plan.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{0}({1!r}, {2!r}, [{3}])'.format(
+            self.__class__.__name__, self._source, self._target, ', '.join([
+                _lower_order_function(conversion_function).__name__
+                for conversion_function in self.conversion_path
+            ]))
+
+
+def conversion_plan(source, target, **kwargs):
+    """
+    Returns the memoised conversion plan from source colour representation to
+    target colour representation for given keyword arguments.
+
+    Parameters
+    ----------
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    target : unicode
+        Target colour representation, i.e. the target node in the automatic
+        colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ConversionPlan
+        Conversion plan.
+
+    Notes
+    -----
+    -   The plans are stored in a bounded cache keyed on the source and target
+        colour representations and a value signature of the keyword
+        arguments, the ``verbose`` keyword argument is not part of the
+        signature. If a keyword argument has no value signature, e.g. a
+        mutable object, a new plan is returned and not cached.
+
+    Examples
+    --------
+    >>> plan = conversion_plan('CIE XYZ', 'CIE Lab')
+    >>> plan is conversion_plan('cie xyz', 'cie lab')
+    True
+    """
+
+    try:
+        key = (source.lower(), target.lower(),
+               _kwargs_signature({
+                   key: value
+                   for key, value in kwargs.items() if key != 'verbose'
+               }))
+    except TypeError:
+        return ConversionPlan(source, target, **kwargs)
+
+    plan = _CACHE_CONVERSION_PLANS.get(key)
+    if plan is None:
+        plan = ConversionPlan(source, target, **kwargs)
+        _CACHE_CONVERSION_PLANS[key] = plan
+
+    return plan
+
+
 @domain_range_scale('1')
 def convert(a, source, target, **kwargs):
     """
@@ -958,32 +1478,22 @@ verbose={'mode': 'Long'})
         'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
         '\n    convert(*args, **kwargs)')
 
-    source, target = source.lower(), target.lower()
+    plan = conversion_plan(source, target, **kwargs)
 
-    conversion_path = _conversion_path(source, target)
+    if 'verbose' not in kwargs:
+        return plan(a)
 
     verbose_kwargs = copy(kwargs)
-    for conversion_function in conversion_path:
+    for conversion_function, filtered_kwargs in plan.steps:
         conversion_function_name = _lower_order_function(
             conversion_function).__name__
 
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
-
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
-
         a = conversion_function(a, **filtered_kwargs)
 
-        if conversion_function_name in verbose_kwargs:
-            verbose_kwargs[conversion_function_name]['return'] = a
-        else:
-            verbose_kwargs[conversion_function_name] = {'return': a}
+        verbose_kwargs[conversion_function_name] = dict(
+            verbose_kwargs.get(conversion_function_name, {}), **{'return': a})
 
-    if 'verbose' in verbose_kwargs:
-        verbose_kwargs.update(verbose_kwargs.pop('verbose'))
-        describe_conversion_path(source, target, **verbose_kwargs)
+    verbose_kwargs.update(verbose_kwargs.pop('verbose'))
+    describe_conversion_path(plan.source, plan.target, **verbose_kwargs)
 
     return a
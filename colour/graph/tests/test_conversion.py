@@ -9,7 +9,8 @@ import unittest
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
 from colour.models import RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.graph import (describe_conversion_path, ConversionPlan,
+                          conversion_plan, convert)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -18,7 +19,11 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestDescribeConversionPath', 'TestConversionPlan',
+    'TestConversionPlanDefinition',
+    'TestConvert'
+]
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -47,6 +52,170 @@ class TestDescribeConversionPath(unittest.TestCase):
             })
 
 
+class TestConversionPlan(unittest.TestCase):
+    """
+    Defines :class:`colour.graph.conversion.ConversionPlan` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('source', 'target', 'conversion_path', 'steps',
+                               'fused_steps')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ConversionPlan))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__', '__repr__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ConversionPlan))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.graph.conversion.ConversionPlan.__call__` method.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+
+        plan = ConversionPlan('CIE XYZ', 'CIE LCHab', illuminant=illuminant)
+        np.testing.assert_almost_equal(
+            plan(a),
+            convert(a, 'CIE XYZ', 'CIE LCHab', illuminant=illuminant),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            plan(np.tile(a, (4, 3, 1))),
+            np.tile(plan(a), (4, 3, 1)),
+            decimal=7)
+
+    def test_kwargs_binding(self):
+        """
+        Tests :class:`colour.graph.conversion.ConversionPlan` class keyword
+        arguments binding.
+        """
+
+        illuminant = np.copy(CCS_ILLUMINANTS[
+            'CIE 1931 2 Degree Standard Observer']['D50'])
+        plan = ConversionPlan(
+            'CIE XYZ', 'CIE Lab', XYZ_to_Lab={'illuminant': illuminant})
+        illuminant *= 0
+
+        self.assertIsNot(plan.steps[0][1]['illuminant'], illuminant)
+        self.assertFalse(np.any(plan.steps[0][1]['illuminant'] == 0))
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        colourspace = RGB_COLOURSPACE_ACES2065_1.copy()
+        plan = ConversionPlan(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+        b = plan(a)
+        colourspace.whitepoint = CCS_ILLUMINANTS[
+            'CIE 1931 2 Degree Standard Observer']['D50']
+
+        np.testing.assert_equal(plan(a), b)
+
+    def test_fused_steps(self):
+        """
+        Tests :attr:`colour.graph.conversion.ConversionPlan.fused_steps`
+        property.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+
+        plan = ConversionPlan(
+            'CIE UCS',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': RGB_COLOURSPACE_ACES2065_1})
+        self.assertEqual(len(plan.steps), 3)
+        self.assertEqual(len(plan.fused_steps), 1)
+
+        b = a
+        for conversion_function, kwargs in plan.steps:
+            b = conversion_function(b, **kwargs)
+
+        np.testing.assert_almost_equal(plan(a), b, decimal=7)
+        np.testing.assert_almost_equal(
+            plan(np.tile(a, (4, 3, 1))), np.tile(b, (4, 3, 1)), decimal=7)
+
+        plan = ConversionPlan('CIE UCS', 'sRGB')
+        self.assertEqual(len(plan.steps), 2)
+        self.assertEqual(len(plan.fused_steps), 2)
+
+        plan = ConversionPlan(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'apply_cctf_encoding': True})
+        self.assertEqual(len(plan.fused_steps), 2)
+
+
+class TestConversionPlanDefinition(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.conversion_plan` definition unit
+    tests methods.
+    """
+
+    def test_conversion_plan(self):
+        """
+        Tests :func:`colour.graph.conversion.conversion_plan` definition.
+        """
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+
+        plan = conversion_plan('CIE XYZ', 'CIE Lab', illuminant=illuminant)
+        self.assertIs(
+            conversion_plan(
+                'cie xyz',
+                'cie lab',
+                illuminant=np.copy(illuminant),
+                verbose={'mode': 'Short'}), plan)
+        self.assertIsNot(conversion_plan('CIE XYZ', 'CIE Lab'), plan)
+        self.assertIsNot(
+            conversion_plan(
+                'CIE XYZ', 'CIE Lab', XYZ_to_Lab={'illuminant': illuminant}),
+            plan)
+
+        # Mutable keyword arguments have no value signature, the plans are
+        # not cached.
+        sd = SDS_ILLUMINANTS['D65'].copy()
+        plan = conversion_plan(
+            'Spectral Distribution', 'CIE XYZ', illuminant=sd)
+        self.assertIsNot(
+            conversion_plan(
+                'Spectral Distribution', 'CIE XYZ', illuminant=sd), plan)
+
+        # *RGB* colourspaces are keyed on their values.
+        colourspace = RGB_COLOURSPACE_ACES2065_1.copy()
+        plan = conversion_plan(
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+        self.assertIs(
+            conversion_plan(
+                'CIE XYZ',
+                'Scene-Referred RGB',
+                RGB_to_RGB={'output_colourspace': colourspace.copy()}), plan)
+
+        colourspace.whitepoint = illuminant
+        self.assertIsNot(
+            conversion_plan(
+                'CIE XYZ',
+                'Scene-Referred RGB',
+                RGB_to_RGB={'output_colourspace': colourspace}), plan)
+
+
 class TestConvert(unittest.TestCase):
     """
     Defines :func:`colour.graph.conversion.convert` definition unit tests
@@ -101,6 +270,33 @@ class TestConvert(unittest.TestCase):
             np.array([0.36364180, 0.31715308, 0.25888531]),
             decimal=7)
 
+        # The mutation of an *RGB* colourspace is reflected by subsequent
+        # conversions.
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        colourspace = RGB_COLOURSPACE_ACES2065_1.copy()
+        RGB_b = convert(
+            a,
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+        colourspace.whitepoint = CCS_ILLUMINANTS[
+            'CIE 1931 2 Degree Standard Observer']['D50']
+        RGB_c = convert(
+            a,
+            'CIE XYZ',
+            'Scene-Referred RGB',
+            RGB_to_RGB={'output_colourspace': colourspace})
+        self.assertFalse(np.allclose(RGB_b, RGB_c))
+        np.testing.assert_almost_equal(
+            RGB_c,
+            convert(
+                a,
+                'CIE XYZ',
+                'Scene-Referred RGB',
+                RGB_to_RGB={'output_colourspace': colourspace.copy()},
+                verbose={'mode': 'Short', 'print_callable': lambda x: None}),
+            decimal=7)
+
     def test_convert_direct_keyword_argument_passing(self):
         """
         Tests :func:`colour.graph.conversion.convert` definition behaviour when
@@ -19,7 +19,8 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.utilities import tsplit, tstack, as_float_array, as_int_array
+from colour.io.luts.common import format_array_as_row, parse_array
+from colour.utilities import tsplit, tstack, as_int_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -97,9 +98,7 @@ def read_LUT_Cinespace(path):
         """
 
         pre_LUT_size = max([int(lines[i]) for i in [0, 3, 6]])
-        pre_LUT = [
-            as_float_array(lines[i].split()) for i in [1, 2, 4, 5, 7, 8]
-        ]
+        pre_LUT = [parse_array(lines[i]) for i in [1, 2, 4, 5, 7, 8]]
         pre_LUT_padded = []
 
         for row in pre_LUT:
@@ -121,14 +120,14 @@ def read_LUT_Cinespace(path):
         """
 
         size = as_int_array(lines[0].split())
-        table = as_float_array([line.split() for line in lines[1:]])
+        table = parse_array(lines[1:]).reshape([-1, 3])
 
         return size, table
 
     with open(path) as csp_file:
-        lines = csp_file.readlines()
+        lines = csp_file.read().splitlines()
         assert len(lines) > 0, 'LUT file empty!'
-        lines = [line.strip() for line in lines if line.strip()]
+        lines = list(filter(None, map(str.strip, lines)))
 
         header = lines[0]
         assert header == 'CSPLUTV100', 'Invalid header!'
@@ -314,21 +313,6 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
 
         return [R_len, G_len, B_len]
 
-    def _format_array(array):
-        """
-        Formats given array as a *Cinespace* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
-    def _format_tuple(array):
-        """
-        Formats given array as 2 space separated values to *decimals*
-        precision.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f}'.format(decimals, *array)
-
     with open(path, 'w') as csp_file:
         csp_file.write('CSPLUTV100\n')
 
@@ -362,59 +346,62 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
 
                     csp_file.write('{0}\n'.format(size))
 
-                    for j in range(size):
-                        if LUT[0].is_domain_explicit():
-                            entry = LUT[0].domain[j][i]
-                        else:
-                            entry = (
-                                LUT[0].domain[0][i] + j *
-                                (LUT[0].domain[1][i] - LUT[0].domain[0][i]) /
-                                (LUT[0].size - 1))
-                        csp_file.write('{0:.{1}f} '.format(entry, decimals))
-
-                    csp_file.write('\n')
-
-                    for j in range(size):
-                        entry = LUT[0].table[j][i]
-                        if non_uniform:
-                            entry -= table_min
-                            entry /= (table_max - table_min)
-                        csp_file.write('{0:.{1}f} '.format(entry, decimals))
-
-                    csp_file.write('\n')
+                    if LUT[0].is_domain_explicit():
+                        entries = LUT[0].domain[:size, i]
+                    else:
+                        entries = (
+                            LUT[0].domain[0][i] + np.arange(size) *
+                            (LUT[0].domain[1][i] - LUT[0].domain[0][i]) /
+                            (LUT[0].size - 1))
+
+                    csp_file.write('{0} \n'.format(
+                        format_array_as_row(entries, decimals)))
+
+                    entries = LUT[0].table[:size, i]
+                    if non_uniform:
+                        entries = ((entries - table_min) /
+                                   (table_max - table_min))
+
+                    csp_file.write('{0} \n'.format(
+                        format_array_as_row(entries, decimals)))
             else:
                 for i in range(3):
                     csp_file.write('2\n')
                     csp_file.write('{0}\n'.format(
-                        _format_tuple(
-                            [LUT[1].domain[0][i], LUT[1].domain[1][i]])))
+                        format_array_as_row(
+                            [LUT[1].domain[0][i], LUT[1].domain[1][i]],
+                            decimals)))
                     csp_file.write('{0:.{2}f} {1:.{2}f}\n'.format(
                         0, 1, decimals))
             if non_uniform:
                 csp_file.write('\n{0}\n'.format(2))
                 row = [table_min, table_min, table_min]
-                csp_file.write('{0}\n'.format(_format_array(row)))
+                csp_file.write('{0}\n'.format(
+                    format_array_as_row(row, decimals)))
                 row = [table_max, table_max, table_max]
-                csp_file.write('{0}\n'.format(_format_array(row)))
+                csp_file.write('{0}\n'.format(
+                    format_array_as_row(row, decimals)))
             else:
                 csp_file.write('\n{0} {1} {2}\n'.format(
                     LUT[1].table.shape[0], LUT[1].table.shape[1],
                     LUT[1].table.shape[2]))
                 table = LUT[1].table.reshape([-1, 3], order='F')
 
-                for row in table:
-                    csp_file.write('{0}\n'.format(_format_array(row)))
+                csp_file.write('{0}\n'.format(
+                    format_array_as_row(table, decimals)))
 
         else:
             for i in range(3):
                 csp_file.write('2\n')
                 csp_file.write('{0}\n'.format(
-                    _format_tuple([LUT[0].domain[0][i], LUT[0].domain[1][i]])))
+                    format_array_as_row(
+                        [LUT[0].domain[0][i], LUT[0].domain[1][i]],
+                        decimals)))
                 csp_file.write('0.0 1.0\n')
             csp_file.write('\n{0}\n'.format(LUT[0].size))
             table = LUT[0].table
 
-            for row in table:
-                csp_file.write('{0}\n'.format(_format_array(row)))
+            csp_file.write('{0}\n'.format(
+                format_array_as_row(table, decimals)))
 
     return True
@@ -7,9 +7,13 @@ Defines LUT Processing common utilities objects that don't fall in any specific
 category.
 """
 
+import numpy as np
 import os
 import re
 
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import is_string
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
 __license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
@@ -17,7 +21,156 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['path_to_title']
+__all__ = [
+    'parse_array', 'format_array_as_row', 'split_table_data', 'path_to_title'
+]
+
+
+def parse_array(a, separator=' ', dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Converts given string or array of strings to :class:`ndarray` class.
+
+    The conversion is performed at once by *Numpy* rather than on a per row
+    basis so that large *LUT* tables can be parsed efficiently.
+
+    Parameters
+    ----------
+    a : unicode or array_like
+        String or array of strings to convert.
+    separator : unicode, optional
+        Separator to split the string(s) with.
+    dtype : type, optional
+        :class:`numpy.dtype` to use for conversion.
+
+    Returns
+    -------
+    ndarray
+        String(s) converted to :class:`ndarray` class.
+
+    Raises
+    ------
+    ValueError
+        If a token cannot be converted, e.g. in a corrupt *LUT* table.
+
+    Examples
+    --------
+    >>> parse_array('-0.25 0.5 0.75')
+    array([-0.25,  0.5 ,  0.75])
+    >>> parse_array(['-0.25 0.5 0.75', '0.1 0.2 0.3'])
+    array([-0.25,  0.5 ,  0.75,  0.1 ,  0.2 ,  0.3 ])
+    """
+
+    if not is_string(a):
+        a = separator.join(a)
+
+    # NOTE: "np.fromstring" definition silently stops at the first token that
+    # cannot be converted, the tokens are thus split and converted by *Numpy*
+    # which raises an exception on any invalid token at a similar cost.
+    if separator.strip():
+        tokens = a.split(separator) if a.strip() else []
+    else:
+        tokens = a.split()
+
+    return np.array(tokens, dtype=dtype)
+
+
+def format_array_as_row(a, decimals=7, separator=' '):
+    """
+    Formats given array as a row, or given 2-dimensional array as rows
+    separated by new lines.
+
+    The formatting is performed with a single call for the whole array rather
+    than on a per row basis so that large *LUT* tables can be written
+    efficiently.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to format.
+    decimals : int or array_like, optional
+        Decimals to format the values with, a value per column can be given.
+    separator : unicode, optional
+        Separator to join the values with.
+
+    Returns
+    -------
+    unicode
+        Array formatted as row(s).
+
+    Examples
+    --------
+    >>> format_array_as_row([1.25, 2.5, 3.75], 3)
+    '1.250 2.500 3.750'
+    >>> print(format_array_as_row([[0, 1, 0.25], [1, 2, 0.5]], [0, 0, 2]))
+    0 1 0.25
+    1 2 0.50
+    """
+
+    a = np.atleast_2d(a)
+
+    row = separator.join([
+        '%0.{0}f'.format(decimal)
+        for decimal in np.broadcast_to(decimals, a.shape[-1])
+    ])
+
+    return '\n'.join([row] * a.shape[0]) % tuple(np.ravel(a).tolist())
+
+
+_KEYWORDS_TABLE_DATA = ('TITLE', 'DOMAIN_MIN', 'DOMAIN_MAX', 'LUT_1D_SIZE',
+                        'LUT_3D_SIZE', 'LUT_1D_INPUT_RANGE',
+                        'LUT_3D_INPUT_RANGE')
+"""
+Keywords of the *LUT* files whose table data is split with
+:func:`colour.io.luts.common.split_table_data` definition.
+
+_KEYWORDS_TABLE_DATA : tuple
+"""
+
+_PATTERN_KEYWORD_LINE = re.compile(
+    '\n[ \\t]*(?:#|(?:{0})(?=[ \\t\n]|$))[^\n]*'.format(
+        '|'.join(_KEYWORDS_TABLE_DATA)))
+"""
+Pattern matching the *LUT* files keyword and comment lines, i.e. the lines
+starting with a known keyword or a *#*, the table data rows starting with
+*nan* or *inf* values are not matched.
+
+The pattern is anchored on the preceding line feed rather than on a multiline
+*^* which is significantly faster to search for in large tables.
+
+_PATTERN_KEYWORD_LINE : Pattern
+"""
+
+
+def split_table_data(text):
+    """
+    Splits given *LUT* file text into its keyword and comment lines, i.e. the
+    lines starting with a known keyword or a *#*, and its table data.
+
+    The keyword and comment lines can then be processed individually while the
+    table data is parsed at once with :func:`colour.io.luts.common.parse_array`
+    definition.
+
+    Parameters
+    ----------
+    text : unicode
+        *LUT* file text to split.
+
+    Returns
+    -------
+    tuple
+        Stripped keyword and comment lines and table data.
+
+    Examples
+    --------
+    >>> split_table_data('TITLE "Nemo"\\n# Comment\\n0.0 0.5 1.0\\n')
+    (['TITLE "Nemo"', '# Comment'], '\\n\\n0.0 0.5 1.0\\n')
+    """
+
+    text = '\n{0}'.format(text)
+
+    return ([
+        line.strip() for line in _PATTERN_KEYWORD_LINE.findall(text)
+    ], _PATTERN_KEYWORD_LINE.sub('\n', text)[1:])
 
 
 def path_to_title(path):
@@ -18,7 +18,8 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import (format_array_as_row, parse_array,
+                                   path_to_title, split_table_data)
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -100,17 +101,13 @@ def read_LUT_IridasCube(path):
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     dimensions = 3
     size = 2
-    table = []
     comments = []
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
+        # The keyword and comment lines are processed individually while the
+        # table data is parsed at once.
+        lines, table = split_table_data(cube_file.read())
         for line in lines:
-            line = line.strip()
-
-            if len(line) == 0:
-                continue
-
             if line.startswith('#'):
                 comments.append(line[1:].strip())
                 continue
@@ -129,9 +126,10 @@ def read_LUT_IridasCube(path):
                 dimensions = 3
                 size = DEFAULT_INT_DTYPE(tokens[1])
             else:
-                table.append(tokens)
+                raise ValueError(
+                    'Unsupported "{0}" keyword!'.format(tokens[0]))
 
-    table = as_float_array(table)
+    table = parse_array(table).reshape([-1, 3])
     if dimensions == 2:
         return LUT3x1D(
             table,
@@ -225,13 +223,6 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
     else:
         assert 2 <= size <= 256, '"LUT" size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as an *Iridas* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     with open(path, 'w') as cube_file:
         cube_file.write('TITLE "{0}"\n'.format(LUT.name))
 
@@ -245,16 +236,15 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
         default_domain = np.array([[0, 0, 0], [1, 1, 1]])
         if not np.array_equal(LUT.domain, default_domain):
             cube_file.write('DOMAIN_MIN {0}\n'.format(
-                _format_array(LUT.domain[0])))
+                format_array_as_row(LUT.domain[0], decimals)))
             cube_file.write('DOMAIN_MAX {0}\n'.format(
-                _format_array(LUT.domain[1])))
+                format_array_as_row(LUT.domain[1], decimals)))
 
         if not is_3x1D:
             table = LUT.table.reshape([-1, 3], order='F')
         else:
             table = LUT.table
 
-        for row in table:
-            cube_file.write('{0}\n'.format(_format_array(row)))
+        cube_file.write('{0}\n'.format(format_array_as_row(table, decimals)))
 
     return True
@@ -15,6 +15,7 @@ Defines the classes and definitions handling *LUT* processing:
 import numpy as np
 import re
 from abc import ABC, abstractmethod
+from multiprocessing.pool import ThreadPool
 from collections.abc import MutableSequence
 from copy import deepcopy
 from operator import (add, mul, pow, sub, truediv, iadd, imul, ipow, isub,
@@ -39,6 +40,83 @@ __all__ = [
 ]
 
 
+def _apply_chunked(function, RGB, chunk_size=None, out=None, workers=1):
+    """
+    Applies given function to given *RGB* colourspace array in chunks of given
+    size, optionally writing into given output array and processing the chunks
+    in parallel with a thread pool.
+
+    Parameters
+    ----------
+    function : callable
+        Function to apply, it must return an array with the same shape as its
+        input.
+    RGB : array_like
+        *RGB* colourspace array to apply the function onto.
+    chunk_size : int, optional
+        Count of pixels processed at once, the whole *RGB* colourspace array
+        is processed at once if *None*.
+    out : ndarray, optional
+        Array the processed *RGB* colourspace array is written into, it must
+        have the same shape as the *RGB* colourspace array.
+    workers : int, optional
+        Count of threads processing the chunks in parallel.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+    """
+
+    RGB = as_float_array(RGB)
+
+    if chunk_size is None and out is None:
+        return function(RGB)
+
+    if out is None:
+        out = np.empty(RGB.shape)
+
+    assert out.shape == RGB.shape, (
+        '"out" array shape must be equal to "RGB" array shape!')
+
+    RGB_f = np.reshape(RGB, (-1, RGB.shape[-1]))
+    if out.flags.c_contiguous:
+        out_f = np.reshape(out, RGB_f.shape)
+    else:
+        out_f = np.empty(RGB_f.shape)
+
+    if chunk_size is None:
+        chunk_size = RGB_f.shape[0]
+
+    assert chunk_size > 0, '"chunk_size" must be strictly positive!'
+
+    def _apply(chunk):
+        """
+        Applies the function to given chunk.
+        """
+
+        out_f[chunk] = function(RGB_f[chunk])
+
+    chunks = [
+        slice(i, i + chunk_size) for i in range(0, RGB_f.shape[0], chunk_size)
+    ]
+
+    if workers > 1 and len(chunks) > 1:
+        pool = ThreadPool(workers)
+        try:
+            pool.map(_apply, chunks)
+        finally:
+            pool.terminate()
+    else:
+        for chunk in chunks:
+            _apply(chunk)
+
+    if not np.shares_memory(out_f, out):
+        out[...] = np.reshape(out_f, out.shape)
+
+    return out
+
+
 class AbstractLUT(ABC):
     """
     Defines the base class for *LUT*.
@@ -1304,7 +1382,10 @@ class LUT3x1D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_kwargs=None):
+              interpolator_kwargs=None,
+              chunk_size=None,
+              out=None,
+              workers=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1316,6 +1397,15 @@ class LUT3x1D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        chunk_size : int, optional
+            Count of pixels processed at once so that the memory used by the
+            intermediate arrays stays bounded, the whole *RGB* colourspace
+            array is processed at once if *None*.
+        out : ndarray, optional
+            Array the interpolated *RGB* colourspace array is written into, it
+            must have the same shape as the *RGB* colourspace array.
+        workers : int, optional
+            Count of threads processing the chunks in parallel.
 
         Returns
         -------
@@ -1350,8 +1440,6 @@ class LUT3x1D(AbstractLUT):
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
-        R, G, B = tsplit(RGB)
-
         if self.is_domain_explicit():
             samples = [
                 axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
@@ -1373,12 +1461,22 @@ class LUT3x1D(AbstractLUT):
 
         s_R, s_G, s_B = samples
 
-        RGB_i = [
-            interpolator(a[0], a[1], **interpolator_kwargs)(a[2])
-            for a in zip((s_R, s_G, s_B), (R_t, G_t, B_t), (R, G, B))
+        RGB_interpolators = [
+            interpolator(a[0], a[1], **interpolator_kwargs)
+            for a in zip((s_R, s_G, s_B), (R_t, G_t, B_t))
         ]
 
-        return tstack(RGB_i)
+        def _apply(RGB):
+            """
+            Applies the *LUT* to given *RGB* colourspace array.
+            """
+
+            return tstack([
+                RGB_interpolator(a) for RGB_interpolator, a in zip(
+                    RGB_interpolators, tsplit(RGB))
+            ])
+
+        return _apply_chunked(_apply, RGB, chunk_size, out, workers)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1773,7 +1871,10 @@ class LUT3D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=table_interpolation_trilinear,
-              interpolator_kwargs=None):
+              interpolator_kwargs=None,
+              chunk_size=None,
+              out=None,
+              workers=1):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1785,6 +1886,15 @@ class LUT3D(AbstractLUT):
             Interpolator object to use as interpolating function.
         interpolator_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function.
+        chunk_size : int, optional
+            Count of pixels processed at once so that the memory used by the
+            intermediate arrays stays bounded, the whole *RGB* colourspace
+            array is processed at once if *None*.
+        out : ndarray, optional
+            Array the interpolated *RGB* colourspace array is written into, it
+            must have the same shape as the *RGB* colourspace array.
+        workers : int, optional
+            Count of threads processing the chunks in parallel.
 
         Returns
         -------
@@ -1813,8 +1923,6 @@ class LUT3D(AbstractLUT):
         if interpolator_kwargs is None:
             interpolator_kwargs = {}
 
-        R, G, B = tsplit(RGB)
-
         if self.is_domain_explicit():
             domain_min = self.domain[0, ...]
             domain_max = [
@@ -1829,12 +1937,20 @@ class LUT3D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
+        def _apply(RGB):
+            """
+            Applies the *LUT* to given *RGB* colourspace array.
+            """
+
+            RGB_l = [
+                linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
+                for i, j in enumerate(tsplit(RGB))
+            ]
 
-        return interpolator(tstack(RGB_l), self._table, **interpolator_kwargs)
+            return interpolator(
+                tstack(RGB_l), self._table, **interpolator_kwargs)
+
+        return _apply_chunked(_apply, RGB, chunk_size, out, workers)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -2090,6 +2206,7 @@ class LUTSequence(MutableSequence):
     -   :meth:`~colour.LUTSequence.__ne__`
     -   :meth:`~colour.LUTSequence.insert`
     -   :meth:`~colour.LUTSequence.apply`
+    -   :meth:`~colour.LUTSequence.bake`
     -   :meth:`~colour.LUTSequence.copy`
 
     Examples
@@ -2338,7 +2455,10 @@ class LUTSequence(MutableSequence):
               interpolator_1D=LinearInterpolator,
               interpolator_1D_kwargs=None,
               interpolator_3D=table_interpolation_trilinear,
-              interpolator_3D_kwargs=None):
+              interpolator_3D_kwargs=None,
+              chunk_size=None,
+              out=None,
+              workers=1):
         """
         Applies the *LUT* sequence sequentially to given *RGB* colourspace
         array.
@@ -2362,6 +2482,15 @@ class LUTSequence(MutableSequence):
         interpolator_3D_kwargs : dict_like, optional
             Arguments to use when calling the interpolating function for
             :class:`colour.LUT3D` class instances.
+        chunk_size : int, optional
+            Count of pixels processed at once by the whole *LUT* sequence so
+            that the memory used by the intermediate arrays stays bounded, the
+            whole *RGB* colourspace array is processed at once if *None*.
+        out : ndarray, optional
+            Array the processed *RGB* colourspace array is written into, it
+            must have the same shape as the *RGB* colourspace array.
+        workers : int, optional
+            Count of threads processing the chunks in parallel.
 
         Returns
         -------
@@ -2384,17 +2513,173 @@ class LUTSequence(MutableSequence):
                [ 0.75     ...,  0.75     ...,  0.75     ...]])
         """
 
-        for operation in self:
-            if isinstance(operation, (LUT1D, LUT3x1D)):
-                RGB = operation.apply(RGB, interpolator_1D,
-                                      interpolator_1D_kwargs)
-            elif isinstance(operation, LUT3D):
-                RGB = operation.apply(RGB, interpolator_3D,
-                                      interpolator_3D_kwargs)
+        def _apply(RGB):
+            """
+            Applies the *LUT* sequence sequentially to given *RGB* colourspace
+            array.
+            """
+
+            for operation in self:
+                if isinstance(operation, (LUT1D, LUT3x1D)):
+                    RGB = operation.apply(RGB, interpolator_1D,
+                                          interpolator_1D_kwargs)
+                elif isinstance(operation, LUT3D):
+                    RGB = operation.apply(RGB, interpolator_3D,
+                                          interpolator_3D_kwargs)
+                else:
+                    RGB = operation.apply(RGB)
+
+            return RGB
+
+        if chunk_size is None and out is None:
+            return _apply(RGB)
+
+        return _apply_chunked(_apply, RGB, chunk_size, out, workers)
+
+    def bake(self,
+             size=33,
+             shaper=None,
+             domain=np.array([[0, 0, 0], [1, 1, 1]]),
+             interpolator_1D=LinearInterpolator,
+             interpolator_1D_kwargs=None,
+             interpolator_3D=table_interpolation_trilinear,
+             interpolator_3D_kwargs=None):
+        """
+        Bakes the *LUT* sequence into a single :class:`colour.LUT3D` class
+        instance, optionally preceded by given shaper *LUT*.
+
+        Parameters
+        ----------
+        size : int, optional
+            Baked :class:`colour.LUT3D` class instance size.
+        shaper : LUT1D or LUT3x1D, optional
+            Monotonically increasing shaper *LUT* mapping the input values to
+            the domain of the baked :class:`colour.LUT3D` class instance, e.g.
+            a logarithmic curve for *log* or *HDR* input values.
+        domain : array_like, optional
+            Domain of the baked :class:`colour.LUT3D` class instance, it is
+            ignored if a shaper *LUT* is given: The range of the shaper *LUT*
+            is used instead.
+        interpolator_1D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT3x1D`) class
+            instances.
+        interpolator_1D_kwargs : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT1D` (and :class:`colour.LUT3x1D`) class
+            instances.
+        interpolator_3D : object, optional
+            Interpolator object to use as interpolating function for
+            :class:`colour.LUT3D` class instances.
+        interpolator_3D_kwargs : dict_like, optional
+            Arguments to use when calling the interpolating function for
+            :class:`colour.LUT3D` class instances.
+
+        Returns
+        -------
+        tuple
+            Baked *LUT*, i.e. a :class:`colour.LUT3D` class instance or a
+            :class:`colour.LUTSequence` class instance of the shaper *LUT* and
+            the :class:`colour.LUT3D` class instance, and estimated maximum
+            absolute bake error.
+
+        Notes
+        -----
+        -   The maximum bake error is estimated at the centres of the
+            :class:`colour.LUT3D` class instance cells, i.e. where the
+            interpolation error is typically the largest, it is not an upper
+            bound of the error.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT3x1D(LUT3x1D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3)
+        >>> LUT, error = LUT_sequence.bake(17)
+        >>> print(LUT.size)
+        17
+        >>> error  # doctest: +ELLIPSIS
+        0.0012733...
+        """
+
+        if interpolator_1D_kwargs is None:
+            interpolator_1D_kwargs = {}
+
+        if interpolator_3D_kwargs is None:
+            interpolator_3D_kwargs = {}
+
+        def _apply(RGB):
+            """
+            Applies the *LUT* sequence sequentially to given *RGB* colourspace
+            array.
+            """
+
+            return self.apply(RGB, interpolator_1D, interpolator_1D_kwargs,
+                              interpolator_3D, interpolator_3D_kwargs)
+
+        if shaper is None:
+
+            def _shaper_inverse(RGB):
+                """
+                Returns given *RGB* colourspace array unchanged.
+                """
+
+                return RGB
+        else:
+            assert isinstance(shaper, (LUT1D, LUT3x1D)), (
+                '"shaper" must be an instance of "LUT1D" or "LUT3x1D"!')
+
+            shaper_3x1D = (shaper.as_LUT(LUT3x1D)
+                           if isinstance(shaper, LUT1D) else shaper)
+
+            if shaper_3x1D.is_domain_explicit():
+                samples = shaper_3x1D.domain
             else:
-                RGB = operation.apply(RGB)
+                samples = LUT3x1D.linear_table(shaper_3x1D.size,
+                                               shaper_3x1D.domain)
+
+            # The inverse of the shaper *LUT* is obtained by swapping its
+            # table and domain.
+            shaper_i = LUT3x1D(samples, domain=shaper_3x1D.table)
+
+            def _shaper_inverse(RGB):
+                """
+                Applies the inverse of the shaper *LUT* to given *RGB*
+                colourspace array.
+                """
+
+                return shaper_i.apply(RGB, interpolator_1D,
+                                      interpolator_1D_kwargs)
+
+            domain = np.vstack([
+                np.nanmin(shaper_3x1D.table, axis=0),
+                np.nanmax(shaper_3x1D.table, axis=0)
+            ])
+
+        domain = as_float_array(domain)
+
+        LUT = LUT3D(
+            _apply(_shaper_inverse(LUT3D.linear_table(size, domain))),
+            'Baked LUT Sequence',
+            domain,
+            comments=['Baked from {0} operation(s).'.format(len(self))])
+
+        # Measuring the bake error at the centres of the "LUT" cells.
+        offset = (domain[1] - domain[0]) / (size - 1) / 2
+        RGB = LUT3D.linear_table(
+            size - 1, np.vstack([domain[0] + offset, domain[1] - offset]))
+        error = np.max(
+            np.abs(
+                _apply(_shaper_inverse(RGB)) -
+                LUT.apply(RGB, interpolator_3D, interpolator_3D_kwargs)))
+
+        LUT.comments.append('Maximum bake error: {0}'.format(error))
+
+        if shaper is not None:
+            LUT = LUTSequence(shaper, LUT)
 
-        return RGB
+        return LUT, error
 
     def copy(self):
         """
@@ -19,7 +19,8 @@ References
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT3x1D, LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import (format_array_as_row, parse_array,
+                                   path_to_title, split_table_data)
 from colour.utilities import as_float_array, tstack
 
 __author__ = 'Colour Developers'
@@ -135,19 +136,15 @@ def read_LUT_ResolveCube(path):
 
     title = path_to_title(path)
     size_3x1D = size_3D = 2
-    table = []
     comments = []
     has_3x1D, has_3D = False, False
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
         LUT = LUTSequence(LUT3x1D(), LUT3D())
+        # The keyword and comment lines are processed individually while the
+        # table data is parsed at once.
+        lines, table = split_table_data(cube_file.read())
         for line in lines:
-            line = line.strip()
-
-            if len(line) == 0:
-                continue
-
             if line.startswith('#'):
                 comments.append(line[1:].strip())
                 continue
@@ -168,9 +165,10 @@ def read_LUT_ResolveCube(path):
                 has_3D = True
                 size_3D = np.int_(tokens[1])
             else:
-                table.append(tokens)
+                raise ValueError(
+                    'Unsupported "{0}" keyword!'.format(tokens[0]))
 
-    table = as_float_array(table)
+    table = parse_array(table).reshape([-1, 3])
     if has_3x1D and has_3D:
         LUT[0].name = '{0} - Shaper'.format(title)
         LUT[1].name = '{0} - Cube'.format(title)
@@ -311,21 +309,6 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
     if has_3D:
         assert 2 <= LUT[1].size <= 256, 'Cube size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Resolve* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
-    def _format_tuple(array):
-        """
-        Formats given array as 2 space separated values to *decimals*
-        precision.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f}'.format(decimals, *array)
-
     with open(path, 'w') as cube_file:
         cube_file.write('TITLE "{0}"\n'.format(name))
 
@@ -344,24 +327,28 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
                                                LUT[0].table.shape[0]))
             if not np.array_equal(LUT[0].domain, default_domain):
                 cube_file.write('LUT_1D_INPUT_RANGE {0}\n'.format(
-                    _format_tuple([LUT[0].domain[0][0], LUT[0].domain[1][0]])))
+                    format_array_as_row(
+                        [LUT[0].domain[0][0], LUT[0].domain[1][0]],
+                        decimals)))
 
         if has_3D:
             cube_file.write('{0} {1}\n'.format('LUT_3D_SIZE',
                                                LUT[1].table.shape[0]))
             if not np.array_equal(LUT[1].domain, default_domain):
                 cube_file.write('LUT_3D_INPUT_RANGE {0}\n'.format(
-                    _format_tuple([LUT[1].domain[0][0], LUT[1].domain[1][0]])))
+                    format_array_as_row(
+                        [LUT[1].domain[0][0], LUT[1].domain[1][0]],
+                        decimals)))
 
         if has_3x1D:
             table = LUT[0].table
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write('{0}\n'.format(
+                format_array_as_row(table, decimals)))
             cube_file.write('\n')
 
         if has_3D:
             table = LUT[1].table.reshape([-1, 3], order='F')
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write('{0}\n'.format(
+                format_array_as_row(table, decimals)))
 
     return True
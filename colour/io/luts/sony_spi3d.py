@@ -13,8 +13,9 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import path_to_title
-from colour.utilities import as_int_array, usage_warning, as_float_array
+from colour.io.luts.common import (format_array_as_row, parse_array,
+                                   path_to_title, split_table_data)
+from colour.utilities import as_int_array, usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -74,28 +75,33 @@ def read_LUT_SonySPI3D(path):
     title = path_to_title(path)
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     size = 2
-    indexes = []
-    table = []
     comments = []
 
     with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
-        for line in lines:
-            if line.startswith('#'):
-                comments.append(line[1:].strip())
-                continue
-
-            tokens = line.split()
-            if len(tokens) == 3:
-                assert len(set(tokens)) == 1, (
-                    'Non-uniform "LUT" shape is unsupported!')
-
-                size = DEFAULT_INT_DTYPE(tokens[0])
-            if len(tokens) == 6:
-                indexes.append(as_int_array(tokens[:3]))
-                table.append(as_float_array(tokens[3:]))
-
-    indexes = as_int_array(indexes)
+        lines = spi3d_file.read().splitlines()
+
+    for i, line in enumerate(lines):
+        line = line.strip()
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        if len(tokens) == 3:
+            assert len(set(tokens)) == 1, (
+                'Non-uniform "LUT" shape is unsupported!')
+
+            size = DEFAULT_INT_DTYPE(tokens[0])
+            break
+
+    # The table data following the header is parsed at once.
+    lines, table = split_table_data('\n'.join(lines[i + 1:]))
+    comments.extend(
+        [line[1:].strip() for line in lines if line.startswith('#')])
+
+    table = parse_array(table).reshape([-1, 6])
+    indexes, table = as_int_array(table[:, :3]), table[:, 3:]
     sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1], indexes[:, 0]))
 
     assert np.array_equal(
@@ -104,8 +110,7 @@ def read_LUT_SonySPI3D(path):
             LUT3D.linear_table(size) * (size - 1))).reshape(
                 (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
 
-    table = as_float_array(table)[sorting_indexes].reshape(
-        [size, size, size, 3])
+    table = table[sorting_indexes].reshape([size, size, size, 3])
 
     return LUT3D(
         table, title, np.vstack([domain_min, domain_max]), comments=comments)
@@ -162,14 +167,6 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
         [1, 1, 1],
     ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi3d* data row.
-        """
-
-        return '{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}'.format(
-            decimals, *array)
-
     with open(path, 'w') as spi3d_file:
         spi3d_file.write('SPILUT 1.0\n')
 
@@ -182,9 +179,9 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
                 [-1, 3])
         table = LUT.table.reshape([-1, 3])
 
-        for i, row in enumerate(indexes):
-            spi3d_file.write('{0}\n'.format(
-                _format_array(list(row) + list(table[i]))))
+        spi3d_file.write('{0}\n'.format(
+            format_array_as_row(
+                np.hstack([indexes, table]), [0, 0, 0] + [decimals] * 3)))
 
         if LUT.comments:
             for comment in LUT.comments:
@@ -79,6 +79,11 @@ class TestReadLUT(unittest.TestCase):
         )
         self.assertEqual(LUT_2[1].size, 4)
 
+        LUT_3 = read_LUT(
+            os.path.join(LUTS_DIRECTORY, 'resolve_cube', 'Demo.cube'))
+        np.testing.assert_array_equal(LUT_3.domain,
+                                      np.array([[0, 0, 0], [3, 3, 3]]))
+
     def test_raise_exception_read_LUT(self):
         """
         Tests :func:`colour.io.luts.__init__.read_LUT` definition raised
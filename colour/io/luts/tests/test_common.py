@@ -3,9 +3,11 @@
 Defines unit tests for :mod:`colour.io.luts.common` module.
 """
 
+import numpy as np
 import unittest
 
-from colour.io.luts.common import path_to_title
+from colour.io.luts.common import (parse_array, format_array_as_row,
+                                   split_table_data, path_to_title)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -14,7 +16,106 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestPathToTitle']
+__all__ = [
+    'TestParseArray', 'TestFormatArrayAsRow', 'TestSplitTableData',
+    'TestPathToTitle'
+]
+
+
+class TestParseArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_array` definition unit tests
+    methods.
+    """
+
+    def test_parse_array(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_array` definition.
+        """
+
+        np.testing.assert_equal(
+            parse_array('-0.25 0.5 0.75'), np.array([-0.25, 0.5, 0.75]))
+
+        np.testing.assert_equal(
+            parse_array(['-0.25', '0.5', '0.75']),
+            np.array([-0.25, 0.5, 0.75]))
+
+        np.testing.assert_equal(
+            parse_array('-0.25, 0.5, 0.75', separator=','),
+            np.array([-0.25, 0.5, 0.75]))
+
+        np.testing.assert_equal(
+            parse_array('0.0 0.5 1.0\n\n0.5 1.0 0.0\n').reshape([-1, 3]),
+            np.array([[0.0, 0.5, 1.0], [0.5, 1.0, 0.0]]))
+
+        self.assertEqual(parse_array('0 1 2', dtype=np.int_).dtype, np.int_)
+
+        np.testing.assert_equal(
+            parse_array('nan inf -inf'), np.array([np.nan, np.inf, -np.inf]))
+
+        self.assertEqual(parse_array('').size, 0)
+
+        self.assertRaises(ValueError, parse_array, '0.1 0.2 abc 0.4')
+
+        self.assertRaises(ValueError, parse_array, '0.1 0.2 1.5.3')
+
+        self.assertRaises(
+            ValueError, parse_array, '0.1, 0.2, abc', separator=',')
+
+
+class TestFormatArrayAsRow(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.format_array_as_row` definition unit
+    tests methods.
+    """
+
+    def test_format_array_as_row(self):
+        """
+        Tests :func:`colour.io.luts.common.format_array_as_row` definition.
+        """
+
+        self.assertEqual(
+            format_array_as_row([1.25, 2.5, 5.0], 5),
+            '1.25000 2.50000 5.00000')
+
+        self.assertEqual(
+            format_array_as_row([[1.25, 2.5], [5.0, 10.0]], 2, ', '),
+            '1.25, 2.50\n5.00, 10.00')
+
+        self.assertEqual(
+            format_array_as_row([[1, 2, 0.25], [3, 4, 0.5]], [0, 0, 3]),
+            '1 2 0.250\n3 4 0.500')
+
+
+class TestSplitTableData(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.split_table_data` definition unit
+    tests methods.
+    """
+
+    def test_split_table_data(self):
+        """
+        Tests :func:`colour.io.luts.common.split_table_data` definition.
+        """
+
+        lines, table = split_table_data(
+            'TITLE "Nemo"\n0.0 0.5 1.0\n  # Comment\n'
+            'LUT_1D_SIZE 2\n-0.5 1.0 0.0\n')
+        self.assertListEqual(lines,
+                             ['TITLE "Nemo"', '# Comment', 'LUT_1D_SIZE 2'])
+        np.testing.assert_equal(
+            parse_array(table), np.array([0.0, 0.5, 1.0, -0.5, 1.0, 0.0]))
+
+        self.assertTupleEqual(
+            split_table_data('0.0 0.5 1.0'), ([], '0.0 0.5 1.0'))
+
+        lines, table = split_table_data(
+            'LUT_3D_SIZE 2\nnan 0.5 1.0\ninf 1.0 0.0\nTITLED "Nemo"\n')
+        self.assertListEqual(lines, ['LUT_3D_SIZE 2'])
+        self.assertRaises(ValueError, parse_array, table)
+        np.testing.assert_equal(
+            parse_array(table.replace('TITLED "Nemo"', '')),
+            np.array([np.nan, 0.5, 1.0, np.inf, 1.0, 0.0]))
 
 
 class TestPathToTitle(unittest.TestCase):
@@ -489,6 +489,22 @@ class TestLUT(unittest.TestCase):
         np.testing.assert_almost_equal(
             LUT_3.apply(RANDOM_TRIPLETS), self._applied_3, decimal=7)
 
+        if self._LUT_factory in (LUT3x1D, LUT3D):
+            np.testing.assert_almost_equal(
+                LUT_3.apply(RANDOM_TRIPLETS, chunk_size=3),
+                self._applied_3,
+                decimal=7)
+
+            out = np.zeros(RANDOM_TRIPLETS.shape)
+            self.assertIs(
+                LUT_3.apply(RANDOM_TRIPLETS, chunk_size=3, out=out, workers=2),
+                out)
+            np.testing.assert_almost_equal(out, self._applied_3, decimal=7)
+
+            out = np.zeros(RANDOM_TRIPLETS.shape, order='F')
+            LUT_3.apply(RANDOM_TRIPLETS, out=out)
+            np.testing.assert_almost_equal(out, self._applied_3, decimal=7)
+
     def test_copy(self):
         """
         Tests :class:`colour.io.luts.lut.LUT1D.copy`,
@@ -828,7 +844,8 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__init__', '__getitem__', '__setitem__',
                             '__delitem__', '__len__', '__str__', '__repr__',
-                            '__eq__', '__ne__', 'insert', 'apply', 'copy')
+                            '__eq__', '__ne__', 'insert', 'apply', 'bake',
+                            'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1222,6 +1239,44 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+        out = np.zeros(RGB.shape)
+        LUT_sequence.apply(RGB, chunk_size=2, out=out, workers=2)
+        np.testing.assert_almost_equal(
+            out, LUT_sequence.apply(RGB), decimal=7)
+
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        LUT, error = self._LUT_sequence.bake(33)
+
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.size, 33)
+        self.assertAlmostEqual(error, 0.00127330, places=7)
+
+        RGB = RANDOM_TRIPLETS
+        np.testing.assert_allclose(
+            LUT.apply(RGB), self._LUT_sequence.apply(RGB), atol=5e-3)
+
+        domain = np.array([[0, 0, 0], [16, 16, 16]])
+        LUT_sequence = LUTSequence(
+            LUT3x1D(LUT3x1D.linear_table(16, domain) / 16, domain=domain),
+            self._LUT_2)
+
+        samples = np.linspace(0, 1, 64)
+        shaper = LUT1D(samples, domain=2 ** (-8 + 12 * samples))
+        LUT, error = LUT_sequence.bake(33, shaper=shaper)
+
+        self.assertIsInstance(LUT, LUTSequence)
+        self.assertIs(LUT[0], shaper)
+        self.assertIsInstance(LUT[1], LUT3D)
+        self.assertLess(error, 1e-2)
+
+        RGB = 2 ** (-8 + 12 * RANDOM_TRIPLETS)
+        np.testing.assert_allclose(
+            LUT.apply(RGB), LUT_sequence.apply(RGB), atol=1e-2)
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
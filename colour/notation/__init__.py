@@ -9,6 +9,7 @@ from .munsell import (munsell_value_Priest1920, munsell_value_Munsell1933,
                       munsell_value_Ladd1955, munsell_value_McCamy1987,
                       munsell_value_ASTMD1535)
 from .munsell import munsell_colour_to_xyY, xyY_to_munsell_colour
+from .munsell import LUT3D_Munsell
 from .hexadecimal import RGB_to_HEX, HEX_to_RGB
 
 __all__ = []
@@ -22,4 +23,5 @@ __all__ += [
     'munsell_value_ASTMD1535'
 ]
 __all__ += ['munsell_colour_to_xyY', 'xyY_to_munsell_colour']
+__all__ += ['LUT3D_Munsell']
 __all__ += ['RGB_to_HEX', 'HEX_to_RGB']
@@ -30,6 +30,9 @@ Defines various objects for *Munsell Renotation System* computations:
 -   :func:`colour.munsell_value`: *Munsell* value :math:`V` computation of
     given *luminance* :math:`Y` using given method.
 -   :func:`colour.munsell_colour_to_xyY`
+-   :class:`colour.notation.LUT3D_Munsell`: Pre-computed lookup table for
+    fast approximate *Munsell* *Colorlab* specification to *CIE xyY*
+    colourspace conversions.
 -   :func:`colour.xyY_to_munsell_colour`
 
 Notes
@@ -116,11 +119,10 @@ MunsellAndKubelkaMunkToolbox/MunsellAndKubelkaMunkToolbox.html
 
 import numpy as np
 import re
-from collections import OrderedDict
+import struct
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
-                            cartesian_to_cylindrical, euclidean_distance,
-                            polar_to_cartesian, spow)
+                            euclidean_distance, spow, table_interpolation)
 from colour.colorimetry import CCS_ILLUMINANTS, luminance_ASTMD1535
 from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
                               INTEGER_THRESHOLD, FLOATING_POINT_NUMBER_PATTERN)
@@ -128,10 +130,10 @@ from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
 from colour.utilities import (
-    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
+    CaseInsensitiveMapping, Lookup, as_float_array, as_int,
     as_numeric, domain_range_scale, from_range_1, from_range_10,
     get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
-    is_integer, is_numeric, tsplit, usage_warning)
+    is_integer, is_numeric, register_cache, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -154,7 +156,7 @@ __all__ = [
     'munsell_value_Ladd1955', 'munsell_value_McCamy1987',
     'munsell_value_ASTMD1535', 'MUNSELL_VALUE_METHODS', 'munsell_value',
     'munsell_specification_to_xyY', 'munsell_colour_to_xyY',
-    'xyY_to_munsell_specification', 'xyY_to_munsell_colour',
+    'LUT3D_Munsell', 'xyY_to_munsell_specification', 'xyY_to_munsell_colour',
     'parse_munsell_colour', 'is_grey_munsell_colour',
     'normalize_munsell_specification',
     'munsell_colour_to_munsell_specification',
@@ -194,9 +196,23 @@ ILLUMINANT_NAME_MUNSELL = 'C'
 CCS_ILLUMINANT_MUNSELL = (CCS_ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][ILLUMINANT_NAME_MUNSELL])
 
-_MUNSELL_SPECIFICATIONS_CACHE = None
-_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_VALUES_RENOTATION = np.array(
+    [0.2, 0.4, 0.6, 0.8, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+"""
+*Munsell* values of the *Munsell Renotation System* data.
+
+_MUNSELL_VALUES_RENOTATION : ndarray
+"""
+
+_CACHE_MUNSELL_SPECIFICATIONS = register_cache(
+    '{0}._CACHE_MUNSELL_SPECIFICATIONS'.format(__name__), maximum_size=1)
+_CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR = register_cache(
+    '{0}._CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR'.format(__name__),
+    maximum_size=1)
+_CACHE_MUNSELL_RENOTATION_INDEX = register_cache(
+    '{0}._CACHE_MUNSELL_RENOTATION_INDEX'.format(__name__), maximum_size=1)
+_CACHE_MUNSELL_RENOTATION_GRIDS = register_cache(
+    '{0}._CACHE_MUNSELL_RENOTATION_GRIDS'.format(__name__), maximum_size=1)
 
 
 def _munsell_specifications():
@@ -224,15 +240,16 @@ def _munsell_specifications():
         *Munsell Renotation System* specifications.
     """
 
-    global _MUNSELL_SPECIFICATIONS_CACHE
+    specifications = _CACHE_MUNSELL_SPECIFICATIONS.get('All')
 
-    if _MUNSELL_SPECIFICATIONS_CACHE is None:
-        _MUNSELL_SPECIFICATIONS_CACHE = np.array([
+    if specifications is None:
+        _CACHE_MUNSELL_SPECIFICATIONS['All'] = specifications = np.array([
             munsell_colour_to_munsell_specification(
                 MUNSELL_COLOUR_FORMAT.format(*colour[0]))
             for colour in MUNSELL_COLOURS_ALL
         ])
-    return _MUNSELL_SPECIFICATIONS_CACHE
+
+    return specifications
 
 
 def _munsell_value_ASTMD1535_interpolator():
@@ -246,44 +263,123 @@ def _munsell_value_ASTMD1535_interpolator():
         *Munsell* value interpolator for *ASTM D1535-08e1* method.
     """
 
-    global _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    interpolator = _CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR.get(
+        'ASTM D1535-08')
 
-    munsell_values = np.arange(0, 10, 0.001)
-    if _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE is None:
-        _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = Extrapolator(
+    if interpolator is None:
+        munsell_values = np.arange(0, 10, 0.001)
+        interpolator = Extrapolator(
             LinearInterpolator(
                 luminance_ASTMD1535(munsell_values), munsell_values))
+        _CACHE_MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR['ASTM D1535-08'] = (
+            interpolator)
 
-    return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
+    return interpolator
 
 
-def _munsell_maximum_chromas_from_renotation():
+def _munsell_renotation_index():
     """
-    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
-    and caches them if not existing.
+    Returns the *Munsell Renotation System* data index and caches it if not
+    existing.
+
+    The index is a hash map of the *CIE xyY* colourspace vectors keyed by
+    *Munsell* *Colorlab* specification, i.e. (hue, value, chroma, code):
+
+    {(2.5, 0.2, 2.0, 4.0): array([ 0.713,  1.414,  0.237]),
+     (5.0, 0.2, 2.0, 4.0): array([ 0.449,  1.145,  0.237]),
+     ...,}
+
+    Returns
+    -------
+    dict
+        *CIE xyY* colourspace vectors hash map.
+    """
+
+    index = _CACHE_MUNSELL_RENOTATION_INDEX.get('All')
+
+    if index is None:
+        index = {}
+        specifications = _munsell_specifications()
+        for i, munsell_colour in enumerate(MUNSELL_COLOURS_ALL):
+            index[tuple(float(j) for j in specifications[i])] = (
+                munsell_colour[1])
+
+        _CACHE_MUNSELL_RENOTATION_INDEX['All'] = index
+
+    return index
+
+
+def _munsell_renotation_grids():
+    """
+    Returns the *Munsell Renotation System* data *CIE xyY* colourspace values
+    and maximum *Munsell* chromas as dense grids and caches them if not
+    existing.
+
+    The grids are indexed by specification code, hue, value and chroma for the
+    *CIE xyY* colourspace values grid, i.e. :math:`[code - 1, hue / 2.5 - 1,
+    i_{value}, chroma / 2 - 1]` where :math:`i_{value}` is the index of the
+    value in :attr:`colour.notation.munsell._MUNSELL_VALUES_RENOTATION`
+    attribute, missing data being represented with *nan*.
 
     Returns
     -------
     tuple
-        Maximum *Munsell* chromas.
+        *CIE xyY* colourspace values grid of shape (10, 4, 14, 25, 3) and
+        maximum *Munsell* chromas grid of shape (10, 4, 14).
+    """
+
+    grids = _CACHE_MUNSELL_RENOTATION_GRIDS.get('All')
+
+    if grids is None:
+        xyY_index = _munsell_renotation_index()
+        specifications = as_float_array(list(xyY_index.keys()))
+        xyY = as_float_array(list(xyY_index.values()))
+
+        hue, value, chroma, code = tsplit(specifications)
+
+        indexes = tuple(
+            as_int(a) for a in (code - 1, hue / 2.5 - 1,
+                                _munsell_renotation_value_index(value),
+                                chroma / 2 - 1))
+
+        xyY_grid = np.full(
+            [10, 4, len(_MUNSELL_VALUES_RENOTATION), 25, 3], np.nan)
+        xyY_grid[indexes] = xyY
+
+        chroma_grid = np.arange(2, 52, 2) * np.ones(xyY_grid.shape[:-1])
+        chroma_grid[np.isnan(xyY_grid[..., 0])] = np.nan
+        maximum_chromas_grid = np.fmax.reduce(chroma_grid, axis=-1)
+
+        _CACHE_MUNSELL_RENOTATION_GRIDS['All'] = grids = (xyY_grid,
+                                                          maximum_chromas_grid)
+
+    return grids
+
+
+def _munsell_renotation_value_index(value):
     """
+    Returns the index of given *Munsell* values in
+    :attr:`colour.notation.munsell._MUNSELL_VALUES_RENOTATION` attribute, the
+    values not in *Munsell Renotation System* data being indexed with *nan*.
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    Parameters
+    ----------
+    value : array_like
+        *Munsell* value.
 
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
-            index = (hue, value, code)
-            if index in chromas:
-                chroma = max(chromas[index], chroma)
+    Returns
+    -------
+    ndarray
+        *Munsell* value index.
+    """
+
+    value = as_float_array(value)
 
-            chromas[index] = chroma
+    index = np.searchsorted(_MUNSELL_VALUES_RENOTATION, value)
+    is_renotation_value = _MUNSELL_VALUES_RENOTATION[np.minimum(
+        index, len(_MUNSELL_VALUES_RENOTATION) - 1)] == value
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    return np.where(is_renotation_value, index, np.nan)
 
 
 def munsell_value_Priest1920(Y):
@@ -727,73 +823,118 @@ def _domain_range_scale_factor():
     return np.array([10, 10, 50 if get_domain_range_scale() == '1' else 2, 10])
 
 
-def _munsell_specification_to_xyY(specification):
+def _linear_interpolation_vectorised(x, x_0, x_1, y_0, y_1):
     """
-    Converts given *Munsell* *Colorlab* specification to *CIE xyY* colourspace.
-
+    Linearly interpolates given points between given per-element
+    :math:`(x_0, y_0)` and :math:`(x_1, y_1)` points as
+    :class:`colour.LinearInterpolator` class would, i.e. using the same
+    expression than :func:`np.interp` definition.
 
     Parameters
     ----------
-    specification : array_like
-        *Munsell* *Colorlab* specification.
+    x : array_like
+        Points to interpolate at.
+    x_0 : array_like
+        Lower independent variable values.
+    x_1 : array_like
+        Upper independent variable values.
+    y_0 : array_like
+        Lower dependent variable values.
+    y_1 : array_like
+        Upper dependent variable values.
 
     Returns
     -------
     ndarray
-        *CIE xyY* colourspace array.
+        Interpolated values.
+
+    Raises
+    ------
+    ValueError
+        If any of the points is outside its interpolation range.
     """
 
-    specification = normalize_munsell_specification(specification)
+    x, x_0, x_1, y_0, y_1 = (as_float_array(a)
+                             for a in (x, x_0, x_1, y_0, y_1))
 
-    if is_grey_munsell_colour(specification):
-        specification = as_float_array(to_domain_10(specification))
-        hue, value, chroma, code = specification
-    else:
-        specification = to_domain_10(specification,
-                                     _domain_range_scale_factor())
-        hue, value, chroma, code = ([as_float(i) for i in specification[0:3]] +
-                                    [DEFAULT_INT_DTYPE(specification[-1])])
+    if np.any(x < x_0):
+        raise ValueError('"{0}" is below interpolation range.'.format(
+            x[x < x_0]))
 
-        assert 0 <= hue <= 10, (
-            '"{0}" specification hue must be normalised to domain '
-            '[0, 10]!'.format(specification))
-        assert 0 <= value <= 10, (
-            '"{0}" specification value must be normalised to domain '
-            '[0, 10]!'.format(specification))
+    if np.any(x > x_1):
+        raise ValueError('"{0}" is above interpolation range.'.format(
+            x[x > x_1]))
+
+    y = (y_1 - y_0) / (x_1 - x_0) * (x - x_0) + y_0
+
+    return np.where(x == x_1, y_1, y)
+
+
+def _munsell_specification_to_xyY_vectorised(specification):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xyY*
+    colourspace, the grey specifications are expected to have a zero chroma
+    or *nan* hue, chroma and code.
+
+    Parameters
+    ----------
+    specification : array_like, (n, 4)
+        *Munsell* *Colorlab* specifications.
+
+    Returns
+    -------
+    ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+    """
+
+    hue, value, chroma, code = tsplit(specification)
+
+    # "0YR" is equivalent to "10R".
+    is_zero_hue = hue == 0
+    code = np.copy(code)
+    code[is_zero_hue] = (code[is_zero_hue] + 1) % 10
+    hue = np.where(is_zero_hue, 10, hue)
+
+    is_grey = np.logical_or(
+        np.all(np.isnan([hue, chroma, code]), axis=0), chroma == 0)
+
+    assert np.all(np.logical_and(0 <= hue, hue <= 10)[~is_grey]), (
+        '"{0}" specification hue must be normalised to domain '
+        '[0, 10]!'.format(specification))
+    assert np.all(np.logical_and(0 <= value, value <= 10)[~is_grey]), (
+        '"{0}" specification value must be normalised to domain '
+        '[0, 10]!'.format(specification))
 
     with domain_range_scale('ignore'):
         Y = luminance_ASTMD1535(value)
 
-    if is_integer(value):
-        value_minus = value_plus = round(value)
-    else:
-        value_minus = np.floor(value)
-        value_plus = value_minus + 1
-
-    specification_minus = (value_minus if is_grey_munsell_colour(specification)
-                           else (hue, value_minus, chroma, code))
-    x_minus, y_minus = munsell_specification_to_xy(specification_minus)
-
-    plus_specification = (value_plus
-                          if (is_grey_munsell_colour(specification) or
-                              value_plus == 10) else (hue, value_plus, chroma,
-                                                      code))
-    x_plus, y_plus = munsell_specification_to_xy(plus_specification)
-
-    if value_minus == value_plus:
-        x = x_minus
-        y = y_minus
-    else:
-        with domain_range_scale('ignore'):
-            Y_minus = luminance_ASTMD1535(value_minus)
-            Y_plus = luminance_ASTMD1535(value_plus)
+    is_integer_value = is_integer(value)
+    value_minus = np.where(is_integer_value, np.around(value),
+                           np.floor(value))
+    value_plus = np.where(is_integer_value, value_minus, value_minus + 1)
+
+    xy_minus = np.tile(CCS_ILLUMINANT_MUNSELL, hue.shape + (1, ))
+    xy_minus[~is_grey] = _munsell_specification_to_xy_vectorised(
+        hue[~is_grey], value_minus[~is_grey], chroma[~is_grey],
+        code[~is_grey])
+
+    xy_plus = np.tile(CCS_ILLUMINANT_MUNSELL, hue.shape + (1, ))
+    is_chromatic = np.logical_and(~is_grey, value_plus != 10)
+    xy_plus[is_chromatic] = _munsell_specification_to_xy_vectorised(
+        hue[is_chromatic], value_plus[is_chromatic], chroma[is_chromatic],
+        code[is_chromatic])
+
+    xy = xy_minus
+    interpolate = value_minus != value_plus
+    with domain_range_scale('ignore'):
+        Y_minus = luminance_ASTMD1535(value_minus[interpolate])
+        Y_plus = luminance_ASTMD1535(value_plus[interpolate])
 
-        x = LinearInterpolator(
-            np.ravel([Y_minus, Y_plus]), np.ravel([x_minus, x_plus]))(Y)
-        y = LinearInterpolator(
-            np.ravel([Y_minus, Y_plus]), np.ravel([y_minus, y_plus]))(Y)
+    xy[interpolate] = _linear_interpolation_vectorised(
+        Y[interpolate, np.newaxis], Y_minus[..., np.newaxis],
+        Y_plus[..., np.newaxis], xy_minus[interpolate], xy_plus[interpolate])
 
-    return np.array([x, y, from_range_1(Y / 100)])
+    return tstack([xy[..., 0], xy[..., 1], Y / 100])
 
 
 def munsell_specification_to_xyY(specification):
@@ -845,17 +986,19 @@ def munsell_specification_to_xyY(specification):
     array([ 0.31006  ,  0.31616  ,  0.7461345...])
     """
 
-    specification = as_float_array(specification)
+    specification = to_domain_10(specification, _domain_range_scale_factor())
     shape = list(specification.shape)
 
-    xyY = [
-        _munsell_specification_to_xyY(a)
-        for a in specification.reshape([-1, 4])
-    ]
+    hue, value, chroma, code = tsplit(np.reshape(specification, [-1, 4]))
+
+    with domain_range_scale('ignore'):
+        x, y, Y = tsplit(
+            _munsell_specification_to_xyY_vectorised(
+                tstack([hue, value, chroma, np.trunc(code)])))
 
     shape[-1] = 3
 
-    return as_float_array(xyY).reshape(shape)
+    return np.reshape(tstack([x, y, from_range_1(Y)]), shape)
 
 
 def munsell_colour_to_xyY(munsell_colour):
@@ -906,19 +1049,502 @@ def munsell_colour_to_xyY(munsell_colour):
             specification.reshape(shape + [4]), _domain_range_scale_factor()))
 
 
+def _munsell_specification_to_xyY_in_renotation(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications components to *CIE xyY*
+    colourspace, the specifications outside the *Munsell Renotation System*
+    data, i.e. whose value is outside domain [1, 10] or whose chroma exceeds
+    the maximum chroma, are converted to *nan*.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *CIE xyY* colourspace arrays.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
+
+    is_defined = np.logical_and.reduce([
+        0 <= hue, hue <= 10, 1 <= value, value <= 10, 0 <= chroma,
+        np.isin(code, np.arange(1, 11))
+    ])
+
+    maximum_chroma = np.zeros(hue.shape)
+    maximum_chroma[is_defined] = _maximum_chroma_from_renotation_vectorised(
+        hue[is_defined], value[is_defined], code[is_defined])
+    is_defined = np.logical_and(is_defined, chroma <= maximum_chroma)
+
+    xyY = np.full(hue.shape + (3, ), np.nan)
+    with domain_range_scale('ignore'):
+        xyY[is_defined] = _munsell_specification_to_xyY_vectorised(
+            tstack([hue, value, chroma, code])[is_defined])
+
+    return xyY
+
+
+class LUT3D_Munsell:
+    """
+    Class for working with pre-computed lookup tables for the conversion of
+    *Munsell* *Colorlab* specifications to *CIE xyY* colourspace. It allows
+    significant time savings by drawing the *Munsell Renotation System* data
+    ovoids ahead of time and interpolating the results stored in a table.
+
+    The table is sampled on a regular grid over the *ASTM* hue in domain
+    [0, 100], the *Munsell* value in domain [1, 10] and the *Munsell* chroma in
+    domain [0, 50], the default sizes placing the table vertices on the
+    *Munsell Renotation System* data hues, integer values and even chromas.
+    The entries outside the *Munsell Renotation System* data are *nan* and the
+    specifications whose interpolation involves any of them are converted
+    with the exact method, so are the specifications outside the table domain.
+    The *CIE xyY* colourspace :math:`Y` luminance is always computed exactly
+    with the *ASTM D1535-08e1* method.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.notation.LUT3D_Munsell.size`
+    -   :attr:`~colour.notation.LUT3D_Munsell.table`
+    -   :attr:`~colour.notation.LUT3D_Munsell.maximum_error`
+
+    Methods
+    -------
+    -   :meth:`~colour.notation.LUT3D_Munsell.__init__`
+    -   :meth:`~colour.notation.LUT3D_Munsell.generate`
+    -   :meth:`~colour.notation.LUT3D_Munsell.error`
+    -   :meth:`~colour.notation.LUT3D_Munsell.munsell_specification_to_xyY`
+    -   :meth:`~colour.notation.LUT3D_Munsell.munsell_colour_to_xyY`
+    -   :meth:`~colour.notation.LUT3D_Munsell.read`
+    -   :meth:`~colour.notation.LUT3D_Munsell.write`
+
+    Examples
+    --------
+    >>> import os
+    >>> import colour
+    >>> LUT = LUT3D_Munsell()
+    >>> LUT.generate()
+    >>> LUT.maximum_error  # doctest: +ELLIPSIS
+    0.0024...
+    >>> path = os.path.join(colour.__path__[0], 'notation', 'tests',
+    ...                     'resources', 'Munsell.lut')
+    >>> LUT.write(path)  # doctest: +SKIP
+    >>> LUT.read(path)  # doctest: +SKIP
+    >>> LUT.munsell_colour_to_xyY('4.2YR 8.1/5.3')  # doctest: +ELLIPSIS
+    array([ 0.3873...,  0.3575...,  0.59362   ])
+    """
+
+    def __init__(self):
+        self._size = None
+        self._table = None
+        self._maximum_error = None
+
+    @property
+    def size(self):
+        """
+        Getter property for the lookup table size, i.e. the samples count on
+        the *ASTM* hue, *Munsell* value and *Munsell* chroma axes.
+
+        Returns
+        -------
+        tuple
+            Lookup table size.
+        """
+
+        return self._size
+
+    @property
+    def table(self):
+        """
+        Getter property for the lookup table *CIE xyY* colourspace values.
+
+        Returns
+        -------
+        ndarray
+            Lookup table *CIE xyY* colourspace values.
+        """
+
+        return self._table
+
+    @property
+    def maximum_error(self):
+        """
+        Getter property for the lookup table maximum error, i.e. the maximum
+        euclidean distance between the *CIE xy* chromaticity coordinates
+        trilinearly interpolated at the table cells centres and those of the
+        exact method.
+
+        Returns
+        -------
+        numeric
+            Lookup table maximum error.
+        """
+
+        return self._maximum_error
+
+    @staticmethod
+    def _table_coordinates(hue, value, chroma, code):
+        """
+        Returns the normalised table coordinates of given *Munsell*
+        *Colorlab* specifications components and whether they are within the
+        table domain.
+        """
+
+        ASTM_hue = np.reshape(hue_to_ASTM_hue(hue, code), np.shape(hue))
+
+        coordinates = tstack([ASTM_hue / 100, (value - 1) / 9, chroma / 50])
+        is_within_domain = np.logical_and.reduce([
+            0 <= hue, hue <= 10,
+            np.isin(code, np.arange(1, 11)),
+            np.all(coordinates >= 0, axis=-1),
+            np.all(coordinates <= 1, axis=-1)
+        ])
+
+        return coordinates, is_within_domain
+
+    def generate(self, size=(161, 37, 51)):
+        """
+        Generates the lookup table by converting the *Munsell* *Colorlab*
+        specifications at its vertices with the exact method and computes its
+        maximum error.
+
+        Parameters
+        ----------
+        size : array_like, optional
+            Samples count on the *ASTM* hue, *Munsell* value and *Munsell*
+            chroma axes.
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate((41, 10, 26))
+        >>> LUT.table.shape
+        (41, 10, 26, 3)
+        """
+
+        self._size = tuple(int(i) for i in size)
+
+        ASTM_hue, value, chroma = np.meshgrid(
+            np.linspace(0, 100, self._size[0]),
+            np.linspace(1, 10, self._size[1]),
+            np.linspace(0, 50, self._size[2]),
+            indexing='ij')
+        hue, code = tsplit(_ASTM_hue_to_hue(ASTM_hue))
+
+        self._table = _munsell_specification_to_xyY_in_renotation(
+            hue, value, chroma, code)
+
+        self._maximum_error = self.error()
+
+    def error(self, specification=None, method='Trilinear'):
+        """
+        Returns the maximum euclidean distance between the *CIE xy*
+        chromaticity coordinates interpolated from the lookup table and those
+        of the exact method for given *Munsell* *Colorlab* specifications.
+
+        Parameters
+        ----------
+        specification : array_like, optional
+            *Munsell* *Colorlab* specifications, the table cells centres are
+            used if not given. The specifications outside the
+            *Munsell Renotation System* data are ignored.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        numeric
+            Maximum error.
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate((41, 10, 26))
+        >>> LUT.error(np.array([4.2, 8.1, 5.3, 6]))  # doctest: +ELLIPSIS
+        0.0001876...
+        """
+
+        if specification is None:
+            ASTM_hue, value, chroma = np.meshgrid(
+                *[(a[1:] + a[:-1]) / 2 for a in (
+                    np.linspace(0, 100, self._size[0]),
+                    np.linspace(1, 10, self._size[1]),
+                    np.linspace(0, 50, self._size[2]))],
+                indexing='ij')
+            hue, code = tsplit(_ASTM_hue_to_hue(ASTM_hue))
+        else:
+            hue, value, chroma, code = tsplit(
+                np.reshape(as_float_array(specification), [-1, 4]))
+
+        hue, value, chroma, code = [
+            np.ravel(a) for a in (hue, value, chroma, code)
+        ]
+
+        coordinates, is_within_domain = self._table_coordinates(
+            hue, value, chroma, code)
+
+        xy_e = _munsell_specification_to_xyY_in_renotation(
+            hue, value, chroma, code)[..., 0:2]
+        xy_i = table_interpolation(coordinates, self._table,
+                                   method)[..., 0:2]
+
+        is_compared = np.logical_and.reduce([
+            is_within_domain,
+            np.all(np.isfinite(xy_e), axis=-1),
+            np.all(np.isfinite(xy_i), axis=-1)
+        ])
+
+        if not np.any(is_compared):
+            return np.nan
+
+        return np.max(
+            euclidean_distance(xy_e[is_compared], xy_i[is_compared]))
+
+    def munsell_specification_to_xyY(self, specification, method='Trilinear'):
+        """
+        Converts given *Munsell* *Colorlab* specifications to *CIE xyY*
+        colourspace by interpolating the lookup table.
+
+        Parameters
+        ----------
+        specification : array_like
+            *Munsell* *Colorlab* specifications.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        ndarray
+            *CIE xyY* colourspace array.
+
+        Raises
+        ------
+        ValueError
+            If any of the given specifications is outside the
+            *Munsell Renotation System* data.
+
+        Notes
+        -----
+
+        +-------------------+-----------------------+---------------+
+        | **Domain**        | **Scale - Reference** | **Scale - 1** |
+        +===================+=======================+===============+
+        | ``specification`` | ``hue`` : [0, 10]     | [0, 1]        |
+        |                   |                       |               |
+        |                   | ``value`` : [0, 10]   | [0, 1]        |
+        |                   |                       |               |
+        |                   | ``chroma`` : [0, 50]  | [0, 1]        |
+        |                   |                       |               |
+        |                   | ``code`` : [0, 10]    | [0, 1]        |
+        +-------------------+-----------------------+---------------+
+
+        +-----------+-----------------------+---------------+
+        | **Range** | **Scale - Reference** | **Scale - 1** |
+        +===========+=======================+===============+
+        | ``xyY``   | [0, 1]                | [0, 1]        |
+        +-----------+-----------------------+---------------+
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate()
+        >>> LUT.munsell_specification_to_xyY(np.array([2.1, 8.0, 17.9, 4]))
+        ... # doctest: +ELLIPSIS
+        array([ 0.440...,  0.552...,  0.5761962...])
+        """
+
+        specification = as_float_array(specification)
+        shape = list(specification.shape)
+
+        hue, value, chroma, code = tsplit(
+            to_domain_10(specification,
+                         _domain_range_scale_factor()).reshape([-1, 4]))
+
+        with domain_range_scale('ignore'):
+            Y = luminance_ASTMD1535(value)
+
+        xy = np.tile(CCS_ILLUMINANT_MUNSELL, value.shape + (1, ))
+
+        is_grey = np.logical_or(
+            np.all(np.isnan([hue, chroma, code]), axis=0), chroma == 0)
+
+        coordinates = np.zeros(value.shape + (3, ))
+        is_within_domain = np.zeros(value.shape, dtype=np.bool_)
+        coordinates[~is_grey], is_within_domain[~is_grey] = (
+            self._table_coordinates(hue[~is_grey], value[~is_grey],
+                                    chroma[~is_grey], code[~is_grey]))
+        is_interpolated = np.logical_and(~is_grey, is_within_domain)
+
+        xy[is_interpolated] = table_interpolation(
+            coordinates[is_interpolated], self._table, method)[..., 0:2]
+
+        # The specifications outside the table domain or close to the
+        # "Munsell Renotation System" data boundaries are converted with the
+        # exact method, the latter raising for the invalid specifications.
+        maximum_chroma = np.zeros(value.shape)
+        maximum_chroma[is_interpolated] = (
+            _maximum_chroma_from_renotation_vectorised(
+                hue[is_interpolated], value[is_interpolated],
+                code[is_interpolated]))
+        is_exact = np.logical_and(~is_grey, np.logical_or.reduce([
+            ~is_within_domain, chroma > maximum_chroma,
+            np.any(np.isnan(xy), axis=-1)
+        ]))
+        with domain_range_scale('ignore'):
+            xy[is_exact] = _munsell_specification_to_xyY_vectorised(
+                tstack([hue, value, chroma, code])[is_exact])[..., 0:2]
+
+        shape[-1] = 3
+
+        return tstack([xy[..., 0], xy[..., 1],
+                       from_range_1(Y / 100)]).reshape(shape)
+
+    def munsell_colour_to_xyY(self, munsell_colour, method='Trilinear'):
+        """
+        Converts given *Munsell* colours to *CIE xyY* colourspace by
+        interpolating the lookup table.
+
+        Parameters
+        ----------
+        munsell_colour : unicode or array_like
+            *Munsell* colours.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        ndarray
+            *CIE xyY* colourspace array.
+
+        Raises
+        ------
+        ValueError
+            If any of the given *Munsell* colours is outside the
+            *Munsell Renotation System* data.
+
+        Notes
+        -----
+
+        +-----------+-----------------------+---------------+
+        | **Range** | **Scale - Reference** | **Scale - 1** |
+        +===========+=======================+===============+
+        | ``xyY``   | [0, 1]                | [0, 1]        |
+        +-----------+-----------------------+---------------+
+
+        Examples
+        --------
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate()
+        >>> LUT.munsell_colour_to_xyY('4.2YR 8.1/5.3')  # doctest: +ELLIPSIS
+        array([ 0.3873...,  0.3575...,  0.59362   ])
+        >>> LUT.munsell_colour_to_xyY('N8.9')  # doctest: +ELLIPSIS
+        array([ 0.31006  ,  0.31616  ,  0.7461345...])
+        """
+
+        munsell_colour = np.array(munsell_colour)
+        shape = list(munsell_colour.shape)
+
+        specification = np.array([
+            munsell_colour_to_munsell_specification(a)
+            for a in np.ravel(munsell_colour)
+        ])
+
+        return self.munsell_specification_to_xyY(
+            from_range_10(
+                specification.reshape(shape + [4]),
+                _domain_range_scale_factor()), method)
+
+    def read(self, path):
+        """
+        Loads the lookup table from a file.
+
+        Parameters
+        ----------
+        path : unicode
+            Path to the file.
+
+        Examples
+        --------
+        >>> import os
+        >>> import colour
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate((41, 10, 26))
+        >>> path = os.path.join(colour.__path__[0], 'notation', 'tests',
+        ...                     'resources', 'Munsell.lut')
+        >>> LUT.write(path)  # doctest: +SKIP
+        >>> LUT.read(path)  # doctest: +SKIP
+        """
+
+        with open(path, 'rb') as lut_file:
+            if lut_file.read(4).decode('ISO-8859-1') != 'MNSL':
+                raise ValueError(
+                    'Bad magic number, this is likely not the right file type!'
+                )
+
+            self._size = struct.unpack('3i', lut_file.read(12))
+            self._maximum_error = np.fromfile(
+                lut_file, count=1, dtype=np.float64)[0]
+            self._table = np.fromfile(
+                lut_file, count=int(np.prod(self._size)) * 3,
+                dtype=np.float64).reshape(list(self._size) + [3])
+
+    def write(self, path):
+        """
+        Writes the lookup table to a file.
+
+        Parameters
+        ----------
+        path : unicode
+            Path to the file.
+
+        Examples
+        --------
+        >>> import os
+        >>> import colour
+        >>> LUT = LUT3D_Munsell()
+        >>> LUT.generate((41, 10, 26))
+        >>> path = os.path.join(colour.__path__[0], 'notation', 'tests',
+        ...                     'resources', 'Munsell.lut')
+        >>> LUT.write(path)  # doctest: +SKIP
+        >>> LUT.read(path)  # doctest: +SKIP
+        """
+
+        with open(path, 'wb') as lut_file:
+            lut_file.write(b'MNSL')
+            lut_file.write(struct.pack('3i', *self._size))
+            np.float64(self._maximum_error).tofile(lut_file)
+            np.float64(self._table).tofile(lut_file)
+
+
 def _xyY_to_munsell_specification(xyY):
     """
     Converts from *CIE xyY* colourspace to *Munsell* *Colorlab* specification.
 
+    The iterative hue and chroma refinements are performed on all the given
+    *CIE xyY* colourspace arrays at once, the converged arrays being removed
+    from the subsequent iterations.
+
     Parameters
     ----------
-    xyY : array_like
-        *CIE xyY* colourspace array.
+    xyY : array_like, (n, 3)
+        *CIE xyY* colourspace arrays.
 
     Returns
     -------
-    ndarray
-        *Munsell* *Colorlab* specification.
+    ndarray, (n, 4)
+        *Munsell* *Colorlab* specifications.
 
     Raises
     ------
@@ -930,226 +1556,251 @@ def _xyY_to_munsell_specification(xyY):
         a result.
     """
 
+    xyY = as_float_array(xyY)
+
     x, y, Y = tsplit(xyY)
     Y = to_domain_1(Y)
 
-    if not is_within_macadam_limits(xyY, ILLUMINANT_NAME_MUNSELL):
+    is_within_limits = is_within_macadam_limits(xyY, ILLUMINANT_NAME_MUNSELL)
+    if not np.all(is_within_limits):
         usage_warning('"{0}" is not within "MacAdam" limits for illuminant '
-                      '"{1}"!'.format(xyY, ILLUMINANT_NAME_MUNSELL))
+                      '"{1}"!'.format(xyY[~is_within_limits],
+                                      ILLUMINANT_NAME_MUNSELL))
 
     with domain_range_scale('ignore'):
-        value = munsell_value_ASTMD1535(Y * 100)
+        value = np.reshape(munsell_value_ASTMD1535(Y * 100), Y.shape)
 
-    if is_integer(value):
-        value = round(value)
+    value = np.where(is_integer(value), np.around(value), value)
 
-    with domain_range_scale('ignore'):
-        x_center, y_center, Y_center = _munsell_specification_to_xyY(value)
+    # The grey specifications *CIE xy* chromaticity coordinates are those of
+    # the *Munsell Renotation System* illuminant.
+    x_center, y_center = CCS_ILLUMINANT_MUNSELL
 
-    rho_input, phi_input, _z_input = cartesian_to_cylindrical(
-        (x - x_center, y - y_center, Y_center))
-    phi_input = np.degrees(phi_input)
+    rho_input = np.hypot(x - x_center, y - y_center)
+    phi_input = np.degrees(np.arctan2(y - y_center, x - x_center))
+
+    specification = tstack([
+        np.full(value.shape, np.nan), value,
+        np.full(value.shape, np.nan),
+        np.full(value.shape, np.nan)
+    ])
 
     grey_threshold = 1e-7
-    if rho_input < grey_threshold:
-        return from_range_10(normalize_munsell_specification(value))
+    is_chromatic = ~(rho_input < grey_threshold)
 
-    X, Y, Z = xyY_to_XYZ([x, y, Y])
+    X, Y, Z = tsplit(xyY_to_XYZ(tstack([x, y, Y])))
     xi, yi = CCS_ILLUMINANT_MUNSELL
-    Xr, Yr, Zr = xyY_to_XYZ([xi, yi, Y])
+    Xr, Yr, Zr = tsplit(
+        xyY_to_XYZ(tstack([np.full(Y.shape, xi),
+                           np.full(Y.shape, yi), Y])))
 
-    XYZ = np.array([X, Y, Z])
-    XYZr = np.array([(1 / Yr) * Xr, 1, (1 / Yr) * Zr])
+    XYZ = tstack([X, Y, Z])
+    XYZr = tstack([(1 / Yr) * Xr, np.ones(Yr.shape), (1 / Yr) * Zr])
 
     Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
-    LCHab = Lab_to_LCHab(Lab)
-    hue_initial, _value_initial, chroma_initial, code_initial = (
+    LCHab = np.reshape(Lab_to_LCHab(Lab), xyY.shape)
+    hue_initial, _value_initial, chroma_initial, code_initial = tsplit(
         LCHab_to_munsell_specification(LCHab))
-    specification_current = [
-        hue_initial, value, (5 / 5.5) * chroma_initial, code_initial
-    ]
 
-    convergence_threshold = 1e-7
-    iterations_maximum = 64
-    iterations = 0
+    indexes = np.arange(value.size)[is_chromatic]
+    x, y, value, rho_input, phi_input = (
+        a[is_chromatic] for a in (x, y, value, rho_input, phi_input))
+    hue_current = hue_initial[is_chromatic]
+    chroma_current = (5 / 5.5) * chroma_initial[is_chromatic]
+    code_current = code_initial[is_chromatic]
 
-    while iterations <= iterations_maximum:
-        iterations += 1
+    def polar_from_specification(hue, value, chroma, code):
+        """
+        Converts given specifications components to polar coordinates about
+        the grey specifications *CIE xy* chromaticity coordinates.
+        """
 
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
+        with domain_range_scale('ignore'):
+            x_s, y_s, _Y_s = tsplit(
+                _munsell_specification_to_xyY_vectorised(
+                    tstack([hue, value, chroma, code])))
 
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        return (np.hypot(x_s - x_center, y_s - y_center),
+                np.degrees(np.arctan2(y_s - y_center, x_s - x_center)))
+
+    def phi_difference(phi, phi_input):
+        """
+        Returns the difference between given angles and given input angles
+        wrapped to domain [-180, 180].
+        """
+
+        phi_difference = (360 - phi_input + phi) % 360
+
+        return np.where(phi_difference > 180, phi_difference - 360,
+                        phi_difference)
+
+    def has_converged(x, y, hue, value, chroma, code):
+        """
+        Returns whether given specifications components are close enough to
+        given *CIE xy* chromaticity coordinates.
+        """
+
+        convergence_threshold = 1e-7
 
         with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+            x_s, y_s, _Y_s = tsplit(
+                _munsell_specification_to_xyY_vectorised(
+                    tstack([hue, value, chroma, code])))
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-        phi_current = np.degrees(phi_current)
-        phi_current_difference = (360 - phi_input + phi_current) % 360
-        if phi_current_difference > 180:
-            phi_current_difference -= 360
+        return euclidean_distance(
+            tstack([x, y]), tstack([x_s, y_s])) < convergence_threshold
 
-        phi_differences = [phi_current_difference]
-        hue_angles = [hue_angle_current]
-        hue_angles_differences = [0]
+    iterations_maximum = 64
+    iterations = 0
 
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        extrapolate = False
+    while iterations <= iterations_maximum and indexes.size != 0:
+        iterations += 1
 
-        while np.sign(min(phi_differences)) == np.sign(
-                max(phi_differences)) and extrapolate is False:
-            iterations_inner += 1
+        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
 
-            if iterations_inner > iterations_maximum_inner:
-                # NOTE: This exception is likely never raised in practice:
-                # 300K iterations with random numbers never reached this code
-                # path, it is kept for consistency with the reference
-                # implementation.
-                raise RuntimeError(  # pragma: no cover
-                    ('Maximum inner iterations count reached without '
-                     'convergence!'))
-
-            hue_angle_inner = ((hue_angle_current + iterations_inner *
-                                (phi_input - phi_current)) % 360)
-            hue_angle_difference_inner = (
-                iterations_inner * (phi_input - phi_current) % 360)
-            if hue_angle_difference_inner > 180:
-                hue_angle_difference_inner -= 360
-
-            hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = _munsell_specification_to_xyY(
-                    (hue_inner, value, chroma_current, code_inner))
-
-            if len(phi_differences) >= 2:
-                extrapolate = True
-
-            if extrapolate is False:
-                rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                    (x_inner - x_center, y_inner - y_center, Y_center))
-                phi_inner = np.degrees(phi_inner)
-                phi_inner_difference = ((360 - phi_input + phi_inner) % 360)
-                if phi_inner_difference > 180:
-                    phi_inner_difference -= 360
-
-                phi_differences.append(phi_inner_difference)
-                hue_angles.append(hue_angle_inner)
-                hue_angles_differences.append(hue_angle_difference_inner)
-
-        phi_differences = np.array(phi_differences)
-        hue_angles_differences = np.array(hue_angles_differences)
-
-        phi_differences_indexes = phi_differences.argsort()
-
-        phi_differences = phi_differences[phi_differences_indexes]
-        hue_angles_differences = (
-            hue_angles_differences[phi_differences_indexes])
-
-        hue_angle_difference_new = Extrapolator(
-            LinearInterpolator(phi_differences,
-                               hue_angles_differences))(0) % 360
+        chroma_maximum = _maximum_chroma_from_renotation_vectorised(
+            hue_current, value, code_current)
+        chroma_current = np.where(chroma_current > chroma_maximum,
+                                  chroma_maximum, chroma_current)
+
+        _rho_current, phi_current = polar_from_specification(
+            hue_current, value, chroma_current, code_current)
+        phi_current_difference = phi_difference(phi_current, phi_input)
+
+        # The hue angle is refined by linearly interpolating or extrapolating
+        # the hue angle differences at the input angle from the current
+        # specification and a specification rotated by the angle difference.
+        hue_angle_inner = (hue_angle_current + (phi_input - phi_current)) % 360
+        hue_angle_difference_inner = (phi_input - phi_current) % 360
+        hue_angle_difference_inner = np.where(
+            hue_angle_difference_inner > 180, hue_angle_difference_inner - 360,
+            hue_angle_difference_inner)
+
+        hue_inner, code_inner = tsplit(hue_angle_to_hue(hue_angle_inner))
+
+        _rho_inner, phi_inner = polar_from_specification(
+            hue_inner, value, chroma_current, code_inner)
+        phi_inner_difference = phi_difference(phi_inner, phi_input)
+
+        is_sorted = phi_current_difference <= phi_inner_difference
+        zeros = np.zeros(is_sorted.shape)
+        phi_0, phi_1 = np.where(
+            is_sorted, [phi_current_difference, phi_inner_difference],
+            [phi_inner_difference, phi_current_difference])
+        hue_angle_0, hue_angle_1 = np.where(
+            is_sorted, [zeros, hue_angle_difference_inner],
+            [hue_angle_difference_inner, zeros])
+
+        hue_angle_difference_new = np.select(
+            [0 < phi_0, 0 > phi_1, 0 == phi_1], [
+                hue_angle_0 + (0 - phi_0) * (hue_angle_1 - hue_angle_0) /
+                (phi_1 - phi_0),
+                hue_angle_1 + (0 - phi_1) * (hue_angle_1 - hue_angle_0) /
+                (phi_1 - phi_0),
+                hue_angle_1,
+            ], (hue_angle_1 - hue_angle_0) / (phi_1 - phi_0) *
+            (0 - phi_0) + hue_angle_0) % 360
         hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
 
-        hue_new, code_new = hue_angle_to_hue(hue_angle_new)
-        specification_current = [hue_new, value, chroma_current, code_new]
-
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+        hue_current, code_current = tsplit(hue_angle_to_hue(hue_angle_new))
 
-        chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+        converged = has_converged(x, y, hue_current, value, chroma_current,
+                                  code_current)
+        specification[indexes[converged]] = tstack(
+            [hue_current, value, chroma_current, code_current])[converged]
 
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+        indexes, x, y, value, rho_input, phi_input = (
+            a[~converged]
+            for a in (indexes, x, y, value, rho_input, phi_input))
+        hue_current, chroma_current, code_current = (
+            a[~converged]
+            for a in (hue_current, chroma_current, code_current))
 
-        # TODO: Consider refactoring implementation.
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        chroma_maximum = maximum_chroma_from_renotation(
+        chroma_maximum = _maximum_chroma_from_renotation_vectorised(
             hue_current, value, code_current)
 
         # NOTE: This condition is likely never "True" while producing a valid
         # "Munsell Specification" in practice: 100K iterations with random
         # numbers never reached this code path while producing a valid
         # "Munsell Specification".
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        chroma_current = np.where(chroma_current > chroma_maximum,
+                                  chroma_maximum, chroma_current)
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
+        rho_current, _phi_current = polar_from_specification(
+            hue_current, value, chroma_current, code_current)
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
+        # The chroma is refined by linearly interpolating the chromas at the
+        # input radius between the closest lower and upper radii of the
+        # specifications scaled until the input radius is bracketed.
+        rho_minimum = np.copy(rho_current)
+        rho_maximum = np.copy(rho_current)
 
-        rho_bounds = [rho_current]
-        chroma_bounds = [chroma_current]
+        is_lower = rho_current <= rho_input
+        rho_lower = np.where(is_lower, rho_current, -np.inf)
+        chroma_lower = np.where(is_lower, chroma_current, np.nan)
+        rho_upper = np.where(is_lower, np.inf, rho_current)
+        chroma_upper = np.where(is_lower, np.nan, chroma_current)
 
         iterations_maximum_inner = 16
         iterations_inner = 0
-        while not (min(rho_bounds) < rho_input < max(rho_bounds)):
+        while True:
+            is_bracketing = np.logical_and(rho_minimum < rho_input,
+                                           rho_input < rho_maximum)
+            if np.all(is_bracketing):
+                break
+
             iterations_inner += 1
 
             if iterations_inner > iterations_maximum_inner:
                 raise RuntimeError(('Maximum inner iterations count reached '
                                     'without convergence!'))
 
-            chroma_inner = (((rho_input / rho_current) ** iterations_inner) *
-                            chroma_current)
-            if chroma_inner > chroma_maximum:
-                chroma_inner = specification_current[2] = chroma_maximum
-
-            specification_inner = (hue_current, value, chroma_inner,
-                                   code_current)
+            i_b = np.where(~is_bracketing)[0]
 
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = _munsell_specification_to_xyY(
-                    specification_inner)
+            chroma_inner = (((rho_input[i_b] / rho_current[i_b]) **
+                             iterations_inner) * chroma_current[i_b])
+            chroma_inner = np.where(chroma_inner > chroma_maximum[i_b],
+                                    chroma_maximum[i_b], chroma_inner)
 
-            rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                (x_inner - x_center, y_inner - y_center, Y_center))
+            rho_inner, _phi_inner = polar_from_specification(
+                hue_current[i_b], value[i_b], chroma_inner, code_current[i_b])
 
-            rho_bounds.append(rho_inner)
-            chroma_bounds.append(chroma_inner)
+            rho_minimum[i_b] = np.minimum(rho_minimum[i_b], rho_inner)
+            rho_maximum[i_b] = np.maximum(rho_maximum[i_b], rho_inner)
 
-        rho_bounds = np.array(rho_bounds)
-        chroma_bounds = np.array(chroma_bounds)
+            is_lower = np.logical_and(rho_inner <= rho_input[i_b],
+                                      rho_inner >= rho_lower[i_b])
+            rho_lower[i_b[is_lower]] = rho_inner[is_lower]
+            chroma_lower[i_b[is_lower]] = chroma_inner[is_lower]
 
-        rhos_bounds_indexes = rho_bounds.argsort()
+            is_upper = np.logical_and(rho_inner > rho_input[i_b],
+                                      rho_inner < rho_upper[i_b])
+            rho_upper[i_b[is_upper]] = rho_inner[is_upper]
+            chroma_upper[i_b[is_upper]] = chroma_inner[is_upper]
 
-        rho_bounds = rho_bounds[rhos_bounds_indexes]
-        chroma_bounds = chroma_bounds[rhos_bounds_indexes]
-        chroma_new = LinearInterpolator(rho_bounds, chroma_bounds)(rho_input)
+        chroma_current = _linear_interpolation_vectorised(
+            rho_input, rho_lower, rho_upper, chroma_lower, chroma_upper)
 
-        specification_current = [hue_current, value, chroma_new, code_current]
+        converged = has_converged(x, y, hue_current, value, chroma_current,
+                                  code_current)
+        specification[indexes[converged]] = tstack(
+            [hue_current, value, chroma_current, code_current])[converged]
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = _munsell_specification_to_xyY(
-                specification_current)
-
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+        indexes, x, y, value, rho_input, phi_input = (
+            a[~converged]
+            for a in (indexes, x, y, value, rho_input, phi_input))
+        hue_current, chroma_current, code_current = (
+            a[~converged]
+            for a in (hue_current, chroma_current, code_current))
 
     # NOTE: This exception is likely never raised in practice: 300K iterations
     # with random numbers never reached this code path, it is kept for
     # consistency with the reference # implementation
-    raise RuntimeError(  # pragma: no cover
-        'Maximum outside iterations count reached without convergence!')
+    if indexes.size != 0:
+        raise RuntimeError(  # pragma: no cover
+            'Maximum outside iterations count reached without convergence!')
+
+    return from_range_10(specification, _domain_range_scale_factor())
 
 
 def xyY_to_munsell_specification(xyY):
@@ -1210,13 +1861,11 @@ def xyY_to_munsell_specification(xyY):
     xyY = as_float_array(xyY)
     shape = list(xyY.shape)
 
-    specification = [
-        _xyY_to_munsell_specification(a) for a in xyY.reshape([-1, 3])
-    ]
+    specification = _xyY_to_munsell_specification(xyY.reshape([-1, 3]))
 
     shape[-1] = 4
 
-    return as_float_array(specification).reshape(shape)
+    return specification.reshape(shape)
 
 
 def xyY_to_munsell_colour(xyY,
@@ -1530,15 +2179,71 @@ def xyY_from_renotation(specification):
 
     specification = normalize_munsell_specification(specification)
 
-    try:
-        index = np.where(
-            (_munsell_specifications() == specification).all(axis=-1))
+    return _xyY_from_renotation_vectorised(
+        *[np.reshape(a, [1]) for a in specification])[0]
+
+
+def _xyY_from_renotation_vectorised(hue, value, chroma, code):
+    """
+    Returns given existing *Munsell* *Colorlab* specifications components
+    *CIE xyY* colourspace vectors from *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *CIE xyY* colourspace vectors.
+
+    Raises
+    ------
+    ValueError
+        If any of the given specifications doesn't exist in
+        *Munsell Renotation System* data.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
+
+    # "0YR" is equivalent to "10R".
+    is_zero_hue = hue == 0
+    code = np.copy(code)
+    code[is_zero_hue] = (code[is_zero_hue] + 1) % 10
+    hue = np.where(is_zero_hue, 10, hue)
 
-        return MUNSELL_COLOURS_ALL[as_int(index[0])][1]
-    except Exception:
+    xyY_grid, _maximum_chromas_grid = _munsell_renotation_grids()
+
+    indexes = np.array([
+        code - 1, hue / 2.5 - 1,
+        _munsell_renotation_value_index(value), chroma / 2 - 1
+    ])
+    in_grid = np.all(
+        [
+            indexes == np.around(indexes), indexes >= 0,
+            indexes < np.reshape(xyY_grid.shape[:-1], [4] + [1] * hue.ndim)
+        ],
+        axis=(0, 1))
+
+    xyY = np.full(hue.shape + (3, ), np.nan)
+    xyY[in_grid] = xyY_grid[tuple(as_int(indexes[:, in_grid]))]
+
+    missing = np.isnan(xyY[..., 0])
+    if np.any(missing):
         raise ValueError(
             ('"{0}" specification does not exists in '
-             '"Munsell Renotation System" data!').format(specification))
+             '"Munsell Renotation System" data!').format(
+                 tstack([hue, value, chroma, code])[missing][0]))
+
+    return xyY
 
 
 def is_specification_in_renotation(specification):
@@ -1606,31 +2311,30 @@ def bounding_hues_from_renotation(hue, code):
            [ 10.,   2.]])
     """
 
-    if hue % 2.5 == 0:
-        if hue == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-        else:
-            hue_cw = hue
-            code_cw = code
-        hue_ccw = hue_cw
-        code_ccw = code_cw
-    else:
-        hue_cw = 2.5 * np.floor(hue / 2.5)
-        hue_ccw = (hue_cw + 2.5) % 10
-        if hue_ccw == 0:
-            hue_ccw = 10
-
-        if hue_cw == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-            if code_cw == 0:
-                code_cw = 10
-        else:
-            code_cw = code
-        code_ccw = code
+    hue = as_float_array(hue)
+    code = as_float_array(code)
+
+    # Standard *Munsell Renotation System* hues.
+    hue_s = np.where(hue == 0, 10, hue)
+    code_s = np.where(hue == 0, (code + 1) % 10, code)
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = (hue_cw + 2.5) % 10
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    code_cw = (code + 1) % 10
+    code_cw = np.where(hue_cw == 0, np.where(code_cw == 0, 10, code_cw), code)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
 
-    return as_float_array([(hue_cw, code_cw), (hue_ccw, code_ccw)])
+    is_standard = hue % 2.5 == 0
+    hue_cw = np.where(is_standard, hue_s, hue_cw)
+    code_cw = np.where(is_standard, code_s, code_cw)
+    hue_ccw = np.where(is_standard, hue_s, hue_ccw)
+    code_ccw = np.where(is_standard, code_s, code)
+
+    return np.stack(
+        [tstack([hue_cw, code_cw]),
+         tstack([hue_ccw, code_ccw])], axis=-2)
 
 
 def hue_to_hue_angle(hue, code):
@@ -1693,37 +2397,18 @@ def hue_angle_to_hue(hue_angle):
     array([ 3.216,  4.   ])
     """
 
-    single_hue = LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
-                                    (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle)
-
-    if single_hue <= 0.5:
-        code = 7
-    elif single_hue <= 1.5:
-        code = 6
-    elif single_hue <= 2.5:
-        code = 5
-    elif single_hue <= 3.5:
-        code = 4
-    elif single_hue <= 4.5:
-        code = 3
-    elif single_hue <= 5.5:
-        code = 2
-    elif single_hue <= 6.5:
-        code = 1
-    elif single_hue <= 7.5:
-        code = 10
-    elif single_hue <= 8.5:
-        code = 9
-    elif single_hue <= 9.5:
-        code = 8
-    else:
-        code = 7
+    single_hue = np.reshape(
+        LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
+                           (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle),
+        np.shape(hue_angle))
+
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        np.arange(0.5, 10, 1), single_hue)]
 
     hue = (10 * (single_hue % 1) + 5) % 10
-    if hue == 0:
-        hue = 10
+    hue = np.where(hue == 0, 10, hue)
 
-    return as_float_array([hue, code])
+    return tstack([hue, code])
 
 
 def hue_to_ASTM_hue(hue, code):
@@ -1753,9 +2438,35 @@ def hue_to_ASTM_hue(hue, code):
     33.2...
     """
 
-    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = 10 * ((7 - as_float_array(code)) % 10) + hue
 
-    return 100 if ASTM_hue == 0 else ASTM_hue
+    return as_numeric(np.where(ASTM_hue == 0, 100, ASTM_hue))
+
+
+def _ASTM_hue_to_hue(ASTM_hue):
+    """
+    Converts from the *ASTM* hue number to the *Munsell* *Colorlab*
+    specification hue and code.
+
+    Parameters
+    ----------
+    ASTM_hue : array_like
+        *ASTM* hue number.
+
+    Returns
+    -------
+    ndarray
+        *Munsell* *Colorlab* specification hue and code, the hue is in domain
+        (0, 10].
+    """
+
+    ASTM_hue = as_float_array(ASTM_hue)
+
+    index = np.ceil(ASTM_hue / 10) - 1
+    hue = ASTM_hue - 10 * index
+    code = (7 - index) % 10
+
+    return tstack([hue, np.where(code == 0, 10, code)])
 
 
 def interpolation_method_from_renotation_ovoid(specification):
@@ -1787,10 +2498,9 @@ def interpolation_method_from_renotation_ovoid(specification):
     specification = normalize_munsell_specification(specification)
 
     interpolation_methods = {0: None, 1: 'Linear', 2: 'Radial'}
-    interpolation_method = 0
     if is_grey_munsell_colour(specification):
         # No interpolation needed for grey colours.
-        interpolation_method = 0
+        return interpolation_methods.get(0)
     else:
         hue, value, chroma, code = specification
 
@@ -1801,12 +2511,6 @@ def interpolation_method_from_renotation_ovoid(specification):
             '"{0}" specification value must be an integer!'.format(
                 specification))
 
-        value = round(value)
-
-        # Ideal white, no interpolation needed.
-        if value == 10:
-            interpolation_method = 0
-
         assert 2 <= chroma <= 50, (
             '"{0}" specification chroma must be normalised to domain '
             '[2, 50]!'.format(specification))
@@ -1815,229 +2519,118 @@ def interpolation_method_from_renotation_ovoid(specification):
                 '"{0}" specification chroma must be an integer and '
                 'multiple of 2!').format(specification))
 
-        chroma = 2 * round(chroma / 2)
-
-        # Standard Munsell Renotation System hue, no interpolation needed.
-        if hue % 2.5 == 0:
-            interpolation_method = 0
-
-        ASTM_hue = hue_to_ASTM_hue(hue, code)
-
-        # NOTE: The first level "else" clauses are likely never reached in
-        # practice, they are kept for consistency with the reference
-        # implementation.
-        if value == 1:
-            if chroma == 2:
-                if 15 < ASTM_hue < 30 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 12.5 < ASTM_hue < 27.5 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 55 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 67.5 < ASTM_hue < 77.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                # NOTE: This condition is likely never "True" while producing a
-                # valid "Munsell Specification" in practice: 1M iterations with
-                # random numbers never reached this code path while producing a
-                # valid "Munsell Specification".
-                if 72.5 < ASTM_hue < 77.5:  # pragma: no cover
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 2:
-            if chroma == 2:
-                if 15 < ASTM_hue < 27.5 or 77.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 12.5 < ASTM_hue < 30 or 62.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 7.5 < ASTM_hue < 22.5 or 62.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 7.5 < ASTM_hue < 15 or 60 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 65 < ASTM_hue < 77.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 3:
-            if chroma == 2:
-                if 10 < ASTM_hue < 37.5 or 65 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 72.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8, 10):
-                if 7.5 < ASTM_hue < 37.5 or 57.5 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 12:
-                if 7.5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 4:
-            if chroma in (2, 4):
-                if 7.5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8):
-                if 7.5 < ASTM_hue < 40 or 57.5 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 7.5 < ASTM_hue < 40 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 5:
-            if chroma == 2:
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (4, 6, 8):
-                if 2.5 < ASTM_hue < 42.5 or 55 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 2.5 < ASTM_hue < 42.5 or 55 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 6:
-            if chroma in (2, 4):
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 87.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 87.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (8, 10):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (12, 14):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 16:
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 7:
-            if chroma in (2, 4, 6):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 10:
-                if (30 < ASTM_hue < 42.5 or 5 < ASTM_hue < 25 or
-                        60 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 12:
-                if (30 < ASTM_hue < 42.5 or 7.5 < ASTM_hue < 27.5 or
-                        80 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 14:
-                if (32.5 < ASTM_hue < 40 or 7.5 < ASTM_hue < 15 or
-                        80 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 8:
-            if chroma in (2, 4, 6, 8, 10, 12):
-                if 5 < ASTM_hue < 40 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 14:
-                if (32.5 < ASTM_hue < 40 or 5 < ASTM_hue < 15 or
-                        60 < ASTM_hue < 85):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-        elif value == 9:
-            if chroma in (2, 4):
-                if 5 < ASTM_hue < 40 or 55 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8, 10, 12, 14):
-                if 5 < ASTM_hue < 42.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 16:
-                if 35 < ASTM_hue < 42.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:  # pragma: no cover
-                interpolation_method = 1
-
-    return interpolation_methods.get(interpolation_method)
+        return interpolation_methods.get(
+            as_int(
+                _interpolation_method_from_renotation_ovoid_vectorised(
+                    hue, round(value), 2 * round(chroma / 2), code)))
+
+
+_RADIAL_INTERPOLATION_ASTM_HUES_RENOTATION_OVOID = {
+    1: ((2, ((15, 30), (60, 85))),
+        (4, ((12.5, 27.5), (57.5, 80))),
+        (6, ((55, 80), )),
+        (8, ((67.5, 77.5), )),
+        (10, ((72.5, 77.5), ))),
+    2: ((2, ((15, 27.5), (77.5, 80))),
+        (4, ((12.5, 30), (62.5, 80))),
+        (6, ((7.5, 22.5), (62.5, 80))),
+        (8, ((7.5, 15), (60, 80))),
+        (10, ((65, 77.5), ))),
+    3: ((2, ((10, 37.5), (65, 85))),
+        (4, ((5, 37.5), (55, 72.5))),
+        (6, ((7.5, 37.5), (57.5, 82.5))),
+        (12, ((7.5, 42.5), (57.5, 80)))),
+    4: ((2, ((7.5, 42.5), (57.5, 85))),
+        (6, ((7.5, 40), (57.5, 82.5))),
+        (10, ((7.5, 40), (57.5, 80)))),
+    5: ((2, ((5, 37.5), (55, 85))),
+        (4, ((2.5, 42.5), (55, 85))),
+        (10, ((2.5, 42.5), (55, 82.5)))),
+    6: ((2, ((5, 37.5), (55, 87.5))),
+        (6, ((5, 42.5), (57.5, 87.5))),
+        (8, ((5, 42.5), (60, 85))),
+        (12, ((5, 42.5), (60, 82.5))),
+        (16, ((5, 42.5), (60, 80)))),
+    7: ((2, ((5, 42.5), (60, 85))),
+        (8, ((5, 42.5), (60, 82.5))),
+        (10, ((30, 42.5), (5, 25), (60, 82.5))),
+        (12, ((30, 42.5), (7.5, 27.5), (80, 82.5))),
+        (14, ((32.5, 40), (7.5, 15), (80, 82.5)))),
+    8: ((2, ((5, 40), (60, 85))),
+        (14, ((32.5, 40), (5, 15), (60, 85)))),
+    9: ((2, ((5, 40), (55, 80))),
+        (6, ((5, 42.5), )),
+        (16, ((35, 42.5), ))),
+}
+"""
+*ASTM* hue open intervals where radial interpolation is used when drawing
+ovoids through data points in the *Munsell Renotation System* data, indexed by
+*Munsell* value and then by increasing minimum *Munsell* chroma, linear
+interpolation is used outside those intervals.
+
+References
+----------
+:cite:`Centore2014l`
+
+_RADIAL_INTERPOLATION_ASTM_HUES_RENOTATION_OVOID : dict
+"""
+
+
+def _interpolation_method_from_renotation_ovoid_vectorised(
+        hue, value, chroma, code):
+    """
+    Returns the interpolation methods codes to use when drawing ovoids through
+    data points in the *Munsell Renotation System* data from given normalised
+    *Munsell* *Colorlab* specifications components, the value must be an
+    integer and the chroma an even integer.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        Interpolation methods codes, 0 for no interpolation, 1 for linear
+        interpolation and 2 for radial interpolation.
+    """
+
+    value = as_float_array(value)
+    chroma = as_float_array(chroma)
+    ASTM_hue = hue_to_ASTM_hue(hue, code)
+
+    interpolation_method = np.zeros(
+        np.broadcast(value, chroma, ASTM_hue).shape, dtype=DEFAULT_INT_DTYPE)
+    for value_r, chromas in (
+            _RADIAL_INTERPOLATION_ASTM_HUES_RENOTATION_OVOID.items()):
+        is_value = value == value_r
+        if not np.any(is_value):
+            continue
+
+        for i, (chroma_r, intervals) in enumerate(chromas):
+            mask = np.logical_and(is_value, chroma >= chroma_r)
+            if i + 1 < len(chromas):
+                mask = np.logical_and(mask, chroma < chromas[i + 1][0])
+
+            if not np.any(mask):
+                continue
+
+            radial = np.zeros(mask.shape, dtype=np.bool_)
+            for lower, upper in intervals:
+                radial = np.logical_or(
+                    radial, np.logical_and(lower < ASTM_hue,
+                                           ASTM_hue < upper))
+
+            interpolation_method[mask] = np.where(radial, 2, 1)[mask]
+
+    return interpolation_method
 
 
 def xy_from_renotation_ovoid(specification):
@@ -2083,101 +2676,132 @@ def xy_from_renotation_ovoid(specification):
     if is_grey_munsell_colour(specification):
         return CCS_ILLUMINANT_MUNSELL
     else:
-        hue, value, chroma, code = specification
+        return _xy_from_renotation_ovoid_vectorised(
+            *[np.reshape(a, [1]) for a in specification])[0]
 
-        assert 1 <= value <= 9, (
-            '"{0}" specification value must be normalised to domain '
-            '[1, 9]!'.format(specification))
-        assert is_integer(value), (
-            '"{0}" specification value must be an integer!'.format(
-                specification))
 
-        value = round(value)
+def _xy_from_renotation_ovoid_vectorised(hue, value, chroma, code):
+    """
+    Converts given normalised *Munsell* *Colorlab* specifications components
+    to *CIE xy* chromaticity coordinates on *Munsell Renotation System* ovoid.
 
-        assert 2 <= chroma <= 50, (
-            '"{0}" specification chroma must be normalised to domain '
-            '[2, 50]!'.format(specification))
-        assert abs(
-            2 * (chroma / 2 - round(chroma / 2))) <= INTEGER_THRESHOLD, ((
-                '"{0}" specification chroma must be an integer and '
-                'multiple of 2!').format(specification))
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *CIE xy* chromaticity coordinates.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
+
+    assert np.all(np.logical_and(1 <= value, value <= 9)), (
+        '"{0}" specification value must be normalised to domain '
+        '[1, 9]!'.format(value))
+    assert np.all(is_integer(value)), (
+        '"{0}" specification value must be an integer!'.format(value))
+
+    value = np.around(value)
+
+    assert np.all(np.logical_and(2 <= chroma, chroma <= 50)), (
+        '"{0}" specification chroma must be normalised to domain '
+        '[2, 50]!'.format(chroma))
+    assert np.all(
+        np.abs(2 * (chroma / 2 - np.around(chroma / 2))) <= INTEGER_THRESHOLD
+    ), ('"{0}" specification chroma must be an integer and '
+        'multiple of 2!'.format(chroma))
 
-        chroma = 2 * round(chroma / 2)
+    chroma = 2 * np.around(chroma / 2)
 
-        # Checking if renotation data is available without interpolation using
-        # given threshold.
-        threshold = 1e-7
-        if (abs(hue) < threshold or abs(hue - 2.5) < threshold or
-                abs(hue - 5) < threshold or abs(hue - 7.5) < threshold or
-                abs(hue - 10) < threshold):
-            hue = 2.5 * round(hue / 2.5)
+    xy = np.empty(hue.shape + (2, ))
 
-            x, y, _Y = xyY_from_renotation((hue, value, chroma, code))
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 1e-7
+    is_renotation_hue = np.any(
+        np.abs(hue[..., np.newaxis] - np.array([0, 2.5, 5, 7.5, 10])) <
+        threshold,
+        axis=-1)
+    if np.any(is_renotation_hue):
+        xy[is_renotation_hue] = _xyY_from_renotation_vectorised(
+            2.5 * np.around(hue[is_renotation_hue] / 2.5),
+            value[is_renotation_hue], chroma[is_renotation_hue],
+            code[is_renotation_hue])[..., 0:2]
 
-            return as_float_array([x, y])
+    interpolate = ~is_renotation_hue
+    if not np.any(interpolate):
+        return xy
 
-        hue_cw, hue_ccw = bounding_hues_from_renotation(hue, code)
-        hue_minus, code_minus = hue_cw
-        hue_plus, code_plus = hue_ccw
+    hue, value, chroma, code = (a[interpolate]
+                                for a in (hue, value, chroma, code))
 
-        x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
+    hue_cw, hue_ccw = np.moveaxis(
+        bounding_hues_from_renotation(hue, code), -2, 0)
+    hue_minus, code_minus = tsplit(hue_cw)
+    hue_plus, code_plus = tsplit(hue_ccw)
 
-        specification_minus = (hue_minus, value, chroma, code_minus)
-        x_minus, y_minus, Y_minus = xyY_from_renotation(specification_minus)
-        rho_minus, phi_minus, _z_minus = cartesian_to_cylindrical(
-            (x_minus - x_grey, y_minus - y_grey, Y_minus))
-        phi_minus = np.degrees(phi_minus)
+    x_grey, y_grey = CCS_ILLUMINANT_MUNSELL
 
-        specification_plus = (hue_plus, value, chroma, code_plus)
-        x_plus, y_plus, Y_plus = xyY_from_renotation(specification_plus)
-        rho_plus, phi_plus, _z_plus = cartesian_to_cylindrical(
-            (x_plus - x_grey, y_plus - y_grey, Y_plus))
-        phi_plus = np.degrees(phi_plus)
+    x_minus, y_minus, _Y_minus = tsplit(
+        _xyY_from_renotation_vectorised(hue_minus, value, chroma, code_minus))
+    rho_minus = np.hypot(x_minus - x_grey, y_minus - y_grey)
+    phi_minus = np.degrees(np.arctan2(y_minus - y_grey, x_minus - x_grey))
 
-        lower_hue_angle = hue_to_hue_angle(hue_minus, code_minus)
-        hue_angle = hue_to_hue_angle(hue, code)
-        upper_hue_angle = hue_to_hue_angle(hue_plus, code_plus)
+    x_plus, y_plus, _Y_plus = tsplit(
+        _xyY_from_renotation_vectorised(hue_plus, value, chroma, code_plus))
+    rho_plus = np.hypot(x_plus - x_grey, y_plus - y_grey)
+    phi_plus = np.degrees(np.arctan2(y_plus - y_grey, x_plus - x_grey))
 
-        if phi_minus - phi_plus > 180:
-            phi_plus += 360
+    lower_hue_angle, hue_angle, upper_hue_angle = np.reshape(
+        hue_to_hue_angle(
+            np.array([hue_minus, hue, hue_plus]),
+            np.array([code_minus, code, code_plus])), (3, ) + hue.shape)
 
-        if lower_hue_angle == 0:
-            lower_hue_angle = 360
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
 
-        if lower_hue_angle > upper_hue_angle:
-            if lower_hue_angle > hue_angle:
-                lower_hue_angle -= 360
-            else:
-                lower_hue_angle -= 360
-                hue_angle -= 360
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
 
-        interpolation_method = interpolation_method_from_renotation_ovoid(
-            specification).lower()
+    is_wrapping = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(is_wrapping, lower_hue_angle <= hue_angle),
+        hue_angle - 360, hue_angle)
+    lower_hue_angle = np.where(is_wrapping, lower_hue_angle - 360,
+                               lower_hue_angle)
 
-        assert interpolation_method is not None, (
-            'Interpolation method must be one of : "{0}"'.format(', '.join(
-                ['Linear', 'radial'])))
+    is_radial = _interpolation_method_from_renotation_ovoid_vectorised(
+        hue, value, chroma, code) == 2
 
-        if interpolation_method == 'linear':
-            x = LinearInterpolator(
-                np.ravel([lower_hue_angle, upper_hue_angle]),
-                np.ravel([x_minus, x_plus]))(hue_angle)
-            y = LinearInterpolator(
-                np.ravel([lower_hue_angle, upper_hue_angle]),
-                np.ravel([y_minus, y_plus]))(hue_angle)
-        elif interpolation_method == 'radial':
-            theta = LinearInterpolator(
-                np.ravel([lower_hue_angle, upper_hue_angle]),
-                np.ravel([phi_minus, phi_plus]))(hue_angle)
-            rho = LinearInterpolator(
-                np.ravel([lower_hue_angle, upper_hue_angle]),
-                np.ravel([rho_minus, rho_plus]))(hue_angle)
+    x = _linear_interpolation_vectorised(hue_angle, lower_hue_angle,
+                                         upper_hue_angle, x_minus, x_plus)
+    y = _linear_interpolation_vectorised(hue_angle, lower_hue_angle,
+                                         upper_hue_angle, y_minus, y_plus)
 
-            x, y = tsplit(
-                polar_to_cartesian(np.ravel([rho, np.radians(theta)])) +
-                as_float_array([x_grey, y_grey]))
+    if np.any(is_radial):
+        theta = _linear_interpolation_vectorised(
+            hue_angle[is_radial], lower_hue_angle[is_radial],
+            upper_hue_angle[is_radial], phi_minus[is_radial],
+            phi_plus[is_radial])
+        rho = _linear_interpolation_vectorised(
+            hue_angle[is_radial], lower_hue_angle[is_radial],
+            upper_hue_angle[is_radial], rho_minus[is_radial],
+            rho_plus[is_radial])
 
-        return as_float_array([x, y])
+        x[is_radial] = rho * np.cos(np.radians(theta)) + x_grey
+        y[is_radial] = rho * np.sin(np.radians(theta)) + y_grey
+
+    xy[interpolate] = tstack([x, y])
+
+    return xy
 
 
 def LCHab_to_munsell_specification(LCHab):
@@ -2208,37 +2832,18 @@ def LCHab_to_munsell_specification(LCHab):
 
     L, C, Hab = tsplit(LCHab)
 
-    if Hab == 0:
-        code = 8
-    elif Hab <= 36:
-        code = 7
-    elif Hab <= 72:
-        code = 6
-    elif Hab <= 108:
-        code = 5
-    elif Hab <= 144:
-        code = 4
-    elif Hab <= 180:
-        code = 3
-    elif Hab <= 216:
-        code = 2
-    elif Hab <= 252:
-        code = 1
-    elif Hab <= 288:
-        code = 10
-    elif Hab <= 324:
-        code = 9
-    else:
-        code = 8
+    code = as_float_array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[np.searchsorted(
+        np.arange(36, 360, 36), Hab)]
+    code = np.where(Hab == 0, 8, code)
 
-    hue = LinearInterpolator((0, 36), (0, 10))(Hab % 36)
-    if hue == 0:
-        hue = 10
+    hue = np.reshape(
+        LinearInterpolator((0, 36), (0, 10))(Hab % 36), np.shape(Hab))
+    hue = np.where(hue == 0, 10, hue)
 
     value = L / 10
     chroma = C / 5
 
-    return as_float_array([hue, value, chroma, code])
+    return tstack([hue, value, chroma, code])
 
 
 def maximum_chroma_from_renotation(hue, value, code):
@@ -2271,48 +2876,86 @@ def maximum_chroma_from_renotation(hue, value, code):
     14.0
     """
 
+    return _maximum_chroma_from_renotation_vectorised(
+        *[np.reshape(a, [1]) for a in (hue, value, code)])[0]
+
+
+def _maximum_chroma_from_renotation_vectorised(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System*
+    data using given *Munsell* *Colorlab* specifications hues, values and
+    codes.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* value code.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas.
+    """
+
+    hue, value, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, code)])
+
+    maximum_chroma = np.zeros(hue.shape)
+
     # Ideal white, no chroma.
-    if value >= 9.99:
-        return 0
+    is_chromatic = ~(value >= 9.99)
+    hue, value, code = (a[is_chromatic] for a in (hue, value, code))
 
-    assert 1 <= value <= 10, (
+    assert np.all(np.logical_and(1 <= value, value <= 10)), (
         '"{0}" value must be normalised to domain [1, 10]!'.format(value))
 
-    if value % 1 == 0:
-        value_minus = value
-        value_plus = value
-    else:
-        value_minus = np.floor(value)
-        value_plus = value_minus + 1
-
-    hue_cw, hue_ccw = bounding_hues_from_renotation(hue, code)
-    hue_cw, code_cw = hue_cw
-    hue_ccw, code_ccw = hue_ccw
-
-    maximum_chromas = _munsell_maximum_chromas_from_renotation()
-    specification_for_indexes = [chroma[0] for chroma in maximum_chromas]
-
-    ma_limit_mcw = maximum_chromas[specification_for_indexes.index(
-        (hue_cw, value_minus, code_cw))][1]
-    ma_limit_mccw = maximum_chromas[specification_for_indexes.index(
-        (hue_ccw, value_minus, code_ccw))][1]
-
-    if value_plus <= 9:
-        ma_limit_pcw = maximum_chromas[specification_for_indexes.index(
-            (hue_cw, value_plus, code_cw))][1]
-        ma_limit_pccw = maximum_chromas[specification_for_indexes.index(
-            (hue_ccw, value_plus, code_ccw))][1]
-        max_chroma = min(ma_limit_mcw, ma_limit_mccw, ma_limit_pcw,
-                         ma_limit_pccw)
-    else:
+    value_minus = np.where(value % 1 == 0, value, np.floor(value))
+    value_plus = np.where(value % 1 == 0, value, value_minus + 1)
+
+    hue_cw, hue_ccw = np.moveaxis(
+        bounding_hues_from_renotation(hue, code), -2, 0)
+    hue_cw, code_cw = tsplit(hue_cw)
+    hue_ccw, code_ccw = tsplit(hue_ccw)
+
+    _xyY_grid, maximum_chromas_grid = _munsell_renotation_grids()
+
+    def maximum_chroma_from_grid(hue, value, code):
+        """
+        Returns the maximum *Munsell* chromas for given standard hues and
+        integer values.
+        """
+
+        return maximum_chromas_grid[tuple(
+            as_int(a) for a in (code - 1, hue / 2.5 - 1,
+                                _munsell_renotation_value_index(value)))]
+
+    ma_limit_mcw = maximum_chroma_from_grid(hue_cw, value_minus, code_cw)
+    ma_limit_mccw = maximum_chroma_from_grid(hue_ccw, value_minus, code_ccw)
+
+    is_extrapolated = value_plus > 9
+    value_plus = np.where(is_extrapolated, value_minus, value_plus)
+    ma_limit_pcw = maximum_chroma_from_grid(hue_cw, value_plus, code_cw)
+    ma_limit_pccw = maximum_chroma_from_grid(hue_ccw, value_plus, code_ccw)
+
+    with domain_range_scale('ignore'):
         L = luminance_ASTMD1535(value)
         L9 = luminance_ASTMD1535(9)
         L10 = luminance_ASTMD1535(10)
 
-        max_chroma = min(
-            LinearInterpolator((L9, L10), (ma_limit_mcw, 0))(L),
-            LinearInterpolator((L9, L10), (ma_limit_mccw, 0))(L))
-    return max_chroma
+    L = np.where(is_extrapolated, L, L9)
+    maximum_chroma[is_chromatic] = np.where(
+        is_extrapolated,
+        np.minimum(
+            _linear_interpolation_vectorised(L, L9, L10, ma_limit_mcw, 0),
+            _linear_interpolation_vectorised(L, L9, L10, ma_limit_mccw, 0)),
+        np.minimum.reduce(
+            [ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw]))
+
+    return maximum_chroma
 
 
 def munsell_specification_to_xy(specification):
@@ -2349,41 +2992,62 @@ def munsell_specification_to_xy(specification):
     if is_grey_munsell_colour(specification):
         return CCS_ILLUMINANT_MUNSELL
     else:
-        hue, value, chroma, code = specification
+        return _munsell_specification_to_xy_vectorised(
+            *[np.reshape(a, [1]) for a in specification])[0]
 
-        assert 0 <= value <= 10, (
-            '"{0}" specification value must be normalised to domain '
-            '[0, 10]!'.format(specification))
-        assert is_integer(value), (
-            '"{0}" specification value must be an integer!'.format(
-                specification))
 
-        value = round(value)
+def _munsell_specification_to_xy_vectorised(hue, value, chroma, code):
+    """
+    Converts given normalised and non-grey *Munsell* *Colorlab* specifications
+    components with integer values to *CIE xy* chromaticity coordinates by
+    interpolating over *Munsell Renotation System* data.
 
-        if chroma % 2 == 0:
-            chroma_minus = chroma_plus = chroma
-        else:
-            chroma_minus = 2 * np.floor(chroma / 2)
-            chroma_plus = chroma_minus + 2
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
 
-        if chroma_minus == 0:
-            # Smallest chroma ovoid collapses to illuminant chromaticity
-            # coordinates.
-            x_minus, y_minus = (CCS_ILLUMINANT_MUNSELL)
-        else:
-            x_minus, y_minus = xy_from_renotation_ovoid((hue, value,
-                                                         chroma_minus, code))
+    Returns
+    -------
+    ndarray
+        *CIE xy* chromaticity coordinates.
+    """
 
-        x_plus, y_plus = xy_from_renotation_ovoid((hue, value, chroma_plus,
-                                                   code))
+    hue, value, chroma, code = np.broadcast_arrays(
+        *[as_float_array(a) for a in (hue, value, chroma, code)])
 
-        if chroma_minus == chroma_plus:
-            x = x_minus
-            y = y_minus
-        else:
-            x = LinearInterpolator((chroma_minus, chroma_plus),
-                                   (x_minus, x_plus))(chroma)
-            y = LinearInterpolator((chroma_minus, chroma_plus),
-                                   (y_minus, y_plus))(chroma)
+    assert np.all(np.logical_and(0 <= value, value <= 10)), (
+        '"{0}" specification value must be normalised to domain '
+        '[0, 10]!'.format(value))
+    assert np.all(is_integer(value)), (
+        '"{0}" specification value must be an integer!'.format(value))
+
+    value = np.around(value)
+
+    chroma_minus = np.where(chroma % 2 == 0, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(chroma % 2 == 0, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    xy_minus = np.tile(CCS_ILLUMINANT_MUNSELL, hue.shape + (1, ))
+    is_chromatic = chroma_minus != 0
+    xy_minus[is_chromatic] = _xy_from_renotation_ovoid_vectorised(
+        hue[is_chromatic], value[is_chromatic], chroma_minus[is_chromatic],
+        code[is_chromatic])
+
+    xy_plus = _xy_from_renotation_ovoid_vectorised(hue, value, chroma_plus,
+                                                   code)
+
+    xy = xy_minus
+    interpolate = chroma_minus != chroma_plus
+    xy[interpolate] = _linear_interpolation_vectorised(
+        chroma[interpolate, np.newaxis], chroma_minus[interpolate, np.newaxis],
+        chroma_plus[interpolate, np.newaxis], xy_minus[interpolate],
+        xy_plus[interpolate])
 
-        return as_float_array([x, y])
+    return xy
@@ -4,6 +4,9 @@ Defines unit tests for :mod:`colour.notation.munsell` module.
 """
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 from itertools import permutations
 
@@ -27,6 +30,7 @@ from colour.notation.munsell import (munsell_colour_to_xyY,
                                      xyY_to_munsell_colour)
 from colour.notation.munsell import (munsell_specification_to_xyY,
                                      xyY_to_munsell_specification)
+from colour.notation.munsell import LUT3D_Munsell
 from colour.notation import (
     munsell_value_Priest1920, munsell_value_Munsell1933,
     munsell_value_Moon1943, munsell_value_Saunderson1944,
@@ -50,7 +54,8 @@ __all__ = [
     'TestMunsellValueMoon1943', 'TestMunsellValueSaunderson1944',
     'TestMunsellValueLadd1955', 'TestMunsellValueMcCamy1992',
     'TestMunsellValueASTMD1535', 'TestMunsellSpecification_to_xyY',
-    'TestMunsellColour_to_xyY', 'TestxyY_to_munsell_specification',
+    'TestMunsellColour_to_xyY', 'TestLUT3D_Munsell',
+    'TestxyY_to_munsell_specification',
     'TestxyY_to_munsell_colour', 'TestParseMunsellColour',
     'TestIsGreyMunsellColour', 'TestNormalizeMunsellSpecification',
     'TestMunsellColourToMunsellSpecification',
@@ -1446,6 +1451,97 @@ class TestMunsellColour_to_xyY(unittest.TestCase):
             munsell_colour_to_xyY(munsell_colour), xyY, decimal=7)
 
 
+class TestLUT3D_Munsell(unittest.TestCase):
+    """
+    Defines :class:`colour.notation.munsell.LUT3D_Munsell` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('size', 'table', 'maximum_error')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D_Munsell))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'generate', 'error',
+                            'munsell_specification_to_xyY',
+                            'munsell_colour_to_xyY', 'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D_Munsell))
+
+    def test_LUT3D_Munsell(self):
+        """
+        Tests the entirety of the
+        :class:`colour.notation.munsell.LUT3D_Munsell` class.
+        """
+
+        LUT = LUT3D_Munsell()
+        LUT.generate()
+
+        self.assertTupleEqual(LUT.size, (161, 37, 51))
+        self.assertLess(LUT.maximum_error, 0.005)
+
+        path = os.path.join(self._temporary_directory, 'Munsell.lut')
+
+        LUT.write(path)
+        table, maximum_error = LUT.table, LUT.maximum_error
+        LUT.read(path)
+
+        np.testing.assert_equal(LUT.table, table)
+        self.assertEqual(LUT.maximum_error, maximum_error)
+
+        specification, xyY = (
+            as_float_array(list(MUNSELL_SPECIFICATIONS[..., 0])),
+            as_float_array(list(MUNSELL_SPECIFICATIONS[..., 1])),
+        )
+
+        for method in ('Trilinear', 'Tetrahedral'):
+            xyY_t = LUT.munsell_specification_to_xyY(specification, method)
+            np.testing.assert_allclose(
+                xyY_t[..., 0:2],
+                xyY[..., 0:2],
+                atol=LUT.error(specification, method) + 1e-7)
+            np.testing.assert_allclose(xyY_t[..., 2], xyY[..., 2], atol=1e-7)
+
+        np.testing.assert_allclose(
+            LUT.munsell_colour_to_xyY('N8.9'),
+            munsell_colour_to_xyY('N8.9'),
+            atol=1e-7)
+
+        with domain_range_scale(1):
+            np.testing.assert_allclose(
+                LUT.munsell_colour_to_xyY('4.2YR 8.1/5.3'),
+                munsell_colour_to_xyY('4.2YR 8.1/5.3'),
+                atol=LUT.maximum_error)
+
+        self.assertRaises(ValueError, LUT.munsell_specification_to_xyY,
+                          np.array([2.5, 5.0, 40.0, 4]))
+
+
 class TestxyY_to_munsell_specification(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1503,6 +1599,15 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
         np.testing.assert_almost_equal(
             xyY_to_munsell_specification(xyY), specification, decimal=7)
 
+        xyY = np.vstack([
+            as_float_array(list(MUNSELL_SPECIFICATIONS[:16, 1])),
+            as_float_array(list(MUNSELL_GREYS_SPECIFICATIONS[:4, 1])),
+        ])
+        specification = np.array(
+            [xyY_to_munsell_specification(a) for a in xyY])
+        np.testing.assert_equal(
+            xyY_to_munsell_specification(xyY), specification)
+
     def test_raise_exception_xyY_to_munsell_specification(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -19,13 +19,16 @@ import os
 from collections import namedtuple
 
 from colour.algebra import euclidean_distance, Extrapolator
-from colour.appearance import XYZ_to_CIECAM02, VIEWING_CONDITIONS_CIECAM02
+from colour.appearance import (CAM_Specification_CIECAM02, XYZ_to_CIECAM02,
+                               VIEWING_CONDITIONS_CIECAM02)
 from colour.colorimetry import (
-    SpectralShape, SpectralDistribution, MultiSpectralDistributions, sd_to_XYZ,
-    sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
+    SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES, SpectralShape,
+    SpectralDistribution, MultiSpectralDistributions, sd_to_XYZ, msds_to_XYZ,
+    planck_law, sd_blackbody, MSDS_CMFS, sd_CIE_illuminant_D_series)
 from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, lerp, usage_warning
+from colour.utilities import (as_float_array, as_int, lerp, register_cache,
+                              tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -58,7 +61,26 @@ RESOURCES_DIRECTORY_CIE2017 = os.path.join(
 RESOURCES_DIRECTORY_CIE2017 : unicode
 """
 
-_CACHE_TCS_CIE2017 = {}
+_CACHE_TCS_CIE2017 = register_cache(
+    '{0}._CACHE_TCS_CIE2017'.format(__name__), maximum_size=2)
+
+_CACHE_CMFS_CIE2017 = register_cache(
+    '{0}._CACHE_CMFS_CIE2017'.format(__name__), maximum_size=2)
+
+_CACHE_REFERENCE_ILLUMINANT_CIE2017 = register_cache(
+    '{0}._CACHE_REFERENCE_ILLUMINANT_CIE2017'.format(__name__),
+    maximum_bytes=2 ** 26)
+
+_CACHE_QUANTISATION_BOUNDS_CIE2017 = register_cache(
+    '{0}._CACHE_QUANTISATION_BOUNDS_CIE2017'.format(__name__), maximum_size=2)
+
+_RANGE_CCT_QUANTISATION_CIE2017 = (1000, 25000)
+"""
+Correlated colour temperature :math:`T_{cp}` range in which the reference
+illuminants are quantised when a :math:`R_f` tolerance is given.
+
+_RANGE_CCT_QUANTISATION_CIE2017 : tuple
+"""
 
 
 class TCS_ColorimetryData_CIE2017(
@@ -81,40 +103,75 @@ class ColourRendering_Specification_CIE2017(
     ----------
     name : unicode
         Name of the test spectral distribution.
-    sd_reference : SpectralDistribution
+    sd_reference : SpectralDistribution or MultiSpectralDistributions
         Spectral distribution of the reference illuminant.
-    R_f : numeric
+    R_f : numeric or ndarray
         *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f`.
     R_s : array_like
         Individual *colour fidelity indexes* data for each sample.
-    CCT : numeric
+    CCT : numeric or ndarray
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric
+    D_uv : numeric or ndarray
         Distance from the Planckian locus :math:`\\Delta_{uv}`.
     colorimetry_data : tuple
         Colorimetry data for the test and reference computations.
-    delta_E_s : ndarray, (16,)
+    delta_E_s : ndarray, (99,) or (M, 99)
         Colour shifts of samples.
+
+    Notes
+    -----
+    -   When the *CIE 2017 Colour Fidelity Index* (CFI) is computed for a
+        :class:`colour.MultiSpectralDistributions` class instance, i.e. a
+        batch of :math:`M` test spectral distributions, the numeric
+        attributes are *ndarray* with a leading axis of length :math:`M` and
+        the *test colour samples* colorimetry data are stored in a single
+        :class:`colour.quality.cfi2017.TCS_ColorimetryData_CIE2017` class
+        instance whose attributes are *ndarray* of shape (M, 99, ...).
     """
 
 
-def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
+def colour_fidelity_index_CIE2017(sd_test,
+                                  additional_data=False,
+                                  tolerance=None):
     """
     Returns the *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` of given
     spectral distribution.
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions, in which
+        case each distribution is evaluated as a separate test light source.
     additional_data : bool, optional
         Whether to output additional data.
+    tolerance : numeric, optional
+        Maximum absolute error on :math:`R_f` allowed in exchange for reusing
+        the reference illuminants computed at quantised correlated colour
+        temperatures :math:`T_{cp}`. If *None*, the reference illuminants are
+        computed at the exact correlated colour temperatures :math:`T_{cp}`.
 
     Returns
     -------
-    numeric or ColourRendering_Specification_CIE2017
+    numeric or ndarray or ColourRendering_Specification_CIE2017
         *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f`.
 
+    Notes
+    -----
+    -   The multi-spectral distributions path evaluates the *test colour
+        samples* tristimulus values of all the test light sources with a
+        single tensor contraction and computes the *CIECAM02* and
+        *CAM02-UCS* correlates of all of them at once.
+    -   The reference illuminants and their *test colour samples* colorimetry
+        data are cached by correlated colour temperature :math:`T_{cp}`.
+        When a ``tolerance`` is given, the correlated colour temperatures
+        :math:`T_{cp}` in the [1000, 25000] range are quantised on a uniform
+        *mired* grid whose step is derived from a Lipschitz bound of the
+        reference *CAM02-UCS* coordinates with respect to the *mired*, so
+        that light sources with close correlated colour temperatures
+        :math:`T_{cp}` share the same reference illuminant while :math:`R_f`
+        stays within ``tolerance`` of its exact value. The reported
+        :math:`T_{cp}` and :math:`\\Delta_{uv}` are always exact.
+
     References
     ----------
     :cite:`CIETC1-902017`
@@ -125,6 +182,14 @@ def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
     >>> sd = SDS_ILLUMINANTS['FL2']
     >>> colour_fidelity_index_CIE2017(sd)  # doctest: +ELLIPSIS
     70.1208254...
+    >>> msds = MultiSpectralDistributions(
+    ...     np.transpose([SDS_ILLUMINANTS[illuminant].values
+    ...                   for illuminant in ('FL1', 'FL2', 'FL3')]),
+    ...     SDS_ILLUMINANTS['FL2'].wavelengths)
+    >>> colour_fidelity_index_CIE2017(msds)  # doctest: +ELLIPSIS
+    array([ 80.6382399...,  70.1208254...,  63.0835437...])
+    >>> colour_fidelity_index_CIE2017(sd, tolerance=0.1)  # doctest: +ELLIPSIS
+    70.1195385...
     """
 
     if sd_test.shape.start > 380 or sd_test.shape.end < 780:
@@ -151,27 +216,45 @@ def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
                           SPECTRAL_SHAPE_CIE2017.end, sd_test.shape.interval)
 
     CCT, D_uv = CCT_reference_illuminant(sd_test)
-    sd_reference = sd_reference_illuminant(CCT, shape)
 
     # NOTE: All computations except CCT calculation use the
     # "CIE 1964 10 Degree Standard Observer".
-    cmfs_10 = MSDS_CMFS['CIE 1964 10 Degree Standard Observer'].copy().align(
-        shape)
-
-    sds_tcs = load_TCS_CIE2017(shape).align(shape)
+    cmfs_10 = _cmfs_CIE2017(shape)
+
+    sds_tcs = load_TCS_CIE2017(shape)
+    if sds_tcs.shape != shape:
+        sds_tcs = sds_tcs.align(shape)
+
+    test_tcs_colorimetry_data = _tcs_colorimetry_data_CIE2017(
+        _aligned_values_CIE2017(sd_test, shape), sds_tcs, cmfs_10)
+    CCT_reference, values_reference, reference_tcs_colorimetry_data = (
+        _reference_illuminant_CIE2017(CCT, shape, sds_tcs, cmfs_10,
+                                      tolerance))
+
+    delta_E_s = euclidean_distance(test_tcs_colorimetry_data.Jpapbp,
+                                   reference_tcs_colorimetry_data.Jpapbp)
+
+    if isinstance(sd_test, MultiSpectralDistributions):
+        if additional_data:
+            sd_reference = MultiSpectralDistributions(
+                np.transpose(values_reference),
+                shape.range(),
+                name='{0} - Reference Illuminants'.format(sd_test.name),
+                labels=sd_test.labels)
+    else:
+        delta_E_s = delta_E_s[0]
 
-    test_tcs_colorimetry_data = tcs_colorimetry_data(sd_test, sds_tcs, cmfs_10)
-    reference_tcs_colorimetry_data = tcs_colorimetry_data(
-        sd_reference, sds_tcs, cmfs_10)
+        if additional_data:
+            sd_reference = sd_reference_illuminant(CCT_reference[0], shape)
 
-    delta_E_s = np.empty(len(sds_tcs.labels))
-    for i, _delta_E in enumerate(delta_E_s):
-        delta_E_s[i] = euclidean_distance(
-            test_tcs_colorimetry_data[i].Jpapbp,
-            reference_tcs_colorimetry_data[i].Jpapbp)
+            test_tcs_colorimetry_data = _tcs_colorimetry_data_unpack_CIE2017(
+                test_tcs_colorimetry_data)
+            reference_tcs_colorimetry_data = (
+                _tcs_colorimetry_data_unpack_CIE2017(
+                    reference_tcs_colorimetry_data))
 
     R_s = delta_E_to_R_f(delta_E_s)
-    R_f = delta_E_to_R_f(np.average(delta_E_s))
+    R_f = delta_E_to_R_f(np.average(delta_E_s, axis=-1))
 
     if additional_data:
         return ColourRendering_Specification_CIE2017(
@@ -207,8 +290,6 @@ def load_TCS_CIE2017(shape):
     99
     """
 
-    global _CACHE_TCS_CIE2017
-
     interval = shape.interval
 
     assert interval in (1, 5), (
@@ -216,8 +297,9 @@ def load_TCS_CIE2017(shape):
 
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
-    if filename in _CACHE_TCS_CIE2017:
-        return _CACHE_TCS_CIE2017[filename]
+    tcs = _CACHE_TCS_CIE2017.get(filename)
+    if tcs is not None:
+        return tcs
 
     data = np.genfromtxt(
         str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
@@ -239,8 +321,8 @@ def CCT_reference_illuminant(sd):
 
     Parameters
     ----------
-    sd : SpectralDistribution
-        Test spectral distribution.
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions.
 
     Returns
     -------
@@ -255,9 +337,12 @@ def CCT_reference_illuminant(sd):
     (4224.4697052..., 0.0017871...)
     """
 
-    XYZ = sd_to_XYZ(sd)
+    if isinstance(sd, MultiSpectralDistributions):
+        XYZ = msds_to_XYZ(sd)
+    else:
+        XYZ = sd_to_XYZ(sd)
 
-    CCT, D_uv = uv_to_CCT_Ohno2013(UCS_to_uv(XYZ_to_UCS(XYZ)))
+    CCT, D_uv = tsplit(uv_to_CCT_Ohno2013(UCS_to_uv(XYZ_to_UCS(XYZ))))
 
     return CCT, D_uv
 
@@ -341,6 +426,325 @@ def sd_reference_illuminant(CCT, shape):
     return sd_reference
 
 
+def _CIE_illuminant_D_series_components_CIE2017(CCT, shape):
+    """
+    Returns the unrounded :math:`M1` and :math:`M2` variables and the basis
+    functions of the *CIE Illuminant D Series* for given correlated colour
+    temperatures :math:`T_{cp}`.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the basis functions.
+
+    Returns
+    -------
+    tuple
+        :math:`M1`, :math:`M2` variables and :math:`S_0`, :math:`S_1`,
+        :math:`S_2` basis functions.
+    """
+
+    x, y = tsplit(np.reshape(CCT_to_xy_CIE_D(CCT), [-1, 2]))
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    # NOTE: The *CIE Illuminant D Series* basis functions are linearly
+    # interpolated, as per :func:`colour.sd_CIE_illuminant_D_series`
+    # definition.
+    wavelengths = shape.range()
+    S0, S1, S2 = [
+        np.interp(wavelengths, basis_function.wavelengths,
+                  basis_function.values)
+        for basis_function in (SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[i]
+                               for i in ('S0', 'S1', 'S2'))
+    ]
+
+    return M1, M2, S0, S1, S2
+
+
+def _sds_reference_illuminant_CIE2017(CCT, shape):
+    """
+    Computes the values of the reference illuminants for given correlated
+    colour temperatures :math:`T_{cp}` for use in
+    *CIE 2017 Colour Fidelity Index* (CFI) computation.
+
+    This definition is the vectorised counterpart of
+    :func:`colour.quality.sd_reference_illuminant` definition.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray, (M, n)
+        Reference illuminants values.
+    """
+
+    CCT = np.ravel(as_float_array(CCT))
+    wavelengths = shape.range()
+
+    values = np.empty([CCT.shape[0], wavelengths.shape[0]])
+
+    is_planckian = CCT <= 5000
+    is_daylight = CCT >= 4000
+
+    values_planckian = planck_law(wavelengths * 1e-9,
+                                  CCT[is_planckian, np.newaxis]) * 1e-9
+
+    M1, M2, S0, S1, S2 = _CIE_illuminant_D_series_components_CIE2017(
+        CCT[is_daylight], shape)
+    M1 = np.around(M1, 3)
+    M2 = np.around(M2, 3)
+    values_daylight = (S0 + M1[..., np.newaxis] * S1 +
+                       M2[..., np.newaxis] * S2)
+
+    values[is_planckian] = values_planckian
+    values[is_daylight] = values_daylight
+
+    is_mixture = np.logical_and(is_planckian, is_daylight)
+    if np.any(is_mixture):
+        values_planckian = values_planckian[is_mixture[is_planckian]]
+        values_daylight = values_daylight[is_mixture[is_daylight]]
+
+        # Planckian and daylight illuminant must be normalised so that the
+        # mixture isn't biased.
+        values_planckian /= msds_to_XYZ(
+            values_planckian, shape=shape)[..., 1, np.newaxis]
+        values_daylight /= msds_to_XYZ(
+            values_daylight, shape=shape)[..., 1, np.newaxis]
+
+        m = (CCT[is_mixture, np.newaxis] - 4000) / 1000
+        values[is_mixture] = lerp(values_planckian, values_daylight, m)
+
+    return values
+
+
+def _cmfs_CIE2017(shape):
+    """
+    Returns the *CIE 1964 10 Degree Standard Observer* aligned to given
+    spectral shape.
+
+    The aligned colour matching functions are cached and won't be aligned
+    again on subsequent calls to this definition.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the tested illuminant.
+
+    Returns
+    -------
+    XYZ_ColourMatchingFunctions
+        *CIE 1964 10 Degree Standard Observer*.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    cmfs = _CACHE_CMFS_CIE2017.get(key)
+    if cmfs is not None:
+        return cmfs
+
+    cmfs = MSDS_CMFS['CIE 1964 10 Degree Standard Observer'].copy().align(
+        shape)
+
+    _CACHE_CMFS_CIE2017[key] = cmfs
+
+    return cmfs
+
+
+def _quantisation_bounds_CIE2017(shape, sds_tcs, cmfs):
+    """
+    Estimates the bounds of the distance travelled by the *test colour
+    samples* in *CAM02-UCS* colourspace under the reference illuminants when
+    their correlated colour temperature :math:`T_{cp}` changes.
+
+    The bounds are cached and won't be estimated again on subsequent calls to
+    this definition.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+    sds_tcs : MultiSpectralDistributions
+        *Test colour samples* spectral distributions.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        Lipschitz constant :math:`L` of the average distance with respect to
+        the *mired* and maximum average distance :math:`F` caused by the
+        rounding of the *CIE Illuminant D Series* :math:`M1` and :math:`M2`
+        variables.
+
+    Notes
+    -----
+    -   :math:`L` is estimated with finite differences on a dense *mired*
+        grid spanning the quantised correlated colour temperature
+        :math:`T_{cp}` range, taking the supremum per sample before
+        averaging.
+    -   The rounding of :math:`M1` and :math:`M2` to 3 decimal places makes
+        the *CIE Illuminant D Series* piecewise constant with respect to the
+        correlated colour temperature :math:`T_{cp}`: two reference
+        illuminants can differ by up to 0.001 in each variable on top of
+        their smooth variation, which :math:`F` accounts for.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    bounds = _CACHE_QUANTISATION_BOUNDS_CIE2017.get(key)
+    if bounds is not None:
+        return bounds
+
+    mired = np.linspace(1e6 / _RANGE_CCT_QUANTISATION_CIE2017[1],
+                        1e6 / _RANGE_CCT_QUANTISATION_CIE2017[0], 2 ** 11)
+    tcs_data = _tcs_colorimetry_data_CIE2017(
+        _sds_reference_illuminant_CIE2017(1e6 / mired, shape), sds_tcs, cmfs)
+
+    d_Jpapbp = np.linalg.norm(
+        np.diff(tcs_data.Jpapbp, axis=0), axis=-1) / np.diff(mired)[:, None]
+
+    L = np.mean(np.max(d_Jpapbp, axis=0))
+
+    M1, M2, S0, S1, S2 = _CIE_illuminant_D_series_components_CIE2017(
+        1e6 / mired[mired <= 1e6 / 4000], shape)
+    M1 = M1[..., np.newaxis]
+    M2 = M2[..., np.newaxis]
+    Jpapbp = _tcs_colorimetry_data_CIE2017(S0 + M1 * S1 + M2 * S2, sds_tcs,
+                                           cmfs).Jpapbp
+    F = 0
+    for d_M1, d_M2 in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+        Jpapbp_d = _tcs_colorimetry_data_CIE2017(
+            S0 + (M1 + d_M1 / 1000) * S1 + (M2 + d_M2 / 1000) * S2, sds_tcs,
+            cmfs).Jpapbp
+        F = max(F,
+                np.max(
+                    np.mean(
+                        np.linalg.norm(Jpapbp_d - Jpapbp, axis=-1), axis=-1)))
+
+    bounds = L, F
+
+    _CACHE_QUANTISATION_BOUNDS_CIE2017[key] = bounds
+
+    return bounds
+
+
+def _reference_illuminant_CIE2017(CCT, shape, sds_tcs, cmfs, tolerance=None):
+    """
+    Returns the reference illuminants and their *test colour samples*
+    colorimetry data for given correlated colour temperatures :math:`T_{cp}`.
+
+    The reference illuminants are cached by correlated colour temperature
+    :math:`T_{cp}`, quantised on a uniform *mired* grid if a :math:`R_f`
+    tolerance is given.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+    sds_tcs : MultiSpectralDistributions
+        *Test colour samples* spectral distributions aligned to the colour
+        matching functions.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    tolerance : numeric, optional
+        Maximum absolute error on :math:`R_f` allowed by the quantisation.
+
+    Returns
+    -------
+    tuple
+        Correlated colour temperatures :math:`T_{cp}` of the reference
+        illuminants, reference illuminants values and their *test colour
+        samples* colorimetry data.
+
+    Notes
+    -----
+    -   Since :math:`R_f` is a function of the average colour difference
+        :math:`\\overline{\\Delta E}` whose derivative is bounded by
+        :math:`c_f = 6.73`, and each colour difference changes at most by
+        the distance travelled by the reference sample, the :math:`R_f`
+        error is bounded by :math:`c_f (L \\cfrac{s}{2} + F)` where
+        :math:`L` is the Lipschitz constant of the reference samples
+        coordinates with respect to the *mired*, :math:`s` the *mired* step
+        and :math:`F` the *CIE Illuminant D Series* rounding term, zero below
+        4000K. The step is chosen as :math:`s = (tol - c_f F) / (c_f L)`,
+        i.e. with a safety factor of 2, and the reference illuminants are
+        computed exactly where it is not positive.
+    """
+
+    CCT = np.ravel(as_float_array(CCT))
+
+    CCT_reference = np.copy(CCT)
+    if tolerance is not None:
+        c_f = 6.73
+        L, F = _quantisation_bounds_CIE2017(shape, sds_tcs, cmfs)
+
+        # Reference illuminants below 4000K are pure Planckian radiators,
+        # the rounding of the *CIE Illuminant D Series* variables only
+        # affects those above.
+        for step, domain in (
+            (tolerance / (c_f * L), (_RANGE_CCT_QUANTISATION_CIE2017[0],
+                                     4000)),
+            ((tolerance - c_f * F) / (c_f * L),
+             (4000, _RANGE_CCT_QUANTISATION_CIE2017[1])),
+        ):
+            if step <= 0:
+                continue
+
+            quantised = np.logical_and(CCT >= domain[0], CCT < domain[1])
+            CCT_q = 1e6 / (np.maximum(
+                np.around(1e6 / CCT[quantised] / step), 1) * step)
+            CCT_q[np.logical_or(CCT_q < domain[0],
+                                CCT_q >= domain[1])] = np.nan
+
+            CCT_reference[quantised] = np.where(
+                np.isnan(CCT_q), CCT[quantised], CCT_q)
+
+    CCT_unique, indexes = np.unique(CCT_reference, return_inverse=True)
+
+    keys = [(shape.start, shape.end, shape.interval, CCT_u)
+            for CCT_u in CCT_unique]
+    entries = [_CACHE_REFERENCE_ILLUMINANT_CIE2017.get(key) for key in keys]
+
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    if missing:
+        values = _sds_reference_illuminant_CIE2017(CCT_unique[missing], shape)
+        tcs_data = _tcs_colorimetry_data_CIE2017(values, sds_tcs, cmfs)
+
+        for j, i in enumerate(missing):
+            entries[i] = (values[j], tcs_data.XYZ[j],
+                          CAM_Specification_CIECAM02(*[
+                              None if value is None else value[j]
+                              for value in tcs_data.CAM
+                          ]), tcs_data.JMh[j], tcs_data.Jpapbp[j])
+
+            _CACHE_REFERENCE_ILLUMINANT_CIE2017[keys[i]] = entries[i]
+
+    values, XYZ, CAMs, JMh, Jpapbp = zip(*entries)
+    CAM = CAM_Specification_CIECAM02(*[
+        None if value[0] is None else np.stack(value)[indexes]
+        for value in zip(*CAMs)
+    ])
+
+    return (CCT_reference, np.stack(values)[indexes],
+            TCS_ColorimetryData_CIE2017(
+                sds_tcs.labels,
+                np.stack(XYZ)[indexes], CAM,
+                np.stack(JMh)[indexes],
+                np.stack(Jpapbp)[indexes]))
+
+
 def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     """
     Returns the *test colour samples* colorimetry data under given test light
@@ -349,9 +753,10 @@ def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
 
     Parameters
     ----------
-    sd_irradiance : SpectralDistribution
+    sd_irradiance : SpectralDistribution or MultiSpectralDistributions
         Test light source or reference illuminant spectral distribution, i.e.
-        the irradiance emitter.
+        the irradiance emitter, or multi-spectral distributions of
+        :math:`M` irradiance emitters.
     sds_tcs : MultiSpectralDistributions
         *Test colour samples* spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
@@ -359,9 +764,13 @@ def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
 
     Returns
     -------
-    list
+    list or TCS_ColorimetryData_CIE2017
         *Test colour samples* colorimetry data under the given test light
-        source or reference illuminant spectral distribution.
+        source or reference illuminant spectral distribution. If
+        multi-spectral distributions are given, a single
+        :class:`colour.quality.cfi2017.TCS_ColorimetryData_CIE2017` class
+        instance is returned whose attributes are *ndarray* of shape
+        (M, 99, ...).
 
     Examples
     --------
@@ -369,22 +778,127 @@ def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     70.1208254...
     """
 
-    XYZ_w = sd_to_XYZ(sd_ones(), cmfs, sd_irradiance)
-    Y_b = 20
-    L_A = 100
-    surround = VIEWING_CONDITIONS_CIECAM02['Average']
+    if sds_tcs.shape != cmfs.shape:
+        sds_tcs = sds_tcs.copy().align(cmfs.shape)
+
+    tcs_data = _tcs_colorimetry_data_CIE2017(
+        _aligned_values_CIE2017(sd_irradiance, cmfs.shape), sds_tcs, cmfs)
+
+    if isinstance(sd_irradiance, MultiSpectralDistributions):
+        return tcs_data
+
+    return _tcs_colorimetry_data_unpack_CIE2017(tcs_data)
+
+
+def _tcs_colorimetry_data_unpack_CIE2017(tcs_data):
+    """
+    Unpacks given *test colour samples* colorimetry data of a single
+    irradiance emitter into a list of per-sample colorimetry data.
+
+    Parameters
+    ----------
+    tcs_data : TCS_ColorimetryData_CIE2017
+        *Test colour samples* colorimetry data whose attributes are *ndarray*
+        of shape (1, 99, ...).
+
+    Returns
+    -------
+    list
+        *Test colour samples* colorimetry data.
+    """
+
+    CAM = tcs_data.CAM
+
+    tcs_data_s = []
+    for i, name in enumerate(tcs_data.name):
+        CAM_i = CAM_Specification_CIECAM02(
+            *[None if value is None else value[0, i] for value in CAM])
+        JMh_i = CAM_i.J, CAM_i.M, CAM_i.h
+
+        tcs_data_s.append(
+            TCS_ColorimetryData_CIE2017(name, tcs_data.XYZ[0, i], CAM_i,
+                                        JMh_i, tcs_data.Jpapbp[0, i]))
+
+    return tcs_data_s
+
+
+def _aligned_values_CIE2017(sd, shape):
+    """
+    Returns the values of given spectral distribution or multi-spectral
+    distributions aligned to given spectral shape.
+
+    The values are directly indexed when the spectral shape wavelengths are
+    a subset of the spectral distribution wavelengths, avoiding the costly
+    per-signal alignment of large multi-spectral distributions.
+
+    Parameters
+    ----------
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
+    shape : SpectralShape
+        Spectral shape to align the values to.
+
+    Returns
+    -------
+    ndarray, (M, n)
+        Aligned values.
+    """
+
+    wavelengths = shape.range()
+    indexes = np.clip(
+        np.searchsorted(sd.wavelengths, wavelengths), 0,
+        len(sd.wavelengths) - 1)
+
+    if np.all(sd.wavelengths[indexes] == wavelengths):
+        values = sd.values[indexes]
+    else:
+        values = sd.copy().align(shape).values
+
+    return np.reshape(np.transpose(values), [-1, len(wavelengths)])
+
 
-    tcs_data = []
-    for sd_tcs in sds_tcs.to_sds():
-        XYZ = sd_to_XYZ(sd_tcs, cmfs, sd_irradiance)
-        CAM = XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, surround, True)
-        JMh = CAM.J, CAM.M, CAM.h
-        Jpapbp = JMh_CIECAM02_to_CAM02UCS(JMh)
+def _tcs_colorimetry_data_CIE2017(values_irradiance, sds_tcs, cmfs):
+    """
+    Returns the *test colour samples* colorimetry data under given irradiance
+    emitters values for the *CIE 2017 Colour Fidelity Index* (CFI)
+    computations.
+
+    Parameters
+    ----------
+    values_irradiance : array_like, (M, n)
+        Irradiance emitters values aligned to the colour matching functions.
+    sds_tcs : MultiSpectralDistributions
+        *Test colour samples* spectral distributions aligned to the colour
+        matching functions.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    TCS_ColorimetryData_CIE2017
+        *Test colour samples* colorimetry data whose attributes are *ndarray*
+        of shape (M, 99, ...).
+    """
+
+    # All the *test colour samples* tristimulus values under all the
+    # irradiance emitters are computed with a single tensor contraction.
+    S_cmfs = as_float_array(values_irradiance)[..., np.newaxis] * cmfs.values
+    k = 100 / np.sum(S_cmfs[..., 1], axis=-1)
+
+    XYZ_w = k[..., np.newaxis] * np.sum(S_cmfs, axis=-2)
+    XYZ = k[..., np.newaxis, np.newaxis] * np.matmul(
+        np.transpose(sds_tcs.values), S_cmfs)
+
+    XYZ_w = np.broadcast_to(XYZ_w[:, np.newaxis, :], XYZ.shape)
+    Y_b = np.full(XYZ.shape[:-1], 20)
+    L_A = np.full(XYZ.shape[:-1], 100)
+    surround = VIEWING_CONDITIONS_CIECAM02['Average']
 
-        tcs_data.append(
-            TCS_ColorimetryData_CIE2017(sd_tcs.name, XYZ, CAM, JMh, Jpapbp))
+    CAM = XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b, surround, True)
+    JMh = tstack([CAM.J, CAM.M, CAM.h])
+    Jpapbp = JMh_CIECAM02_to_CAM02UCS(JMh)
 
-    return tcs_data
+    return TCS_ColorimetryData_CIE2017(sds_tcs.labels, XYZ, CAM, JMh, Jpapbp)
 
 
 def delta_E_to_R_f(delta_E):
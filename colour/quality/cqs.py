@@ -27,14 +27,16 @@ from collections import namedtuple
 
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
-    SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series, CCS_ILLUMINANTS,
-    MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+    SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES, SPECTRAL_SHAPE_DEFAULT,
+    CCS_ILLUMINANTS, MSDS_CMFS_STANDARD_OBSERVER, MultiSpectralDistributions,
+    planck_law)
 from colour.quality.datasets.vs import INDEXES_TO_NAMES_VS, SDS_VS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
 from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import as_float_array, domain_range_scale, tsplit
+from colour.utilities import (as_float, as_float_array, register_cache,
+                              tsplit)
 from colour.utilities.documentation import (DocstringTuple,
                                             is_documentation_building)
 
@@ -52,6 +54,9 @@ __all__ = [
     'scale_conversion', 'delta_E_RMS', 'colour_quality_scales'
 ]
 
+_CACHE_VS_CQS = register_cache(
+    '{0}._CACHE_VS_CQS'.format(__name__), maximum_size=8)
+
 GAMUT_AREA_D65 = 8210
 """
 Gamut area for *CIE Illuminant D Series D65*.
@@ -113,6 +118,16 @@ class ColourRendering_Specification_CQS(
     colorimetry_data : tuple
         Colorimetry data for the test and reference computations.
 
+    Notes
+    -----
+    -   When the *Colour Quality Scale* (CQS) is computed for a
+        :class:`colour.MultiSpectralDistributions` class instance, i.e. a
+        batch of :math:`M` test spectral distributions, the scales and the
+        individual *Colour Quality Scale* (CQS) data are *ndarray* of shape
+        (M, ), and the *VS test colour samples* colorimetry data are stored
+        in a single :class:`colour.quality.cqs.VS_ColorimetryData` class
+        instance whose attributes are *ndarray* of shape (M, 15, ...).
+
     References
     ----------
     :cite:`Davis2010a`, :cite:`Ohno2008a`,  :cite:`Ohno2013`
@@ -142,8 +157,9 @@ def colour_quality_scale(sd_test, additional_data=False,
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions, in which
+        case each distribution is evaluated as a separate test light source.
     additional_data : bool, optional
         Whether to output additional data.
     method : unicode, optional
@@ -152,9 +168,18 @@ def colour_quality_scale(sd_test, additional_data=False,
 
     Returns
     -------
-    numeric or ColourRendering_Specification_CQS
+    numeric or ndarray or ColourRendering_Specification_CQS
         Color quality scale.
 
+    Notes
+    -----
+    -   The *VS test colour samples* reflectances are aligned once per
+        method and spectral shape and cached, all the test light sources are
+        then evaluated with a handful of matrix products. Multi-spectral
+        distributions already aligned to the
+        :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute spectral shape avoid
+        a costly per-signal alignment.
+
     References
     ----------
     :cite:`Davis2010a`, :cite:`Ohno2008a`, :cite:`Ohno2013`
@@ -165,6 +190,14 @@ def colour_quality_scale(sd_test, additional_data=False,
     >>> sd = SDS_ILLUMINANTS['FL2']
     >>> colour_quality_scale(sd)  # doctest: +ELLIPSIS
     64.1117031...
+    >>> from colour import LinearInterpolator
+    >>> msds = MultiSpectralDistributions(
+    ...     np.transpose([SDS_ILLUMINANTS[illuminant].values
+    ...                   for illuminant in ('FL1', 'FL2', 'FL3')]),
+    ...     SDS_ILLUMINANTS['FL2'].wavelengths,
+    ...     interpolator=LinearInterpolator)
+    >>> colour_quality_scale(msds)  # doctest: +ELLIPSIS
+    array([ 74.9825858...,  64.1117031...,  57.8940308...])
     """
 
     method = method.lower()
@@ -178,37 +211,36 @@ def colour_quality_scale(sd_test, additional_data=False,
             SPECTRAL_SHAPE_DEFAULT)
 
     shape = cmfs.shape
-    sd_test = sd_test.copy().align(shape)
-    vs_sds = {
-        sd.name: sd.copy().align(shape)
-        for sd in SDS_VS[method].values()
-    }
+    is_msds = isinstance(sd_test, MultiSpectralDistributions)
+    if not is_msds or sd_test.shape != shape:
+        sd_test = sd_test.copy().align(shape)
 
-    with domain_range_scale('1'):
-        XYZ = sd_to_XYZ(sd_test, cmfs)
+    values_test = np.reshape(np.transpose(sd_test.values), [-1, len(shape)])
 
-    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
-    CCT, _D_uv = uv_to_CCT_Ohno2013(uv)
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(values_test, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Ohno2013(uv))
 
-    if CCT < 5000:
-        sd_reference = sd_blackbody(CCT, shape)
-    else:
-        xy = CCT_to_xy_CIE_D(CCT)
-        sd_reference = sd_CIE_illuminant_D_series(xy)
-        sd_reference.align(shape)
+    values_reference = _sds_reference_illuminant_CQS(CCT, shape)
+
+    names_vs, values_vs = _vs_CQS(method, shape)
 
-    test_vs_colorimetry_data = vs_colorimetry_data(
-        sd_test, sd_reference, vs_sds, cmfs, chromatic_adaptation=True)
+    test_vs_colorimetry_data = _vs_colorimetry_data_CQS(
+        values_test,
+        values_reference,
+        values_vs,
+        names_vs,
+        cmfs,
+        chromatic_adaptation=True)
 
-    reference_vs_colorimetry_data = vs_colorimetry_data(
-        sd_reference, sd_reference, vs_sds, cmfs)
+    reference_vs_colorimetry_data = _vs_colorimetry_data_CQS(
+        values_reference, values_reference, values_vs, names_vs, cmfs)
 
     if method == 'nist cqs 9.0':
         CCT_f = 1
         scaling_f = 3.2
     else:
-        XYZ_r = sd_to_XYZ(sd_reference, cmfs)
-        XYZ_r /= XYZ_r[1]
+        XYZ_r = np.dot(values_reference, cmfs.values)
+        XYZ_r /= XYZ_r[..., 1, np.newaxis]
         CCT_f = CCT_factor(reference_vs_colorimetry_data, XYZ_r)
         scaling_f = 3.104
 
@@ -228,24 +260,40 @@ def colour_quality_scale(sd_test, additional_data=False,
 
     Q_f = scale_conversion(D_E_RMS, CCT_f, scaling_f)
 
-    G_t = gamut_area(
-        [vs_CQS_data.Lab for vs_CQS_data in test_vs_colorimetry_data])
-    G_r = gamut_area(
-        [vs_CQS_data.Lab for vs_CQS_data in reference_vs_colorimetry_data])
+    G_t = gamut_area(test_vs_colorimetry_data.Lab)
+    G_r = gamut_area(reference_vs_colorimetry_data.Lab)
 
     Q_g = G_t / GAMUT_AREA_D65 * 100
 
     if method == 'nist cqs 9.0':
         Q_d = Q_p = None
     else:
-        p_delta_C = np.average([
-            sample_data.D_C_ab if sample_data.D_C_ab > 0 else 0
-            for sample_data in Q_as.values()
-        ])
+        p_delta_C = np.average(
+            [
+                np.where(sample_data.D_C_ab > 0, sample_data.D_C_ab, 0)
+                for sample_data in Q_as.values()
+            ],
+            axis=0)
         Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
         Q_d = G_t / G_r * CCT_f * 100
 
+    if not is_msds:
+        Q_a, Q_f, Q_g = Q_a[0], Q_f[0], Q_g[0]
+        if method != 'nist cqs 9.0':
+            Q_p, Q_d = Q_p[0], Q_d[0]
+
     if additional_data:
+        if not is_msds:
+            Q_as = {
+                key: VS_ColourQualityScaleData(
+                    *[value.name] + [attribute[0] for attribute in value[1:]])
+                for key, value in Q_as.items()
+            }
+            test_vs_colorimetry_data = _vs_colorimetry_data_unpack_CQS(
+                test_vs_colorimetry_data)
+            reference_vs_colorimetry_data = _vs_colorimetry_data_unpack_CQS(
+                reference_vs_colorimetry_data)
+
         return ColourRendering_Specification_CQS(
             sd_test.name, Q_a, Q_f, Q_p, Q_g, Q_d, Q_as,
             (test_vs_colorimetry_data, reference_vs_colorimetry_data))
@@ -253,6 +301,92 @@ def colour_quality_scale(sd_test, additional_data=False,
         return Q_a
 
 
+def _vs_CQS(method, shape):
+    """
+    Returns the *VS test colour samples* names and reflectances of given
+    method aligned to given spectral shape.
+
+    The aligned reflectances are cached and won't be aligned again on
+    subsequent calls to this definition.
+
+    Parameters
+    ----------
+    method : unicode
+        **{'nist cqs 9.0', 'nist cqs 7.4'}**,
+        Computation method.
+    shape : SpectralShape
+        Spectral shape to align the reflectances to.
+
+    Returns
+    -------
+    tuple
+        *VS test colour samples* names and reflectances as an (n, 15)
+        *ndarray*.
+    """
+
+    key = (method, shape.start, shape.end, shape.interval)
+
+    vs = _CACHE_VS_CQS.get(key)
+    if vs is not None:
+        return vs
+
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_VS.items())]
+    values = np.transpose(
+        [SDS_VS[method][name].copy().align(shape).values for name in names])
+
+    vs = _CACHE_VS_CQS[key] = names, values
+
+    return vs
+
+
+def _sds_reference_illuminant_CQS(CCT, shape):
+    """
+    Computes the values of the reference illuminants for given correlated
+    colour temperatures :math:`T_{cp}`, i.e. a Planckian radiator below
+    5000K and a *CIE Illuminant D Series* above.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray, (M, n)
+        Reference illuminants values.
+    """
+
+    CCT = np.ravel(CCT)
+    wavelengths = shape.range()
+
+    values = np.empty([CCT.shape[0], wavelengths.shape[0]])
+
+    is_planckian = CCT < 5000
+    values[is_planckian] = planck_law(wavelengths * 1e-9,
+                                      CCT[is_planckian, np.newaxis]) * 1e-9
+
+    # NOTE: The *CIE Illuminant D Series* variables are rounded and its basis
+    # functions linearly interpolated as per
+    # :func:`colour.sd_CIE_illuminant_D_series` definition.
+    x, y = tsplit(
+        np.reshape(CCT_to_xy_CIE_D(CCT[~is_planckian]), [-1, 2]))
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+    M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+    S0, S1, S2 = [
+        np.interp(wavelengths, basis_function.wavelengths,
+                  basis_function.values)
+        for basis_function in (SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[i]
+                               for i in ('S0', 'S1', 'S2'))
+    ]
+    values[~is_planckian] = (S0 + M1[..., np.newaxis] * S1 +
+                             M2[..., np.newaxis] * S2)
+
+    return values
+
+
 def gamut_area(Lab):
     """
     Returns the gamut area :math:`G` covered by given *CIE L\\*a\\*b\\**
@@ -261,11 +395,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\\*a\\*b\\** colourspace matrices.
+        *CIE L\\*a\\*b\\** colourspace matrices, the penultimate axis
+        indexing the samples.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -292,18 +427,15 @@ def gamut_area(Lab):
     """
 
     Lab = as_float_array(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
-
-    _L, a, b = tsplit(Lab)
-    _L_s, a_s, b_s = tsplit(Lab_s)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack([a_s - a, b_s - b]), axis=-1)
+    C = np.linalg.norm(Lab_s[..., 1:3] - Lab[..., 1:3], axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(sd_test,
@@ -316,10 +448,12 @@ def vs_colorimetry_data(sd_test,
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
-    sd_reference : SpectralDistribution
-        Reference spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions of
+        :math:`M` test light sources.
+    sd_reference : SpectralDistribution or MultiSpectralDistributions
+        Reference spectral distribution or multi-spectral distributions of
+        :math:`M` reference illuminants.
     sds_vs : dict
         *VS test colour samples* spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
@@ -329,33 +463,115 @@ def vs_colorimetry_data(sd_test,
 
     Returns
     -------
-    list
-        *VS test colour samples* colorimetry data.
+    list or VS_ColorimetryData
+        *VS test colour samples* colorimetry data. If multi-spectral
+        distributions are given, a single
+        :class:`colour.quality.cqs.VS_ColorimetryData` class instance is
+        returned whose attributes are *ndarray* of shape (M, 15, ...).
+    """
+
+    values_test, values_reference = [
+        np.reshape(
+            np.transpose((sd if sd.shape == cmfs.shape else sd.copy().align(
+                cmfs.shape)).values), [-1, len(cmfs.shape)])
+        for sd in (sd_test, sd_reference)
+    ]
+
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_VS.items())]
+    values_vs = np.transpose([
+        (sds_vs[name] if sds_vs[name].shape == cmfs.shape else
+         sds_vs[name].copy().align(cmfs.shape)).values for name in names
+    ])
+
+    vs_data = _vs_colorimetry_data_CQS(
+        values_test, values_reference, values_vs,
+        [sds_vs[name].name for name in names], cmfs, chromatic_adaptation)
+
+    if isinstance(sd_test, MultiSpectralDistributions):
+        return vs_data
+
+    return _vs_colorimetry_data_unpack_CQS(vs_data)
+
+
+def _vs_colorimetry_data_CQS(values_test,
+                             values_reference,
+                             values_vs,
+                             names_vs,
+                             cmfs,
+                             chromatic_adaptation=False):
     """
+    Returns the *VS test colour samples* colorimetry data under given test
+    light sources values.
 
-    XYZ_t = sd_to_XYZ(sd_test, cmfs)
-    XYZ_t /= XYZ_t[1]
+    Parameters
+    ----------
+    values_test : array_like, (M, n)
+        Test light sources values aligned to the colour matching functions.
+    values_reference : array_like, (M, n)
+        Reference illuminants values aligned to the colour matching functions.
+    values_vs : array_like, (n, 15)
+        *VS test colour samples* reflectances aligned to the colour matching
+        functions.
+    names_vs : list
+        *VS test colour samples* names.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
 
-    XYZ_r = sd_to_XYZ(sd_reference, cmfs)
-    XYZ_r /= XYZ_r[1]
+    Returns
+    -------
+    VS_ColorimetryData
+        *VS test colour samples* colorimetry data whose attributes are
+        *ndarray* of shape (M, 15, ...).
+    """
+
+    XYZ_t = np.dot(values_test, cmfs.values)
+    XYZ_t /= XYZ_t[..., 1, np.newaxis]
+
+    XYZ_r = np.dot(values_reference, cmfs.values)
+    XYZ_r /= XYZ_r[..., 1, np.newaxis]
     xy_r = XYZ_to_xy(XYZ_r)
 
-    vs_data = []
-    for _key, value in sorted(INDEXES_TO_NAMES_VS.items()):
-        sd_vs = sds_vs[value]
+    S_cmfs = values_test[..., np.newaxis] * cmfs.values
+    XYZ_vs = (np.matmul(np.transpose(values_vs), S_cmfs) /
+              np.sum(S_cmfs[..., 1], axis=-1)[..., np.newaxis, np.newaxis])
 
-        with domain_range_scale('1'):
-            XYZ_vs = sd_to_XYZ(sd_vs, cmfs, sd_test)
+    if chromatic_adaptation:
+        XYZ_vs = chromatic_adaptation_VonKries(
+            XYZ_vs,
+            XYZ_t[..., np.newaxis, :],
+            XYZ_r[..., np.newaxis, :],
+            transform='CMCCAT2000')
 
-        if chromatic_adaptation:
-            XYZ_vs = chromatic_adaptation_VonKries(
-                XYZ_vs, XYZ_t, XYZ_r, transform='CMCCAT2000')
+    Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r[..., np.newaxis, :])
+    _L_vs, C_vs, _Hab = tsplit(Lab_to_LCHab(Lab_vs))
 
-        Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r)
-        _L_vs, C_vs, _Hab = Lab_to_LCHab(Lab_vs)
+    return VS_ColorimetryData(names_vs, XYZ_vs, Lab_vs, C_vs)
 
-        vs_data.append(VS_ColorimetryData(sd_vs.name, XYZ_vs, Lab_vs, C_vs))
-    return vs_data
+
+def _vs_colorimetry_data_unpack_CQS(vs_data):
+    """
+    Unpacks given *VS test colour samples* colorimetry data of a single test
+    light source into a list of per-sample colorimetry data.
+
+    Parameters
+    ----------
+    vs_data : VS_ColorimetryData
+        *VS test colour samples* colorimetry data whose attributes are
+        *ndarray* of shape (1, 15, ...).
+
+    Returns
+    -------
+    list
+        *VS test colour samples* colorimetry data.
+    """
+
+    return [
+        VS_ColorimetryData(name, vs_data.XYZ[0, i], vs_data.Lab[0, i],
+                           vs_data.C[0, i])
+        for i, name in enumerate(vs_data.name)
+    ]
 
 
 def CCT_factor(reference_data, XYZ_r):
@@ -365,31 +581,38 @@ def CCT_factor(reference_data, XYZ_r):
 
     Parameters
     ----------
-    reference_data : VS_ColorimetryData
+    reference_data : list or VS_ColorimetryData
         Reference colorimetry data.
     XYZ_r : array_like
         *CIE XYZ* tristimulus values for reference.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Correlated colour temperature factor.
     """
 
     xy_w = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
     XYZ_w = xy_to_XYZ(xy_w)
 
-    Labs = []
-    for vs_colorimetry_data_ in reference_data:
-        _name, XYZ, _Lab, _C = vs_colorimetry_data_
-        XYZ_a = chromatic_adaptation_VonKries(
-            XYZ, XYZ_r, XYZ_w, transform='CMCCAT2000')
+    if isinstance(reference_data, VS_ColorimetryData):
+        XYZ = reference_data.XYZ
+    else:
+        XYZ = as_float_array(
+            [vs_colorimetry_data_.XYZ for vs_colorimetry_data_ in
+             reference_data])
+
+    XYZ_a = chromatic_adaptation_VonKries(
+        XYZ,
+        np.broadcast_to(
+            as_float_array(XYZ_r)[..., np.newaxis, :], XYZ.shape),
+        XYZ_w,
+        transform='CMCCAT2000')
 
-        Lab = XYZ_to_Lab(XYZ_a, illuminant=xy_w)
-        Labs.append(Lab)
+    Labs = XYZ_to_Lab(XYZ_a, illuminant=xy_w)
 
     G_r = gamut_area(Labs) / GAMUT_AREA_D65
-    CCT_f = 1 if G_r > 1 else G_r
+    CCT_f = as_float(np.where(G_r > 1, 1, G_r))
 
     return CCT_f
 
@@ -438,10 +661,12 @@ def delta_E_RMS(cqs_data, attribute):
         Root-mean-square average.
     """
 
-    return np.sqrt(1 / len(cqs_data) * np.sum([
-        getattr(sample_data, attribute) ** 2
-        for sample_data in cqs_data.values()
-    ]))
+    return np.sqrt(1 / len(cqs_data) * np.sum(
+        [
+            getattr(sample_data, attribute) ** 2
+            for sample_data in cqs_data.values()
+        ],
+        axis=0))
 
 
 def colour_quality_scales(test_data, reference_data, scaling_f, CCT_f):
@@ -450,13 +675,13 @@ def colour_quality_scales(test_data, reference_data, scaling_f, CCT_f):
 
     Parameters
     ----------
-    test_data : list
+    test_data : list or VS_ColorimetryData
         Test data.
-    reference_data : list
+    reference_data : list or VS_ColorimetryData
         Reference data.
     scaling_f : numeric, optional
         Scaling factor constant.
-    CCT_f : numeric
+    CCT_f : numeric or array_like
         Factor penalizing lamps with extremely low correlated colour
         temperatures.
 
@@ -466,6 +691,23 @@ def colour_quality_scales(test_data, reference_data, scaling_f, CCT_f):
         *VS Test colour samples* colour rendering scales.
     """
 
+    if isinstance(test_data, VS_ColorimetryData):
+        D_C_ab = test_data.C - reference_data.C
+        D_E_ab = euclidean_distance(test_data.Lab, reference_data.Lab)
+        D_Ep_ab = np.where(D_C_ab > 0,
+                           np.sqrt(np.abs(D_E_ab ** 2 - D_C_ab ** 2)), D_E_ab)
+
+        Q_a = scale_conversion(D_Ep_ab,
+                               as_float_array(CCT_f)[..., np.newaxis],
+                               scaling_f)
+
+        return {
+            i + 1: VS_ColourQualityScaleData(name, Q_a[..., i],
+                                             D_C_ab[..., i], D_E_ab[..., i],
+                                             D_Ep_ab[..., i])
+            for i, name in enumerate(test_data.name)
+        }
+
     Q_as = {}
     for i, _ in enumerate(test_data):
         D_C_ab = test_data[i].C - reference_data[i].C
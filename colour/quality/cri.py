@@ -21,12 +21,12 @@ from collections import namedtuple
 
 from colour.algebra import euclidean_distance, spow
 from colour.colorimetry import (
-    SPECTRAL_SHAPE_DEFAULT, sd_CIE_illuminant_D_series,
-    MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody, sd_to_XYZ)
+    SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES, SPECTRAL_SHAPE_DEFAULT,
+    MSDS_CMFS_STANDARD_OBSERVER, MultiSpectralDistributions, planck_law)
 from colour.quality.datasets.tcs import INDEXES_TO_NAMES_TCS, SDS_TCS
-from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
+from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
-from colour.utilities import domain_range_scale
+from colour.utilities import as_float, register_cache, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -41,6 +41,9 @@ __all__ = [
     'tcs_colorimetry_data', 'colour_rendering_indexes'
 ]
 
+_CACHE_TCS_CRI = register_cache(
+    '{0}._CACHE_TCS_CRI'.format(__name__), maximum_size=8)
+
 
 class TCS_ColorimetryData(
         namedtuple('TCS_ColorimetryData', ('name', 'XYZ', 'uv', 'UVW'))):
@@ -67,13 +70,23 @@ class ColourRendering_Specification_CRI(
     ----------
     name : unicode
         Name of the test spectral distribution.
-    Q_a : numeric
+    Q_a : numeric or ndarray
         *Colour Rendering Index* (CRI) :math:`Q_a`.
     Q_as : dict
         Individual *colour rendering indexes* data for each sample.
     colorimetry_data : tuple
         Colorimetry data for the test and reference computations.
 
+    Notes
+    -----
+    -   When the *Colour Rendering Index* (CRI) is computed for a
+        :class:`colour.MultiSpectralDistributions` class instance, i.e. a
+        batch of :math:`M` test spectral distributions, :math:`Q_a` and the
+        individual *colour rendering indexes* are *ndarray* of shape (M, ),
+        and the *test colour samples* colorimetry data are stored in a single
+        :class:`colour.quality.cri.TCS_ColorimetryData` class instance whose
+        attributes are *ndarray* of shape (M, 14, ...).
+
     References
     ----------
     :cite:`Ohno2008a`
@@ -87,16 +100,25 @@ def colour_rendering_index(sd_test, additional_data=False):
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions, in which
+        case each distribution is evaluated as a separate test light source.
     additional_data : bool, optional
         Whether to output additional data.
 
     Returns
     -------
-    numeric or ColourRendering_Specification_CRI
+    numeric or ndarray or ColourRendering_Specification_CRI
         *Colour Rendering Index* (CRI).
 
+    Notes
+    -----
+    -   The *test colour samples* reflectances are aligned once per spectral
+        shape and cached, all the test light sources are then evaluated with
+        a handful of matrix products. Multi-spectral distributions already
+        aligned to the :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute
+        spectral shape avoid a costly per-signal alignment.
+
     References
     ----------
     :cite:`Ohno2008a`
@@ -107,6 +129,14 @@ def colour_rendering_index(sd_test, additional_data=False):
     >>> sd = SDS_ILLUMINANTS['FL2']
     >>> colour_rendering_index(sd)  # doctest: +ELLIPSIS
     64.2337241...
+    >>> from colour import LinearInterpolator
+    >>> msds = MultiSpectralDistributions(
+    ...     np.transpose([SDS_ILLUMINANTS[illuminant].values
+    ...                   for illuminant in ('FL1', 'FL2', 'FL3')]),
+    ...     SDS_ILLUMINANTS['FL2'].wavelengths,
+    ...     interpolator=LinearInterpolator)
+    >>> colour_rendering_index(msds)  # doctest: +ELLIPSIS
+    array([ 75.8528279...,  64.2337241...,  56.7896565...])
     """
 
     cmfs = MSDS_CMFS_STANDARD_OBSERVER[
@@ -114,35 +144,51 @@ def colour_rendering_index(sd_test, additional_data=False):
             SPECTRAL_SHAPE_DEFAULT)
 
     shape = cmfs.shape
-    sd_test = sd_test.copy().align(shape)
-    tcs_sds = {sd.name: sd.copy().align(shape) for sd in SDS_TCS.values()}
+    is_msds = isinstance(sd_test, MultiSpectralDistributions)
+    if not is_msds or sd_test.shape != shape:
+        sd_test = sd_test.copy().align(shape)
 
-    with domain_range_scale('1'):
-        XYZ = sd_to_XYZ(sd_test, cmfs)
+    values_test = np.reshape(np.transpose(sd_test.values), [-1, len(shape)])
 
-    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
-    CCT, _D_uv = uv_to_CCT_Robertson1968(uv)
+    uv = UCS_to_uv(XYZ_to_UCS(np.dot(values_test, cmfs.values)))
+    CCT, _D_uv = tsplit(uv_to_CCT_Robertson1968(uv))
 
-    if CCT < 5000:
-        sd_reference = sd_blackbody(CCT, shape)
-    else:
-        xy = CCT_to_xy_CIE_D(CCT)
-        sd_reference = sd_CIE_illuminant_D_series(xy)
-        sd_reference.align(shape)
+    values_reference = _sds_reference_illuminant_CRI(CCT, shape)
+
+    names_tcs, values_tcs = _tcs_CRI(shape)
 
-    test_tcs_colorimetry_data = tcs_colorimetry_data(
-        sd_test, sd_reference, tcs_sds, cmfs, chromatic_adaptation=True)
+    test_tcs_colorimetry_data = _tcs_colorimetry_data_CRI(
+        values_test,
+        values_reference,
+        values_tcs,
+        names_tcs,
+        cmfs,
+        chromatic_adaptation=True)
 
-    reference_tcs_colorimetry_data = tcs_colorimetry_data(
-        sd_reference, sd_reference, tcs_sds, cmfs)
+    reference_tcs_colorimetry_data = _tcs_colorimetry_data_CRI(
+        values_reference, values_reference, values_tcs, names_tcs, cmfs)
 
-    Q_as = colour_rendering_indexes(test_tcs_colorimetry_data,
-                                    reference_tcs_colorimetry_data)
+    Q_as = 100 - 4.6 * euclidean_distance(reference_tcs_colorimetry_data.UVW,
+                                          test_tcs_colorimetry_data.UVW)
 
-    Q_a = np.average(
-        [v.Q_a for k, v in Q_as.items() if k in (1, 2, 3, 4, 5, 6, 7, 8)])
+    Q_a = np.average(Q_as[..., :8], axis=-1)
+
+    if not is_msds:
+        Q_a = Q_a[0]
 
     if additional_data:
+        if not is_msds:
+            Q_as = Q_as[0]
+            test_tcs_colorimetry_data = _tcs_colorimetry_data_unpack_CRI(
+                test_tcs_colorimetry_data)
+            reference_tcs_colorimetry_data = _tcs_colorimetry_data_unpack_CRI(
+                reference_tcs_colorimetry_data)
+
+        Q_as = {
+            i + 1: TCS_ColourQualityScaleData(name, as_float(Q_as[..., i]))
+            for i, name in enumerate(names_tcs)
+        }
+
         return ColourRendering_Specification_CRI(
             sd_test.name, Q_a, Q_as,
             (test_tcs_colorimetry_data, reference_tcs_colorimetry_data))
@@ -150,6 +196,89 @@ def colour_rendering_index(sd_test, additional_data=False):
         return Q_a
 
 
+def _tcs_CRI(shape):
+    """
+    Returns the *test colour samples* names and reflectances aligned to given
+    spectral shape.
+
+    The aligned reflectances are cached and won't be aligned again on
+    subsequent calls to this definition.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape to align the reflectances to.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* names and reflectances as an (n, 14)
+        *ndarray*.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    tcs = _CACHE_TCS_CRI.get(key)
+    if tcs is not None:
+        return tcs
+
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_TCS.items())]
+    values = np.transpose(
+        [SDS_TCS[name].copy().align(shape).values for name in names])
+
+    tcs = _CACHE_TCS_CRI[key] = names, values
+
+    return tcs
+
+
+def _sds_reference_illuminant_CRI(CCT, shape):
+    """
+    Computes the values of the reference illuminants for given correlated
+    colour temperatures :math:`T_{cp}`, i.e. a Planckian radiator below
+    5000K and a *CIE Illuminant D Series* above.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+
+    Returns
+    -------
+    ndarray, (M, n)
+        Reference illuminants values.
+    """
+
+    CCT = np.ravel(CCT)
+    wavelengths = shape.range()
+
+    values = np.empty([CCT.shape[0], wavelengths.shape[0]])
+
+    is_planckian = CCT < 5000
+    values[is_planckian] = planck_law(wavelengths * 1e-9,
+                                      CCT[is_planckian, np.newaxis]) * 1e-9
+
+    # NOTE: The *CIE Illuminant D Series* variables are rounded and its basis
+    # functions linearly interpolated as per
+    # :func:`colour.sd_CIE_illuminant_D_series` definition.
+    x, y = tsplit(
+        np.reshape(CCT_to_xy_CIE_D(CCT[~is_planckian]), [-1, 2]))
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = np.around((-1.3515 - 1.7703 * x + 5.9114 * y) / M, 3)
+    M2 = np.around((0.0300 - 31.4424 * x + 30.0717 * y) / M, 3)
+    S0, S1, S2 = [
+        np.interp(wavelengths, basis_function.wavelengths,
+                  basis_function.values)
+        for basis_function in (SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES[i]
+                               for i in ('S0', 'S1', 'S2'))
+    ]
+    values[~is_planckian] = (S0 + M1[..., np.newaxis] * S1 +
+                             M2[..., np.newaxis] * S2)
+
+    return values
+
+
 def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
                          chromatic_adaptation=False):
     """
@@ -157,10 +286,12 @@ def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
 
     Parameters
     ----------
-    sd_t : SpectralDistribution
-        Test spectral distribution.
-    sd_r : SpectralDistribution
-        Reference spectral distribution.
+    sd_t : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions of
+        :math:`M` test light sources.
+    sd_r : SpectralDistribution or MultiSpectralDistributions
+        Reference spectral distribution or multi-spectral distributions of
+        :math:`M` reference illuminants.
     sds_tcs : dict
         *Test colour samples* spectral distributions.
     cmfs : XYZ_ColourMatchingFunctions
@@ -170,60 +301,138 @@ def tcs_colorimetry_data(sd_t, sd_r, sds_tcs, cmfs,
 
     Returns
     -------
-    list
-        *Test colour samples* colorimetry data.
+    list or TCS_ColorimetryData
+        *Test colour samples* colorimetry data. If multi-spectral
+        distributions are given, a single
+        :class:`colour.quality.cri.TCS_ColorimetryData` class instance is
+        returned whose attributes are *ndarray* of shape (M, 14, ...).
+    """
+
+    values_t, values_r = [
+        np.reshape(
+            np.transpose((sd if sd.shape == cmfs.shape else sd.copy().align(
+                cmfs.shape)).values), [-1, len(cmfs.shape)])
+        for sd in (sd_t, sd_r)
+    ]
+
+    names = [value for _key, value in sorted(INDEXES_TO_NAMES_TCS.items())]
+    values_tcs = np.transpose([
+        (sds_tcs[name] if sds_tcs[name].shape == cmfs.shape else
+         sds_tcs[name].copy().align(cmfs.shape)).values for name in names
+    ])
+
+    tcs_data = _tcs_colorimetry_data_CRI(
+        values_t, values_r, values_tcs, [sds_tcs[name].name for name in names],
+        cmfs, chromatic_adaptation)
+
+    if isinstance(sd_t, MultiSpectralDistributions):
+        return tcs_data
+
+    return _tcs_colorimetry_data_unpack_CRI(tcs_data)
+
+
+def _tcs_colorimetry_data_CRI(values_t,
+                              values_r,
+                              values_tcs,
+                              names_tcs,
+                              cmfs,
+                              chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* colorimetry data under given test light
+    sources values.
+
+    Parameters
+    ----------
+    values_t : array_like, (M, n)
+        Test light sources values aligned to the colour matching functions.
+    values_r : array_like, (M, n)
+        Reference illuminants values aligned to the colour matching functions.
+    values_tcs : array_like, (n, 14)
+        *Test colour samples* reflectances aligned to the colour matching
+        functions.
+    names_tcs : list
+        *Test colour samples* names.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    TCS_ColorimetryData
+        *Test colour samples* colorimetry data whose attributes are *ndarray*
+        of shape (M, 14, ...).
     """
 
-    XYZ_t = sd_to_XYZ(sd_t, cmfs)
-    uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
-    u_t, v_t = uv_t[0], uv_t[1]
+    u_t, v_t = tsplit(UCS_to_uv(XYZ_to_UCS(np.dot(values_t, cmfs.values))))
+    u_r, v_r = tsplit(UCS_to_uv(XYZ_to_UCS(np.dot(values_r, cmfs.values))))
+
+    S_cmfs = values_t[..., np.newaxis] * cmfs.values
+    k = 100 / np.sum(S_cmfs[..., 1], axis=-1)
+
+    XYZ_tcs = k[..., np.newaxis, np.newaxis] * np.matmul(
+        np.transpose(values_tcs), S_cmfs)
+    uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
+    u_tcs, v_tcs = tsplit(uv_tcs)
+
+    u_t, v_t = u_t[..., np.newaxis], v_t[..., np.newaxis]
+    u_r, v_r = u_r[..., np.newaxis], v_r[..., np.newaxis]
+
+    if chromatic_adaptation:
 
-    XYZ_r = sd_to_XYZ(sd_r, cmfs)
-    uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
-    u_r, v_r = uv_r[0], uv_r[1]
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
 
-    tcs_data = []
-    for _key, value in sorted(INDEXES_TO_NAMES_TCS.items()):
-        sd_tcs = sds_tcs[value]
-        XYZ_tcs = sd_to_XYZ(sd_tcs, cmfs, sd_t)
-        xyY_tcs = XYZ_to_xyY(XYZ_tcs)
-        uv_tcs = UCS_to_uv(XYZ_to_UCS(XYZ_tcs))
-        u_tcs, v_tcs = uv_tcs[0], uv_tcs[1]
+            return (4 - x - 10 * y) / y
 
-        if chromatic_adaptation:
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
 
-            def c(x, y):
-                """
-                Computes the :math:`c` term.
-                """
+            return (1.708 * y + 0.404 - 1.481 * x) / y
 
-                return (4 - x - 10 * y) / y
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = (
+            (10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+            (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
 
-            def d(x, y):
-                """
-                Computes the :math:`d` term.
-                """
+    W_tcs = 25 * spow(XYZ_tcs[..., 1], 1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
 
-                return (1.708 * y + 0.404 - 1.481 * x) / y
+    return TCS_ColorimetryData(names_tcs, XYZ_tcs, uv_tcs,
+                               tstack([U_tcs, V_tcs, W_tcs]))
 
-            c_t, d_t = c(u_t, v_t), d(u_t, v_t)
-            c_r, d_r = c(u_r, v_r), d(u_r, v_r)
-            tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
-            u_tcs = (
-                (10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
-                (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
-            v_tcs = (5.52 /
-                     (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
 
-        W_tcs = 25 * spow(xyY_tcs[-1], 1 / 3) - 17
-        U_tcs = 13 * W_tcs * (u_tcs - u_r)
-        V_tcs = 13 * W_tcs * (v_tcs - v_r)
+def _tcs_colorimetry_data_unpack_CRI(tcs_data):
+    """
+    Unpacks given *test colour samples* colorimetry data of a single test
+    light source into a list of per-sample colorimetry data.
 
-        tcs_data.append(
-            TCS_ColorimetryData(sd_tcs.name, XYZ_tcs, uv_tcs,
-                                np.array([U_tcs, V_tcs, W_tcs])))
+    Parameters
+    ----------
+    tcs_data : TCS_ColorimetryData
+        *Test colour samples* colorimetry data whose attributes are *ndarray*
+        of shape (1, 14, ...).
+
+    Returns
+    -------
+    list
+        *Test colour samples* colorimetry data.
+    """
 
-    return tcs_data
+    return [
+        TCS_ColorimetryData(name, tcs_data.XYZ[0, i], tcs_data.uv[0, i],
+                            tcs_data.UVW[0, i])
+        for i, name in enumerate(tcs_data.name)
+    ]
 
 
 def colour_rendering_indexes(test_data, reference_data):
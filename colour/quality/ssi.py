@@ -17,8 +17,7 @@ References
 import numpy as np
 from scipy.ndimage.filters import convolve1d
 
-from colour.algebra import LinearInterpolator
-from colour.colorimetry import SpectralShape
+from colour.colorimetry import MultiSpectralDistributions, SpectralShape
 from colour.utilities import zeros
 
 __author__ = 'Colour Developers'
@@ -41,6 +40,17 @@ _SPECTRAL_SHAPE_SSI_LARGE = SpectralShape(380, 670, 10)
 
 _MATRIX_INTEGRATION = None
 
+_MATRIX_WEIGHTED_CONVOLUTION = None
+
+_SIZE_CHUNK_SSI = 2 ** 16
+"""
+Number of test and reference pairs evaluated at once by
+:func:`colour.spectral_similarity_index` definition, bounding its memory
+footprint to a few tens of MiB.
+
+_SIZE_CHUNK_SSI : int
+"""
+
 
 def spectral_similarity_index(sd_test, sd_reference):
     """
@@ -49,15 +59,31 @@ def spectral_similarity_index(sd_test, sd_reference):
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
-    sd_reference : SpectralDistribution
-        Reference spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions of
+        :math:`M` test spectral distributions.
+    sd_reference : SpectralDistribution or MultiSpectralDistributions
+        Reference spectral distribution or multi-spectral distributions of
+        :math:`K` reference spectral distributions.
 
     Returns
     -------
-    numeric
-        *Academy Spectral Similarity Index* (SSI).
+    numeric or ndarray
+        *Academy Spectral Similarity Index* (SSI). If multi-spectral
+        distributions are given, the *Academy Spectral Similarity Index* (SSI)
+        of every test and reference pair is returned as an *ndarray* of shape
+        (M, K), the axis of a single spectral distribution being dropped.
+
+    Notes
+    -----
+    -   The linear interpolation and zero extrapolation of the spectral
+        distributions to the :attr:`colour.quality.SPECTRAL_SHAPE_SSI`
+        attribute spectral shape followed by their integration into 10nm
+        bins are expressed as a single resampling matrix per wavelengths
+        domain, thus the spectral distributions are never aligned.
+    -   The test and reference pairs are evaluated in chunks of bounded size
+        so that large :math:`M \\times K` matrices can be computed with a
+        constant memory footprint.
 
     References
     ----------
@@ -70,6 +96,71 @@ def spectral_similarity_index(sd_test, sd_reference):
     >>> sd_reference = SDS_ILLUMINANTS['D65']
     >>> spectral_similarity_index(sd_test, sd_reference)
     94.0
+    >>> from colour import SpectralShape
+    >>> msds_test = MultiSpectralDistributions(
+    ...     np.transpose([
+    ...         SDS_ILLUMINANTS[illuminant].copy().align(
+    ...             SpectralShape(360, 780, 5)).values
+    ...         for illuminant in ('C', 'D50', 'A')
+    ...     ]), SpectralShape(360, 780, 5).range())
+    >>> spectral_similarity_index(msds_test, sd_reference)
+    array([ 94.,  85.,  47.])
+    """
+
+    global _MATRIX_WEIGHTED_CONVOLUTION
+
+    if _MATRIX_WEIGHTED_CONVOLUTION is None:
+        weights = np.array([
+            12 / 45, 22 / 45, 32 / 45, 40 / 45, 44 / 45, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 11 / 15, 3 / 15
+        ])
+
+        # The weighting and the convolution of the zero padded relative
+        # differences are linear and can be applied as a single matrix.
+        _MATRIX_WEIGHTED_CONVOLUTION = convolve1d(
+            np.pad(np.diag(weights), [(0, 0), (1, 1)]), [0.22, 0.56, 0.22],
+            axis=-1)
+
+    test_i = _integrated_values_SSI(sd_test)
+    reference_i = _integrated_values_SSI(sd_reference)
+
+    reference_n = 1 / (reference_i + np.mean(reference_i, axis=-1)[...,
+                                                                   np.newaxis])
+
+    SSI = zeros([test_i.shape[0], reference_i.shape[0]])
+    size_chunk = max(_SIZE_CHUNK_SSI // reference_i.shape[0], 1)
+    for i in range(0, test_i.shape[0], size_chunk):
+        d_i = test_i[i:i + size_chunk, np.newaxis] - reference_i
+        dr_i = d_i * reference_n
+        c_wdr_i = np.dot(dr_i, _MATRIX_WEIGHTED_CONVOLUTION)
+        m_v = np.sum(c_wdr_i ** 2, axis=-1)
+
+        SSI[i:i + size_chunk] = np.around(100 - 32 * np.sqrt(m_v))
+
+    if not isinstance(sd_reference, MultiSpectralDistributions):
+        SSI = SSI[..., 0]
+
+    if not isinstance(sd_test, MultiSpectralDistributions):
+        SSI = SSI[0]
+
+    return SSI
+
+
+def _integrated_values_SSI(sd):
+    """
+    Returns the normalised values of given spectral distribution integrated
+    into the :attr:`colour.quality.ssi._SPECTRAL_SHAPE_SSI_LARGE` attribute
+    10nm bins.
+
+    Parameters
+    ----------
+    sd : SpectralDistribution or MultiSpectralDistributions
+        Spectral distribution or multi-spectral distributions.
+
+    Returns
+    -------
+    ndarray, (M, 30)
+        Normalised integrated values.
     """
 
     global _MATRIX_INTEGRATION
@@ -85,32 +176,30 @@ def spectral_similarity_index(sd_test, sd_reference):
         for i in range(_MATRIX_INTEGRATION.shape[0]):
             _MATRIX_INTEGRATION[i, (10 * i):(10 * i + 11)] = weights
 
-    settings = {
-        'interpolator': LinearInterpolator,
-        'extrapolator_kwargs': {
-            'left': 0,
-            'right': 0
-        }
-    }
-
-    sd_test = sd_test.copy().align(SPECTRAL_SHAPE_SSI, **settings)
-    sd_reference = sd_reference.copy().align(SPECTRAL_SHAPE_SSI, **settings)
-
-    test_i = np.dot(_MATRIX_INTEGRATION, sd_test.values)
-    reference_i = np.dot(_MATRIX_INTEGRATION, sd_reference.values)
-
-    test_i /= np.sum(test_i)
-    reference_i /= np.sum(reference_i)
-
-    d_i = test_i - reference_i
-    dr_i = d_i / (reference_i + np.mean(reference_i))
-    wdr_i = dr_i * [
-        12 / 45, 22 / 45, 32 / 45, 40 / 45, 44 / 45, 1, 1, 1, 1, 1, 1, 1, 1, 1,
-        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 11 / 15, 3 / 15
-    ]
-    c_wdr_i = convolve1d(np.hstack([0, wdr_i, 0]), [0.22, 0.56, 0.22])
-    m_v = np.sum(c_wdr_i ** 2)
-
-    SSI = np.around(100 - 32 * np.sqrt(m_v))
-
-    return SSI
+    wavelengths = sd.wavelengths
+    wavelengths_SSI = SPECTRAL_SHAPE_SSI.range()
+
+    # The linear interpolation to the
+    # :attr:`colour.quality.SPECTRAL_SHAPE_SSI` attribute spectral shape, with
+    # zero extrapolation as per *SSI* specification, is expressed as a sparse
+    # resampling matrix holding the interpolation weights of the two nearest
+    # wavelengths.
+    i = np.clip(
+        np.searchsorted(wavelengths, wavelengths_SSI, side='right') - 1, 0,
+        len(wavelengths) - 2)
+    f = ((wavelengths_SSI - wavelengths[i]) /
+         (wavelengths[i + 1] - wavelengths[i]))
+    j = np.where(
+        np.logical_and(wavelengths_SSI >= wavelengths[0],
+                       wavelengths_SSI <= wavelengths[-1]))[0]
+
+    matrix_resampling = zeros([len(wavelengths_SSI), len(wavelengths)])
+    matrix_resampling[j, i[j]] = 1 - f[j]
+    matrix_resampling[j, i[j] + 1] += f[j]
+
+    values_i = np.dot(
+        np.reshape(np.transpose(sd.values), [-1, len(wavelengths)]),
+        np.transpose(np.dot(_MATRIX_INTEGRATION, matrix_resampling)))
+    values_i /= np.sum(values_i, axis=-1)[..., np.newaxis]
+
+    return values_i
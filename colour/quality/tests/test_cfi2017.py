@@ -12,7 +12,8 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (SpectralShape, SpectralDistribution,
-                                sd_blackbody, SDS_ILLUMINANTS)
+                                MultiSpectralDistributions, sd_blackbody,
+                                SDS_ILLUMINANTS)
 from colour.quality.cfi2017 import (CCT_reference_illuminant,
                                     sd_reference_illuminant,
                                     colour_fidelity_index_CIE2017)
@@ -583,6 +584,102 @@ class TestColourFidelityIndexCIE2017(unittest.TestCase):
             66.1, 67.5, 92.6, 51.3, 69.5, 40.7, 61.5, 70.2, 80.0, 67.0, 45.0
         ], 1)
 
+    def test_n_dimensional_colour_fidelity_index_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.colour_fidelity_index_CIE2017`
+        definition n-dimensional support.
+        """
+
+        shape = SD_SAMPLE_5NM.shape
+        sds = [
+            SD_SAMPLE_5NM, SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['FL3'],
+            sd_blackbody(4500, shape),
+            SDS_ILLUMINANTS['D65'].copy().align(shape)
+        ]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]), shape.range())
+
+        specification = colour_fidelity_index_CIE2017(
+            msds, additional_data=True)
+
+        np.testing.assert_almost_equal(
+            colour_fidelity_index_CIE2017(msds), specification.R_f, 7)
+
+        for i, sd in enumerate(sds):
+            specification_i = colour_fidelity_index_CIE2017(
+                sd, additional_data=True)
+
+            np.testing.assert_almost_equal(
+                specification.R_f[i], specification_i.R_f, 7)
+            np.testing.assert_almost_equal(
+                specification.R_s[i], specification_i.R_s, 7)
+            np.testing.assert_almost_equal(
+                specification.CCT[i], specification_i.CCT, 7)
+            np.testing.assert_almost_equal(
+                specification.D_uv[i], specification_i.D_uv, 7)
+            np.testing.assert_allclose(
+                specification.sd_reference.values[:, i],
+                specification_i.sd_reference.values,
+                rtol=1e-10)
+            np.testing.assert_almost_equal(
+                specification.colorimetry_data[0].Jpapbp[i],
+                [data.Jpapbp for data in specification_i.colorimetry_data[0]],
+                7)
+            np.testing.assert_almost_equal(
+                specification.colorimetry_data[1].XYZ[i],
+                [data.XYZ for data in specification_i.colorimetry_data[1]],
+                7)
+
+        shape = SpectralShape(400, 700, 5)
+        sds = [
+            SDS_ILLUMINANTS['FL1'].copy().align(shape),
+            SDS_ILLUMINANTS['FL2'].copy().align(shape)
+        ]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]), shape.range())
+
+        self.assertWarns(ColourUsageWarning, colour_fidelity_index_CIE2017,
+                         msds)
+        np.testing.assert_almost_equal(
+            colour_fidelity_index_CIE2017(msds),
+            [colour_fidelity_index_CIE2017(sd) for sd in sds], 7)
+
+    def test_tolerance_colour_fidelity_index_CIE2017(self):
+        """
+        Tests :func:`colour.quality.CIE2017.colour_fidelity_index_CIE2017`
+        definition tolerance support.
+        """
+
+        shape = SD_SAMPLE_5NM.shape
+        wavelengths = shape.range()
+        values = np.transpose([
+            np.exp(-((wavelengths - peak) / width) ** 2) +
+            np.exp(-((wavelengths - 600) / 50) ** 2) * weight
+            for peak, width, weight in zip(
+                np.linspace(430, 480, 11), np.linspace(10, 30, 11),
+                np.linspace(0.25, 3, 11))
+        ])
+        msds = MultiSpectralDistributions(
+            np.hstack([values, SD_SAMPLE_5NM.values[:, np.newaxis]]),
+            wavelengths)
+
+        specification = colour_fidelity_index_CIE2017(
+            msds, additional_data=True)
+        for tolerance in (1, 0.1, 0.01, 0.001):
+            specification_t = colour_fidelity_index_CIE2017(
+                msds, additional_data=True, tolerance=tolerance)
+
+            np.testing.assert_array_less(
+                np.abs(specification_t.R_f - specification.R_f), tolerance)
+            np.testing.assert_equal(specification_t.CCT, specification.CCT)
+
+        for sd in [SD_SAMPLE_5NM, SD_SAMPLE_1NM]:
+            np.testing.assert_allclose(
+                colour_fidelity_index_CIE2017(sd, tolerance=0.1),
+                colour_fidelity_index_CIE2017(sd),
+                atol=0.1)
+
     def test_raise_exception_colour_fidelity_index_CFI2017(self):
         """
         Tests :func:`colour.quality.CIE2017.colour_fidelity_index_CFI2017`
@@ -613,6 +710,21 @@ class TestCctReferenceIlluminant(unittest.TestCase):
             np.testing.assert_allclose(CCT, 3287.5, rtol=0.25)
             np.testing.assert_allclose(D_uv, -0.000300000000000, atol=0.0005)
 
+    def test_n_dimensional_CCT_reference_illuminant(self):
+        """
+        Tests :func:`colour.quality.CIE2017.CCT_reference_illuminant`
+        definition n-dimensional support.
+        """
+
+        sds = [SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2']]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]), sds[0].wavelengths)
+
+        np.testing.assert_almost_equal(
+            np.transpose(CCT_reference_illuminant(msds)),
+            [CCT_reference_illuminant(sd) for sd in sds],
+            decimal=7)
+
 
 class TestSdReferenceIlluminant(unittest.TestCase):
     """
@@ -8,7 +8,9 @@ import unittest
 
 from colour.quality import (ColourRendering_Specification_CQS,
                             colour_quality_scale)
-from colour.colorimetry import SDS_ILLUMINANTS, SDS_LIGHT_SOURCES
+from colour.algebra import LinearInterpolator
+from colour.colorimetry import (SDS_ILLUMINANTS, SDS_LIGHT_SOURCES,
+                                MultiSpectralDistributions)
 from colour.quality.cqs import VS_ColorimetryData, VS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -672,6 +674,53 @@ class TestColourQualityScale(unittest.TestCase):
             decimal=7,
         )
 
+    def test_n_dimensional_colour_quality_scale(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale` definition
+        n-dimensional support.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS[illuminant] for illuminant in ('FL1', 'FL2', 'FL3')
+        ]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]),
+            sds[0].wavelengths,
+            interpolator=LinearInterpolator)
+
+        for method in ('NIST CQS 9.0', 'NIST CQS 7.4'):
+            specification_m = colour_quality_scale(
+                msds, additional_data=True, method=method)
+            for i, sd in enumerate(sds):
+                specification_s = colour_quality_scale(
+                    sd, additional_data=True, method=method)
+                for attribute in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d'):
+                    value_s = getattr(specification_s, attribute)
+                    if value_s is None:
+                        self.assertIsNone(
+                            getattr(specification_m, attribute))
+                        continue
+
+                    self.assertAlmostEqual(
+                        getattr(specification_m, attribute)[i],
+                        value_s,
+                        places=7)
+
+                np.testing.assert_almost_equal(
+                    [
+                        data.D_Ep_ab[i] for _index, data in sorted(
+                            specification_m.Q_as.items())
+                    ],
+                    [
+                        data.D_Ep_ab for _index, data in sorted(
+                            specification_s.Q_as.items())
+                    ],
+                    decimal=7)
+                np.testing.assert_almost_equal(
+                    specification_m.colorimetry_data[0].Lab[i],
+                    [data.Lab for data in specification_s.colorimetry_data[0]],
+                    decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
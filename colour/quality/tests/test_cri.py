@@ -8,7 +8,9 @@ import unittest
 
 from colour.quality import (ColourRendering_Specification_CRI,
                             colour_rendering_index)
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+from colour.algebra import LinearInterpolator
+from colour.colorimetry import (SDS_ILLUMINANTS, MultiSpectralDistributions,
+                                SpectralDistribution)
 from colour.quality.cri import TCS_ColorimetryData, TCS_ColourQualityScaleData
 
 __author__ = 'Colour Developers'
@@ -342,6 +344,47 @@ class TestColourRenderingIndex(unittest.TestCase):
             decimal=7,
         )
 
+        self.assertIsInstance(specification_t.Q_a, np.float64)
+        for data in specification_t.Q_as.values():
+            self.assertIsInstance(data.Q_a, np.float64)
+
+    def test_n_dimensional_colour_rendering_index(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index` definition
+        n-dimensional support.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS[illuminant] for illuminant in ('FL1', 'FL2', 'FL3')
+        ]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]),
+            sds[0].wavelengths,
+            interpolator=LinearInterpolator)
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index(msds),
+            [colour_rendering_index(sd) for sd in sds],
+            decimal=7)
+
+        specification_m = colour_rendering_index(msds, additional_data=True)
+        for i, sd in enumerate(sds):
+            specification_s = colour_rendering_index(sd, additional_data=True)
+            np.testing.assert_almost_equal(
+                [
+                    data.Q_a[i]
+                    for _index, data in sorted(specification_m.Q_as.items())
+                ],
+                [
+                    data.Q_a
+                    for _index, data in sorted(specification_s.Q_as.items())
+                ],
+                decimal=7)
+            np.testing.assert_almost_equal(
+                specification_m.colorimetry_data[0].UVW[i],
+                [data.UVW for data in specification_s.colorimetry_data[0]],
+                decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,10 +3,12 @@
 Defines unit tests for :mod:`colour.quality.ssi` module.
 """
 
+import numpy as np
 import unittest
 
 from colour.quality import spectral_similarity_index
-from colour.colorimetry import SDS_ILLUMINANTS, SpectralDistribution
+from colour.colorimetry import (SDS_ILLUMINANTS, MultiSpectralDistributions,
+                                SpectralDistribution, SpectralShape)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -570,6 +572,45 @@ class TestSpectralSimilarityIndex(unittest.TestCase):
             spectral_similarity_index(
                 SpectralDistribution(DATA_HMI), SDS_ILLUMINANTS['D50']), 72.0)
 
+    def test_n_dimensional_spectral_similarity_index(self):
+        """
+        Tests :func:`colour.quality.ssi.spectral_similarity_index` definition
+        n-dimensional support.
+        """
+
+        shape = SpectralShape(360, 780, 5)
+        sds = [
+            SDS_ILLUMINANTS[illuminant].copy().align(shape)
+            for illuminant in ('A', 'C', 'D50', 'D65', 'FL2')
+        ]
+        sds.append(SpectralDistribution(DATA_HMI).align(shape))
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]), shape.range())
+
+        SSI = [[
+            spectral_similarity_index(sd_test, sd_reference)
+            for sd_reference in sds[:3]
+        ] for sd_test in sds]
+
+        msds_reference = MultiSpectralDistributions(
+            msds.values[:, :3], shape.range())
+        np.testing.assert_equal(
+            spectral_similarity_index(msds, msds_reference), SSI)
+
+        np.testing.assert_equal(
+            spectral_similarity_index(msds, sds[1]),
+            np.array(SSI)[:, 1])
+
+        np.testing.assert_equal(
+            spectral_similarity_index(sds[1], msds_reference), SSI[1])
+
+        np.testing.assert_equal(
+            spectral_similarity_index(msds, SDS_ILLUMINANTS['D65']),
+            [
+                spectral_similarity_index(sd_test, SDS_ILLUMINANTS['D65'])
+                for sd_test in sds
+            ])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,7 +12,7 @@ Notes
 import numpy as np
 import unittest
 
-from colour.colorimetry import SDS_ILLUMINANTS
+from colour.colorimetry import MultiSpectralDistributions, SDS_ILLUMINANTS
 from colour.quality.tm3018 import (averages_area,
                                    colour_fidelity_index_ANSIIESTM3018)
 from colour.utilities import as_float_array
@@ -69,6 +69,36 @@ class TestColourFidelityIndexANSIIESTM3018(unittest.TestCase):
             0.19, 0.11, -0.08, -0.15, -0.26, -0.17
         ], 2)
 
+    def test_n_dimensional_colour_fidelity_index_ANSIIESTM3018(self):
+        """
+        Tests :func:`colour.quality.tm3018.colour_fidelity_index_ANSIIESTM3018`
+        definition n-dimensional support.
+        """
+
+        sds = [
+            SDS_ILLUMINANTS['FL1'], SDS_ILLUMINANTS['FL2'],
+            SDS_ILLUMINANTS['FL11']
+        ]
+        msds = MultiSpectralDistributions(
+            np.transpose([sd.values for sd in sds]), sds[0].wavelengths)
+
+        specification = colour_fidelity_index_ANSIIESTM3018(
+            msds, additional_data=True)
+
+        for i, sd in enumerate(sds):
+            specification_i = colour_fidelity_index_ANSIIESTM3018(
+                sd, additional_data=True)
+
+            self.assertListEqual(specification.bins[i], specification_i.bins)
+
+            for attribute in ('R_f', 'R_s', 'CCT', 'D_uv', 'R_g',
+                              'averages_test', 'averages_reference',
+                              'average_norms', 'R_fs', 'R_cs', 'R_hs'):
+                np.testing.assert_almost_equal(
+                    getattr(specification, attribute)[i],
+                    getattr(specification_i, attribute),
+                    decimal=7)
+
 
 class TestAveragesArea(unittest.TestCase):
     """
@@ -89,6 +119,23 @@ class TestAveragesArea(unittest.TestCase):
         poly = np.array([[1., -1], [1, 1], [3, 1], [3, 3], [-1, 3], [-1, -1]])
         np.allclose(averages_area(poly), 12)
 
+    def test_n_dimensional_averages_area(self):
+        """
+        Tests :func:`colour.quality.tm3018.averages_area` definition
+        n-dimensional arrays support.
+        """
+
+        rectangle = as_float_array([[2, 1], [1, 2], [-2, -1], [-1, -2]])
+        area = averages_area(rectangle)
+
+        rectangle = np.tile(rectangle, (6, 1, 1))
+        area = np.tile(area, 6)
+        np.testing.assert_almost_equal(averages_area(rectangle), area)
+
+        rectangle = np.reshape(rectangle, (2, 3, 4, 2))
+        area = np.reshape(area, (2, 3))
+        np.testing.assert_almost_equal(averages_area(rectangle), area)
+
 
 if __name__ == '__main__':
     unittest.main()
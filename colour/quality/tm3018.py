@@ -19,9 +19,10 @@ References
 import numpy as np
 from collections import namedtuple
 
+from colour.colorimetry import MultiSpectralDistributions
 from colour.quality import colour_fidelity_index_CIE2017
 from colour.quality.cfi2017 import delta_E_to_R_f
-from colour.utilities import as_float_array, as_int
+from colour.utilities import as_float_array
 
 
 class ColourQuality_Specification_ANSIIESTM3018(
@@ -38,20 +39,22 @@ class ColourQuality_Specification_ANSIIESTM3018(
     ----------
     name : unicode
         Name of the test spectral distribution.
-    sd_test : SpectralDistribution
+    sd_test : SpectralDistribution or MultiSpectralDistributions
         Spectral distribution of the tested illuminant.
-    sd_reference : SpectralDistribution
+    sd_reference : SpectralDistribution or MultiSpectralDistributions
         Spectral distribution of the reference illuminant.
-    R_f : numeric
+    R_f : numeric or ndarray
         *Colour Fidelity Index* (CFI) :math:`R_f`.
     R_s : list
         Individual *colour fidelity indexes* data for each sample.
-    CCT : numeric
+    CCT : numeric or ndarray
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric
+    D_uv : numeric or ndarray
         Distance from the Planckian locus :math:`\\Delta_{uv}`.
     colorimetry_data : tuple
         Colorimetry data for the test and reference computations.
+    R_g : numeric or ndarray
+        *Gamut Index* :math:`R_g`.
     bins : list of list of int
         List of 16 lists, each containing the indexes of colour samples that
         lie in the respective hue bin.
@@ -68,6 +71,14 @@ class ColourQuality_Specification_ANSIIESTM3018(
         Local chromaticity shifts for each hue bin, in percents.
     R_hs : ndarray, (16,)
         Local hue shifts for each hue bin.
+
+    Notes
+    -----
+    -   When the specification is computed for a
+        :class:`colour.MultiSpectralDistributions` class instance, i.e. a
+        batch of :math:`M` test spectral distributions, the numeric and
+        *ndarray* attributes have a leading axis of length :math:`M` and
+        ``bins`` is a list of :math:`M` lists of 16 lists.
     """
 
 
@@ -78,14 +89,15 @@ def colour_fidelity_index_ANSIIESTM3018(sd_test, additional_data=False):
 
     Parameters
     ----------
-    sd_test : SpectralDistribution
-        Test spectral distribution.
+    sd_test : SpectralDistribution or MultiSpectralDistributions
+        Test spectral distribution or multi-spectral distributions, in which
+        case each distribution is evaluated as a separate test light source.
     additional_data : bool, optional
         Whether to output additional data.
 
     Returns
     -------
-    numeric or ColourQuality_Specification_ANSIIESTM3018
+    numeric or ndarray or ColourQuality_Specification_ANSIIESTM3018
         *ANSI/IES TM-30-18 Colour Fidelity Index* (CFI).
 
     References
@@ -105,45 +117,60 @@ def colour_fidelity_index_ANSIIESTM3018(sd_test, additional_data=False):
 
     specification = colour_fidelity_index_CIE2017(sd_test, True)
 
+    test_tcs_colorimetry_data, reference_tcs_colorimetry_data = (
+        specification.colorimetry_data)
+
+    if isinstance(sd_test, MultiSpectralDistributions):
+        h_reference = reference_tcs_colorimetry_data.CAM.h
+        apbp_test = test_tcs_colorimetry_data.Jpapbp[..., 1:]
+        apbp_reference = reference_tcs_colorimetry_data.Jpapbp[..., 1:]
+    else:
+        h_reference = as_float_array(
+            [sample.CAM.h for sample in reference_tcs_colorimetry_data])
+        apbp_test = as_float_array(
+            [sample.Jpapbp[1:] for sample in test_tcs_colorimetry_data])
+        apbp_reference = as_float_array(
+            [sample.Jpapbp[1:] for sample in reference_tcs_colorimetry_data])
+
     # Setup bins based on where the reference a'b' points are located.
-    bins = [[] for _i in range(16)]
-    for i, sample in enumerate(specification.colorimetry_data[1]):
-        bin_index = as_int(np.floor(sample.CAM.h / 22.5))
-        bins[bin_index].append(i)
+    bin_indexes = np.floor(h_reference / 22.5).astype(np.int_)
+    bin_masks = (bin_indexes[..., np.newaxis] == np.arange(16)).astype(
+        np.float_)
+    bin_counts = np.sum(bin_masks, axis=-2)
+
+    bins = [[np.where(masks)[0].tolist() for masks in np.transpose(mask)]
+            for mask in np.reshape(bin_masks, (-1, ) + bin_masks.shape[-2:])]
+    if not isinstance(sd_test, MultiSpectralDistributions):
+        bins = bins[0]
 
     # Per-bin a'b' averages.
-    averages_test = np.empty([16, 2])
-    averages_reference = np.empty([16, 2])
-    for i in range(16):
-        apbp_s = [
-            specification.colorimetry_data[0][j].Jpapbp[[1, 2]]
-            for j in bins[i]
-        ]
-        averages_test[i, :] = np.mean(apbp_s, axis=0)
-        apbp_s = [
-            specification.colorimetry_data[1][j].Jpapbp[[1, 2]]
-            for j in bins[i]
-        ]
-        averages_reference[i, :] = np.mean(apbp_s, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        averages_test = np.matmul(
+            np.swapaxes(bin_masks, -1, -2),
+            apbp_test) / bin_counts[..., np.newaxis]
+        averages_reference = np.matmul(
+            np.swapaxes(bin_masks, -1, -2),
+            apbp_reference) / bin_counts[..., np.newaxis]
+
+        # Local colour fidelity indexes, i.e. 16 CFIs for each bin.
+        bin_delta_E_s = np.matmul(
+            specification.delta_E_s[..., np.newaxis, :],
+            bin_masks)[..., 0, :] / bin_counts
 
     # Gamut Index.
     R_g = 100 * (
         averages_area(averages_test) / averages_area(averages_reference))
 
-    # Local colour fidelity indexes, i.e. 16 CFIs for each bin.
-    bin_delta_E_s = [
-        np.mean([specification.delta_E_s[bins[i]]]) for i in range(16)
-    ]
-    R_fs = delta_E_to_R_f(as_float_array(bin_delta_E_s))
+    R_fs = delta_E_to_R_f(bin_delta_E_s)
 
     # Angles bisecting the hue bins.
     angles = (22.5 * np.arange(16) + 11.25) / 180 * np.pi
     cosines = np.cos(angles)
     sines = np.sin(angles)
 
-    average_norms = np.linalg.norm(averages_reference, axis=1)
-    a_deltas = averages_test[:, 0] - averages_reference[:, 0]
-    b_deltas = averages_test[:, 1] - averages_reference[:, 1]
+    average_norms = np.linalg.norm(averages_reference, axis=-1)
+    a_deltas = averages_test[..., 0] - averages_reference[..., 0]
+    b_deltas = averages_test[..., 1] - averages_reference[..., 1]
 
     # Local chromaticity shifts, multiplied by 100 to obtain percentages.
     R_cs = 100 * (a_deltas * cosines + b_deltas * sines) / average_norms
@@ -164,21 +191,20 @@ def averages_area(averages):
 
     Parameters
     ----------
-    averages : array_like, (n, 2)
+    averages : array_like, (n, 2) or (..., n, 2)
         Hue bin averages.
 
     Returns
     -------
-    float
+    float or ndarray
         Area of the polygon.
     """
 
-    N = averages.shape[0]
+    averages = as_float_array(averages)
+
+    u = averages
+    v = np.roll(averages, -1, axis=-2)
 
-    triangle_areas = np.empty(N)
-    for i in range(N):
-        u = averages[i, :]
-        v = averages[(i + 1) % N, :]
-        triangle_areas[i] = (u[0] * v[1] - u[1] * v[0]) / 2
+    triangle_areas = (u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]) / 2
 
-    return np.sum(triangle_areas)
+    return np.sum(triangle_areas, axis=-1)
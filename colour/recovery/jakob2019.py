@@ -19,7 +19,9 @@ References
 """
 
 import numpy as np
+import os
 import struct
+from functools import partial
 from scipy.optimize import minimize
 from scipy.interpolate import RegularGridInterpolator
 
@@ -30,9 +32,10 @@ from colour.colorimetry import (
     intermediate_lightness_function_CIE1976, sd_to_XYZ)
 from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
-from colour.utilities import (as_float_array, domain_range_scale, full,
-                              index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+from colour.utilities import (
+    as_float_array, domain_range_scale, full, index_along_last_axis,
+    is_tqdm_installed, message_box, multiprocessing_pool, to_domain_1,
+    runtime_warning, tsplit, tstack, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -287,20 +290,20 @@ def dimensionalise_coefficients(coefficients, shape):
 
     Parameters
     ----------
-    coefficients : array_like, (3,)
+    coefficients : array_like, (..., 3)
         Dimensionless coefficients.
     shape : SpectralShape
         Spectral distribution shape used in calculations.
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (..., 3)
         Dimensionful coefficients, with units of
         :math:`\\frac{1}{\\mathrm{nm}^2}`, :math:`\\frac{1}{\\mathrm{nm}}`
         and 1, respectively.
     """
 
-    cp_0, cp_1, cp_2 = coefficients
+    cp_0, cp_1, cp_2 = tsplit(coefficients)
     span = shape.end - shape.start
 
     c_0 = cp_0 / span ** 2
@@ -308,7 +311,7 @@ def dimensionalise_coefficients(coefficients, shape):
     c_2 = (
         cp_0 * shape.start ** 2 / span ** 2 - cp_1 * shape.start / span + cp_2)
 
-    return np.array([c_0, c_1, c_2])
+    return tstack([c_0, c_1, c_2])
 
 
 def lightness_scale(steps):
@@ -340,29 +343,260 @@ def lightness_scale(steps):
     return smoothstep_function(smoothstep_function(linear))
 
 
+def _Lab_Jakob2019(coefficients, wv, matrix_R_to_XYZ, XYZ_n):
+    """
+    Computes the *CIE L\\*a\\*b\\** colourspace arrays of the colours defined
+    by given dimensionless coefficients of the *Jakob and Hanika (2019)*
+    reflectance spectral model, along with their Jacobian matrices.
+
+    Parameters
+    ----------
+    coefficients : ndarray, (n, 3)
+        Dimensionless coefficients.
+    wv : ndarray, (m,)
+        Normalised wavelengths, i.e. spectral shape mapped to [0, 1] range.
+    matrix_R_to_XYZ : ndarray, (m, 3)
+        Matrix converting spectral reflectances to *CIE XYZ* tristimulus
+        values, i.e. the normalised product of the illuminant and the colour
+        matching functions.
+    XYZ_n : ndarray, (3,)
+        Illuminant *CIE XYZ* tristimulus values normalised to :math:`Y_n = 1`.
+
+    Returns
+    -------
+    Lab : ndarray, (n, 3)
+        *CIE L\\*a\\*b\\** colourspace arrays.
+    J : ndarray, (n, 3, 3)
+        Jacobian matrices of the *CIE L\\*a\\*b\\** colourspace arrays with
+        respect to the coefficients.
+    """
+
+    U = np.dot(coefficients, [wv ** 2, wv, np.ones(wv.shape)])
+    t1 = np.sqrt(1 + U ** 2)
+    R = 1 / 2 + U / (2 * t1)
+    dR = 1 / (2 * t1 ** 3)
+
+    XYZ = np.dot(R, matrix_R_to_XYZ)
+    dXYZ = np.einsum('nm,mp,mx->nxp', dR,
+                     np.transpose([wv ** 2, wv, np.ones(wv.shape)]),
+                     matrix_R_to_XYZ)
+
+    XYZ_f = intermediate_lightness_function_CIE1976(XYZ, XYZ_n)
+    dXYZ_f = np.where(XYZ / XYZ_n > (24 / 116) ** 3,
+                      1 / (3 * spow(XYZ_n, 1 / 3) * spow(XYZ, 2 / 3)),
+                      (841 / 108) / XYZ_n)[..., np.newaxis] * dXYZ
+
+    M = np.array([[0, 116, 0], [500, -500, 0], [0, 200, -200]])
+
+    Lab = np.dot(XYZ_f, np.transpose(M)) - np.array([16, 0, 0])
+    J = np.einsum('lx,nxp->nlp', M, dXYZ_f)
+
+    return Lab, J
+
+
+def _gauss_newton_Jakob2019(coefficients,
+                            target,
+                            wv,
+                            matrix_R_to_XYZ,
+                            XYZ_n,
+                            max_error,
+                            iterations_maximum=50):
+    """
+    Minimises the :math:`\\Delta E_{76}` errors between given target colours
+    and the colours defined by given dimensionless coefficients using the
+    *Gauss-Newton* algorithm with a backtracking line search.
+
+    The coefficients whose error is lower than given maximal error, or that
+    cannot be improved any further, are removed from the subsequent
+    iterations.
+
+    Parameters
+    ----------
+    coefficients : ndarray, (n, 3)
+        Starting dimensionless coefficients.
+    target : ndarray, (n, 3)
+        *CIE L\\*a\\*b\\** colourspace arrays of the target colours.
+    wv : ndarray, (m,)
+        Normalised wavelengths.
+    matrix_R_to_XYZ : ndarray, (m, 3)
+        Matrix converting spectral reflectances to *CIE XYZ* tristimulus
+        values.
+    XYZ_n : ndarray, (3,)
+        Illuminant *CIE XYZ* tristimulus values normalised to :math:`Y_n = 1`.
+    max_error : numeric
+        Maximal acceptable error.
+    iterations_maximum : int, optional
+        Maximum iterations count.
+
+    Returns
+    -------
+    coefficients : ndarray, (n, 3)
+        Computed dimensionless coefficients.
+    error : ndarray, (n,)
+        :math:`\\Delta E_{76}` errors.
+    """
+
+    coefficients = np.copy(coefficients)
+    Lab, J = _Lab_Jakob2019(coefficients, wv, matrix_R_to_XYZ, XYZ_n)
+    error = np.linalg.norm(Lab - target, axis=-1)
+
+    indexes = np.where(error > max_error)[0]
+    for _iteration in range(iterations_maximum):
+        if indexes.size == 0:
+            break
+
+        J_i = J[indexes]
+        J_i_T = np.swapaxes(J_i, -1, -2)
+        H = np.matmul(J_i_T, J_i)
+        # Marginal damping keeping the normal equations solvable when the
+        # spectral model saturates.
+        trace = np.trace(H, axis1=-2, axis2=-1)
+        H += 1e-12 * trace[..., np.newaxis, np.newaxis] * np.identity(3)
+        r = (target[indexes] - Lab[indexes])[..., np.newaxis]
+        step = np.linalg.solve(H, np.matmul(J_i_T, r))[..., 0]
+
+        alpha = np.ones(indexes.size)
+        is_accepted = np.zeros(indexes.size, dtype=bool)
+        for _halving in range(20):
+            i_s = np.where(~is_accepted)[0]
+            if i_s.size == 0:
+                break
+
+            coefficients_s = (coefficients[indexes[i_s]] +
+                              alpha[i_s, np.newaxis] * step[i_s])
+            Lab_s, J_s = _Lab_Jakob2019(coefficients_s, wv, matrix_R_to_XYZ,
+                                        XYZ_n)
+            error_s = np.linalg.norm(Lab_s - target[indexes[i_s]], axis=-1)
+
+            is_lower = error_s < error[indexes[i_s]]
+            i_l = indexes[i_s[is_lower]]
+            coefficients[i_l] = coefficients_s[is_lower]
+            Lab[i_l], J[i_l] = Lab_s[is_lower], J_s[is_lower]
+            error[i_l] = error_s[is_lower]
+
+            is_accepted[i_s[is_lower]] = True
+            alpha[i_s] /= 2
+
+        indexes = indexes[is_accepted]
+        indexes = indexes[error[indexes] > max_error]
+
+    return coefficients, error
+
+
+def _find_coefficients_batch_Jakob2019(XYZ,
+                                       cmfs,
+                                       illuminant,
+                                       coefficients_0=None,
+                                       max_error=JND_CIE1976 / 100):
+    """
+    Computes the coefficients for *Jakob and Hanika (2019)* reflectance
+    spectral model of given *CIE XYZ* tristimulus values at once.
+
+    Similarly to :func:`colour.recovery.find_coefficients_Jakob2019`
+    definition, the target colours are reached by walking from a grey colour,
+    the walk being retried with finer steps for the targets whose error is
+    not acceptable.
+
+    Parameters
+    ----------
+    XYZ : array_like, (n, 3)
+        *CIE XYZ* tristimulus values to find the coefficients for.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution, aligned to the colour matching
+        functions.
+    coefficients_0 : array_like, (n, 3), optional
+        Starting non-dimensionalised coefficients for the solver.
+    max_error : float, optional
+        Maximal acceptable error.
+
+    Returns
+    -------
+    coefficients : ndarray, (n, 3)
+        Computed dimensionless coefficients.
+    error : ndarray, (n,)
+        :math:`\\Delta E_{76}` errors.
+    """
+
+    XYZ = as_float_array(XYZ)
+
+    if max_error is None:
+        max_error = 0
+
+    wv = np.linspace(0, 1, len(cmfs.shape))
+    dw = cmfs.wavelengths[1] - cmfs.wavelengths[0]
+    k = 1 / (np.sum(cmfs.values[:, 1] * illuminant.values) * dw)
+    matrix_R_to_XYZ = k * dw * illuminant.values[..., np.newaxis] * cmfs.values
+
+    XYZ_n = sd_to_XYZ(illuminant, cmfs)
+    XYZ_n /= XYZ_n[1]
+    xy_n = XYZ_to_xy(XYZ_n)
+
+    target = XYZ_to_Lab(XYZ, xy_n)
+
+    if coefficients_0 is not None:
+        coefficients, error = _gauss_newton_Jakob2019(
+            as_float_array(coefficients_0), target, wv, matrix_R_to_XYZ,
+            XYZ_n, max_error)
+    else:
+        coefficients = zeros(XYZ.shape)
+        error = full(XYZ.shape[0], np.inf)
+
+    XYZ_r = 0.5 * XYZ_n
+    indexes = np.where(error > max_error)[0]
+    for divisions in (3, 5, 7, 9):
+        if indexes.size == 0:
+            break
+
+        coefficients_i = zeros([indexes.size, 3])
+        for i in range(1, divisions):
+            XYZ_i = (XYZ[indexes] - XYZ_r) * i / (divisions - 1) + XYZ_r
+
+            coefficients_i, error_i = _gauss_newton_Jakob2019(
+                coefficients_i, XYZ_to_Lab(XYZ_i, xy_n), wv, matrix_R_to_XYZ,
+                XYZ_n, max_error)
+
+        is_lower = error_i < error[indexes]
+        coefficients[indexes[is_lower]] = coefficients_i[is_lower]
+        error[indexes[is_lower]] = error_i[is_lower]
+
+        indexes = indexes[error[indexes] > max_error]
+
+    return coefficients, error
+
+
 def find_coefficients_Jakob2019(
         XYZ,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
         .copy().align(SPECTRAL_SHAPE_JAKOB2019),
         illuminant=SDS_ILLUMINANTS['D65'].copy().align(
             SPECTRAL_SHAPE_JAKOB2019),
-        coefficients_0=zeros(3),
+        coefficients_0=None,
         max_error=JND_CIE1976 / 100,
         dimensionalise=True):
     """
     Computes the coefficients for *Jakob and Hanika (2019)* reflectance
     spectral model.
 
+    The coefficients of multiple *CIE XYZ* tristimulus values, i.e. an array
+    with more than one dimension, are computed at once with a vectorised
+    *Gauss-Newton* solver using the analytic Jacobian matrices of the
+    spectral model.
+
     Parameters
     ----------
-    XYZ : array_like, (3,)
+    XYZ : array_like, (3,) or (..., 3)
         *CIE XYZ* tristimulus values to find the coefficients for.
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     illuminant : SpectralDistribution
         Illuminant spectral distribution.
-    coefficients_0 : array_like, (3,), optional
-        Starting coefficients for the solver.
+    coefficients_0 : array_like, (3,) or (..., 3), optional
+        Starting coefficients for the solver, e.g. the non-dimensionalised
+        coefficients of a neighbouring colour. If given, the solver is first
+        started from them and only falls back to walking from a grey colour
+        to the given colour if the resulting error is not acceptable.
     max_error : float, optional
         Maximal acceptable error. Set higher to save computational time.
         If *None*, the solver will keep going until it is very close to the
@@ -373,9 +607,9 @@ def find_coefficients_Jakob2019(
 
     Returns
     -------
-    coefficients : ndarray, (3,)
+    coefficients : ndarray, (3,) or (..., 3)
         Computed coefficients that best fit the given colour.
-    error : float
+    error : numeric or ndarray
         :math:`\\Delta E_{76}` between the target colour and the colour
         corresponding to the computed coefficients.
 
@@ -389,6 +623,14 @@ def find_coefficients_Jakob2019(
     >>> find_coefficients_Jakob2019(XYZ)  # doctest: +ELLIPSIS
     (array([  1.3723791...e-04,  -1.3514399...e-01,   3.0838973...e+01]), \
 0.0141941...)
+    >>> XYZ = np.array([[0.20654008, 0.12197225, 0.05136952],
+    ...                 [0.14222010, 0.23042768, 0.10495772]])
+    >>> coefficients, error = find_coefficients_Jakob2019(XYZ)
+    >>> coefficients  # doctest: +ELLIPSIS
+    array([[  1.3728690...e-04,  -1.3519436...e-01,   3.0850764...e+01],
+           [ -1.6527223...e-04,   1.7750831...e-01,  -4.8063325...e+01]])
+    >>> error  # doctest: +ELLIPSIS
+    array([  2.4749406...e-04,   1.1533206...e-05])
     """
 
     shape = cmfs.shape
@@ -415,8 +657,35 @@ def find_coefficients_Jakob2019(
         except StopMinimizationEarly as error:
             return error.coefficients, error.error
 
+    XYZ = as_float_array(XYZ)
+
+    if XYZ.ndim > 1:
+        coefficients, error = _find_coefficients_batch_Jakob2019(
+            np.reshape(XYZ, [-1, 3]), cmfs, illuminant,
+            (np.reshape(coefficients_0, [-1, 3])
+             if coefficients_0 is not None else None), max_error)
+
+        if dimensionalise:
+            coefficients = dimensionalise_coefficients(coefficients, shape)
+
+        return (np.reshape(coefficients, XYZ.shape),
+                np.reshape(error, XYZ.shape[:-1]))
+
     xy_n = XYZ_to_xy(sd_to_XYZ(illuminant, cmfs))
 
+    target = XYZ_to_Lab(XYZ, xy_n)
+
+    if coefficients_0 is not None and max_error is not None:
+        coefficients, error = optimize(target,
+                                       as_float_array(coefficients_0))
+
+        if error <= max_error:
+            if dimensionalise:
+                coefficients = dimensionalise_coefficients(
+                    coefficients, shape)
+
+            return coefficients, error
+
     XYZ_good = full(3, 0.5)
     coefficients_good = zeros(3)
 
@@ -445,7 +714,6 @@ def find_coefficients_Jakob2019(
         if not keep_divisions:
             divisions += 2
 
-    target = XYZ_to_Lab(XYZ, xy_n)
     coefficients, error = optimize(target, coefficients_0)
 
     if dimensionalise:
@@ -575,6 +843,83 @@ def XYZ_to_sd_Jakob2019(
         return sd
 
 
+def _generate_columns_Jakob2019(chromas_coefficients_0, lightness_scale,
+                                matrix_RGB_to_XYZ, whitepoint, xy_n, cmfs,
+                                illuminant):
+    """
+    Computes the coefficients of given *Jakob and Hanika (2019)* lookup table
+    columns, i.e. for given fully bright colours along given lightness scale.
+
+    The lightness scale is walked down and up from its first third, the
+    columns being solved at once for each lightness and started from the
+    coefficients of the previous one.
+
+    Parameters
+    ----------
+    chromas_coefficients_0 : tuple
+        Fully bright *RGB* colourspace arrays of the columns and starting
+        non-dimensionalised coefficients for the first solve, *None* to start
+        from a grey colour.
+    lightness_scale : array_like
+        Lookup table lightness scale.
+    matrix_RGB_to_XYZ : array_like
+        *RGB* colourspace to *CIE XYZ* tristimulus values matrix.
+    whitepoint : array_like
+        *RGB* colourspace whitepoint.
+    xy_n : array_like
+        Illuminant chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    tuple
+        Columns dimensionalised coefficients and first solve
+        non-dimensionalised coefficients.
+    """
+
+    chromas, coefficients_0 = chromas_coefficients_0
+
+    coefficients = np.empty([len(chromas), len(lightness_scale), 3])
+
+    def optimize(L, coefficients_0):
+        """
+        Solves for a specific lightness and stores the results in the
+        appropriate cells.
+        """
+
+        RGB = lightness_scale[L] * chromas
+
+        XYZ = RGB_to_XYZ(RGB, whitepoint, xy_n, matrix_RGB_to_XYZ)
+
+        coefficients_L, _error = _find_coefficients_batch_Jakob2019(
+            XYZ, cmfs, illuminant, coefficients_0)
+
+        coefficients[:, L] = dimensionalise_coefficients(
+            coefficients_L, cmfs.shape)
+
+        return coefficients_L
+
+    # Starts from somewhere in the middle, similarly to how feedback works in
+    # "colour.recovery.find_coefficients_Jakob2019" definition.
+    L_middle = len(lightness_scale) // 3
+    coefficients_middle = optimize(L_middle, coefficients_0)
+
+    # Goes down the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in reversed(range(0, L_middle)):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    # Goes up the lightness scale.
+    coefficients_0 = coefficients_middle
+    for L in range(L_middle + 1, len(lightness_scale)):
+        coefficients_0 = optimize(L, coefficients_0)
+
+    return coefficients, coefficients_middle
+
+
 class LUT3D_Jakob2019:
     """
     Class for working with pre-computed lookup tables for the
@@ -628,49 +973,49 @@ class LUT3D_Jakob2019:
     >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
     >>> with numpy_print_options(suppress=True):
     ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.7666362...],
-                          [ 370.        ,    0.6251086...],
-                          [ 380.        ,    0.4584017...],
-                          [ 390.        ,    0.3161559...],
-                          [ 400.        ,    0.2196213...],
-                          [ 410.        ,    0.1596688...],
-                          [ 420.        ,    0.1225656...],
-                          [ 430.        ,    0.0989919...],
-                          [ 440.        ,    0.0835916...],
-                          [ 450.        ,    0.0733669...],
-                          [ 460.        ,    0.0666183...],
-                          [ 470.        ,    0.0623707...],
-                          [ 480.        ,    0.0600743...],
-                          [ 490.        ,    0.0594537...],
-                          [ 500.        ,    0.0604370...],
-                          [ 510.        ,    0.0631385...],
-                          [ 520.        ,    0.0678869...],
-                          [ 530.        ,    0.0753101...],
-                          [ 540.        ,    0.0865126...],
-                          [ 550.        ,    0.1034213...],
-                          [ 560.        ,    0.1294488...],
-                          [ 570.        ,    0.1706888...],
-                          [ 580.        ,    0.2375459...],
-                          [ 590.        ,    0.3441276...],
-                          [ 600.        ,    0.4952667...],
-                          [ 610.        ,    0.660606 ...],
-                          [ 620.        ,    0.7915809...],
-                          [ 630.        ,    0.8739343...],
-                          [ 640.        ,    0.9213543...],
-                          [ 650.        ,    0.9487058...],
-                          [ 660.        ,    0.9650651...],
-                          [ 670.        ,    0.9752897...],
-                          [ 680.        ,    0.9819535...],
-                          [ 690.        ,    0.9864608...],
-                          [ 700.        ,    0.9896088...],
-                          [ 710.        ,    0.9918690...],
-                          [ 720.        ,    0.9935308...],
-                          [ 730.        ,    0.9947782...],
-                          [ 740.        ,    0.9957315...],
-                          [ 750.        ,    0.9964717...],
-                          [ 760.        ,    0.9970544...],
-                          [ 770.        ,    0.9975191...],
-                          [ 780.        ,    0.9978937...]],
+    SpectralDistribution([[ 360.        ,    0.7677914...],
+                          [ 370.        ,    0.6265998...],
+                          [ 380.        ,    0.4597814...],
+                          [ 390.        ,    0.3170893...],
+                          [ 400.        ,    0.2201565...],
+                          [ 410.        ,    0.1599604...],
+                          [ 420.        ,    0.1227228...],
+                          [ 430.        ,    0.0990749...],
+                          [ 440.        ,    0.0836322...],
+                          [ 450.        ,    0.0733818...],
+                          [ 460.        ,    0.0666169...],
+                          [ 470.        ,    0.0623581...],
+                          [ 480.        ,    0.0600534...],
+                          [ 490.        ,    0.0594261...],
+                          [ 500.        ,    0.0604034...],
+                          [ 510.        ,    0.0630991...],
+                          [ 520.        ,    0.0678413...],
+                          [ 530.        ,    0.0752576...],
+                          [ 540.        ,    0.0864522...],
+                          [ 550.        ,    0.1033524...],
+                          [ 560.        ,    0.1293720...],
+                          [ 570.        ,    0.1706097...],
+                          [ 580.        ,    0.2374839...],
+                          [ 590.        ,    0.3441287...],
+                          [ 600.        ,    0.4953868...],
+                          [ 610.        ,    0.6608230...],
+                          [ 620.        ,    0.7917995...],
+                          [ 630.        ,    0.8741030...],
+                          [ 640.        ,    0.9214733...],
+                          [ 650.        ,    0.9487886...],
+                          [ 660.        ,    0.9651237...],
+                          [ 670.        ,    0.9753322...],
+                          [ 680.        ,    0.9819851...],
+                          [ 690.        ,    0.9864848...],
+                          [ 700.        ,    0.9896274...],
+                          [ 710.        ,    0.9918836...],
+                          [ 720.        ,    0.9935426...],
+                          [ 730.        ,    0.9947878...],
+                          [ 740.        ,    0.9957394...],
+                          [ 750.        ,    0.9964782...],
+                          [ 760.        ,    0.9970599...],
+                          [ 770.        ,    0.9975237...],
+                          [ 780.        ,    0.9978976...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -730,12 +1075,17 @@ class LUT3D_Jakob2019:
         """
         Getter property for the *Jakob and Hanika (2019)* interpolator.
 
+        The interpolator is created on first access.
+
         Returns
         -------
         RegularGridInterpolator
             *Jakob and Hanika (2019)* interpolator.
         """
 
+        if self._interpolator is None and self._coefficients is not None:
+            self._create_interpolator()
+
         return self._interpolator
 
     def _create_interpolator(self):
@@ -758,7 +1108,9 @@ class LUT3D_Jakob2019:
                  illuminant=SDS_ILLUMINANTS['D65'].copy().align(
                      SPECTRAL_SHAPE_JAKOB2019),
                  size=64,
-                 print_callable=print):
+                 print_callable=print,
+                 checkpoint_path=None,
+                 processes=None):
         """
         Generates the lookup table data for given *RGB* colourspace, colour
         matching functions, illuminant and given size.
@@ -777,6 +1129,16 @@ class LUT3D_Jakob2019:
             *\\*.coeff* files have a resolution of 64.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        checkpoint_path : unicode, optional
+            Path to a checkpoint file storing the partially generated lookup
+            table data, it is updated as the generation progresses and, if
+            existing, the generation resumes from it. The checkpoint must have
+            been written for the same *RGB* colourspace, colour matching
+            functions, illuminant and size and is removed once the generation
+            completes.
+        processes : int, optional
+            Number of worker processes solving the lookup table columns
+            concurrently, defaults to the number of CPUs.
 
         Examples
         --------
@@ -827,17 +1189,48 @@ class LUT3D_Jakob2019:
         self._coefficients = np.empty(
             [3, chroma_steps, chroma_steps, lightness_steps, 3])
 
-        cube_indexes = np.ndindex(3, chroma_steps, chroma_steps)
         total_coefficients = chroma_steps ** 2 * 3
 
         # First, create a list of all the fully bright colours with the order
-        # matching cube_indexes.
+        # matching the "(3, chroma_steps, chroma_steps)" cube indexes.
         samples = np.linspace(0, 1, chroma_steps)
         ij = np.meshgrid(*[[1], samples, samples], indexing='ij')
         ij = np.transpose(ij).reshape(-1, 3)
         chromas = np.concatenate(
             [ij, np.roll(ij, 1, axis=1),
-             np.roll(ij, 2, axis=1)])
+             np.roll(ij, 2, axis=1)]).reshape([3, chroma_steps, chroma_steps,
+                                               3])
+
+        # Non-dimensionalised coefficients of the first solve of each column,
+        # used to start the solves of the neighbouring columns.
+        coefficients_middle = np.empty([3, chroma_steps, chroma_steps, 3])
+        k_start = 0
+
+        # The checkpoint stores the values the lookup table depends on so that
+        # resuming the generation of a different lookup table is prevented.
+        checkpoint_data = {
+            'lightness_scale': self._lightness_scale,
+            'chromas': chromas,
+            'matrix_RGB_to_XYZ': colourspace.matrix_RGB_to_XYZ,
+            'whitepoint': colourspace.whitepoint,
+            'wavelengths': cmfs.wavelengths,
+            'cmfs': cmfs.values,
+            'illuminant': illuminant.values,
+        }
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with np.load(checkpoint_path) as checkpoint:
+                if not all(
+                        name in checkpoint and np.array_equal(
+                            checkpoint[name], value)
+                        for name, value in checkpoint_data.items()):
+                    raise ValueError(
+                        '"{0}" checkpoint does not match the lookup table '
+                        'being generated!'.format(checkpoint_path))
+
+                self._coefficients[...] = checkpoint['coefficients']
+                coefficients_middle[...] = checkpoint['coefficients_middle']
+                k_start = int(checkpoint['k'])
 
         message_box(
             '"Jakob et al. (2018)" LUT Optimisation',
@@ -846,62 +1239,85 @@ class LUT3D_Jakob2019:
         print_callable(
             '\nOptimising {0} coefficients...\n'.format(total_coefficients))
 
-        def optimize(ijkL, coefficients_0):
-            """
-            Solves for a specific lightness and stores the result in the
-            appropriate cell.
-            """
-
-            i, j, k, L = ijkL
-
-            RGB = self._lightness_scale[L] * chroma
-
-            XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, xy_n,
-                             colourspace.matrix_RGB_to_XYZ)
-
-            coefficients, _error = find_coefficients_Jakob2019(
-                XYZ, cmfs, illuminant, coefficients_0, dimensionalise=False)
-
-            self._coefficients[i, L, j, k, :] = dimensionalise_coefficients(
-                coefficients, shape)
-
-            return coefficients
-
-        with tqdm(total=total_coefficients) as progress:
-            for ijk, chroma in zip(cube_indexes, chromas):
-                progress.update()
-
-                # Starts from somewhere in the middle, similarly to how
-                # feedback works in "colour.recovery.\
-                # find_coefficients_Jakob2019" definition.
-                L_middle = lightness_steps // 3
-                coefficients_middle = optimize(
-                    np.hstack([ijk, L_middle]), zeros(3))
-
-                # Goes down the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in reversed(range(0, L_middle)):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
-
-                # Goes up the lightness scale.
-                coefficients_0 = coefficients_middle
-                for L in range(L_middle + 1, lightness_steps):
-                    coefficients_0 = optimize(
-                        np.hstack([ijk, L]), coefficients_0)
+        generate_columns = partial(
+            _generate_columns_Jakob2019,
+            lightness_scale=self._lightness_scale,
+            matrix_RGB_to_XYZ=colourspace.matrix_RGB_to_XYZ,
+            whitepoint=colourspace.whitepoint,
+            xy_n=xy_n,
+            cmfs=cmfs,
+            illuminant=illuminant)
+
+        # The columns sharing the same last cube index are independent: they
+        # are split in as many chunks as worker processes, each chunk being
+        # solved at once and started from the solutions of the neighbouring
+        # columns along the last cube index.
+        chunks = np.array_split(
+            np.arange(3 * chroma_steps),
+            min(3 * chroma_steps, processes or os.cpu_count() or 1))
+
+        with tqdm(total=total_coefficients) as progress, multiprocessing_pool(
+                processes) as pool:
+            progress.update(k_start * chroma_steps * 3)
+
+            for k in range(k_start, chroma_steps):
+                chromas_k = np.reshape(chromas[:, :, k], [-1, 3])
+                coefficients_middle_k = (np.reshape(
+                    coefficients_middle[:, :, k - 1], [-1, 3])
+                                         if k > 0 else None)
+
+                columns = pool.map(generate_columns, [
+                    (chromas_k[chunk], coefficients_middle_k[chunk]
+                     if coefficients_middle_k is not None else None)
+                    for chunk in chunks
+                ])
+
+                coefficients = np.reshape(
+                    np.concatenate([column[0] for column in columns]),
+                    [3, chroma_steps, lightness_steps, 3])
+                self._coefficients[:, :, :, k] = np.swapaxes(coefficients,
+                                                             1, 2)
+                coefficients_middle[:, :, k] = np.reshape(
+                    np.concatenate([column[1] for column in columns]),
+                    [3, chroma_steps, 3])
+
+                if checkpoint_path is not None:
+                    checkpoint_path_t = '{0}.tmp'.format(checkpoint_path)
+                    with open(checkpoint_path_t, 'wb') as checkpoint_file:
+                        np.savez(
+                            checkpoint_file,
+                            coefficients=self._coefficients,
+                            coefficients_middle=coefficients_middle,
+                            k=k + 1,
+                            **checkpoint_data)
+                    os.replace(checkpoint_path_t, checkpoint_path)
+
+                progress.update(chroma_steps * 3)
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
 
         self._size = size
-        self._create_interpolator()
+        self._interpolator = None
 
-    def RGB_to_coefficients(self, RGB):
+    def RGB_to_coefficients(self, RGB, method='Interpolator'):
         """
         Look up a given *RGB* colourspace array and return corresponding
         coefficients. Interpolation is used for colours not on the table grid.
 
         Parameters
         ----------
-        RGB : ndarray, (3,)
+        RGB : ndarray, (3,) or (..., 3)
             *RGB* colourspace array.
+        method : unicode, optional
+            **{'Interpolator', 'Trilinear', 'Nearest'}**,
+            Interpolation method, the *Interpolator* method uses the
+            :class:`scipy.interpolate.RegularGridInterpolator` class instance
+            of the :attr:`~colour.recovery.LUT3D_Jakob2019.interpolator`
+            attribute whereas the *Trilinear* and *Nearest* methods directly
+            index the coefficients, e.g. memory-mapped ones, without building
+            it. The *Trilinear* method agrees with the *Interpolator* method
+            up to floating point rounding.
 
         Returns
         -------
@@ -922,7 +1338,7 @@ class LUT3D_Jakob2019:
         ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> LUT.RGB_to_coefficients(RGB)  # doctest: +ELLIPSIS
-        array([  1.5012557...e-04,  -1.4678661...e-01,   3.4017293...e+01])
+        array([  1.5029377...e-04,  -1.469630...e-01,   3.4062831...e+01])
         """
 
         RGB = as_float_array(RGB)
@@ -935,11 +1351,56 @@ class LUT3D_Jakob2019:
         i_2 = index_along_last_axis(chroma, (i_m + 2) % 3)
         i_3 = index_along_last_axis(chroma, (i_m + 1) % 3)
 
-        indexes = np.stack([i_m, i_1, i_2, i_3], axis=-1)
+        if method.lower() == 'interpolator':
+            indexes = np.stack([i_m, i_1, i_2, i_3], axis=-1)
+
+            return self.interpolator(indexes).squeeze()
+
+        if method.lower() not in ('trilinear', 'nearest'):
+            raise ValueError(
+                '"{0}" method is not supported!'.format(method))
+
+        # Outside the table domain, the coefficients are undefined, similarly
+        # to the "scipy.interpolate.RegularGridInterpolator" class.
+        is_within = np.logical_and.reduce(
+            [np.logical_and(i >= 0, i <= 1) for i in (i_1, i_2, i_3)])
+        i_1, i_2, i_3 = (np.where(is_within, i, 0) for i in (i_1, i_2, i_3))
+
+        x_1 = np.clip(
+            np.searchsorted(self._lightness_scale, i_1, side='right') - 1, 0,
+            self._size - 2)
+        t_1 = ((i_1 - self._lightness_scale[x_1]) /
+               (self._lightness_scale[x_1 + 1] - self._lightness_scale[x_1]))
+        x_2 = np.clip(
+            np.floor(i_2 * (self._size - 1)).astype(np.int_), 0,
+            self._size - 2)
+        t_2 = i_2 * (self._size - 1) - x_2
+        x_3 = np.clip(
+            np.floor(i_3 * (self._size - 1)).astype(np.int_), 0,
+            self._size - 2)
+        t_3 = i_3 * (self._size - 1) - x_3
+
+        if method.lower() == 'nearest':
+            coefficients = as_float_array(self._coefficients[
+                i_m, np.where(t_1 <= 0.5, x_1, x_1 + 1),
+                np.where(t_2 <= 0.5, x_2, x_2 + 1),
+                np.where(t_3 <= 0.5, x_3, x_3 + 1)])
+        else:
+            coefficients = zeros(RGB.shape)
+            for d_1, d_2, d_3 in np.ndindex(2, 2, 2):
+                weight = (np.where(d_1, t_1, 1 - t_1) * np.where(
+                    d_2, t_2, 1 - t_2) * np.where(d_3, t_3, 1 - t_3))
+                coefficients += weight[..., np.newaxis] * self._coefficients[
+                    i_m, x_1 + d_1, x_2 + d_2, x_3 + d_3]
+
+        coefficients[~is_within] = np.nan
 
-        return self._interpolator(indexes).squeeze()
+        return coefficients.squeeze()
 
-    def RGB_to_sd(self, RGB, shape=SPECTRAL_SHAPE_JAKOB2019):
+    def RGB_to_sd(self,
+                  RGB,
+                  shape=SPECTRAL_SHAPE_JAKOB2019,
+                  method='Interpolator'):
         """
         Looks up a given *RGB* colourspace array and return the corresponding
         spectral distribution.
@@ -950,6 +1411,11 @@ class LUT3D_Jakob2019:
             *RGB* colourspace array.
         shape : SpectralShape, optional
             Shape used by the spectral distribution.
+        method : unicode, optional
+            **{'Interpolator', 'Trilinear', 'Nearest'}**,
+            Interpolation method, see
+            :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients`
+            method.
 
         Returns
         -------
@@ -971,61 +1437,61 @@ class LUT3D_Jakob2019:
         >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
         >>> with numpy_print_options(suppress=True):
         ...     LUT.RGB_to_sd(RGB, cmfs.shape)  # doctest: +ELLIPSIS
-        SpectralDistribution([[ 360.        ,    0.7666362...],
-                              [ 370.        ,    0.6251086...],
-                              [ 380.        ,    0.4584017...],
-                              [ 390.        ,    0.3161559...],
-                              [ 400.        ,    0.2196213...],
-                              [ 410.        ,    0.1596688...],
-                              [ 420.        ,    0.1225656...],
-                              [ 430.        ,    0.0989919...],
-                              [ 440.        ,    0.0835916...],
-                              [ 450.        ,    0.0733669...],
-                              [ 460.        ,    0.0666183...],
-                              [ 470.        ,    0.0623707...],
-                              [ 480.        ,    0.0600743...],
-                              [ 490.        ,    0.0594537...],
-                              [ 500.        ,    0.0604370...],
-                              [ 510.        ,    0.0631385...],
-                              [ 520.        ,    0.0678869...],
-                              [ 530.        ,    0.0753101...],
-                              [ 540.        ,    0.0865126...],
-                              [ 550.        ,    0.1034213...],
-                              [ 560.        ,    0.1294488...],
-                              [ 570.        ,    0.1706888...],
-                              [ 580.        ,    0.2375459...],
-                              [ 590.        ,    0.3441276...],
-                              [ 600.        ,    0.4952667...],
-                              [ 610.        ,    0.660606 ...],
-                              [ 620.        ,    0.7915809...],
-                              [ 630.        ,    0.8739343...],
-                              [ 640.        ,    0.9213543...],
-                              [ 650.        ,    0.9487058...],
-                              [ 660.        ,    0.9650651...],
-                              [ 670.        ,    0.9752897...],
-                              [ 680.        ,    0.9819535...],
-                              [ 690.        ,    0.9864608...],
-                              [ 700.        ,    0.9896088...],
-                              [ 710.        ,    0.9918690...],
-                              [ 720.        ,    0.9935308...],
-                              [ 730.        ,    0.9947782...],
-                              [ 740.        ,    0.9957315...],
-                              [ 750.        ,    0.9964717...],
-                              [ 760.        ,    0.9970544...],
-                              [ 770.        ,    0.9975191...],
-                              [ 780.        ,    0.9978937...]],
+        SpectralDistribution([[ 360.        ,    0.7677914...],
+                              [ 370.        ,    0.6265998...],
+                              [ 380.        ,    0.4597814...],
+                              [ 390.        ,    0.3170893...],
+                              [ 400.        ,    0.2201565...],
+                              [ 410.        ,    0.1599604...],
+                              [ 420.        ,    0.1227228...],
+                              [ 430.        ,    0.0990749...],
+                              [ 440.        ,    0.0836322...],
+                              [ 450.        ,    0.0733818...],
+                              [ 460.        ,    0.0666169...],
+                              [ 470.        ,    0.0623581...],
+                              [ 480.        ,    0.0600534...],
+                              [ 490.        ,    0.0594261...],
+                              [ 500.        ,    0.0604034...],
+                              [ 510.        ,    0.0630991...],
+                              [ 520.        ,    0.0678413...],
+                              [ 530.        ,    0.0752576...],
+                              [ 540.        ,    0.0864522...],
+                              [ 550.        ,    0.1033524...],
+                              [ 560.        ,    0.1293720...],
+                              [ 570.        ,    0.1706097...],
+                              [ 580.        ,    0.2374839...],
+                              [ 590.        ,    0.3441287...],
+                              [ 600.        ,    0.4953868...],
+                              [ 610.        ,    0.6608230...],
+                              [ 620.        ,    0.7917995...],
+                              [ 630.        ,    0.8741030...],
+                              [ 640.        ,    0.9214733...],
+                              [ 650.        ,    0.9487886...],
+                              [ 660.        ,    0.9651237...],
+                              [ 670.        ,    0.9753322...],
+                              [ 680.        ,    0.9819851...],
+                              [ 690.        ,    0.9864848...],
+                              [ 700.        ,    0.9896274...],
+                              [ 710.        ,    0.9918836...],
+                              [ 720.        ,    0.9935426...],
+                              [ 730.        ,    0.9947878...],
+                              [ 740.        ,    0.9957394...],
+                              [ 750.        ,    0.9964782...],
+                              [ 760.        ,    0.9970599...],
+                              [ 770.        ,    0.9975237...],
+                              [ 780.        ,    0.9978976...]],
                              interpolator=SpragueInterpolator,
                              interpolator_kwargs={},
                              extrapolator=Extrapolator,
                              extrapolator_kwargs={...})
         """
 
-        sd = sd_Jakob2019(self.RGB_to_coefficients(RGB), shape)
+        sd = sd_Jakob2019(self.RGB_to_coefficients(RGB, method), shape)
         sd.name = '{0} (RGB) - Jakob (2019)'.format(RGB)
 
         return sd
 
-    def read(self, path):
+    def read(self, path, mmap=False):
         """
         Loads a lookup table from a *\\*.coeff* file.
 
@@ -1033,6 +1499,13 @@ class LUT3D_Jakob2019:
         ----------
         path : unicode
             Path to the file.
+        mmap : bool, optional
+            Whether to map the coefficients read-only in memory rather than
+            reading them, the mapped pages are then shared by the processes
+            reading the same file. The interpolator is created on first
+            access in both cases, the *Trilinear* and *Nearest* methods of
+            :meth:`~colour.recovery.LUT3D_Jakob2019.RGB_to_coefficients`
+            method index the mapped coefficients without creating it.
 
         Examples
         --------
@@ -1062,12 +1535,21 @@ class LUT3D_Jakob2019:
             self._size = struct.unpack('i', coeff_file.read(4))[0]
             self._lightness_scale = np.fromfile(
                 coeff_file, count=self._size, dtype=np.float32)
-            self._coefficients = np.fromfile(
-                coeff_file, count=3 * (self._size ** 3) * 3, dtype=np.float32)
-            self._coefficients = self._coefficients.reshape(
-                3, self._size, self._size, self._size, 3)
 
-        self._create_interpolator()
+            shape = (3, self._size, self._size, self._size, 3)
+            if mmap:
+                self._coefficients = np.memmap(
+                    coeff_file,
+                    dtype=np.float32,
+                    mode='r',
+                    offset=coeff_file.tell(),
+                    shape=shape)
+            else:
+                self._coefficients = np.fromfile(
+                    coeff_file, count=np.prod(shape), dtype=np.float32)
+                self._coefficients = self._coefficients.reshape(shape)
+
+        self._interpolator = None
 
     def write(self, path):
         """
@@ -18,7 +18,9 @@ References
 """
 
 import numpy as np
+import os
 from collections import namedtuple
+from functools import partial
 from unittest import mock
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
@@ -28,7 +30,8 @@ from colour.models import XYZ_to_xy
 from colour.recovery import (SPECTRAL_SHAPE_OTSU2018, BASIS_FUNCTIONS_OTSU2018,
                              CLUSTER_MEANS_OTSU2018, SELECTOR_ARRAY_OTSU2018)
 from colour.utilities import (as_float_array, domain_range_scale,
-                              is_tqdm_installed, message_box, runtime_warning,
+                              is_tqdm_installed, message_box,
+                              multiprocessing_pool, runtime_warning,
                               to_domain_1, zeros)
 
 if is_tqdm_installed():
@@ -670,6 +673,106 @@ class ColourData:
         return lesser, greater
 
 
+def _reconstruction_error_Otsu2018(reflectances, XYZ, mean, XYZ_mu,
+                                   basis_functions, M_inverse):
+    """
+    Reconstructs the reflectances of given *CIE XYZ* tristimulus values with
+    given *Principal Component Analysis* (PCA) results and returns the
+    reconstruction errors summation against given reflectances.
+
+    Parameters
+    ----------
+    reflectances : ndarray, (n, m)
+        Reflectances of the colours.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the colours.
+    mean : ndarray, (m,)
+        Mean reflectance.
+    XYZ_mu : ndarray, (3,)
+        *CIE XYZ* tristimulus values of the mean reflectance.
+    basis_functions : ndarray, (3, m)
+        Basis functions.
+    M_inverse : ndarray, (3, 3)
+        Inverse of the basis functions *CIE XYZ* tristimulus values matrix.
+
+    Returns
+    -------
+    numeric
+        Reconstruction errors summation.
+    """
+
+    weights = np.dot(XYZ - XYZ_mu, np.transpose(M_inverse))
+    recovered_reflectances = np.clip(
+        np.dot(weights, basis_functions) + mean, 0, 1)
+
+    return np.sum((reflectances - recovered_reflectances) ** 2)
+
+
+def _partition_reconstruction_errors_Otsu2018(positions, reflectances, XYZ,
+                                              matrix_R_to_XYZ):
+    """
+    Computes the reconstruction errors summations of the two parts created by
+    splitting given sorted reflectances at given positions.
+
+    The sums and outer products sums of the reflectances of the lesser part
+    are updated incrementally while sweeping the positions so that the
+    *Principal Component Analysis* (PCA) of both parts does not require
+    iterating over their reflectances.
+
+    Parameters
+    ----------
+    positions : array_like
+        Ascending positions the reflectances are split at, i.e. the lesser
+        part sizes.
+    reflectances : ndarray, (n, m)
+        Reflectances sorted along the partition direction.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values of the reflectances.
+    matrix_R_to_XYZ : ndarray, (m, 3)
+        Matrix converting reflectances to *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        Reconstruction errors summations.
+    """
+
+    count = reflectances.shape[0]
+    sum_total = np.sum(reflectances, axis=0)
+    sum_outer_total = np.dot(np.transpose(reflectances), reflectances)
+
+    sum_lesser = zeros(sum_total.shape)
+    sum_outer_lesser = zeros(sum_outer_total.shape)
+
+    errors = zeros(len(positions))
+    position_p = 0
+    for i, position in enumerate(positions):
+        reflectances_p = reflectances[position_p:position]
+        sum_lesser += np.sum(reflectances_p, axis=0)
+        sum_outer_lesser += np.dot(
+            np.transpose(reflectances_p), reflectances_p)
+        position_p = position
+
+        for part, count_p, sum_p, sum_outer_p in (
+            (slice(0, position), position, sum_lesser, sum_outer_lesser),
+            (slice(position, None), count - position, sum_total - sum_lesser,
+             sum_outer_total - sum_outer_lesser),
+        ):
+            mean = sum_p / count_p
+            matrix_covariance = sum_outer_p - count_p * np.outer(mean, mean)
+            _eigenvalues, eigenvectors = np.linalg.eigh(matrix_covariance)
+            basis_functions = np.transpose(eigenvectors[:, -3:])
+
+            M = np.transpose(np.dot(basis_functions, matrix_R_to_XYZ))
+
+            errors[i] += _reconstruction_error_Otsu2018(
+                reflectances[part], XYZ[part], mean,
+                np.dot(mean, matrix_R_to_XYZ), basis_functions,
+                np.linalg.inv(M))
+
+    return errors
+
+
 class Node:
     """
     Represents a node in a :meth:`colour.recovery.NodeTree_Otsu2018` class
@@ -1015,12 +1118,9 @@ class Node:
         if self._M is None:
             self.PCA()
 
-        error = 0
-        for i in range(len(self.colour_data)):
-            sd = self.colour_data.reflectances[i, :]
-            XYZ = self.colour_data.XYZ[i, :]
-            recovered_sd = self.reconstruct(XYZ)
-            error += np.sum((sd - recovered_sd.values) ** 2)
+        error = _reconstruction_error_Otsu2018(
+            self.colour_data.reflectances, self.colour_data.XYZ, self._mean,
+            self._XYZ_mu, self._basis_functions, self._M_inverse)
 
         self._cached_leaf_reconstruction_error = error
 
@@ -1082,10 +1182,21 @@ class Node:
 
         return error, (lesser, greater)
 
-    def find_best_partition(self):
+    def find_best_partition(self, processes=None):
         """
         Finds the best partition for the node.
 
+        The colours data is sorted once along each partition direction and the
+        candidate partitions, i.e. splitting at each of the colours, are swept
+        while updating the statistics of the two parts incrementally. The
+        candidates are evaluated concurrently in chunks.
+
+        Parameters
+        ----------
+        processes : int, optional
+            Number of worker processes evaluating the candidate partitions
+            concurrently, defaults to the number of CPUs.
+
         Returns
         -------
         partition_error : float
@@ -1101,31 +1212,61 @@ class Node:
             return self._best_partition
 
         leaf_error = self.leaf_reconstruction_error()
-        best_error = None
+        best_error, best_axis = None, None
 
-        with tqdm(total=2 * len(self.colour_data)) as progress:
+        count = len(self.colour_data)
+        cmfs, illuminant = self._tree.cmfs, self._tree.illuminant
+        matrix_R_to_XYZ = (self._tree._k * self._tree._dw *
+                           illuminant.values[..., np.newaxis] * cmfs.values)
+
+        with tqdm(total=2 * count) as progress, multiprocessing_pool(
+                processes) as pool:
             for direction in [0, 1]:
-                for i in range(len(self.colour_data)):
-                    progress.update()
-                    origin = self.colour_data.xy[i, direction]
-                    axis = PartitionAxis(origin, direction)
+                progress.update(count)
+
+                xy = self.colour_data.xy[:, direction]
+                indexes = np.argsort(xy, kind='mergesort')
+                xy = xy[indexes]
 
-                    try:
-                        partition_error, partition = (
-                            self.partition_reconstruction_error(axis))
-                    except RuntimeError:
-                        continue
+                # Partitioning at a colour puts all the colours with lesser or
+                # equal coordinate in the lesser part.
+                positions = np.unique(np.searchsorted(xy, xy, side='right'))
+                positions = positions[np.logical_and(
+                    positions >= self._tree.minimum_cluster_size,
+                    count - positions >= self._tree.minimum_cluster_size)]
 
-                    if partition_error >= leaf_error:
-                        continue
+                if positions.size == 0:
+                    continue
+
+                chunks = np.array_split(
+                    positions,
+                    min(positions.size, processes or os.cpu_count() or 1))
+
+                errors = np.concatenate(
+                    pool.map(
+                        partial(
+                            _partition_reconstruction_errors_Otsu2018,
+                            reflectances=(
+                                self.colour_data.reflectances[indexes]),
+                            XYZ=self.colour_data.XYZ[indexes],
+                            matrix_R_to_XYZ=matrix_R_to_XYZ), chunks))
+
+                i = np.argmin(errors)
+                if errors[i] >= leaf_error:
+                    continue
 
-                    if best_error is None or partition_error < best_error:
-                        self._best_partition = (partition_error, axis,
-                                                partition)
+                if best_error is None or errors[i] < best_error:
+                    best_error = errors[i]
+                    best_axis = PartitionAxis(xy[positions[i] - 1], direction)
 
-        if self._best_partition is None:
+        if best_axis is None:
             raise RuntimeError('Could not find a best partition!')
 
+        partition_error, partition = self.partition_reconstruction_error(
+            best_axis)
+
+        self._best_partition = (partition_error, best_axis, partition)
+
         return self._best_partition
 
 
@@ -1194,49 +1335,49 @@ class NodeTree_Otsu2018(Node):
     >>> sd = XYZ_to_sd_Otsu2018(XYZ, cmfs, illuminant, dataset)
     >>> with numpy_print_options(suppress=True):
     ...     sd  # doctest: +ELLIPSIS
-    SpectralDistribution([[ 360.        ,    0.0651341...],
-                          [ 370.        ,    0.0651341...],
-                          [ 380.        ,    0.0651341...],
-                          [ 390.        ,    0.0749684...],
-                          [ 400.        ,    0.0815578...],
-                          [ 410.        ,    0.0776439...],
-                          [ 420.        ,    0.0721897...],
-                          [ 430.        ,    0.0649064...],
-                          [ 440.        ,    0.0567185...],
-                          [ 450.        ,    0.0484685...],
-                          [ 460.        ,    0.0409768...],
-                          [ 470.        ,    0.0358964...],
-                          [ 480.        ,    0.0307857...],
-                          [ 490.        ,    0.0270148...],
-                          [ 500.        ,    0.0273773...],
-                          [ 510.        ,    0.0303157...],
-                          [ 520.        ,    0.0331285...],
-                          [ 530.        ,    0.0363027...],
-                          [ 540.        ,    0.0425987...],
-                          [ 550.        ,    0.0513442...],
-                          [ 560.        ,    0.0579256...],
-                          [ 570.        ,    0.0653850...],
-                          [ 580.        ,    0.0929522...],
-                          [ 590.        ,    0.1600326...],
-                          [ 600.        ,    0.2586159...],
-                          [ 610.        ,    0.3701242...],
-                          [ 620.        ,    0.4702243...],
-                          [ 630.        ,    0.5396261...],
-                          [ 640.        ,    0.5737561...],
-                          [ 650.        ,    0.590848 ...],
-                          [ 660.        ,    0.5935371...],
-                          [ 670.        ,    0.5923295...],
-                          [ 680.        ,    0.5956326...],
-                          [ 690.        ,    0.5982513...],
-                          [ 700.        ,    0.6017904...],
-                          [ 710.        ,    0.6016419...],
-                          [ 720.        ,    0.5996892...],
-                          [ 730.        ,    0.6000018...],
-                          [ 740.        ,    0.5964443...],
-                          [ 750.        ,    0.5868181...],
-                          [ 760.        ,    0.5860973...],
-                          [ 770.        ,    0.5614878...],
-                          [ 780.        ,    0.5289331...]],
+    SpectralDistribution([[ 360.        ,    0.0677170...],
+                          [ 370.        ,    0.0677170...],
+                          [ 380.        ,    0.0677170...],
+                          [ 390.        ,    0.0741034...],
+                          [ 400.        ,    0.0705992...],
+                          [ 410.        ,    0.0571362...],
+                          [ 420.        ,    0.0491761...],
+                          [ 430.        ,    0.0462002...],
+                          [ 440.        ,    0.0471148...],
+                          [ 450.        ,    0.0478113...],
+                          [ 460.        ,    0.0476942...],
+                          [ 470.        ,    0.0486075...],
+                          [ 480.        ,    0.0463660...],
+                          [ 490.        ,    0.0424104...],
+                          [ 500.        ,    0.0403907...],
+                          [ 510.        ,    0.0399747...],
+                          [ 520.        ,    0.0381523...],
+                          [ 530.        ,    0.036656 ...],
+                          [ 540.        ,    0.0389028...],
+                          [ 550.        ,    0.0448139...],
+                          [ 560.        ,    0.0494312...],
+                          [ 570.        ,    0.0545378...],
+                          [ 580.        ,    0.0836147...],
+                          [ 590.        ,    0.1595926...],
+                          [ 600.        ,    0.2693875...],
+                          [ 610.        ,    0.3852325...],
+                          [ 620.        ,    0.4799022...],
+                          [ 630.        ,    0.5414932...],
+                          [ 640.        ,    0.5704649...],
+                          [ 650.        ,    0.5866223...],
+                          [ 660.        ,    0.5921847...],
+                          [ 670.        ,    0.5937899...],
+                          [ 680.        ,    0.5985738...],
+                          [ 690.        ,    0.6012250...],
+                          [ 700.        ,    0.6038473...],
+                          [ 710.        ,    0.6021798...],
+                          [ 720.        ,    0.5991427...],
+                          [ 730.        ,    0.5983027...],
+                          [ 740.        ,    0.5958498...],
+                          [ 750.        ,    0.5885521...],
+                          [ 760.        ,    0.5927789...],
+                          [ 770.        ,    0.5712452...],
+                          [ 780.        ,    0.5409848...]],
                          interpolator=SpragueInterpolator,
                          interpolator_kwargs={},
                          extrapolator=Extrapolator,
@@ -1413,7 +1554,8 @@ class NodeTree_Otsu2018(Node):
     def optimise(self,
                  iterations=8,
                  minimum_cluster_size=None,
-                 print_callable=print):
+                 print_callable=print,
+                 processes=None):
         """
         Optimises the tree by repeatedly performing optimal partitioning of the
         nodes, creating a tree that minimizes the total reconstruction error.
@@ -1431,6 +1573,9 @@ class NodeTree_Otsu2018(Node):
             *Principal Component Analysis* (PCA) will not be possible.
         print_callable : callable, optional
             Callable used to print progress and diagnostic information.
+        processes : int, optional
+            Number of worker processes evaluating the candidate partitions
+            concurrently, defaults to the number of CPUs.
 
         Examples
         --------
@@ -1464,24 +1609,24 @@ class NodeTree_Otsu2018(Node):
         Optimising "NodeTree_Otsu2018(1 Node)"...
         <BLANKLINE>
         Split "NodeTree_Otsu2018(1 Node)" into \
-"Node#...(ColourData(10 Reflectances))" and \
-"Node#...(ColourData(14 Reflectances))" along "\
-PartitionAxis(horizontal partition at y = 0.3240945...)".
-        Error is reduced by 0.0054840... and is now 4.8650513..., \
-99.9% of the initial error.
+"Node#...(ColourData(15 Reflectances))" and \
+"Node#...(ColourData(9 Reflectances))" along "\
+PartitionAxis(horizontal partition at y = 0.3308236...)".
+        Error is reduced by 1.7835346... and is now 3.0870007..., \
+63.4% of the initial error.
         <BLANKLINE>
         Iteration 2 of 2:
         <BLANKLINE>
-        Optimising "Node#...(ColourData(10 Reflectances))"...
+        Optimising "Node#...(ColourData(15 Reflectances))"...
+        Optimising "Node#...(ColourData(9 Reflectances))"...
         Optimisation failed: Could not find a best partition!
-        Optimising "Node#...(ColourData(14 Reflectances))"...
         <BLANKLINE>
-        Split "Node#...(ColourData(14 Reflectances))" into \
+        Split "Node#...(ColourData(15 Reflectances))" into \
 "Node#...(ColourData(7 Reflectances))" and \
-"Node#...(ColourData(7 Reflectances))" along \
-"PartitionAxis(horizontal partition at y = 0.3600663...)".
-        Error is reduced by 0.9681059... and is now 3.8969453..., \
-80.0% of the initial error.
+"Node#...(ColourData(8 Reflectances))" along \
+"PartitionAxis(vertical partition at x = 0.3077738...)".
+        Error is reduced by 0.9955437... and is now 2.0914569..., \
+42.9% of the initial error.
         Node tree optimisation is complete!
         >>> len(node_tree)
         3
@@ -1515,7 +1660,7 @@ PartitionAxis(horizontal partition at y = 0.3240945...)".
 
                 try:
                     partition_error, axis, partition = (
-                        leaf.find_best_partition())
+                        leaf.find_best_partition(processes))
                 except RuntimeError as error:
                     print_callable('Optimisation failed: {0}'.format(error))
                     continue
@@ -1544,7 +1689,7 @@ PartitionAxis(horizontal partition at y = 0.3240945...)".
             print_callable(
                 'Error is reduced by {0} and is now {1}, '
                 '{2:.1f}% of the initial error.'.format(
-                    leaf.leaf_reconstruction_error() - partition_error,
+                    total_error - optimised_total_error,
                     optimised_total_error,
                     100 * optimised_total_error / initial_branch_error))
 
@@ -9,14 +9,22 @@ import shutil
 import tempfile
 import unittest
 
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
+                                sd_to_XYZ)
 from colour.difference import JND_CIE1976, delta_E_CIE1976
-from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
+from colour.models import (RGB_COLOURSPACE_DISPLAY_P3, RGB_COLOURSPACE_sRGB,
+                           RGB_to_XYZ, XYZ_to_Lab)
 from colour.recovery.jakob2019 import (
     XYZ_to_sd_Jakob2019, sd_Jakob2019, error_function,
-    dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
+    dimensionalise_coefficients, find_coefficients_Jakob2019,
+    SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
 from colour.utilities import domain_range_scale, full, ones, zeros
 
 __author__ = 'Colour Developers'
@@ -27,7 +35,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestErrorFunction', 'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
+    'TestErrorFunction', 'TestFind_coefficients_Jakob2019',
+    'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
 ]
 
 
@@ -132,6 +141,73 @@ class TestErrorFunction(unittest.TestCase):
                 staggered_derrors, approximate_derrors, atol=1e-3, rtol=1e-2)
 
 
+class TestFind_coefficients_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._shape = SPECTRAL_SHAPE_JAKOB2019
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(self._shape)
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._shape)
+        self._xy_D65 = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D65']
+
+    def test_n_dimensional_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ_n = sd_to_XYZ(self._sd_D65, self._cmfs)
+        XYZ_n /= XYZ_n[1]
+        xy_n = XYZ_n[:2] / np.sum(XYZ_n)
+
+        np.random.seed(16)
+        RGB = np.random.uniform(0, 1, (4, 8, 3))
+        RGB[0] = np.random.uniform(0, 1, (8, 3)) ** 4
+        RGB[1, 0] = zeros(3)
+        RGB[1, 1] = ones(3)
+        RGB[1, 2] = np.array([1, 0, 0])
+        RGB[1, 3] = np.array([0, 0, 1])
+        XYZ = RGB_to_XYZ(RGB, RGB_COLOURSPACE_sRGB.whitepoint, self._xy_D65,
+                         RGB_COLOURSPACE_sRGB.matrix_RGB_to_XYZ)
+
+        coefficients, error = find_coefficients_Jakob2019(
+            XYZ, self._cmfs, self._sd_D65, dimensionalise=False)
+
+        self.assertTupleEqual(coefficients.shape, (4, 8, 3))
+        self.assertTupleEqual(error.shape, (4, 8))
+        self.assertLessEqual(np.max(error), JND_CIE1976 / 100)
+
+        for XYZ_i, coefficients_i, error_i in zip(
+                np.reshape(XYZ, [-1, 3]), np.reshape(coefficients, [-1, 3]),
+                np.ravel(error)):
+            self.assertAlmostEqual(
+                error_function(coefficients_i, XYZ_to_Lab(XYZ_i, xy_n),
+                               self._cmfs, self._sd_D65)[0],
+                error_i,
+                places=7)
+
+        np.testing.assert_almost_equal(
+            find_coefficients_Jakob2019(XYZ, self._cmfs, self._sd_D65)[0],
+            dimensionalise_coefficients(coefficients, self._shape),
+            decimal=7)
+
+        coefficients_s, error_s = find_coefficients_Jakob2019(
+            XYZ[2:3], self._cmfs, self._sd_D65, coefficients[2:3],
+            dimensionalise=False)
+        np.testing.assert_almost_equal(
+            coefficients_s, coefficients[2:3], decimal=7)
+        np.testing.assert_almost_equal(error_s, error[2:3], decimal=7)
+
+
 class TestXYZ_to_sd_Jakob2019(unittest.TestCase):
     """
     Defines :func:`colour.recovery.jakob2019.XYZ_to_sd_Jakob2019` definition
@@ -276,6 +352,106 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                 self.fail('Delta E for RGB={0} in colourspace {1} is {2}!'
                           .format(RGB, self._RGB_colourspace.name, error))
 
+    def test_RGB_to_coefficients(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.\
+RGB_to_coefficients` method.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        sd_D65 = self._sd_D65.copy().align(cmfs.shape)
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, cmfs, sd_D65, 4, lambda x: x)
+
+        path = os.path.join(self._temporary_directory, 'Test_Jakob2019.coeff')
+        LUT.write(path)
+
+        LUT_m = LUT3D_Jakob2019()
+        LUT_m.read(path, mmap=True)
+        self.assertIsInstance(LUT_m.coefficients, np.memmap)
+        self.assertIsNone(LUT_m._interpolator)
+
+        np.random.seed(4)
+        RGB = np.random.uniform(0, 1, (4, 5, 3))
+        RGB[0, 0] = zeros(3)
+        RGB[0, 1] = ones(3)
+        RGB[0, 2] = np.array([1, 0, 0])
+
+        coefficients = LUT_m.RGB_to_coefficients(RGB, 'Trilinear')
+        self.assertIsNone(LUT_m._interpolator)
+
+        np.testing.assert_allclose(
+            coefficients, LUT_m.RGB_to_coefficients(RGB), rtol=1e-7)
+        self.assertIsNotNone(LUT_m._interpolator)
+
+        LUT_m.interpolator.method = 'nearest'
+        np.testing.assert_almost_equal(
+            LUT_m.RGB_to_coefficients(RGB, 'Nearest'),
+            LUT_m.RGB_to_coefficients(RGB, 'Interpolator'),
+            decimal=7)
+
+        np.testing.assert_allclose(
+            LUT_m.RGB_to_coefficients(RGB, 'Trilinear'),
+            LUT.RGB_to_coefficients(RGB, 'Trilinear'),
+            rtol=1e-6)
+
+        self.assertTrue(
+            np.all(
+                np.isnan(
+                    LUT_m.RGB_to_coefficients(
+                        np.array([2, 1, 0]), 'Trilinear'))))
+
+        self.assertRaises(ValueError, LUT_m.RGB_to_coefficients, RGB,
+                          'Undefined')
+
+    def test_generate_checkpoint(self):
+        """
+        Tests :meth:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method checkpoint support.
+        """
+
+        cmfs = self._cmfs.copy().align(SpectralShape(360, 780, 10))
+        sd_D65 = self._sd_D65.copy().align(cmfs.shape)
+
+        path = os.path.join(self._temporary_directory, 'Jakob2019.npz')
+
+        LUT = LUT3D_Jakob2019()
+        LUT.generate(self._RGB_colourspace, cmfs, sd_D65, 3, lambda x: x)
+
+        def generate_interrupted(colourspace):
+            """
+            Generates a lookup table interrupted after the first column.
+            """
+
+            with mock.patch('colour.recovery.jakob2019.tqdm') as tqdm:
+                progress = tqdm.return_value.__enter__.return_value
+                progress.update.side_effect = [None, RuntimeError]
+
+                self.assertRaises(RuntimeError,
+                                  LUT3D_Jakob2019().generate, colourspace,
+                                  cmfs, sd_D65, 3, lambda x: x, path)
+
+        generate_interrupted(self._RGB_colourspace)
+        self.assertTrue(os.path.exists(path))
+
+        LUT_r = LUT3D_Jakob2019()
+        LUT_r.generate(self._RGB_colourspace, cmfs, sd_D65, 3, lambda x: x,
+                       path)
+        np.testing.assert_allclose(
+            LUT_r.coefficients, LUT.coefficients, rtol=1e-7)
+        self.assertFalse(os.path.exists(path))
+
+        generate_interrupted(self._RGB_colourspace)
+        self.assertRaises(ValueError, LUT_r.generate, self._RGB_colourspace,
+                          cmfs, sd_D65, 4, lambda x: x, path)
+        self.assertRaises(ValueError, LUT_r.generate,
+                          RGB_COLOURSPACE_DISPLAY_P3, cmfs, sd_D65, 3,
+                          lambda x: x, path)
+        self.assertRaises(ValueError, LUT_r.generate, self._RGB_colourspace,
+                          cmfs, SDS_ILLUMINANTS['D50'].copy().align(
+                              cmfs.shape), 3, lambda x: x, path)
+
 
 if __name__ == '__main__':
     unittest.main()
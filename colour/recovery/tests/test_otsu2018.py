@@ -16,7 +16,7 @@ from colour.difference import delta_E_CIE1976
 from colour.models import XYZ_to_Lab
 from colour.recovery import (XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
                              Dataset_Otsu2018, NodeTree_Otsu2018)
-from colour.recovery.otsu2018 import ColourData, Node
+from colour.recovery.otsu2018 import ColourData, Node, PartitionAxis
 from colour.utilities import domain_range_scale, metric_mse
 
 __author__ = 'Colour Developers'
@@ -185,6 +185,47 @@ class TestNode(unittest.TestCase):
         for method in required_methods:
             self.assertIn(method, dir(Node))
 
+    def test_find_best_partition(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Node.find_best_partition`
+        method.
+        """
+
+        cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SPECTRAL_SHAPE_OTSU2018)
+        sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(SPECTRAL_SHAPE_OTSU2018)
+        reflectances = np.array([
+            sd.copy().align(SPECTRAL_SHAPE_OTSU2018).values
+            for sd in SDS_COLOURCHECKERS['ColorChecker N Ohta'].values()
+        ])
+
+        node_tree = NodeTree_Otsu2018(reflectances, cmfs, sd_D65)
+        node_tree._minimum_cluster_size = 3
+
+        partition_error, axis, partition = node_tree.find_best_partition()
+
+        # Exhaustive search of the best partition.
+        best_error = None
+        for direction in [0, 1]:
+            for origin in node_tree.colour_data.xy[:, direction]:
+                try:
+                    error, _partition = (
+                        node_tree.partition_reconstruction_error(
+                            PartitionAxis(origin, direction)))
+                except RuntimeError:
+                    continue
+
+                if best_error is None or error < best_error:
+                    best_error, best_axis = error, PartitionAxis(
+                        origin, direction)
+
+        self.assertAlmostEqual(partition_error, best_error, places=7)
+        self.assertEqual(axis, best_axis)
+        self.assertEqual(
+            len(partition[0].colour_data) + len(partition[1].colour_data),
+            len(reflectances))
+
 
 class TestNodeTree_Otsu2018(unittest.TestCase):
     """
@@ -264,7 +264,7 @@ def xy_to_CCT(xy, method='CIE Illuminant D Series'):
     --------
     >>> import numpy as np
     >>> xy_to_CCT(np.array([0.31270, 0.32900]))  # doctest: +ELLIPSIS
-    6508.1175148...
+    6508.1175425...
     >>> xy_to_CCT(np.array([0.31270, 0.32900]), 'Hernandez 1999')
     ... # doctest: +ELLIPSIS
     6500.7420431...
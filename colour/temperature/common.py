@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Correlated Colour Temperature Common Utilities
+==============================================
+
+Defines correlated colour temperature common utilities objects that don't fall
+in any specific category:
+
+-   :func:`colour.temperature.common.minimise_batch`: Batched minimisation of
+    the distance between a function output and target values, used to invert
+    the correlated colour temperature computation methods that do not have an
+    analytical inverse.
+"""
+
+import numpy as np
+
+from colour.utilities import as_float_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['MINIMISE_BATCH_OPTIONS', 'minimise_batch']
+
+MINIMISE_BATCH_OPTIONS = {
+    'xatol': 1e-10,
+    'fatol': 1e-10,
+    'maxiter': 100,
+}
+"""
+Default options of :func:`colour.temperature.common.minimise_batch`
+definition, named after the :func:`scipy.optimize.minimize` definition
+*Nelder-Mead* method options:
+
+-   *xatol*: Absolute variable step size for convergence.
+-   *fatol*: Absolute objective function change for convergence.
+-   *maxiter*: Maximum iterations count.
+
+MINIMISE_BATCH_OPTIONS : dict
+"""
+
+
+def minimise_batch(function, target, x0, optimisation_kwargs=None):
+    """
+    Minimises the euclidean distance between given function output and given
+    target values for a batch of independent problems at once using a damped
+    *Gauss-Newton* method.
+
+    Either the variable or the output of the function must be
+    one-dimensional, the *Jacobian* matrices are then of rank 1 and the
+    *Gauss-Newton* steps, i.e. the least squares or minimum norm steps, are
+    computed in closed form for all the problems. The *Jacobian* matrices are
+    estimated with central finite differences and the steps are halved until
+    they decrease the objective function.
+
+    Parameters
+    ----------
+    function : callable
+        Vectorised function to evaluate, taking an array of variables of shape
+        (n, m) and returning an array of shape (n, k).
+    target : array_like, (n, k)
+        Target values.
+    x0 : array_like, (m, ) or (n, m)
+        Initial guess.
+    optimisation_kwargs : dict_like, optional
+        Parameters with the same layout than those of
+        :func:`scipy.optimize.minimize` definition, only the *xatol*, *fatol*
+        and *maxiter* keys of the *options* dictionary are used, see
+        :attr:`colour.temperature.common.MINIMISE_BATCH_OPTIONS` attribute.
+
+    Returns
+    -------
+    ndarray, (n, m)
+        Variables minimising the distance to the target values, *nan* for the
+        problems whose objective function is not finite at the initial guess.
+
+    Examples
+    --------
+    >>> function = lambda x: np.hstack([x, x ** 2])
+    >>> minimise_batch(function, np.array([[2, 4], [3, 9]]), [1])
+    ... # doctest: +ELLIPSIS
+    array([[ 2...],
+           [ 3...]])
+    """
+
+    target = as_float_array(target)
+
+    options = dict(MINIMISE_BATCH_OPTIONS)
+    if optimisation_kwargs is not None:
+        options.update(optimisation_kwargs.get('options', {}))
+
+    x0 = as_float_array(x0)
+    x = np.array(np.broadcast_to(x0, target.shape[:-1] + x0.shape[-1:]))
+
+    def objective_function(x, target):
+        """
+        Objective function, i.e. half the squared residuals norm, and
+        residuals.
+        """
+
+        residuals = function(x) - target
+
+        return 0.5 * np.sum(residuals ** 2, axis=-1), residuals
+
+    objective, residuals = objective_function(x, target)
+    finite = np.isfinite(objective)
+    x[~finite] = np.nan
+
+    active = np.where(finite)[0]
+    for _i in range(options['maxiter']):
+        if active.size == 0:
+            break
+
+        x_a, target_a = x[active], target[active]
+        objective_a, residuals_a = objective[active], residuals[active]
+
+        m = x_a.shape[-1]
+        h = 1e-6 * np.maximum(np.abs(x_a), 1)
+        J = np.empty(residuals_a.shape + (m, ))
+        for j in range(m):
+            h_j = np.zeros(x_a.shape)
+            h_j[..., j] = h[..., j]
+            J[..., j] = ((function(x_a + h_j) - function(x_a - h_j)) /
+                         (2 * h[..., j, np.newaxis]))
+
+        step = -(np.einsum('...km,...k->...m', J, residuals_a) /
+                 np.sum(J ** 2, axis=(-2, -1))[..., np.newaxis])
+
+        # Step halving until the objective function decreases.
+        x_n = x_a + step
+        objective_n, residuals_n = objective_function(x_n, target_a)
+        for _j in range(32):
+            increasing = ~(objective_n <= objective_a)
+            if not np.any(increasing):
+                break
+
+            step[increasing] /= 2
+            x_n[increasing] = x_a[increasing] + step[increasing]
+            objective_n[increasing], residuals_n[increasing] = (
+                objective_function(x_n[increasing], target_a[increasing]))
+
+        decreasing = objective_n <= objective_a
+        x_a[decreasing] = x_n[decreasing]
+        x[active] = x_a
+        objective[active] = np.where(decreasing, objective_n, objective_a)
+        residuals[active] = np.where(decreasing[..., np.newaxis], residuals_n,
+                                     residuals_a)
+
+        converged = np.logical_or(
+            ~decreasing,
+            np.logical_and(
+                np.max(np.abs(step), axis=-1) <= options['xatol'],
+                objective_a - objective_n <= options['fatol']))
+
+        active = active[~converged]
+
+    return x
@@ -23,6 +23,7 @@ References
 import numpy as np
 from scipy.optimize import minimize
 
+from colour.temperature.common import minimise_batch
 from colour.utilities import as_float_array, as_numeric, tstack, usage_warning
 
 __author__ = 'Colour Developers'
@@ -45,7 +46,10 @@ def xy_to_CCT_Kang2002(xy, optimisation_kwargs=None):
     xy : array_like
         *CIE xy* chromaticity coordinates.
     optimisation_kwargs : dict_like, optional
-        Parameters for :func:`scipy.optimize.minimize` definition.
+        Parameters for :func:`scipy.optimize.minimize` definition. Unless a
+        *method* is given, all the elements are solved at once with
+        :func:`colour.temperature.common.minimise_batch` definition which only
+        uses the tolerances of the *options*.
 
     Returns
     -------
@@ -57,8 +61,7 @@ def xy_to_CCT_Kang2002(xy, optimisation_kwargs=None):
     *Kang et al. (2002)* does not give an analytical inverse transformation to
     compute the correlated colour temperature :math:`T_{cp}` from given
     *CIE xy* chromaticity coordinates, the current implementation relies on
-    optimization using :func:`scipy.optimize.minimize` definition and thus has
-    reduced precision and poor performance.
+    optimization and thus has reduced precision.
 
     References
     ----------
@@ -68,13 +71,22 @@ def xy_to_CCT_Kang2002(xy, optimisation_kwargs=None):
     --------
     >>> xy_to_CCT_Kang2002(np.array([0.31342600, 0.32359597]))
     ... # doctest: +ELLIPSIS
-    6504.3893128...
+    6504.3893032...
     """
 
     xy = as_float_array(xy)
     shape = xy.shape
     xy = np.atleast_1d(xy.reshape([-1, 2]))
 
+    if optimisation_kwargs is None or 'method' not in optimisation_kwargs:
+        # The reciprocal correlated colour temperature is used as variable as
+        # it is better conditioned for the batched minimisation.
+        CCT = 1e6 / minimise_batch(
+            lambda M: CCT_to_xy_Kang2002(1e6 / M[..., 0]), xy, [1e6 / 6500],
+            optimisation_kwargs)[..., 0]
+
+        return as_numeric(CCT.reshape(shape[:-1]))
+
     def objective_function(CCT, xy):
         """
         Objective function.
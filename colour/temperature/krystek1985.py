@@ -23,6 +23,7 @@ References
 import numpy as np
 from scipy.optimize import minimize
 
+from colour.temperature.common import minimise_batch
 from colour.utilities import as_float_array, as_numeric, tstack
 
 __author__ = 'Colour Developers'
@@ -46,7 +47,10 @@ def uv_to_CCT_Krystek1985(uv, optimisation_kwargs=None):
     uv : array_like
          *CIE UCS* colourspace *uv* chromaticity coordinates.
     optimisation_kwargs : dict_like, optional
-        Parameters for :func:`scipy.optimize.minimize` definition.
+        Parameters for :func:`scipy.optimize.minimize` definition. Unless a
+        *method* is given, all the elements are solved at once with
+        :func:`colour.temperature.common.minimise_batch` definition which only
+        uses the tolerances of the *options*.
 
     Returns
     -------
@@ -58,8 +62,7 @@ def uv_to_CCT_Krystek1985(uv, optimisation_kwargs=None):
     *Krystek (1985)* does not give an analytical inverse transformation to
     compute the correlated colour temperature :math:`T_{cp}` from given
     *CIE UCS* colourspace *uv* chromaticity coordinates, the current
-    implementation relies on optimization using :func:`scipy.optimize.minimize`
-    definition and thus has reduced precision and poor performance.
+    implementation relies on optimization and thus has reduced precision.
 
     Notes
     -----
@@ -74,13 +77,22 @@ def uv_to_CCT_Krystek1985(uv, optimisation_kwargs=None):
     --------
     >>> uv_to_CCT_Krystek1985(np.array([0.20047203, 0.31029290]))
     ... # doctest: +ELLIPSIS
-    6504.3894290...
+    6504.3894169...
     """
 
     uv = as_float_array(uv)
     shape = uv.shape
     uv = np.atleast_1d(uv.reshape([-1, 2]))
 
+    if optimisation_kwargs is None or 'method' not in optimisation_kwargs:
+        # The reciprocal correlated colour temperature is used as variable as
+        # it is better conditioned for the batched minimisation.
+        CCT = 1e6 / minimise_batch(
+            lambda M: CCT_to_uv_Krystek1985(1e6 / M[..., 0]), uv, [1e6 / 6500],
+            optimisation_kwargs)[..., 0]
+
+        return as_numeric(CCT.reshape(shape[:-1]))
+
     def objective_function(CCT, uv):
         """
         Objective function.
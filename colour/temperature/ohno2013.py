@@ -24,10 +24,12 @@ import numpy as np
 from collections import namedtuple
 
 from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
-                                sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, msds_to_XYZ,
+                                planck_law, sd_blackbody, sd_to_XYZ)
+from colour.constants import DEFAULT_INT_DTYPE
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import as_float_array, runtime_warning, tsplit
+from colour.utilities import (as_float_array, register_cache, runtime_warning,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -51,6 +53,112 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+_CACHE_PLANCKIAN_TABLES = register_cache(
+    '{0}._CACHE_PLANCKIAN_TABLES'.format(__name__), maximum_size=2 ** 14)
+
+_PLANCKIAN_TABLES_CHUNK_SIZE = 2 ** 12
+"""
+Planckian radiators count whose spectral distributions are computed at once
+when building the planckian tables, it bounds the memory footprint of the
+blackbody spectral radiance arrays.
+
+_PLANCKIAN_TABLES_CHUNK_SIZE : int
+"""
+
+
+def _uv_planckian_radiators(T, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures using given colour matching
+    functions.
+
+    The blackbody spectral distributions are computed and converted to
+    tristimulus values in batches with
+    :func:`colour.colorimetry.msds_to_XYZ` definition.
+
+    Parameters
+    ----------
+    T : array_like
+        Temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        *uv* chromaticity coordinates.
+    """
+
+    T = as_float_array(T)
+
+    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
+
+    shape = cmfs.shape
+    wavelengths = shape.range()
+
+    T_f = np.ravel(T)
+    uv = np.empty([T_f.size, 2])
+    for i in range(0, T_f.size, _PLANCKIAN_TABLES_CHUNK_SIZE):
+        slice_ = slice(i, i + _PLANCKIAN_TABLES_CHUNK_SIZE)
+        sds = planck_law(wavelengths * 1e-9, T_f[slice_, np.newaxis]) * 1e-9
+        XYZ = msds_to_XYZ(sds, cmfs, method='ASTM E308', shape=shape)
+        XYZ /= np.max(XYZ, axis=-1)[..., np.newaxis]
+        uv[slice_] = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    return np.reshape(uv, T.shape + (2, ))
+
+
+def _planckian_tables(cmfs, start, end, count):
+    """
+    Returns the planckian tables, i.e. the temperatures and *CIE UCS*
+    colourspace *uv* chromaticity coordinates of the planckian radiators, for
+    given colour matching functions and temperature ranges and caches them if
+    not existing.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric or array_like
+        Temperature ranges start in kelvins.
+    end : numeric or array_like
+        Temperature ranges end in kelvins.
+    count : int
+        Temperatures count in the planckian tables.
+
+    Returns
+    -------
+    ndarray
+        Planckian tables of shape (ranges count, ``count``, 3) with the
+        temperatures and *uv* chromaticity coordinates in the last axis.
+    """
+
+    start, end = np.ravel(start), np.ravel(end)
+
+    hash_cmfs = hash(cmfs)
+    keys = [(hash_cmfs, start_i, end_i, count)
+            for start_i, end_i in zip(start.tolist(), end.tolist())]
+
+    tables = np.empty([len(keys), count, 3])
+    missing = []
+    for i, key in enumerate(keys):
+        table = _CACHE_PLANCKIAN_TABLES.get(key)
+        if table is None:
+            missing.append(i)
+        else:
+            tables[i] = table
+
+    if missing:
+        Ti = np.linspace(start[missing], end[missing], count, axis=-1)
+        tables[missing] = np.concatenate(
+            [Ti[..., np.newaxis],
+             _uv_planckian_radiators(Ti, cmfs)], axis=-1)
+
+        for i in missing:
+            _CACHE_PLANCKIAN_TABLES[keys[i]] = np.copy(tables[i])
+
+    return tables
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -112,21 +220,12 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     ux, vx = uv
 
-    cmfs = cmfs.copy().trim(SPECTRAL_SHAPE_DEFAULT)
-
-    shape = cmfs.shape
-
-    table = []
-    for Ti in np.linspace(start, end, count):
-        sd = sd_blackbody(Ti, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    Ti, ui, vi = tsplit(_planckian_tables(cmfs, start, end, count)[0])
+    di = np.hypot(ux - ui, vx - vi)
 
-    return table
+    return [
+        PLANCKIAN_TABLE_TUVD(*Tuvdi) for Tuvdi in zip(Ti, ui, vi, di)
+    ]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -180,9 +279,13 @@ def _uv_to_CCT_Ohno2013(
     value, the more planckian tables will be generated through cascade
     expansion in order to converge to the exact solution.
 
+    The chromaticity coordinates are processed at once, the planckian tables
+    being only computed for the unique temperature ranges reached by the
+    cascade expansion and cached.
+
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (n, 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -197,37 +300,56 @@ def _uv_to_CCT_Ohno2013(
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
     """
 
+    ux, vx = tsplit(uv)
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+    # Planckian tables creation through cascade expansion, performed for all
+    # the chromaticity coordinates at once: "windows" indexes the planckian
+    # table of each chromaticity coordinates among the tables spanning the
+    # unique temperature ranges.
+    start, end = np.array([start]), np.array([end])
+    windows = np.zeros(ux.shape, dtype=DEFAULT_INT_DTYPE)
+    for i in range(iterations):
+        T_t, u_t, v_t = tsplit(_planckian_tables(cmfs, start, end, count))
+        index = np.argmin(
+            (ux[..., np.newaxis] - u_t[windows]) ** 2 +
+            (vx[..., np.newaxis] - v_t[windows]) ** 2,
+            axis=-1)
+
+        lower, upper = index == 0, index == count - 1
+        if np.any(lower):
             runtime_warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+            index[lower] += 1
+        if np.any(upper):
             runtime_warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
+            index[upper] -= 1
 
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        if i == iterations - 1:
+            break
 
-    _ux, vx = uv
+        keys, windows = np.unique(
+            windows * count + index, return_inverse=True)
+        start = T_t[keys // count, keys % count - 1]
+        end = T_t[keys // count, keys % count + 1]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tip, uip, vip = (T_t[windows, index - 1], u_t[windows, index - 1],
+                     v_t[windows, index - 1])
+    Ti, ui, vi = (T_t[windows, index], u_t[windows, index],
+                  v_t[windows, index])
+    Tin, uin, vin = (T_t[windows, index + 1], u_t[windows, index + 1],
+                     v_t[windows, index + 1])
+    dip, di, din = (np.hypot(ux - uip, vx - vip), np.hypot(ux - ui, vx - vi),
+                    np.hypot(ux - uin, vx - vin))
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -235,11 +357,15 @@ def _uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
+    parabolic = np.abs(D_uv) >= 0.002
+    if np.any(parabolic):
+        Tip, Ti, Tin = Tip[parabolic], Ti[parabolic], Tin[parabolic]
+        dip, di, din = dip[parabolic], di[parabolic], din[parabolic]
+
         X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
         a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
         b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
@@ -248,11 +374,12 @@ def _uv_to_CCT_Ohno2013(
             -(dip * (Tin - Ti) * Ti * Tin + di *
               (Tip - Tin) * Tip * Tin + din * (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+        T[parabolic] = -b / (2 * a)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+        D_uv[parabolic] = sign[parabolic] * (
+            a * T[parabolic] ** 2 + b * T[parabolic] + c)
 
-    return np.array([T, D_uv])
+    return tstack([T, D_uv])
 
 
 def uv_to_CCT_Ohno2013(uv,
@@ -306,17 +433,15 @@ def uv_to_CCT_Ohno2013(uv,
     ... )
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
-    array([  6.5074738...e+03,   3.2233460...e-03])
+    array([  6.5074738...e+03,   3.223346...e-03])
     """
 
     uv = as_float_array(uv)
 
-    CCT_D_uv = [
-        _uv_to_CCT_Ohno2013(a, cmfs, start, end, count, iterations)
-        for a in np.reshape(uv, (-1, 2))
-    ]
+    CCT_D_uv = _uv_to_CCT_Ohno2013(
+        np.reshape(uv, (-1, 2)), cmfs, start, end, count, iterations)
 
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    return np.reshape(CCT_D_uv, uv.shape)
 
 
 def _CCT_to_uv_Ohno2013(CCT_D_uv,
@@ -37,7 +37,7 @@ Set_xy_coord. https://www.adobe.com/support/downloads/dng/dng_sdk.html
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import as_float_array, tsplit
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -119,68 +119,65 @@ def _uv_to_CCT_Robertson1968(uv):
     :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
     coordinates using *Roberston (1968)* method.
 
+    The signed distances of the chromaticity coordinates to all the
+    isotemperature lines are computed at once, the first isotemperature line
+    with a negative or null distance, i.e. the first sign change, is then
+    used to interpolate the correlated colour temperature and
+    :math:`\\Delta_{uv}`.
+
     Parameters
     ----------
-    uv : array_like
+    uv : array_like, (n, 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ISOTEMPERATURE_LINES_ROBERTSON1968[i]
-        wr_ruvt_previous = ISOTEMPERATURE_LINES_ROBERTSON1968[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
+    u, v = tsplit(uv)
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    r_l, u_l, v_l, t_l = tsplit(ISOTEMPERATURE_LINES_ROBERTSON1968)
 
-        dt = -uu * dv + vv * du
+    length = np.hypot(1, t_l)
+    du_l, dv_l = 1 / length, t_l / length
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    dt_l = (-(u[..., np.newaxis] - u_l) * dv_l +
+            (v[..., np.newaxis] - v_l) * du_l)
 
-            dt = -dt
+    # First isotemperature line in [1, 30] with a negative or null distance,
+    # the last one being used if none is found.
+    sign_change = dt_l[..., 1:] <= 0
+    sign_change[..., -1] = True
+    i = np.argmax(sign_change, axis=-1) + 1
+    first = i == 1
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    samples = np.arange(i.size)
+    dt = -np.minimum(dt_l[samples, i], 0)
+    last_dt = dt_l[samples, i - 1]
+    last_du = np.where(first, 0, du_l[i - 1])
+    last_dv = np.where(first, 0, dv_l[i - 1])
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    f = np.zeros(dt.shape)
+    f[~first] = dt[~first] / (last_dt[~first] + dt[~first])
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    T = 1.0e6 / (r_l[i - 1] * f + r_l[i] * (1 - f))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    uu = u - (u_l[i - 1] * f + u_l[i] * (1 - f))
+    vv = v - (v_l[i - 1] * f + v_l[i] * (1 - f))
 
-            length = np.hypot(du, dv)
+    du = du_l[i] * (1 - f) + last_du * f
+    dv = dv_l[i] * (1 - f) + last_dv * f
 
-            du /= length
-            dv /= length
+    length = np.hypot(du, dv)
 
-            D_uv = uu * du + vv * dv
+    du /= length
+    dv /= length
 
-            break
+    D_uv = uu * du + vv * dv
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
-
-    return np.array([T, -D_uv])
+    return tstack([T, -D_uv])
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -212,9 +209,9 @@ def uv_to_CCT_Robertson1968(uv):
 
     uv = as_float_array(uv)
 
-    CCT_D_uv = [_uv_to_CCT_Robertson1968(a) for a in np.reshape(uv, (-1, 2))]
+    CCT_D_uv = _uv_to_CCT_Robertson1968(np.reshape(uv, (-1, 2)))
 
-    return as_float_array(CCT_D_uv).reshape(uv.shape)
+    return np.reshape(CCT_D_uv, uv.shape)
 
 
 def _CCT_to_uv_Robertson1968(CCT_D_uv):
@@ -223,55 +220,57 @@ def _CCT_to_uv_Robertson1968(CCT_D_uv):
     correlated colour temperature :math:`T_{cp}` and :math:`\\Delta_{uv}` using
     *Roberston (1968)* method.
 
+    The isotemperature lines bracketing the reciprocal temperatures are
+    searched at once and the chromaticity coordinates are then interpolated
+    for all the correlated colour temperatures.
+
     Parameters
     ----------
-    CCT_D_uv : ndarray
+    CCT_D_uv : ndarray, (n, 2)
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
 
     Returns
     -------
-    ndarray
+    ndarray, (n, 2)
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     """
 
     CCT, D_uv = tsplit(CCT_D_uv)
 
-    r = 1.0e6 / CCT
-
-    for i in range(30):
-        wr_ruvt = ISOTEMPERATURE_LINES_ROBERTSON1968[i]
-        wr_ruvt_next = ISOTEMPERATURE_LINES_ROBERTSON1968[i + 1]
+    r_l, u_l, v_l, t_l = tsplit(ISOTEMPERATURE_LINES_ROBERTSON1968)
 
-        if r < wr_ruvt_next.r or i == 29:
-            f = (wr_ruvt_next.r - r) / (wr_ruvt_next.r - wr_ruvt.r)
+    r = 1.0e6 / CCT
 
-            u = wr_ruvt.u * f + wr_ruvt_next.u * (1 - f)
-            v = wr_ruvt.v * f + wr_ruvt_next.v * (1 - f)
+    # First isotemperature line in [0, 29] whose next line reciprocal
+    # temperature is greater than the reciprocal temperature, the last one
+    # being used if none is found.
+    bracket = r[..., np.newaxis] < r_l[1:]
+    bracket[..., -1] = True
+    i = np.argmax(bracket, axis=-1)
 
-            uu1 = uu2 = 1.0
-            vv1, vv2 = wr_ruvt.t, wr_ruvt_next.t
+    f = (r_l[i + 1] - r) / (r_l[i + 1] - r_l[i])
 
-            length1 = np.hypot(1, vv1)
-            length2 = np.hypot(1, vv2)
+    u = u_l[i] * f + u_l[i + 1] * (1 - f)
+    v = v_l[i] * f + v_l[i + 1] * (1 - f)
 
-            uu1 /= length1
-            vv1 /= length1
+    length1 = np.hypot(1, t_l[i])
+    length2 = np.hypot(1, t_l[i + 1])
 
-            uu2 /= length2
-            vv2 /= length2
+    uu1, vv1 = 1 / length1, t_l[i] / length1
+    uu2, vv2 = 1 / length2, t_l[i + 1] / length2
 
-            uu3 = uu1 * f + uu2 * (1 - f)
-            vv3 = vv1 * f + vv2 * (1 - f)
+    uu3 = uu1 * f + uu2 * (1 - f)
+    vv3 = vv1 * f + vv2 * (1 - f)
 
-            len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+    len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
 
-            uu3 /= len3
-            vv3 /= len3
+    uu3 /= len3
+    vv3 /= len3
 
-            u += uu3 * -D_uv
-            v += vv3 * -D_uv
+    u += uu3 * -D_uv
+    v += vv3 * -D_uv
 
-            return np.array([u, v])
+    return tstack([u, v])
 
 
 def CCT_to_uv_Robertson1968(CCT_D_uv):
@@ -303,6 +302,6 @@ def CCT_to_uv_Robertson1968(CCT_D_uv):
 
     CCT_D_uv = as_float_array(CCT_D_uv)
 
-    uv = [_CCT_to_uv_Robertson1968(a) for a in np.reshape(CCT_D_uv, (-1, 2))]
+    uv = _CCT_to_uv_Robertson1968(np.reshape(CCT_D_uv, (-1, 2)))
 
-    return as_float_array(uv).reshape(CCT_D_uv.shape)
+    return np.reshape(uv, CCT_D_uv.shape)
@@ -55,6 +55,13 @@ class TestXy_to_CCT_CIE_D(unittest.TestCase):
             rtol=0.0000001,
             atol=0.0000001)
 
+        CCT = np.array([4000, 7000, 25000])
+        np.testing.assert_allclose(
+            xy_to_CCT_CIE_D(CCT_to_xy_CIE_D(CCT)),
+            CCT,
+            rtol=0.0000001,
+            atol=0.0000001)
+
     def test_n_dimensional_xy_to_CCT_CIE_D(self):
         """
         Tests :func:`colour.temperature.cie_d.xy_to_CCT_CIE_D` definition
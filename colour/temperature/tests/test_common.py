@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.temperature.common` module.
+"""
+
+import numpy as np
+import unittest
+
+from colour.temperature.common import minimise_batch
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestMinimiseBatch']
+
+
+class TestMinimiseBatch(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.common.minimise_batch` definition unit
+    tests methods.
+    """
+
+    def test_minimise_batch(self):
+        """
+        Tests :func:`colour.temperature.common.minimise_batch` definition.
+        """
+
+        def function(x):
+            """
+            Function with a one-dimensional variable.
+            """
+
+            return np.hstack([x, x ** 2])
+
+        np.testing.assert_almost_equal(
+            minimise_batch(function,
+                           np.array([[2, 4], [3, 9], [0.5, 0.25]]), [1]),
+            np.array([[2], [3], [0.5]]),
+            decimal=7)
+
+        def norm(x):
+            """
+            Function with a one-dimensional output.
+            """
+
+            return np.sum(x ** 2, axis=-1)[..., np.newaxis]
+
+        x = minimise_batch(norm, np.array([[4], [9]]), [1, 1])
+        np.testing.assert_almost_equal(
+            np.sum(x ** 2, axis=-1), np.array([4, 9]), decimal=7)
+
+        np.testing.assert_almost_equal(
+            minimise_batch(
+                function,
+                np.array([[2, 4]]), [1],
+                {'options': {
+                    'maxiter': 0
+                }}),
+            np.array([[1]]),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_minimise_batch(self):
+        """
+        Tests :func:`colour.temperature.common.minimise_batch` definition nan
+        support.
+        """
+
+        x = minimise_batch(lambda x: x, np.array([[np.nan], [2], [np.inf]]),
+                           [1])
+        np.testing.assert_almost_equal(x, np.array([[np.nan], [2], [np.nan]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
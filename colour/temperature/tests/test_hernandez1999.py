@@ -107,6 +107,21 @@ class TestCCT_to_xy_Hernandez1999(unittest.TestCase):
             np.array([0.08269106, 0.36612620]),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Hernandez1999(2000),
+            np.array([0.48997481, 0.39488587]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Hernandez1999(15000),
+            np.array([0.19015868, 0.36165112]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_Hernandez1999(20000),
+            np.array([0.14485667, 0.37471075]),
+            decimal=7)
+
     def test_n_dimensional_CCT_to_xy_Hernandez1999(self):
         """
         Tests :func:`colour.temperature.hernandez1999.CCT_to_xy_Hernandez1999`
@@ -56,6 +56,13 @@ class TestXy_to_CCT_Kang2002(unittest.TestCase):
             rtol=0.0000001,
             atol=0.0000001)
 
+        CCT = np.array([4500, 7000, 25000])
+        np.testing.assert_allclose(
+            xy_to_CCT_Kang2002(CCT_to_xy_Kang2002(CCT)),
+            CCT,
+            rtol=0.0000001,
+            atol=0.0000001)
+
     def test_n_dimensional_xy_to_CCT_Kang2002(self):
         """
         Tests :func:`colour.temperature.kang2002.xy_to_CCT_Kang2002`
@@ -56,6 +56,13 @@ class TestUv_to_CCT_Krystek1985(unittest.TestCase):
             rtol=0.0000001,
             atol=0.0000001)
 
+        CCT = np.array([1000, 7000, 15000])
+        np.testing.assert_allclose(
+            uv_to_CCT_Krystek1985(CCT_to_uv_Krystek1985(CCT)),
+            CCT,
+            rtol=0.0000001,
+            atol=0.0000001)
+
     def test_n_dimensional_uv_to_CCT_Krystek1985(self):
         """
         Tests :func:`colour.temperature.krystek1985.uv_to_CCT_Krystek1985`
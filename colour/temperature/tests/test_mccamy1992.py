@@ -107,6 +107,21 @@ class TestCCT_to_xy_McCamy1992(unittest.TestCase):
             np.array([0.11173782, 0.36987375]),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            CCT_to_xy_McCamy1992(2000),
+            np.array([0.50735647, 0.39323176]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_McCamy1992(15000),
+            np.array([0.18022953, 0.35241419]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_xy_McCamy1992(20000),
+            np.array([0.12117522, 0.35785331]),
+            decimal=7)
+
     def test_n_dimensional_CCT_to_xy_McCamy1992(self):
         """
         Tests :func:`colour.temperature.mccamy1992.CCT_to_xy_McCamy1992`
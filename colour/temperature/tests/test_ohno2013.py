@@ -108,6 +108,13 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(
+                np.array([[0.1978, 0.3122], [0.4328, 0.2883]]), cmfs),
+            np.array([[6507.47380460, 0.00322335],
+                      [1041.68315360, -0.06737802]]),
+            decimal=7)
+
     def test_n_dimensional_uv_to_CCT_Ohno2013(self):
         """
         Tests :func:`colour.temperature.ohno2013.uv_to_CCT_Ohno2013` definition
@@ -139,6 +139,11 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+        np.testing.assert_allclose(
+            uv_to_CCT_Robertson1968(list(TEMPERATURE_DUV_TO_UV.values())),
+            list(TEMPERATURE_DUV_TO_UV.keys()),
+            atol=0.25)
+
     def test_n_dimensional_uv_to_CCT_Robertson1968(self):
         """
         Tests :func:`colour.temperature.robertson1968.uv_to_CCT_Robertson1968`
@@ -188,6 +193,11 @@ class TestCCT_to_uv_Robertson1968(unittest.TestCase):
             np.testing.assert_almost_equal(
                 CCT_to_uv_Robertson1968(key), value, decimal=7)
 
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(list(TEMPERATURE_DUV_TO_UV.keys())),
+            list(TEMPERATURE_DUV_TO_UV.values()),
+            decimal=7)
+
     def test_n_dimensional_CCT_to_uv_Robertson1968(self):
         """
         Tests :func:`colour.temperature.robertson1968.CCT_to_uv_Robertson1968`
@@ -2,6 +2,8 @@
 
 from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
                               LazyCaseInsensitiveMapping)
+from .cache import (CacheStatistics, LRUCache, CacheRegistry, CACHE_REGISTRY,
+                    register_cache, clear_caches)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
@@ -32,6 +34,10 @@ __all__ = [
     'Lookup', 'Structure', 'CaseInsensitiveMapping',
     'LazyCaseInsensitiveMapping'
 ]
+__all__ += [
+    'CacheStatistics', 'LRUCache', 'CacheRegistry', 'CACHE_REGISTRY',
+    'register_cache', 'clear_caches'
+]
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
@@ -0,0 +1,692 @@
+# -*- coding: utf-8 -*-
+"""
+Caching
+=======
+
+Defines the caching objects used by *Colour* to store expensive intermediate
+results:
+
+-   :class:`colour.utilities.LRUCache`: A bounded, thread-safe, least recently
+    used cache.
+-   :class:`colour.utilities.CacheRegistry`: A registry of named
+    :class:`colour.utilities.LRUCache` class instances.
+-   :attr:`colour.utilities.CACHE_REGISTRY`: The *Colour* cache registry.
+-   :func:`colour.utilities.register_cache`
+-   :func:`colour.utilities.clear_caches`
+"""
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'CacheStatistics', 'LRUCache', 'CacheRegistry', 'CACHE_REGISTRY',
+    'register_cache', 'clear_caches'
+]
+
+
+class CacheStatistics(
+        namedtuple('CacheStatistics', ('hits', 'misses', 'evictions', 'size',
+                                       'bytes'))):
+    """
+    Defines the class storing the statistics of a
+    :class:`colour.utilities.LRUCache` class instance.
+
+    Parameters
+    ----------
+    hits : int
+        Count of successful lookups.
+    misses : int
+        Count of unsuccessful lookups.
+    evictions : int
+        Count of items evicted to honour the cache limits.
+    size : int
+        Count of items currently stored.
+    bytes : int
+        Estimated size in bytes of the items currently stored.
+    """
+
+
+def _nbytes(value):
+    """
+    Returns the estimated size in bytes of given value.
+
+    *Numpy* arrays and objects exposing a ``nbytes`` attribute report it,
+    *tuple*, *list* and *dict* instances are traversed recursively and any
+    other object is measured with :func:`sys.getsizeof` definition.
+
+    Parameters
+    ----------
+    value : object
+        Value to estimate the size of.
+
+    Returns
+    -------
+    int
+        Estimated size in bytes.
+    """
+
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _nbytes(key) + _nbytes(item) for key, item in value.items())
+
+    return sys.getsizeof(value)
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a bounded, thread-safe, least recently used (LRU) cache.
+
+    Items are evicted, least recently used first, whenever the count of stored
+    items exceeds :attr:`colour.utilities.LRUCache.maximum_size` or their
+    estimated size in bytes exceeds
+    :attr:`colour.utilities.LRUCache.maximum_bytes`.
+
+    Parameters
+    ----------
+    name : unicode, optional
+        Cache name.
+    maximum_size : int, optional
+        Maximum count of stored items, *None* means unbounded.
+    maximum_bytes : int, optional
+        Maximum estimated size in bytes of the stored items, *None* means
+        unbounded.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.LRUCache.name`
+    -   :attr:`~colour.utilities.LRUCache.maximum_size`
+    -   :attr:`~colour.utilities.LRUCache.maximum_bytes`
+    -   :attr:`~colour.utilities.LRUCache.statistics`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.LRUCache.__init__`
+    -   :meth:`~colour.utilities.LRUCache.__getitem__`
+    -   :meth:`~colour.utilities.LRUCache.__setitem__`
+    -   :meth:`~colour.utilities.LRUCache.__delitem__`
+    -   :meth:`~colour.utilities.LRUCache.__contains__`
+    -   :meth:`~colour.utilities.LRUCache.__iter__`
+    -   :meth:`~colour.utilities.LRUCache.__len__`
+    -   :meth:`~colour.utilities.LRUCache.__repr__`
+    -   :meth:`~colour.utilities.LRUCache.get`
+    -   :meth:`~colour.utilities.LRUCache.clear`
+
+    Notes
+    -----
+    -   The lookups performed with
+        :meth:`colour.utilities.LRUCache.__getitem__` and
+        :meth:`colour.utilities.LRUCache.get` methods update the
+        hits and misses counters whereas
+        :meth:`colour.utilities.LRUCache.__contains__` method does not.
+
+    Examples
+    --------
+    >>> cache = LRUCache('Example', maximum_size=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    >>> cache.statistics  # doctest: +ELLIPSIS
+    CacheStatistics(hits=1, misses=0, evictions=1, size=2, bytes=...)
+    """
+
+    def __init__(self, name=None, maximum_size=None, maximum_bytes=None):
+        self._name = '{0}'.format(id(self)) if name is None else name
+        self._maximum_size = None
+        self._maximum_bytes = None
+
+        self._lock = threading.RLock()
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.maximum_size = maximum_size
+        self.maximum_bytes = maximum_bytes
+
+    @property
+    def name(self):
+        """
+        Getter property for the cache name.
+
+        Returns
+        -------
+        unicode
+            Cache name.
+        """
+
+        return self._name
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum count of stored items.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum count of stored items with.
+
+        Returns
+        -------
+        int
+            Maximum count of stored items.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for the **self.maximum_size** property.
+        """
+
+        if value is not None:
+            assert value >= 0, (
+                '"{0}" attribute: "{1}" must be positive or zero!'.format(
+                    'maximum_size', value))
+
+        with self._lock:
+            self._maximum_size = value
+            self._evict()
+
+    @property
+    def maximum_bytes(self):
+        """
+        Getter and setter property for the maximum estimated size in bytes of
+        the stored items.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum estimated size in bytes of the stored
+            items with.
+
+        Returns
+        -------
+        int
+            Maximum estimated size in bytes of the stored items.
+        """
+
+        return self._maximum_bytes
+
+    @maximum_bytes.setter
+    def maximum_bytes(self, value):
+        """
+        Setter for the **self.maximum_bytes** property.
+        """
+
+        if value is not None:
+            assert value >= 0, (
+                '"{0}" attribute: "{1}" must be positive or zero!'.format(
+                    'maximum_bytes', value))
+
+        with self._lock:
+            self._maximum_bytes = value
+            self._evict()
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the cache statistics.
+
+        Returns
+        -------
+        CacheStatistics
+            Cache statistics.
+        """
+
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, self._evictions,
+                                   len(self._data), self._bytes)
+
+    def __getitem__(self, key):
+        """
+        Returns the value of given key and marks it as the most recently used.
+
+        Parameters
+        ----------
+        key : object
+            Key to retrieve the value of.
+
+        Returns
+        -------
+        object
+            Key value.
+
+        Raises
+        ------
+        KeyError
+            If the key is not stored in the cache.
+        """
+
+        with self._lock:
+            try:
+                nbytes, value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                raise
+
+            self._data.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def __setitem__(self, key, value):
+        """
+        Sets given key with given value, evicting the least recently used
+        items if required.
+
+        Parameters
+        ----------
+        key : object
+            Key to set the value of.
+        value : object
+            Value to store.
+        """
+
+        nbytes = _nbytes(value)
+
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[0]
+
+            self._data[key] = (nbytes, value)
+            self._bytes += nbytes
+
+            self._evict()
+
+    def __delitem__(self, key):
+        """
+        Deletes given key from the cache.
+
+        Parameters
+        ----------
+        key : object
+            Key to delete.
+        """
+
+        with self._lock:
+            self._bytes -= self._data.pop(key)[0]
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache contains given key.
+
+        Parameters
+        ----------
+        key : object
+            Key to check the existence of.
+
+        Returns
+        -------
+        bool
+            Whether the key is in the cache.
+        """
+
+        with self._lock:
+            return key in self._data
+
+    def __iter__(self):
+        """
+        Iterates over the keys of the cache, least recently used first.
+
+        Returns
+        -------
+        generator
+            Keys iterator.
+        """
+
+        with self._lock:
+            keys = list(self._data.keys())
+
+        return iter(keys)
+
+    def __len__(self):
+        """
+        Returns the count of items stored in the cache.
+
+        Returns
+        -------
+        int
+            Items count.
+        """
+
+        return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the cache.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return ('{0}(name={1!r}, maximum_size={2!r}, maximum_bytes={3!r})'
+                ).format(self.__class__.__name__, self._name,
+                         self._maximum_size, self._maximum_bytes)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of given key or given default value if the key is
+        not stored in the cache.
+
+        Parameters
+        ----------
+        key : object
+            Key to retrieve the value of.
+        default : object, optional
+            Default value.
+
+        Returns
+        -------
+        object
+            Key value or default value.
+        """
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        """
+        Removes all the items of the cache and resets its statistics.
+        """
+
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _evict(self):
+        """
+        Evicts the least recently used items until the cache limits are
+        honoured.
+        """
+
+        while self._data and (
+            (self._maximum_size is not None and
+             len(self._data) > self._maximum_size) or
+            (self._maximum_bytes is not None and
+             self._bytes > self._maximum_bytes)):
+            self._bytes -= self._data.popitem(last=False)[1][0]
+            self._evictions += 1
+
+
+class CacheRegistry:
+    """
+    A registry of named :class:`colour.utilities.LRUCache` class instances.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.CacheRegistry.registry`
+    -   :attr:`~colour.utilities.CacheRegistry.statistics`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.CacheRegistry.__init__`
+    -   :meth:`~colour.utilities.CacheRegistry.__repr__`
+    -   :meth:`~colour.utilities.CacheRegistry.register_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.unregister_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_cache`
+    -   :meth:`~colour.utilities.CacheRegistry.clear_all_caches`
+
+    Examples
+    --------
+    >>> cache_registry = CacheRegistry()
+    >>> cache_a = cache_registry.register_cache('Cache A', maximum_size=2)
+    >>> cache_a['Foo'] = 'Bar'
+    >>> cache_b = cache_registry.register_cache('Cache B')
+    >>> cache_b['John'] = 'Doe'
+    >>> cache_b['Luke'] = 'Skywalker'
+    >>> print(cache_registry)
+    {'Cache A': '1 item(s)', 'Cache B': '2 item(s)'}
+    >>> cache_registry.clear_cache('Cache A')
+    >>> print(cache_registry)
+    {'Cache A': '0 item(s)', 'Cache B': '2 item(s)'}
+    >>> cache_registry.unregister_cache('Cache B')
+    >>> print(cache_registry)
+    {'Cache A': '0 item(s)'}
+    >>> len(cache_b)
+    0
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._registry = OrderedDict()
+
+    @property
+    def registry(self):
+        """
+        Getter property for the cache registry.
+
+        Returns
+        -------
+        dict
+            Cache registry.
+        """
+
+        with self._lock:
+            return OrderedDict(self._registry)
+
+    @property
+    def statistics(self):
+        """
+        Getter property for the statistics of the registered caches.
+
+        Returns
+        -------
+        dict
+            Registered caches statistics.
+        """
+
+        return OrderedDict((name, cache.statistics)
+                           for name, cache in self.registry.items())
+
+    def __repr__(self):
+        """
+        Returns an evaluable string representation of the cache registry.
+
+        Returns
+        -------
+        unicode
+            Evaluable string representation.
+        """
+
+        return '{{{0}}}'.format(', '.join([
+            '{0!r}: \'{1} item(s)\''.format(name, len(cache))
+            for name, cache in self.registry.items()
+        ]))
+
+    def register_cache(self, name, maximum_size=None, maximum_bytes=None):
+        """
+        Registers a new cache with given name in the registry.
+
+        If a cache with given name is already registered, it is returned with
+        its limits updated, only the limits that are given, i.e. not *None*,
+        are updated so that an existing bound is never removed.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name for the registry.
+        maximum_size : int, optional
+            Maximum count of stored items, *None* means unbounded.
+        maximum_bytes : int, optional
+            Maximum estimated size in bytes of the stored items, *None* means
+            unbounded.
+
+        Returns
+        -------
+        LRUCache
+            Registered cache.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = 'Bar'
+        >>> cache_b = cache_registry.register_cache('Cache B')
+        >>> cache_b['John'] = 'Doe'
+        >>> cache_b['Luke'] = 'Skywalker'
+        >>> print(cache_registry)
+        {'Cache A': '1 item(s)', 'Cache B': '2 item(s)'}
+        """
+
+        with self._lock:
+            cache = self._registry.get(name)
+            if cache is None:
+                cache = self._registry[name] = LRUCache(
+                    name, maximum_size, maximum_bytes)
+            else:
+                if maximum_size is not None:
+                    cache.maximum_size = maximum_size
+                if maximum_bytes is not None:
+                    cache.maximum_bytes = maximum_bytes
+
+            return cache
+
+    def unregister_cache(self, name):
+        """
+        Unregisters cache with given name in the registry, the cache is also
+        cleared.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = 'Bar'
+        >>> cache_registry.unregister_cache('Cache A')
+        >>> print(cache_registry)
+        {}
+        """
+
+        with self._lock:
+            self._registry.pop(name).clear()
+
+    def clear_cache(self, name):
+        """
+        Clears the cache with given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name in the registry.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = 'Bar'
+        >>> print(cache_registry)
+        {'Cache A': '1 item(s)'}
+        >>> cache_registry.clear_cache('Cache A')
+        >>> print(cache_registry)
+        {'Cache A': '0 item(s)'}
+        """
+
+        self.registry[name].clear()
+
+    def clear_all_caches(self):
+        """
+        Clears all the caches in the registry.
+
+        Examples
+        --------
+        >>> cache_registry = CacheRegistry()
+        >>> cache_a = cache_registry.register_cache('Cache A')
+        >>> cache_a['Foo'] = 'Bar'
+        >>> cache_b = cache_registry.register_cache('Cache B')
+        >>> cache_b['John'] = 'Doe'
+        >>> cache_b['Luke'] = 'Skywalker'
+        >>> print(cache_registry)
+        {'Cache A': '1 item(s)', 'Cache B': '2 item(s)'}
+        >>> cache_registry.clear_all_caches()
+        >>> print(cache_registry)
+        {'Cache A': '0 item(s)', 'Cache B': '0 item(s)'}
+        """
+
+        for cache in self.registry.values():
+            cache.clear()
+
+
+CACHE_REGISTRY = CacheRegistry()
+"""
+*Colour* cache registry referencing all the caches used for repetitive or long
+processes.
+
+CACHE_REGISTRY : CacheRegistry
+"""
+
+
+def register_cache(name, maximum_size=None, maximum_bytes=None):
+    """
+    Registers a new cache with given name in the *Colour* cache registry.
+
+    Parameters
+    ----------
+    name : unicode
+        Cache name for the registry.
+    maximum_size : int, optional
+        Maximum count of stored items, *None* means unbounded.
+    maximum_bytes : int, optional
+        Maximum estimated size in bytes of the stored items, *None* means
+        unbounded.
+
+    Returns
+    -------
+    LRUCache
+        Registered cache.
+
+    Examples
+    --------
+    >>> cache_a = register_cache('Cache A', maximum_size=8)
+    >>> cache_a['Foo'] = 'Bar'
+    >>> cache_a.get('Foo')
+    'Bar'
+    >>> CACHE_REGISTRY.unregister_cache('Cache A')
+    """
+
+    return CACHE_REGISTRY.register_cache(name, maximum_size, maximum_bytes)
+
+
+def clear_caches():
+    """
+    Clears all the caches of the *Colour* cache registry.
+
+    Examples
+    --------
+    >>> clear_caches()
+    """
+
+    CACHE_REGISTRY.clear_all_caches()
@@ -276,6 +276,13 @@ def multiprocessing_pool(*args, **kwargs):
 
             return [func(a) for a in iterable]
 
+        def imap(self, func, iterable, chunksize=1):
+            """
+            Lazily applies given function to each element of given iterable.
+            """
+
+            return (func(a) for a in iterable)
+
         def terminate(self):
             """
             Terminate the process.
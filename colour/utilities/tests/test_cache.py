@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.cache` module.
+"""
+
+import numpy as np
+import threading
+import unittest
+
+from colour.utilities import (LRUCache, CacheRegistry, CACHE_REGISTRY,
+                              register_cache, clear_caches)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'TestLRUCache', 'TestCacheRegistry', 'TestRegisterCache',
+    'TestClearCaches'
+]
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.cache.LRUCache` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name', 'maximum_size', 'maximum_bytes',
+                               'statistics')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__getitem__', '__setitem__',
+                            '__delitem__', '__contains__', '__iter__',
+                            '__len__', '__repr__', 'get', 'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_maximum_size(self):
+        """
+        Tests :attr:`colour.utilities.cache.LRUCache.maximum_size` property.
+        """
+
+        cache = LRUCache(maximum_size=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+        self.assertListEqual(list(cache), ['a', 'c'])
+        self.assertEqual(cache.statistics.evictions, 1)
+
+        cache.maximum_size = 1
+        self.assertListEqual(list(cache), ['c'])
+        self.assertEqual(cache.statistics.evictions, 2)
+
+        self.assertRaises(AssertionError,
+                          lambda: setattr(cache, 'maximum_size', -1))
+
+    def test_maximum_bytes(self):
+        """
+        Tests :attr:`colour.utilities.cache.LRUCache.maximum_bytes` property.
+        """
+
+        cache = LRUCache(maximum_bytes=np.zeros(16).nbytes * 2)
+        cache['a'] = np.zeros(16)
+        cache['b'] = np.zeros(16)
+        self.assertEqual(cache.statistics.bytes, np.zeros(16).nbytes * 2)
+
+        cache['c'] = np.zeros(16)
+        self.assertListEqual(list(cache), ['b', 'c'])
+
+        cache['d'] = np.zeros(64)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.statistics.bytes, 0)
+
+    def test_statistics(self):
+        """
+        Tests :attr:`colour.utilities.cache.LRUCache.statistics` property.
+        """
+
+        cache = LRUCache()
+        cache['a'] = 1
+        cache.get('a')
+        cache.get('b')
+        self.assertRaises(KeyError, lambda: cache['b'])
+        self.assertNotIn('b', cache)
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 2)
+        self.assertEqual(statistics.evictions, 0)
+        self.assertEqual(statistics.size, 1)
+
+        cache.clear()
+        self.assertTupleEqual(tuple(cache.statistics), (0, 0, 0, 0, 0))
+
+    def test__delitem__(self):
+        """
+        Tests :meth:`colour.utilities.cache.LRUCache.__delitem__` method.
+        """
+
+        cache = LRUCache()
+        cache['a'] = np.zeros(16)
+        del cache['a']
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.statistics.bytes, 0)
+
+    def test_thread_safety(self):
+        """
+        Tests :class:`colour.utilities.cache.LRUCache` class thread safety.
+        """
+
+        cache = LRUCache(maximum_size=32)
+
+        def worker(offset):
+            for i in range(1000):
+                cache[(offset, i)] = i
+                cache.get((offset, i - 1))
+
+        threads = [
+            threading.Thread(target=worker, args=(i, )) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.size, 32)
+        self.assertEqual(statistics.evictions, 8000 - 32)
+        self.assertEqual(statistics.hits + statistics.misses, 8000)
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.cache.CacheRegistry` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('registry', 'statistics')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CacheRegistry))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__repr__', 'register_cache',
+                            'unregister_cache', 'clear_cache',
+                            'clear_all_caches')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CacheRegistry))
+
+    def test_register_cache(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.register_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A', maximum_size=8)
+        self.assertIn('Cache A', cache_registry.registry)
+        self.assertEqual(cache_a.maximum_size, 8)
+
+        self.assertIs(
+            cache_registry.register_cache('Cache A', maximum_size=4), cache_a)
+        self.assertEqual(cache_a.maximum_size, 4)
+
+        cache_registry.register_cache('Cache A', maximum_bytes=1024)
+        self.assertEqual(cache_a.maximum_size, 4)
+        self.assertEqual(cache_a.maximum_bytes, 1024)
+
+        cache_registry.register_cache('Cache A')
+        self.assertEqual(cache_a.maximum_size, 4)
+        self.assertEqual(cache_a.maximum_bytes, 1024)
+
+    def test_unregister_cache(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.unregister_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_registry.unregister_cache('Cache A')
+        self.assertNotIn('Cache A', cache_registry.registry)
+        self.assertEqual(len(cache_a), 0)
+
+    def test_clear_cache(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.clear_cache`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_b['John'] = 'Doe'
+        cache_registry.clear_cache('Cache A')
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 1)
+
+    def test_clear_all_caches(self):
+        """
+        Tests :meth:`colour.utilities.cache.CacheRegistry.clear_all_caches`
+        method.
+        """
+
+        cache_registry = CacheRegistry()
+        cache_a = cache_registry.register_cache('Cache A')
+        cache_a['Foo'] = 'Bar'
+        cache_b = cache_registry.register_cache('Cache B')
+        cache_b['John'] = 'Doe'
+        cache_registry.clear_all_caches()
+        self.assertEqual(len(cache_a), 0)
+        self.assertEqual(len(cache_b), 0)
+        self.assertListEqual(
+            [statistics.size
+             for statistics in cache_registry.statistics.values()], [0, 0])
+
+
+class TestRegisterCache(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.register_cache` definition units
+    tests methods.
+    """
+
+    def test_register_cache(self):
+        """
+        Tests :func:`colour.utilities.cache.register_cache` definition.
+        """
+
+        cache = register_cache('{0}.Cache A'.format(__name__))
+        self.assertIn(cache.name, CACHE_REGISTRY.registry)
+        CACHE_REGISTRY.unregister_cache(cache.name)
+        self.assertNotIn(cache.name, CACHE_REGISTRY.registry)
+
+
+class TestClearCaches(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.cache.clear_caches` definition units
+    tests methods.
+    """
+
+    def test_clear_caches(self):
+        """
+        Tests :func:`colour.utilities.cache.clear_caches` definition.
+        """
+
+        from colour import SDS_ILLUMINANTS, SDS_LIGHT_SOURCES, sd_to_XYZ
+        from colour.colorimetry.tristimulus import _CACHE_SD_TO_XYZ
+
+        sd_to_XYZ(SDS_LIGHT_SOURCES['Neodimium Incandescent'],
+                  illuminant=SDS_ILLUMINANTS['D65'])
+        self.assertGreater(len(_CACHE_SD_TO_XYZ), 0)
+
+        clear_caches()
+        self.assertEqual(len(_CACHE_SD_TO_XYZ), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
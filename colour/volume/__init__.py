@@ -7,7 +7,8 @@ from .mesh import is_within_mesh_volume
 from .pointer_gamut import is_within_pointer_gamut
 from .spectrum import (generate_pulse_waves, XYZ_outer_surface,
                        is_within_visible_spectrum)
-from .rgb import (RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+from .rgb import (MonteCarlo_Estimate, RGB_colourspace_limits,
+                  RGB_colourspace_volume_MonteCarlo,
                   RGB_colourspace_volume_coverage_MonteCarlo,
                   RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
                   RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
@@ -21,7 +22,8 @@ __all__ += [
     'generate_pulse_waves', 'XYZ_outer_surface', 'is_within_visible_spectrum'
 ]
 __all__ += [
-    'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+    'MonteCarlo_Estimate', 'RGB_colourspace_limits',
+    'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
@@ -10,6 +10,7 @@ import numpy as np
 from scipy.spatial import Delaunay
 
 from colour.models import xyY_to_XYZ
+from colour.utilities import register_cache
 from colour.volume import OPTIMAL_COLOUR_STIMULI_ILLUMINANTS
 
 __author__ = 'Colour Developers'
@@ -21,8 +22,11 @@ __status__ = 'Production'
 
 __all__ = ['is_within_macadam_limits']
 
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = {}
-_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = {}
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ = register_cache(
+    '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ'.format(__name__), maximum_size=16)
+_CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS = register_cache(
+    '{0}._CACHE_OPTIMAL_COLOUR_STIMULI_XYZ_TRIANGULATIONS'.format(__name__),
+    maximum_size=16)
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
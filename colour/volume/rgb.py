@@ -13,8 +13,12 @@ Defines various RGB colourspace volume computation objects:
 """
 
 import itertools
-import multiprocessing
 import numpy as np
+import os
+from collections import namedtuple
+from contextlib import ExitStack
+from multiprocessing.pool import ThreadPool
+from scipy.special import ndtri
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import CCS_ILLUMINANTS
@@ -31,7 +35,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
+    'MonteCarlo_Estimate', 'sample_RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_limits',
     'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
@@ -39,6 +44,42 @@ __all__ = [
 ]
 
 
+class MonteCarlo_Estimate(
+        namedtuple('MonteCarlo_Estimate',
+                   ('value', 'standard_error', 'samples'))):
+    """
+    Defines the class storing a *Monte Carlo* estimate.
+
+    Parameters
+    ----------
+    value : numeric
+        Estimated value.
+    standard_error : numeric
+        Standard error of the estimated value.
+    samples : integer
+        Samples count the estimate is computed from.
+    """
+
+
+def _random_state_MonteCarlo(seed_sequence):
+    """
+    Returns the *Mersenne Twister* pseudo-random number generator of a
+    *Monte Carlo* batch for given seed sequence.
+
+    Parameters
+    ----------
+    seed_sequence : SeedSequence
+        Seed sequence spawned for the batch.
+
+    Returns
+    -------
+    RandomState
+        *Mersenne Twister* pseudo-random number generator.
+    """
+
+    return np.random.RandomState(np.random.MT19937(seed_sequence))
+
+
 def _wrapper_RGB_colourspace_volume_MonteCarlo(arguments):
     """
     Convenient wrapper to be able to call
@@ -48,15 +89,171 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(arguments):
     Parameters
     ----------
     arguments : array_like, optional
-        Arguments.
+        Arguments, the last two being the batch samples count and seed
+        sequence.
 
     Returns
     -------
-    integer
-        Inside *RGB* colourspace volume samples count.
+    tuple
+        Inside *RGB* colourspace volume samples count and samples count.
+    """
+
+    (colourspace, limits, illuminant_Lab, chromatic_adaptation_method,
+     random_generator, samples, seed_sequence) = arguments
+
+    return sample_RGB_colourspace_volume_MonteCarlo(
+        colourspace, samples, limits, illuminant_Lab,
+        chromatic_adaptation_method, random_generator,
+        _random_state_MonteCarlo(seed_sequence)), samples
+
+
+def _wrapper_RGB_colourspace_volume_coverage_MonteCarlo(arguments):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.volume.rgb.\
+_sample_RGB_colourspace_volume_coverage_MonteCarlo` definition with multiple
+    arguments.
+
+    Parameters
+    ----------
+    arguments : array_like, optional
+        Arguments, the last two being the batch samples count and seed
+        sequence.
+
+    Returns
+    -------
+    tuple
+        Inside *RGB* colourspace volume samples count and within the arbitrary
+        volume samples count.
+    """
+
+    (colourspace, coverage_sampler, random_generator, samples,
+     seed_sequence) = arguments
+
+    return _sample_RGB_colourspace_volume_coverage_MonteCarlo(
+        colourspace, coverage_sampler, samples, random_generator,
+        _random_state_MonteCarlo(seed_sequence))
+
+
+def _estimate_MonteCarlo(wrapper,
+                         arguments,
+                         samples,
+                         scale,
+                         batch_size,
+                         random_state,
+                         workers,
+                         backend,
+                         confidence_interval,
+                         confidence):
+    """
+    Estimates a proportion scaled by given factor using *Monte Carlo* method.
+
+    The samples are split in batches evaluated concurrently, each batch
+    drawing its samples with an independent pseudo-random number generator
+    seeded from a seed sequence spawned from the root seed sequence, so that
+    the estimate only depends on the root seed sequence and the batch size,
+    not on the workers count, the backend or the scheduling. The batches
+    results are accumulated in order, allowing to stop as soon as the
+    confidence interval of the estimate is narrow enough.
+
+    Parameters
+    ----------
+    wrapper : callable
+        Definition evaluating a batch and returning the successes and trials
+        counts.
+    arguments : tuple
+        Arguments of the wrapper definition, the batch samples count and seed
+        sequence are appended to them.
+    samples : numeric
+        Maximum samples count.
+    scale : numeric
+        Factor scaling the estimated proportion.
+    batch_size : numeric
+        Samples count per batch.
+    random_state : int or SeedSequence or RandomState or Generator
+        Root seed or pseudo-random number generator to draw the root seed
+        sequence entropy from. If *None*, fresh entropy is used.
+    workers : int
+        Number of workers evaluating the batches concurrently, defaults to the
+        number of CPUs.
+    backend : unicode
+        **{'Process', 'Thread'}**,
+        Pool backend evaluating the batches.
+    confidence_interval : numeric
+        Half-width of the confidence interval below which the estimation
+        stops.
+    confidence : numeric
+        Confidence level of the confidence interval.
+
+    Returns
+    -------
+    MonteCarlo_Estimate
+        *Monte Carlo* estimate.
     """
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*arguments)
+    assert backend.lower() in ['process', 'thread'], (
+        '"{0}" backend is invalid, must be one of {1}!'.format(
+            backend, ['Process', 'Thread']))
+
+    if isinstance(random_state, np.random.RandomState):
+        random_state = random_state.randint(
+            0, 2 ** 32, size=4, dtype=np.uint64)
+    elif isinstance(random_state, np.random.Generator):
+        random_state = random_state.integers(
+            0, 2 ** 32, size=4, dtype=np.uint64)
+
+    if isinstance(random_state, np.random.SeedSequence):
+        seed_sequence = random_state
+    else:
+        seed_sequence = np.random.SeedSequence(random_state)
+
+    samples = DEFAULT_INT_DTYPE(samples)
+    batch_size = DEFAULT_INT_DTYPE(batch_size)
+
+    assert batch_size > 0, '"batch_size" must be strictly positive!'
+
+    batches_samples = [
+        min(batch_size, samples - i) for i in range(0, samples, batch_size)
+    ]
+    tasks = [
+        tuple(arguments) + (batch_samples, batch_seed_sequence)
+        for batch_samples, batch_seed_sequence in zip(
+            batches_samples, seed_sequence.spawn(len(batches_samples)))
+    ]
+
+    workers = min(len(tasks), workers or os.cpu_count() or 1)
+
+    z = ndtri((1 + confidence) / 2)
+
+    successes = trials = samples_c = 0
+    value = standard_error = np.nan
+    with ExitStack() as stack:
+        if workers > 1:
+            pool = stack.enter_context(
+                multiprocessing_pool(workers) if backend.lower() ==
+                'process' else ThreadPool(workers))
+            results = pool.imap(wrapper, tasks)
+        else:
+            results = map(wrapper, tasks)
+
+        for (batch_successes, batch_trials), batch_samples in zip(
+                results, batches_samples):
+            successes += batch_successes
+            trials += batch_trials
+            samples_c += batch_samples
+
+            if trials == 0:
+                continue
+
+            p = successes / trials
+            value = scale * p
+            standard_error = scale * np.sqrt(p * (1 - p) / trials)
+
+            if (confidence_interval is not None and
+                    z * standard_error <= confidence_interval):
+                break
+
+    return MonteCarlo_Estimate(value, standard_error, samples_c)
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -186,7 +383,13 @@ def RGB_colourspace_volume_MonteCarlo(
             'D65'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        batch_size=10e5,
+        workers=None,
+        backend='Process',
+        confidence_interval=None,
+        confidence=0.95,
+        additional_data=False):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
@@ -209,17 +412,40 @@ def RGB_colourspace_volume_MonteCarlo(
     random_generator : generator, optional
         Random triplet generator providing the random samples within the
         *CIE L\\*a\\*b\\** colourspace volume.
-    random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+    random_state : int or SeedSequence or RandomState or Generator, optional
+        Seed or pseudo-random number generator seeding the batches
+        pseudo-random number generators.
+    batch_size : numeric, optional
+        Samples count per batch, each batch drawing its samples with an
+        independent pseudo-random number generator.
+    workers : int, optional
+        Number of workers evaluating the batches concurrently, defaults to the
+        number of CPUs.
+    backend : unicode, optional
+        **{'Process', 'Thread'}**,
+        Pool backend evaluating the batches.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval below which the estimation
+        stops before drawing all the samples.
+    confidence : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output additional data.
 
     Returns
     -------
-    float
+    float or MonteCarlo_Estimate
         *RGB* colourspace volume.
 
     Notes
     -----
+    -   The samples are drawn in batches, the pseudo-random number
+        generator of each batch being seeded from a seed sequence spawned
+        from a root seed sequence built from given ``random_state``, i.e. an
+        *int* or :class:`numpy.random.SeedSequence` class instance seed, or a
+        pseudo-random number generator the root seed sequence entropy is
+        drawn from. The estimate is thus reproducible irrespectively of the
+        workers count and backend.
     -   The doctest is assuming that :func:`np.random.RandomState` definition
         will return the same sequence no matter which *OS* or *Python*
         version is used. There is however no formal promise about the *prng*
@@ -238,21 +464,29 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     ...     RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng)
     ... # doctest: +ELLIPSIS
     8...
-    """
-
-    processes = multiprocessing.cpu_count()
-    process_samples = DEFAULT_INT_DTYPE(np.round(samples / processes))
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+    Stopping as soon as the 95% confidence interval half-width is lower than
+    10000:
 
-    with multiprocessing_pool() as pool:
-        results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                           [arguments for _ in range(processes)])
+    >>> RGB_colourspace_volume_MonteCarlo(  # doctest: +ELLIPSIS
+    ...     sRGB, 10e6, random_state=2, batch_size=10e4, backend='Thread',
+    ...     confidence_interval=10000, additional_data=True)
+    MonteCarlo_Estimate(value=814410.0, standard_error=4713.9602430..., \
+samples=300000)
+    """
 
     Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    return Lab_volume * np.sum(results) / (process_samples * processes)
+    estimate = _estimate_MonteCarlo(
+        _wrapper_RGB_colourspace_volume_MonteCarlo,
+        (colourspace, limits, illuminant_Lab, chromatic_adaptation_method,
+         random_generator), samples, Lab_volume, batch_size, random_state,
+        workers, backend, confidence_interval, confidence)
+
+    if additional_data:
+        return estimate
+    else:
+        return estimate.value
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -260,7 +494,13 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         coverage_sampler,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        batch_size=10e5,
+        workers=None,
+        backend='Process',
+        confidence_interval=None,
+        confidence=0.95,
+        additional_data=False):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -274,15 +514,41 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         Samples count.
     random_generator : generator, optional
         Random triplet generator providing the random samples.
-    random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+    random_state : int or SeedSequence or RandomState or Generator, optional
+        Seed or pseudo-random number generator seeding the batches
+        pseudo-random number generators.
+    batch_size : numeric, optional
+        Samples count per batch, each batch drawing its samples with an
+        independent pseudo-random number generator.
+    workers : int, optional
+        Number of workers evaluating the batches concurrently, defaults to the
+        number of CPUs.
+    backend : unicode, optional
+        **{'Process', 'Thread'}**,
+        Pool backend evaluating the batches.
+    confidence_interval : numeric, optional
+        Half-width of the confidence interval below which the estimation
+        stops before drawing all the samples.
+    confidence : numeric, optional
+        Confidence level of the confidence interval.
+    additional_data : bool, optional
+        Whether to output additional data.
 
     Returns
     -------
-    float
+    float or MonteCarlo_Estimate
         Percentage coverage of volume.
 
+    Notes
+    -----
+    -   The samples are drawn in batches, the pseudo-random number
+        generator of each batch being seeded from a seed sequence spawned
+        from a root seed sequence built from given ``random_state``, i.e. an
+        *int* or :class:`numpy.random.SeedSequence` class instance seed, or a
+        pseudo-random number generator the root seed sequence entropy is
+        drawn from. The estimate is thus reproducible irrespectively of the
+        workers count and backend.
+
     Examples
     --------
     >>> from colour.models import RGB_COLOURSPACE_sRGB as sRGB
@@ -290,7 +556,50 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     >>> RGB_colourspace_volume_coverage_MonteCarlo(
     ...     sRGB, is_within_pointer_gamut, 10e3, random_state=prng)
     ... # doctest: +ELLIPSIS
-    81...
+    80...
+    """
+
+    estimate = _estimate_MonteCarlo(
+        _wrapper_RGB_colourspace_volume_coverage_MonteCarlo,
+        (colourspace, coverage_sampler, random_generator), samples, 100,
+        batch_size, random_state, workers, backend, confidence_interval,
+        confidence)
+
+    if additional_data:
+        return estimate
+    else:
+        return estimate.value
+
+
+def _sample_RGB_colourspace_volume_coverage_MonteCarlo(
+        colourspace,
+        coverage_sampler,
+        samples=10e6,
+        random_generator=random_triplet_generator,
+        random_state=None):
+    """
+    Randomly samples an arbitrary volume and returns the count of samples
+    within the given *RGB* colourspace volume and within the arbitrary volume.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    coverage_sampler : object
+        Python object responsible for checking the volume coverage.
+    samples : numeric, optional
+        Samples count.
+    random_generator : generator, optional
+        Random triplet generator providing the random samples.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator to use in the random
+        number generator.
+
+    Returns
+    -------
+    tuple
+        Within *RGB* colourspace volume and within the arbitrary volume
+        samples count.
     """
 
     random_state = (random_state
@@ -308,14 +617,15 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         np.min(RGB, axis=-1) >= 0,
         np.max(RGB, axis=-1) <= 1)]
 
-    return 100 * RGB_c.size / XYZ_vs.size
+    return len(RGB_c), len(XYZ_vs)
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        **kwargs):
     """
     Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
     volume using *Monte Carlo* method.
@@ -328,13 +638,19 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         Samples count.
     random_generator : generator, optional
         Random triplet generator providing the random samples.
-    random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+    random_state : int or SeedSequence or RandomState or Generator, optional
+        Seed or pseudo-random number generator seeding the batches
+        pseudo-random number generators.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.volume.RGB_colourspace_volume_coverage_MonteCarlo`},
+        Please refer to the documentation of the previously listed definition.
 
     Returns
     -------
-    float
+    float or MonteCarlo_Estimate
         Percentage coverage of *Pointer's Gamut* volume.
 
     Examples
@@ -343,19 +659,20 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     >>> prng = np.random.RandomState(2)
     >>> RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     ...     sRGB, 10e3, random_state=prng)  # doctest: +ELLIPSIS
-    81...
+    80...
     """
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_pointer_gamut, samples, random_generator,
-        random_state)
+        random_state, **kwargs)
 
 
 def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        **kwargs):
     """
     Returns given *RGB* colourspace percentage coverage of visible spectrum
     volume using *Monte Carlo* method.
@@ -368,13 +685,19 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         Samples count.
     random_generator : generator, optional
         Random triplet generator providing the random samples.
-    random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+    random_state : int or SeedSequence or RandomState or Generator, optional
+        Seed or pseudo-random number generator seeding the batches
+        pseudo-random number generators.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.volume.RGB_colourspace_volume_coverage_MonteCarlo`},
+        Please refer to the documentation of the previously listed definition.
 
     Returns
     -------
-    float
+    float or MonteCarlo_Estimate
         Percentage coverage of visible spectrum volume.
 
     Examples
@@ -383,9 +706,9 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     >>> prng = np.random.RandomState(2)
     >>> RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     ...     sRGB, 10e3, random_state=prng)  # doctest: +ELLIPSIS
-    46...
+    48...
     """
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace, is_within_visible_spectrum, samples, random_generator,
-        random_state)
+        random_state, **kwargs)
@@ -20,7 +20,7 @@ import numpy as np
 from colour.colorimetry import (MSDS_CMFS, msds_to_XYZ, SpectralShape, sd_ones)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.volume import is_within_mesh_volume
-from colour.utilities import zeros
+from colour.utilities import register_cache, zeros
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -42,8 +42,10 @@ interval of 5.
 SPECTRAL_SHAPE_OUTER_SURFACE_XYZ : SpectralShape
 """
 
-_CACHE_OUTER_SURFACE_XYZ = {}
-_CACHE_OUTER_SURFACE_XYZ_POINTS = {}
+_CACHE_OUTER_SURFACE_XYZ = register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ'.format(__name__), maximum_size=16)
+_CACHE_OUTER_SURFACE_XYZ_POINTS = register_cache(
+    '{0}._CACHE_OUTER_SURFACE_XYZ_POINTS'.format(__name__), maximum_size=16)
 
 
 def generate_pulse_waves(bins):
@@ -111,6 +111,55 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
             821700.0 * 1e-6,
             places=1)
 
+    def test_workers_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition reproducibility irrespectively of the workers count and
+        backend.
+        """
+
+        estimate = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e4,
+            random_state=4,
+            batch_size=10e3,
+            workers=1,
+            additional_data=True)
+
+        self.assertEqual(estimate.samples, 100000)
+
+        for backend in ('Thread', 'Process'):
+            self.assertTupleEqual(
+                RGB_colourspace_volume_MonteCarlo(
+                    RGB_COLOURSPACE_BT709,
+                    10e4,
+                    random_state=4,
+                    batch_size=10e3,
+                    workers=3,
+                    backend=backend,
+                    additional_data=True), estimate)
+
+    def test_confidence_interval_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition early stopping.
+        """
+
+        estimate = RGB_colourspace_volume_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            10e6,
+            random_state=4,
+            batch_size=10e3,
+            backend='Thread',
+            confidence_interval=20000,
+            additional_data=True)
+
+        self.assertLess(estimate.samples, 10e6)
+        self.assertLessEqual(1.96 * estimate.standard_error, 20000)
+        self.assertGreater(1.96 * estimate.standard_error, 20000 / 2)
+        self.assertAlmostEqual(
+            estimate.value * 1e-6, 821700.0 * 1e-6, places=1)
+
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
@@ -134,9 +183,37 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
                 is_within_pointer_gamut,
                 10e3,
                 random_state=np.random.RandomState(2)),
-            81.044349070100140,
+            80.509641873278240,
             decimal=7)
 
+    def test_workers_RGB_colourspace_volume_coverage_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_coverage_MonteCarlo` definition reproducibility
+        irrespectively of the workers count and backend.
+        """
+
+        estimate = RGB_colourspace_volume_coverage_MonteCarlo(
+            RGB_COLOURSPACE_BT709,
+            is_within_pointer_gamut,
+            10e4,
+            random_state=np.random.SeedSequence(4),
+            batch_size=10e3,
+            workers=1,
+            additional_data=True)
+
+        for backend in ('Thread', 'Process'):
+            self.assertTupleEqual(
+                RGB_colourspace_volume_coverage_MonteCarlo(
+                    RGB_COLOURSPACE_BT709,
+                    is_within_pointer_gamut,
+                    10e4,
+                    random_state=np.random.SeedSequence(4),
+                    batch_size=10e3,
+                    workers=3,
+                    backend=backend,
+                    additional_data=True), estimate)
+
 
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
@@ -160,7 +237,7 @@ RGB_colourspace_pointer_gamut_coverage_MonteCarlo` definition.
                 RGB_COLOURSPACE_BT709,
                 10e3,
                 random_state=np.random.RandomState(2)),
-            81.044349070100140,
+            80.509641873278240,
             decimal=7)
 
 
@@ -186,7 +263,7 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
                 RGB_COLOURSPACE_BT709,
                 10e3,
                 random_state=np.random.RandomState(2)),
-            46.931407942238266,
+            48.089559503528840,
             decimal=7)
 
 